@@ -21,6 +21,7 @@ setup(
         "pyyaml>=5.4.1",
         "fastapi>=0.68.1",
         "uvicorn>=0.15.0",
+        "httpx>=0.23.0",
         "dash>=2.0.0",
         "plotly>=5.3.1"
     ],
@@ -0,0 +1,120 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+import asyncio
+from src.core.network_slice import QoSRequirements
+
+class PredictionBatcher:
+    def __init__(
+        self,
+        predictor,
+        max_batch_size: int = 256,
+        max_wait_ms: float = 2.0
+    ):
+        self.predictor = predictor
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000.0  # Seconds to wait for more requests after the first
+        self.stats = {"requests": 0, "batches": 0}
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+        # One worker thread keeps model calls serialized and off the event loop
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    async def predict(
+        self,
+        qos_requirements: QoSRequirements,
+        service_type: str,
+        current_load: Optional[Dict[str, float]] = None
+    ) -> Dict[str, float]:
+        """
+        Predict required resources, batched with concurrent callers.
+        
+        Args:
+            qos_requirements: QoS requirements
+            service_type: Type of service
+            current_load: Current system load
+        
+        Returns:
+            Dict[str, float]: Predicted resource requirements
+        """
+        self.start()
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put(((qos_requirements, service_type, current_load or {}), future))
+        return await future
+
+    def start(self) -> asyncio.Task:
+        """
+        Start the batching loop on the running event loop if not running yet.
+        
+        Returns:
+            asyncio.Task: The batching task
+        """
+        if self._task is None or self._task.done():
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="prediction-batcher")
+            self._queue = asyncio.Queue()
+            self._task = asyncio.get_running_loop().create_task(self._run())
+        return self._task
+
+    def stop(self) -> None:
+        """
+        Cancel the batching loop, fail requests still waiting and release the
+        worker thread. A batch being scored finishes in the background.
+        """
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+        while self._queue is not None and not self._queue.empty():
+            _, future = self._queue.get_nowait()
+            if not future.done():
+                future.cancel()
+
+    async def _run(self) -> None:
+        """
+        Collect requests into batches and score each batch in the worker thread.
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.max_wait
+            while len(batch) < self.max_batch_size:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout=remaining))
+                except asyncio.TimeoutError:
+                    break
+
+            await self._score(loop, batch)
+
+    async def _score(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        batch: List[Tuple[Tuple, asyncio.Future]]
+    ) -> None:
+        """
+        Run one batched prediction and resolve the callers' futures.
+        
+        Args:
+            loop: Running event loop
+            batch: (request, future) pairs
+        """
+        requests = [request for request, _ in batch]
+        try:
+            results = await loop.run_in_executor(
+                self._executor, self.predictor.predict_resources_batch, requests
+            )
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        self.stats["requests"] += len(batch)
+        self.stats["batches"] += 1
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
@@ -0,0 +1,473 @@
+from typing import Dict, List, Optional, Tuple
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+import numpy as np
+from src.core.network_slice import QoSRequirements
+
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None
+
+# QoS ranges per service type: (low, high) per field, isolation level
+SERVICE_PROFILES = {
+    "eMBB": {
+        "latency_ms": (10.0, 50.0),
+        "bandwidth_mbps": (100.0, 1000.0),
+        "reliability": (99.0, 99.9),
+        "isolation_level": "shared"
+    },
+    "URLLC": {
+        "latency_ms": (1.0, 10.0),
+        "bandwidth_mbps": (10.0, 100.0),
+        "reliability": (99.999, 99.99999),
+        "isolation_level": "dedicated"
+    },
+    "mMTC": {
+        "latency_ms": (100.0, 1000.0),
+        "bandwidth_mbps": (1.0, 10.0),
+        "reliability": (95.0, 99.0),
+        "isolation_level": "isolated"
+    }
+}
+
+LOAD_CURVES = ("flat", "diurnal", "spike")
+DEFAULT_BATCH_SIZES = (1, 4, 16, 64, 256, 1024, 4096)
+
+class WorkloadGenerator:
+    def __init__(
+        self,
+        mix: Optional[Dict[str, float]] = None,
+        load_curve: str = "diurnal",
+        noise: float = 0.05,
+        seed: int = 0
+    ):
+        if load_curve not in LOAD_CURVES:
+            raise ValueError(f"Unknown load curve: {load_curve}")
+        mix = mix or {"eMBB": 0.5, "URLLC": 0.3, "mMTC": 0.2}
+        unknown = set(mix) - set(SERVICE_PROFILES)
+        if unknown:
+            raise ValueError(f"Unknown service types: {sorted(unknown)}")
+        total = sum(mix.values())
+        self.service_types = list(mix)
+        self.weights = np.array([mix[s] / total for s in self.service_types])  # Share of requests per type
+        self.load_curve = load_curve
+        self.noise = noise  # Relative noise on the reference resource needs
+        self.rng = np.random.default_rng(seed)
+
+    def load_at(self, time_of_day: np.ndarray) -> np.ndarray:
+        """
+        Get the system load of the load curve.
+        
+        Args:
+            time_of_day: Fraction of the day, in [0, 1)
+        
+        Returns:
+            np.ndarray: Load fraction in [0, 1]
+        """
+        if self.load_curve == "flat":
+            return np.full_like(time_of_day, 0.5)
+        if self.load_curve == "diurnal":
+            # Trough at 04:00, peak at 16:00
+            return 0.5 - 0.4 * np.cos(2 * np.pi * (time_of_day - 1 / 6))
+        # Diurnal with a short flash crowd at 20:00
+        spike = 0.5 * np.exp(-((time_of_day - 20 / 24) ** 2) / (2 * 0.01 ** 2))
+        return np.minimum(1.0, 0.5 - 0.4 * np.cos(2 * np.pi * (time_of_day - 1 / 6)) + spike)
+
+    def generate(self, count: int) -> Tuple[List[Tuple[QoSRequirements, str, Dict[str, float]]], np.ndarray]:
+        """
+        Generate prediction requests and their reference resource needs.
+        
+        Args:
+            count: Number of requests
+        
+        Returns:
+            Tuple[List[Tuple], np.ndarray]: (QoS requirements, service type,
+                current load) requests and the matching (count, 3) matrix of
+                cpu, memory and bandwidth needs
+        """
+        codes = self.rng.choice(len(self.service_types), size=count, p=self.weights)
+        load = self.load_at(self.rng.random(count))
+        load_columns = np.clip(
+            load[:, None] + self.rng.normal(0.0, 0.05, (count, 3)), 0.0, 1.0
+        )
+
+        requests = []
+        fields = np.zeros((count, 3))
+        for i, code in enumerate(codes):
+            service_type = self.service_types[code]
+            profile = SERVICE_PROFILES[service_type]
+            values = [self.rng.uniform(*profile[name]) for name in ("latency_ms", "bandwidth_mbps", "reliability")]
+            fields[i] = values
+            requests.append((
+                QoSRequirements(*values, isolation_level=profile["isolation_level"]),
+                service_type,
+                dict(zip(("cpu", "memory", "bandwidth"), load_columns[i].tolist()))
+            ))
+
+        service_types = [self.service_types[code] for code in codes]
+        return requests, self.reference_resources(fields, service_types, load_columns)
+
+    def reference_resources(
+        self,
+        fields: np.ndarray,
+        service_types: List[str],
+        load: np.ndarray
+    ) -> np.ndarray:
+        """
+        Synthetic ground truth the predictor is scored against.
+        
+        Bandwidth drives all resources; tight latency and high reliability
+        cost extra CPU and memory, and a loaded system needs more headroom.
+        
+        Args:
+            fields: (latency_ms, bandwidth_mbps, reliability) rows
+            service_types: Service type per row
+            load: (cpu, memory, bandwidth) load fraction rows
+        
+        Returns:
+            np.ndarray: (cpu, memory, bandwidth) rows
+        """
+        latency, bandwidth, reliability = fields.T
+        urgency = 1.0 + 10.0 / np.maximum(latency, 1.0)
+        nines = -np.log10(np.maximum(1.0 - reliability / 100.0, 1e-9))
+        dedicated = np.array([s == "URLLC" for s in service_types], dtype=np.float64)
+
+        cpu = (0.1 * bandwidth * urgency + 0.5 * nines) * (1.0 + 0.5 * load[:, 0]) * (1.0 + dedicated)
+        memory = (10.0 * bandwidth + 256.0 * nines) * (1.0 + 0.3 * load[:, 1])
+        bandwidth_needed = bandwidth * (1.0 + 0.2 * load[:, 2]) * (1.0 + 0.1 * nines)
+        needs = np.stack([cpu, memory, bandwidth_needed], axis=1)
+        return needs * (1.0 + self.rng.normal(0.0, self.noise, needs.shape))
+
+    def training_data(self, count: int) -> List[Tuple[Dict, Dict]]:
+        """
+        Generate (input_features, actual_resources) pairs for ResourcePredictor.train.
+        
+        Args:
+            count: Number of samples
+        
+        Returns:
+            List[Tuple[Dict, Dict]]: Training pairs
+        """
+        requests, needs = self.generate(count)
+        return [
+            (
+                {"qos_requirements": qos, "service_type": service_type, "current_load": load},
+                dict(zip(("cpu", "memory", "bandwidth"), row.tolist()))
+            )
+            for (qos, service_type, load), row in zip(requests, needs)
+        ]
+
+def _percentile_ms(samples: List[float], q: float) -> float:
+    return float(np.percentile(samples, q) * 1000.0)
+
+def measure_latency(
+    predictor,
+    requests: List[Tuple],
+    batch_sizes: Tuple[int, ...] = DEFAULT_BATCH_SIZES,
+    min_time: float = 1.0,
+    max_repeats: int = 1000
+) -> Dict[str, Dict[str, float]]:
+    """
+    Measure prediction latency per batch size.
+    
+    Batch size 1 goes through predict_resources, the per-request admission
+    path; larger sizes go through predict_resources_batch. Each size is
+    repeated until min_time has passed or max_repeats is reached.
+    
+    Args:
+        predictor: ResourcePredictor, ideally with its cache disabled
+        requests: Requests to cycle through
+        batch_sizes: Batch sizes to measure
+        min_time: Seconds to spend per batch size
+        max_repeats: Maximum calls per batch size
+    
+    Returns:
+        Dict[str, Dict[str, float]]: Per batch size, p50/p99 call latency,
+                                     per-request latency and throughput
+    """
+    results = {}
+    for batch_size in batch_sizes:
+        batches = [
+            [requests[(start + i) % len(requests)] for i in range(batch_size)]
+            for start in range(0, max(len(requests), batch_size), batch_size)
+        ]
+        if batch_size == 1:
+            call = lambda batch: predictor.predict_resources(*batch[0])
+        else:
+            call = predictor.predict_resources_batch
+
+        call(batches[0])  # Warm up
+        timings = []
+        started = time.perf_counter()
+        while len(timings) < max_repeats and (time.perf_counter() - started < min_time or len(timings) < 5):
+            batch = batches[len(timings) % len(batches)]
+            begin = time.perf_counter()
+            call(batch)
+            timings.append(time.perf_counter() - begin)
+
+        p50 = _percentile_ms(timings, 50)
+        results[str(batch_size)] = {
+            "calls": len(timings),
+            "p50_ms": p50,
+            "p99_ms": _percentile_ms(timings, 99),
+            "per_request_us": p50 * 1000.0 / batch_size,
+            # None rather than infinity, which is not valid JSON
+            "throughput_per_s": batch_size / (p50 / 1000.0) if p50 > 0 else None
+        }
+    return results
+
+def measure_cold_start(model_path: Optional[str], repeats: int = 3) -> Dict[str, float]:
+    """
+    Measure import and first-prediction time in fresh interpreters.
+    
+    Args:
+        model_path: Model to load, an untrained model if None
+        repeats: Number of interpreters to start
+    
+    Returns:
+        Dict[str, float]: Median import, load and first prediction time in ms
+    """
+    script = (
+        "import json, sys, time\n"
+        "begin = time.perf_counter()\n"
+        "from src.ai.resource_predictor import ResourcePredictor\n"
+        "from src.core.network_slice import QoSRequirements\n"
+        "imported = time.perf_counter()\n"
+        "predictor = ResourcePredictor(sys.argv[1] or None, cache_size=0)\n"
+        "loaded = time.perf_counter()\n"
+        "predictor.predict_resources(QoSRequirements(10.0, 100.0, 99.9, 'shared'), 'eMBB', {})\n"
+        "predicted = time.perf_counter()\n"
+        "print(json.dumps({'import_ms': (imported - begin) * 1000, 'load_ms': (loaded - imported) * 1000,"
+        " 'first_prediction_ms': (predicted - loaded) * 1000,"
+        " 'tensorflow_loaded': 'tensorflow' in sys.modules}))\n"
+    )
+    root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(filter(None, [root, os.environ.get("PYTHONPATH")]))}
+    model_arg = os.path.abspath(model_path) if model_path else ""
+
+    runs = []
+    for _ in range(repeats):
+        begin = time.perf_counter()
+        output = subprocess.run(
+            [sys.executable, "-c", script, model_arg],
+            capture_output=True, text=True, check=True, cwd=root, env=env
+        ).stdout
+        total = (time.perf_counter() - begin) * 1000.0
+        runs.append({**json.loads(output.strip().splitlines()[-1]), "process_ms": total})
+
+    results = {
+        key: float(np.median([run[key] for run in runs]))
+        for key in ("import_ms", "load_ms", "first_prediction_ms", "process_ms")
+    }
+    results["tensorflow_loaded"] = runs[-1]["tensorflow_loaded"]
+    return results
+
+def measure_memory(predictor, requests: List[Tuple]) -> Dict[str, Optional[float]]:
+    """
+    Measure memory used by one large batch prediction.
+    
+    tracemalloc sees Python and NumPy allocations only; TensorFlow's own
+    allocator shows up in the process peak RSS instead.
+    
+    Args:
+        predictor: ResourcePredictor
+        requests: Requests to predict in one batch
+    
+    Returns:
+        Dict[str, Optional[float]]: Traced peak for the batch and process peak RSS, in MB
+    """
+    tracemalloc.start()
+    predictor.predict_resources_batch(requests)
+    _, traced_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    rss_peak = None
+    if resource is not None:
+        # ru_maxrss is in kB on Linux and in bytes on macOS
+        scale = 1.0 if sys.platform == "darwin" else 1024.0
+        rss_peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale / 2 ** 20
+    return {
+        "batch_size": len(requests),
+        "batch_traced_peak_mb": traced_peak / 2 ** 20,
+        "process_peak_rss_mb": rss_peak
+    }
+
+def measure_accuracy(predictor, requests: List[Tuple], needs: np.ndarray) -> Dict[str, Dict[str, float]]:
+    """
+    Score predictions against the reference resource needs.
+    
+    Args:
+        predictor: ResourcePredictor
+        requests: Requests to predict
+        needs: Reference (cpu, memory, bandwidth) rows
+    
+    Returns:
+        Dict[str, Dict[str, float]]: Per service type and "all", mean absolute
+            error and mean/p95 relative error (percent) per resource
+    """
+    predictions = np.array([
+        [prediction[k] for k in ("cpu", "memory", "bandwidth")]
+        for prediction in predictor.predict_resources_batch(requests)
+    ])
+    relative = np.abs(predictions - needs) / np.maximum(np.abs(needs), 1e-9) * 100.0
+    service_types = np.array([service_type for _, service_type, _ in requests])
+
+    groups = {"all": np.ones(len(requests), dtype=bool)}
+    groups.update({s: service_types == s for s in SERVICE_PROFILES if (service_types == s).any()})
+    results = {}
+    for group, mask in groups.items():
+        scores = {"samples": int(mask.sum())}
+        for column, resource_type in enumerate(("cpu", "memory", "bandwidth")):
+            scores[f"{resource_type}_mae"] = float(np.abs(predictions[mask, column] - needs[mask, column]).mean())
+            scores[f"{resource_type}_mean_error"] = float(relative[mask, column].mean())
+            scores[f"{resource_type}_p95_error"] = float(np.percentile(relative[mask, column], 95))
+        results[group] = scores
+    return results
+
+def run_benchmark(
+    model_path: Optional[str] = None,
+    mix: Optional[Dict[str, float]] = None,
+    load_curve: str = "diurnal",
+    batch_sizes: Tuple[int, ...] = DEFAULT_BATCH_SIZES,
+    train_samples: int = 20000,
+    test_samples: int = 10000,
+    epochs: int = 20,
+    min_time: float = 1.0,
+    cold_start_repeats: int = 3,
+    seed: int = 0
+) -> Dict:
+    """
+    Run the full benchmark.
+    
+    Without a model path a fresh model is trained on the synthetic workload
+    first and its NumPy export is benchmarked (epochs=0 scores an untrained
+    Keras model).
+    
+    Args:
+        model_path: Model to benchmark
+        mix: Share of requests per service type
+        load_curve: One of LOAD_CURVES
+        batch_sizes: Batch sizes for the latency measurement
+        train_samples: Samples to train on when no model is given
+        test_samples: Samples to score and time
+        epochs: Training epochs when no model is given
+        min_time: Seconds per batch size in the latency measurement
+        cold_start_repeats: Fresh interpreters for the cold-start measurement
+        seed: Seed of the workload generator
+    
+    Returns:
+        Dict: JSON-serializable results
+    """
+    from src.ai.resource_predictor import ResourcePredictor
+    from src.ai.numpy_backend import NumpyMLP
+
+    # Holds the export of a model trained here until the cold-start runs have loaded it
+    with tempfile.TemporaryDirectory(prefix="predictor-benchmark-") as work_dir:
+        generator = WorkloadGenerator(mix, load_curve, seed=seed)
+        predictor = ResourcePredictor(model_path, cache_size=0)
+        training = None
+        served_path = model_path
+        if model_path is None and epochs > 0:
+            begin = time.perf_counter()
+            predictor.train(generator.training_data(train_samples), epochs=epochs, batch_size=256)
+            training = {"samples": train_samples, "epochs": epochs, "seconds": time.perf_counter() - begin}
+
+            # Benchmark what would be served: the NumPy export of the trained model
+            served_path = os.path.join(work_dir, "model.npz")
+            predictor.export_numpy(served_path)
+            predictor = ResourcePredictor(served_path, cache_size=0)
+
+        requests, needs = generator.generate(test_samples)
+        return {
+            "timestamp": time.time(),
+            "environment": {
+                "python": platform.python_version(),
+                "numpy": np.__version__,
+                "platform": platform.platform(),
+                "cpu_count": os.cpu_count()
+            },
+            "model": {
+                "path": model_path,  # None for the model trained here
+                "backend": "numpy" if isinstance(predictor.model, NumpyMLP) else "keras",
+                "scaled": predictor.scaler is not None
+            },
+            "workload": {
+                "mix": dict(zip(generator.service_types, generator.weights.tolist())),
+                "load_curve": load_curve,
+                "seed": seed,
+                "test_samples": test_samples
+            },
+            "training": training,
+            "latency": measure_latency(predictor, requests, batch_sizes, min_time),
+            "cold_start": measure_cold_start(served_path, cold_start_repeats),
+            "memory": measure_memory(predictor, requests[:max(batch_sizes)]),
+            "accuracy": measure_accuracy(predictor, requests, needs)
+        }
+
+def parse_mix(value: str) -> Dict[str, float]:
+    """
+    Parse a "eMBB=0.5,URLLC=0.3,mMTC=0.2" service mix.
+    
+    Args:
+        value: Comma-separated type=weight pairs
+    
+    Returns:
+        Dict[str, float]: Weight per service type
+    """
+    mix = {}
+    for pair in value.split(","):
+        service_type, _, weight = pair.partition("=")
+        mix[service_type.strip()] = float(weight)
+    return mix
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="ResourcePredictor latency, memory and accuracy benchmark "
+                    "(e.g. python -m src.ai.benchmark --model models/v0001/model.npz --output bench.json)"
+    )
+    parser.add_argument("--model", type=str, default=None, help="Model to benchmark (.npz or Keras); trains one if omitted")
+    parser.add_argument("--mix", type=parse_mix, default=None, help="Service mix, e.g. eMBB=0.5,URLLC=0.3,mMTC=0.2")
+    parser.add_argument("--load-curve", choices=LOAD_CURVES, default="diurnal")
+    parser.add_argument(
+        "--batch-sizes",
+        type=lambda v: tuple(int(s) for s in v.split(",")),
+        default=DEFAULT_BATCH_SIZES
+    )
+    parser.add_argument("--train-samples", type=int, default=20000)
+    parser.add_argument("--test-samples", type=int, default=10000)
+    parser.add_argument("--epochs", type=int, default=20)
+    parser.add_argument("--min-time", type=float, default=1.0, help="Seconds per batch size")
+    parser.add_argument("--cold-start-repeats", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", type=str, default=None, help="JSON file to write, stdout if omitted")
+    args = parser.parse_args(argv)
+
+    results = run_benchmark(
+        model_path=args.model,
+        mix=args.mix,
+        load_curve=args.load_curve,
+        batch_sizes=args.batch_sizes,
+        train_samples=args.train_samples,
+        test_samples=args.test_samples,
+        epochs=args.epochs,
+        min_time=args.min_time,
+        cold_start_repeats=args.cold_start_repeats,
+        seed=args.seed
+    )
+    output = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output + "\n")
+    else:
+        print(output)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,316 @@
+from typing import Callable, Dict, List, Optional, Tuple
+import asyncio
+import numpy as np
+
+class DemandForecaster:
+    def __init__(
+        self,
+        season_length: int = 24,
+        alpha: float = 0.3,
+        beta: float = 0.05,
+        gamma: float = 0.2,
+        resource_types: Tuple[str, ...] = ("cpu", "memory", "bandwidth"),
+        initial_capacity: int = 64
+    ):
+        if not all(0 < factor <= 1 for factor in (alpha, beta, gamma)):
+            raise ValueError("Smoothing factors must be in (0, 1]")
+        self.season_length = season_length  # Intervals per season (e.g. 24 hourly intervals per day)
+        self.alpha = alpha  # Level smoothing
+        self.beta = beta  # Trend smoothing
+        self.gamma = gamma  # Seasonal smoothing
+        self.resource_types = resource_types
+        self.rows: Dict[str, int] = {}  # Slice ID -> row in the state arrays
+        self._free_rows = list(range(initial_capacity - 1, -1, -1))  # Popped lowest first
+
+        # Additive Holt-Winters state, one row per slice
+        columns = len(resource_types)
+        self.level = np.zeros((initial_capacity, columns))
+        self.trend = np.zeros((initial_capacity, columns))
+        self.season = np.zeros((initial_capacity, season_length, columns))
+        self.steps = np.zeros(initial_capacity, dtype=np.int64)  # Intervals observed per slice
+
+    def observe(self, usage: Dict[str, Dict[str, float]]) -> None:
+        """
+        Add one interval of observed usage for any number of slices.
+        
+        All slices are updated together in one vectorized step. Slices
+        missing from usage keep their state and do not advance.
+        
+        Args:
+            usage: Slice ID -> resource usage during the interval
+                   (e.g., {"slice-1": {"cpu": 4, "memory": 8192, "bandwidth": 900}})
+        """
+        if not usage:
+            return
+        rows = np.array([self._row(slice_id) for slice_id in usage])
+        values = np.array(
+            [[demand.get(k, 0.0) for k in self.resource_types] for demand in usage.values()],
+            dtype=np.float64
+        )
+        self._update(rows, values)
+
+    def fit(self, slice_ids: List[str], history: np.ndarray) -> None:
+        """
+        Learn from utilization histories, all slices in lockstep.
+        
+        Args:
+            slice_ids: IDs of the slices, one per history row
+            history: Usage with shape (slices, intervals, resources), oldest first
+        """
+        history = np.asarray(history, dtype=np.float64)
+        rows = np.array([self._row(slice_id) for slice_id in slice_ids])
+        for step in range(history.shape[1]):
+            self._update(rows, history[:, step])
+
+    def forecast(self, horizon: int, slice_ids: Optional[List[str]] = None) -> Tuple[List[str], np.ndarray]:
+        """
+        Forecast demand for the next intervals.
+        
+        Args:
+            horizon: Number of intervals ahead
+            slice_ids: Slices to forecast, all known slices if None
+        
+        Returns:
+            Tuple[List[str], np.ndarray]: (Slice IDs, forecasts with shape
+                                          (slices, horizon, resources)), clipped at 0
+        """
+        slice_ids = list(self.rows) if slice_ids is None else [s for s in slice_ids if s in self.rows]
+        rows = np.array([self.rows[slice_id] for slice_id in slice_ids], dtype=np.int64)
+        steps_ahead = np.arange(1, horizon + 1)
+
+        season_index = (self.steps[rows, None] + steps_ahead[None, :] - 1) % self.season_length
+        forecasts = (
+            self.level[rows, None, :]
+            + steps_ahead[None, :, None] * self.trend[rows, None, :]
+            + self.season[rows[:, None], season_index]
+            * (self.steps[rows] >= self.season_length)[:, None, None]  # Flat until a season is seen
+        )
+        return slice_ids, np.maximum(forecasts, 0.0)
+
+    def forecast_peaks(self, horizon: int) -> Dict[str, Dict[str, float]]:
+        """
+        Get the highest forecast demand per slice and resource over the horizon.
+        
+        Args:
+            horizon: Number of intervals ahead
+        
+        Returns:
+            Dict[str, Dict[str, float]]: Slice ID -> peak demand per resource
+        """
+        slice_ids, forecasts = self.forecast(horizon)
+        peaks = forecasts.max(axis=1) if len(slice_ids) else np.zeros((0, len(self.resource_types)))
+        return {
+            slice_id: dict(zip(self.resource_types, peak.tolist()))
+            for slice_id, peak in zip(slice_ids, peaks)
+        }
+
+    def remove(self, slice_id: str) -> bool:
+        """
+        Forget the state of a slice.
+        
+        Args:
+            slice_id: ID of the slice
+        
+        Returns:
+            bool: True if the slice was known, False otherwise
+        """
+        row = self.rows.pop(slice_id, None)
+        if row is None:
+            return False
+        self._free_rows.append(row)
+        return True
+
+    def _row(self, slice_id: str) -> int:
+        """
+        Get the state row of a slice, assigning a fresh one if needed.
+        
+        Args:
+            slice_id: ID of the slice
+        
+        Returns:
+            int: Row index
+        """
+        row = self.rows.get(slice_id)
+        if row is not None:
+            return row
+
+        if not self._free_rows:
+            capacity = len(self.steps)
+            # Double the state arrays; rows keep their indices
+            self.level = np.concatenate([self.level, np.zeros_like(self.level)])
+            self.trend = np.concatenate([self.trend, np.zeros_like(self.trend)])
+            self.season = np.concatenate([self.season, np.zeros_like(self.season)])
+            self.steps = np.concatenate([self.steps, np.zeros_like(self.steps)])
+            self._free_rows.extend(range(2 * capacity - 1, capacity - 1, -1))
+
+        row = self._free_rows.pop()
+        self.level[row] = 0.0
+        self.trend[row] = 0.0
+        self.season[row] = 0.0
+        self.steps[row] = 0
+        self.rows[slice_id] = row
+        return row
+
+    def _update(self, rows: np.ndarray, values: np.ndarray) -> None:
+        """
+        Apply one additive Holt-Winters step to the given rows.
+        
+        During a slice's first season the observations are only buffered;
+        once it completes, the level starts at their mean and the seasonal
+        offsets at their deviations from it.
+        
+        Args:
+            rows: State rows to update
+            values: Observed usage with shape (rows, resources)
+        """
+        steps = self.steps[rows]
+        season_index = steps % self.season_length
+        warming_up = (steps < self.season_length)[:, None]
+        level = self.level[rows]
+        trend = self.trend[rows]
+        previous_season = self.season[rows, season_index]
+
+        # Steady state: additive Holt-Winters
+        new_level = self.alpha * (values - previous_season) + (1 - self.alpha) * (level + trend)
+        new_trend = self.beta * (new_level - level) + (1 - self.beta) * trend
+        new_season = self.gamma * (values - new_level) + (1 - self.gamma) * previous_season
+
+        # First season: level is the running mean, observations are buffered in the season
+        running_mean = level + (values - level) / (steps[:, None] + 1)
+        self.level[rows] = np.where(warming_up, running_mean, new_level)
+        self.trend[rows] = np.where(warming_up, 0.0, new_trend)
+        self.season[rows, season_index] = np.where(warming_up, values, new_season)
+        self.steps[rows] = steps + 1
+
+        # Season complete: turn the buffered observations into offsets from the mean
+        completed = rows[steps + 1 == self.season_length]
+        self.season[completed] -= self.level[completed, None, :]
+
+def slice_usage_source(sdn_controller, vnf_manager) -> Callable[[], Dict[str, Dict[str, float]]]:
+    """
+    Build a usage source that reads the current usage of the controller's slices.
+    
+    A slice's usage is the reported usage of the VNF instances attached to
+    it (instances whose network is the slice ID). Slices without reporting
+    instances fall back to their allocation scaled by the
+    resource_utilization metric; slices with neither are left out, so
+    their forecast does not advance on a missing measurement.
+    
+    Args:
+        sdn_controller: SDNController whose slices are observed
+        vnf_manager: VNFManager running the slices' VNF instances
+    
+    Returns:
+        Callable[[], Dict[str, Dict[str, float]]]: Source for CapacityPlanner
+    """
+    def usage() -> Dict[str, Dict[str, float]]:
+        slices = sdn_controller.active_slices
+        totals: Dict[str, Dict[str, float]] = {}
+        for vnf in vnf_manager.active_vnfs.values():
+            if vnf["usage_reported"] and vnf["network"] in slices:
+                total = totals.setdefault(vnf["network"], {})
+                for resource_type, amount in vnf["resource_usage"].items():
+                    total[resource_type] = total.get(resource_type, 0.0) + amount
+
+        for slice_id, slice_instance in slices.items():
+            utilization = slice_instance.performance_metrics.get("resource_utilization", 0.0)
+            if slice_id not in totals and utilization > 0:
+                totals[slice_id] = {
+                    resource_type: amount * utilization / 100.0
+                    for resource_type, amount in slice_instance.allocated_resources.items()
+                }
+        return totals
+
+    return usage
+
+def planner_from_config(config: Dict, sdn_controller, vnf_manager) -> Optional["CapacityPlanner"]:
+    """
+    Build a capacity planner from the "forecasting" configuration section.
+    
+    Args:
+        config: Full configuration dictionary
+        sdn_controller: SDNController to reserve capacity on
+        vnf_manager: VNFManager whose instances report slice usage
+    
+    Returns:
+        Optional[CapacityPlanner]: Planner fed by slice_usage_source, None if
+                                   forecasting is not enabled
+    """
+    section = config.get("forecasting", {}) or {}
+    if not section.get("enabled", False):
+        return None
+    return CapacityPlanner(
+        sdn_controller,
+        DemandForecaster(season_length=section.get("season_length", 24)),
+        slice_usage_source(sdn_controller, vnf_manager),
+        horizon=section.get("horizon", 6),
+        headroom=section.get("headroom", 0.1)
+    )
+
+class CapacityPlanner:
+    def __init__(
+        self,
+        sdn_controller,
+        forecaster: DemandForecaster,
+        usage_source: Callable[[], Dict[str, Dict[str, float]]],
+        horizon: int = 6,
+        headroom: float = 0.1
+    ):
+        self.sdn_controller = sdn_controller
+        self.forecaster = forecaster
+        self.usage_source = usage_source  # Returns the last interval's usage per slice
+        self.horizon = horizon  # Intervals ahead to reserve for
+        self.headroom = headroom  # Fraction added on top of the forecast peak
+        self._task: Optional[asyncio.Task] = None
+
+    def tick(self) -> Dict[str, Dict[str, Dict[str, float]]]:
+        """
+        Observe one interval and reserve capacity for the forecast peaks.
+        
+        Returns:
+            Dict[str, Dict[str, Dict[str, float]]]: Reservation result per slice,
+                                                    as returned by reserve_capacity
+        """
+        active = set(self.sdn_controller.active_slices)
+        for slice_id in [s for s in self.forecaster.rows if s not in active]:
+            self.forecaster.remove(slice_id)
+
+        usage = self.usage_source()
+        self.forecaster.observe({s: u for s, u in usage.items() if s in active})
+        return self.sdn_controller.reserve_capacity(
+            self.forecaster.forecast_peaks(self.horizon),
+            headroom=self.headroom
+        )
+
+    async def run(self, interval: float = 3600.0) -> None:
+        """
+        Observe and reserve every interval seconds until cancelled.
+        
+        Args:
+            interval: Seconds per forecasting interval
+        """
+        while True:
+            self.tick()
+            await asyncio.sleep(interval)
+
+    def start(self, interval: float = 3600.0) -> asyncio.Task:
+        """
+        Start the planning loop as a background task on the running event loop.
+        
+        Args:
+            interval: Seconds per forecasting interval
+        
+        Returns:
+            asyncio.Task: The background task
+        """
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self.run(interval))
+        return self._task
+
+    def stop(self) -> None:
+        """
+        Cancel the background planning loop if it is running.
+        """
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
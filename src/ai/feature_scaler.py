@@ -0,0 +1,145 @@
+from typing import Optional
+import os
+import numpy as np
+
+class FeatureScaler:
+    def __init__(self):
+        self.count = 0
+        self.mean: Optional[np.ndarray] = None
+        self._m2: Optional[np.ndarray] = None  # Sum of squared deviations from the mean
+
+    @property
+    def fitted(self) -> bool:
+        return self.count > 0
+
+    @property
+    def scale(self) -> np.ndarray:
+        """
+        Standard deviation per column, 1 for constant columns.
+        """
+        std = np.sqrt(self._m2 / self.count)
+        return np.where(std > 0, std, 1.0)
+
+    def partial_fit(self, values: np.ndarray) -> "FeatureScaler":
+        """
+        Update the column statistics with a chunk of rows.
+        
+        Chunks are merged with the parallel variance formula, so fitting on
+        a dataset chunk by chunk gives the same result as fitting on all of it.
+        
+        Args:
+            values: Chunk with one row per sample
+        
+        Returns:
+            FeatureScaler: self
+        """
+        values = np.asarray(values, dtype=np.float64)
+        if len(values) == 0:
+            return self
+
+        chunk_count = len(values)
+        chunk_mean = values.mean(axis=0)
+        chunk_m2 = ((values - chunk_mean) ** 2).sum(axis=0)
+
+        if self.count == 0:
+            self.count, self.mean, self._m2 = chunk_count, chunk_mean, chunk_m2
+            return self
+
+        total = self.count + chunk_count
+        delta = chunk_mean - self.mean
+        self.mean = self.mean + delta * chunk_count / total
+        self._m2 = self._m2 + chunk_m2 + delta ** 2 * self.count * chunk_count / total
+        self.count = total
+        return self
+
+    def fit(self, values: np.ndarray) -> "FeatureScaler":
+        """
+        Fit the column statistics from scratch.
+        
+        Args:
+            values: Matrix with one row per sample
+        
+        Returns:
+            FeatureScaler: self
+        """
+        self.count, self.mean, self._m2 = 0, None, None
+        return self.partial_fit(values)
+
+    def transform(self, values: np.ndarray) -> np.ndarray:
+        """
+        Standardize columns to zero mean and unit variance.
+        
+        Args:
+            values: Matrix with one row per sample
+        
+        Returns:
+            np.ndarray: Standardized float32 matrix
+        """
+        return ((values - self.mean) / self.scale).astype(np.float32)
+
+    def inverse_transform(self, values: np.ndarray) -> np.ndarray:
+        """
+        Map standardized values back to original units.
+        
+        Args:
+            values: Standardized matrix
+        
+        Returns:
+            np.ndarray: Matrix in original units
+        """
+        return values * self.scale + self.mean
+
+class ScalingPipeline:
+    def __init__(self, features: Optional[FeatureScaler] = None, targets: Optional[FeatureScaler] = None):
+        self.features = features or FeatureScaler()  # Model inputs
+        self.targets = targets or FeatureScaler()  # Predicted resources
+
+    @staticmethod
+    def path_for(model_path: str) -> str:
+        """
+        Get the path the pipeline of a saved model is stored at.
+        
+        Args:
+            model_path: Path of the saved model
+        
+        Returns:
+            str: Path of the pipeline file next to the model
+        """
+        return model_path.rstrip("/\\") + ".scaler.npz"
+
+    def save(self, path: str) -> None:
+        """
+        Write the fitted statistics to a .npz file.
+        
+        Args:
+            path: Path of the file to write
+        """
+        arrays = {}
+        for name, scaler in (("features", self.features), ("targets", self.targets)):
+            arrays[f"{name}_count"] = np.array(scaler.count)
+            arrays[f"{name}_mean"] = scaler.mean
+            arrays[f"{name}_m2"] = scaler._m2
+        with open(path, "wb") as f:
+            np.savez(f, **arrays)
+
+    @classmethod
+    def load(cls, path: str) -> Optional["ScalingPipeline"]:
+        """
+        Read statistics written by save.
+        
+        Args:
+            path: Path of the file
+        
+        Returns:
+            Optional[ScalingPipeline]: Loaded pipeline, None if the file is missing
+        """
+        if not os.path.exists(path):
+            return None
+
+        pipeline = cls()
+        with np.load(path) as data:
+            for name, scaler in (("features", pipeline.features), ("targets", pipeline.targets)):
+                scaler.count = int(data[f"{name}_count"])
+                scaler.mean = data[f"{name}_mean"]
+                scaler._m2 = data[f"{name}_m2"]
+        return pipeline
@@ -0,0 +1,111 @@
+from typing import List, Tuple
+import numpy as np
+
+ACTIVATIONS = {
+    "linear": lambda x: x,
+    "relu": lambda x: np.maximum(x, 0.0, out=x),
+    "sigmoid": lambda x: 1.0 / (1.0 + np.exp(-x)),
+    "tanh": np.tanh
+}
+
+def export_weights(model, path: str) -> None:
+    """
+    Export the dense layers of a trained Keras model to a compact .npz file.
+    
+    Args:
+        model: Trained Keras Sequential model of Dense layers
+        path: Path of the .npz file to write
+    """
+    NumpyMLP.from_keras(model).save(path)
+
+class NumpyMLP:
+    def __init__(self, layers: List[Tuple[np.ndarray, np.ndarray, str]]):
+        self.layers = layers  # (kernel, bias, activation) per dense layer
+
+    @classmethod
+    def from_keras(cls, model) -> "NumpyMLP":
+        """
+        Copy the dense layers of a Keras model.
+        
+        Dropout and other layers without weights are inference no-ops and are
+        left out.
+        
+        Args:
+            model: Keras Sequential model of Dense layers
+        
+        Returns:
+            NumpyMLP: Inference engine with the model's weights
+        """
+        layers = []
+        for layer in model.layers:
+            weights = layer.get_weights()
+            if not weights:
+                continue
+            activation = layer.get_config().get("activation", "linear")
+            if activation not in ACTIVATIONS:
+                raise ValueError(f"Unsupported activation for NumPy inference: {activation}")
+            layers.append((weights[0].astype(np.float32), weights[1].astype(np.float32), activation))
+        return cls(layers)
+
+    def save(self, path: str) -> None:
+        """
+        Write the weights to a .npz file.
+        
+        Args:
+            path: Path of the .npz file to write
+        """
+        arrays = {}
+        for i, (kernel, bias, _) in enumerate(self.layers):
+            arrays[f"kernel_{i}"] = kernel
+            arrays[f"bias_{i}"] = bias
+        np.savez(path, activations=np.array([a for _, _, a in self.layers]), **arrays)
+
+    @classmethod
+    def load(cls, path: str) -> "NumpyMLP":
+        """
+        Load weights exported with export_weights.
+        
+        Args:
+            path: Path of the .npz file
+        
+        Returns:
+            NumpyMLP: Inference engine with the exported weights
+        """
+        with np.load(path) as data:
+            activations = [str(a) for a in data["activations"]]
+            return cls([
+                (data[f"kernel_{i}"], data[f"bias_{i}"], activation)
+                for i, activation in enumerate(activations)
+            ])
+
+    @property
+    def input_dim(self) -> int:
+        """
+        Number of input features the network expects.
+        """
+        return self.layers[0][0].shape[0]
+
+    def get_weights(self) -> List[np.ndarray]:
+        """
+        Get the weights in Keras order (kernel, bias per dense layer).
+        
+        Returns:
+            List[np.ndarray]: Weight arrays
+        """
+        return [w for kernel, bias, _ in self.layers for w in (kernel, bias)]
+
+    def __call__(self, features: np.ndarray, training: bool = False) -> np.ndarray:
+        """
+        Run a forward pass, mirroring a Keras model call.
+        
+        Args:
+            features: Feature matrix with one row per input
+            training: Ignored, kept for call compatibility with Keras
+        
+        Returns:
+            np.ndarray: Network outputs, one row per input
+        """
+        x = np.asarray(features, dtype=np.float32)
+        for kernel, bias, activation in self.layers:
+            x = ACTIVATIONS[activation](x @ kernel + bias)
+        return x
@@ -0,0 +1,125 @@
+from collections import OrderedDict
+from typing import Callable, Dict, Hashable, Optional, Tuple
+import threading
+import time
+from src.core.network_slice import QoSRequirements
+
+# Quantization step per input feature; inputs closer than a step share a cache entry
+DEFAULT_RESOLUTION = {
+    "latency_ms": 0.1,
+    "bandwidth_mbps": 1.0,
+    "reliability": 0.001,
+    "load": 0.01
+}
+
+class PredictionCache:
+    def __init__(
+        self,
+        max_entries: int = 4096,
+        ttl: float = 300.0,
+        resolution: Optional[Dict[str, float]] = None,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.max_entries = max_entries
+        self.ttl = ttl  # Seconds an entry stays valid
+        self.resolution = {**DEFAULT_RESOLUTION, **(resolution or {})}
+        self.clock = clock
+        self.hits = 0
+        self.misses = 0
+        self.generation = 0  # Bumped by invalidate, i.e. whenever the model changes
+        self._entries: "OrderedDict[Hashable, Tuple[float, Dict[str, float]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def make_key(
+        self,
+        qos_requirements: QoSRequirements,
+        service_type: str,
+        current_load: Optional[Dict[str, float]]
+    ) -> Tuple:
+        """
+        Build the cache key of a prediction input.
+        
+        Args:
+            qos_requirements: QoS requirements
+            service_type: Type of service
+            current_load: Current system load
+        
+        Returns:
+            Tuple: Service type with quantized QoS and load features
+        """
+        res = self.resolution
+        return (
+            service_type,
+            round(qos_requirements.latency_ms / res["latency_ms"]),
+            round(qos_requirements.bandwidth_mbps / res["bandwidth_mbps"]),
+            round(qos_requirements.reliability / res["reliability"]),
+            tuple(sorted(
+                (name, round(value / res["load"]))
+                for name, value in (current_load or {}).items()
+            ))
+        )
+
+    def get(self, key: Hashable) -> Optional[Dict[str, float]]:
+        """
+        Look up a cached prediction.
+        
+        Args:
+            key: Key from make_key
+        
+        Returns:
+            Optional[Dict[str, float]]: Copy of the prediction, None on a miss
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self.clock() - entry[0] <= self.ttl:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return dict(entry[1])
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+    def put(self, key: Hashable, prediction: Dict[str, float], generation: Optional[int] = None) -> None:
+        """
+        Store a prediction, evicting the least recently used entry when full.
+        
+        A prediction computed while the cache was invalidated came from a
+        replaced model and is dropped.
+        
+        Args:
+            key: Key from make_key
+            prediction: Predicted resource requirements
+            generation: Value of generation read before inference started
+        """
+        with self._lock:
+            if generation is not None and generation != self.generation:
+                return
+            self._entries[key] = (self.clock(), dict(prediction))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self) -> None:
+        """
+        Drop all entries, e.g. after the model was retrained or reloaded.
+        """
+        with self._lock:
+            self._entries.clear()
+            self.generation += 1
+
+    def get_stats(self) -> Dict[str, float]:
+        """
+        Get cache size and hit/miss counters.
+        
+        Returns:
+            Dict[str, float]: Entries, hits, misses and hit rate
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0
+            }
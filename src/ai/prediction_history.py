@@ -0,0 +1,138 @@
+from typing import Dict, List, Tuple
+import time
+import numpy as np
+
+# Relative error histogram bins (percent): 0, then log-spaced from 0.01 % to 10000 %
+ERROR_BIN_EDGES = np.concatenate([[0.0], np.logspace(-2, 4, 241)])
+
+class PredictionHistory:
+    def __init__(
+        self,
+        capacity: int = 10000,
+        resource_types: Tuple[str, ...] = ("cpu", "memory", "bandwidth"),
+        service_types: Tuple[str, ...] = ("eMBB", "URLLC", "mMTC")
+    ):
+        self.capacity = capacity
+        self.resource_types = resource_types
+        self.service_types = service_types
+        columns = len(resource_types)
+
+        # Columnar storage, one row per prediction
+        self.predicted = np.zeros((capacity, columns), dtype=np.float64)
+        self.actual = np.zeros((capacity, columns), dtype=np.float64)
+        self.relative_error = np.zeros((capacity, columns), dtype=np.float64)  # Percent
+        self.service_code = np.full(capacity, -1, dtype=np.int8)  # Index into service_types, -1 if unknown
+        self.timestamp = np.zeros(capacity, dtype=np.float64)
+        self.position = 0  # Next row to write
+        self.size = 0
+
+        # Running statistics over the rows currently held
+        self._error_sum = np.zeros(columns, dtype=np.float64)
+        self._error_bin = np.zeros((capacity, columns), dtype=np.int64)
+        self._histogram = np.zeros((columns, len(ERROR_BIN_EDGES)), dtype=np.int64)
+        self._columns = np.arange(columns)
+
+    def __len__(self) -> int:
+        return self.size
+
+    def append(
+        self,
+        prediction: Dict[str, float],
+        actual_usage: Dict[str, float],
+        service_type: str,
+        timestamp: float = None
+    ) -> None:
+        """
+        Add a prediction result, evicting the oldest once full.
+        
+        The running error sum and error histogram are updated for the new
+        and the evicted row only, so the cost is independent of capacity.
+        
+        Args:
+            prediction: Predicted resource requirements
+            actual_usage: Actual resource usage
+            service_type: Type of service
+            timestamp: Time of the result, now if None
+        """
+        row = self.position
+        predicted = np.array([prediction[k] for k in self.resource_types], dtype=np.float64)
+        actual = np.array([actual_usage[k] for k in self.resource_types], dtype=np.float64)
+        relative_error = np.divide(
+            np.abs(predicted - actual) * 100,
+            actual,
+            out=np.zeros_like(actual),
+            where=actual > 0
+        )
+        error_bin = np.searchsorted(ERROR_BIN_EDGES, relative_error, side="right") - 1
+
+        if self.size == self.capacity:
+            self._error_sum -= self.relative_error[row]
+            self._histogram[self._columns, self._error_bin[row]] -= 1
+
+        self.predicted[row] = predicted
+        self.actual[row] = actual
+        self.relative_error[row] = relative_error
+        self._error_bin[row] = error_bin
+        self.service_code[row] = (
+            self.service_types.index(service_type) if service_type in self.service_types else -1
+        )
+        self.timestamp[row] = time.time() if timestamp is None else timestamp
+
+        self._error_sum += relative_error
+        self._histogram[self._columns, error_bin] += 1
+        self.position = (row + 1) % self.capacity
+        self.size = min(self.size + 1, self.capacity)
+
+        # Re-sum once per wrap-around so floating point drift cannot build up
+        if self.position == 0:
+            self._error_sum = self.relative_error.sum(axis=0)
+
+    def get_accuracy(self) -> Dict[str, float]:
+        """
+        Get mean and p95 relative error per resource over the held rows.
+        
+        The p95 is read from the error histogram and is accurate to one
+        log-spaced bin (about 6 %).
+        
+        Returns:
+            Dict[str, float]: "<resource>_mean_error" and "<resource>_p95_error"
+                              in percent, empty if nothing was recorded
+        """
+        if self.size == 0:
+            return {}
+
+        mean = self._error_sum / self.size
+        cumulative = np.cumsum(self._histogram, axis=1)
+        p95_bin = np.argmax(cumulative >= np.ceil(0.95 * self.size), axis=1)
+        p95 = ERROR_BIN_EDGES[np.minimum(p95_bin + 1, len(ERROR_BIN_EDGES) - 1)]
+
+        accuracy = {}
+        for i, resource_type in enumerate(self.resource_types):
+            accuracy[f"{resource_type}_mean_error"] = float(mean[i])
+            accuracy[f"{resource_type}_p95_error"] = float(p95[i])
+        return accuracy
+
+    def records(self, last: int = None) -> List[Dict]:
+        """
+        Get held rows as dictionaries, oldest first.
+        
+        Args:
+            last: Number of most recent rows to return, all if None
+        
+        Returns:
+            List[Dict]: Prediction, actual usage, service type and error per row
+        """
+        count = self.size if last is None else min(last, self.size)
+        rows = (np.arange(self.position - count, self.position)) % self.capacity
+        return [
+            {
+                "prediction": dict(zip(self.resource_types, self.predicted[row].tolist())),
+                "actual": dict(zip(self.resource_types, self.actual[row].tolist())),
+                "service_type": (
+                    self.service_types[self.service_code[row]] if self.service_code[row] >= 0 else None
+                ),
+                "relative_error": dict(zip(self.resource_types, self.relative_error[row].tolist())),
+                "timestamp": float(self.timestamp[row])
+            }
+            for row in rows
+        ]
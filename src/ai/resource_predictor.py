@@ -1,23 +1,97 @@
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+import logging
 import numpy as np
-import tensorflow as tf
-from typing import Dict, List, Tuple
+import threading
+import time
+from typing import Deque, Dict, List, Optional, Tuple
 from src.core.network_slice import QoSRequirements
+from src.ai.numpy_backend import NumpyMLP, export_weights
+from src.ai.prediction_cache import PredictionCache
+from src.ai.prediction_history import PredictionHistory
+from src.ai.feature_scaler import ScalingPipeline
+
+logger = logging.getLogger(__name__)
+
+# TensorFlow is imported only where a Keras model is built, loaded or trained,
+# so serving from exported NumPy weights never loads it.
+
+SERVICE_TYPES = ("eMBB", "URLLC", "mMTC")  # One-hot encoded in this order
+RESOURCE_TYPES = ("cpu", "memory", "bandwidth")  # Model outputs in this order
+LOAD_FEATURES = ("cpu", "memory", "bandwidth")  # Current system load features, in this order
+NUM_FEATURES = 3 + len(SERVICE_TYPES) + len(LOAD_FEATURES)
 
 class ResourcePredictor:
-    def __init__(self, model_path: str = None):
+    def __init__(
+        self,
+        model_path: str = None,
+        cache_size: int = 4096,
+        cache_ttl: float = 300.0,
+        cache_resolution: Optional[Dict[str, float]] = None,
+        history_size: int = 10000
+    ):
+        self._swap_lock = threading.Lock()  # Keeps model and scaler consistent during swaps
+        # Predictions are memoized on quantized inputs, a cache_size of 0 disables this
+        self.cache = PredictionCache(cache_size, cache_ttl, cache_resolution) if cache_size > 0 else None
         self.model = self._build_model() if not model_path else self._load_model(model_path)
-        self.scaler = None  # Will be initialized during training
-        self.history: List[Dict] = []  # Store historical predictions and actual usage
+        # Input and target normalization, fitted during training and saved next to the model
+        self.scaler: Optional[ScalingPipeline] = (
+            ScalingPipeline.load(ScalingPipeline.path_for(model_path)) if model_path else None
+        )
+        # Store historical predictions and actual usage, bounded to the last history_size
+        self.history = PredictionHistory(history_size, RESOURCE_TYPES, SERVICE_TYPES)
+        self.online_learning: Optional[Dict] = None  # Settings of online learning, None if disabled
+        self._online_samples: Deque[Tuple[np.ndarray, np.ndarray]] = deque()
+        self._online_lock = threading.Lock()  # Guards the pending samples and the scheduled update
+        self._online_executor: Optional[ThreadPoolExecutor] = None
+        self._online_future: Optional[Future] = None
+        # (Model published by the last online update, Keras model it was exported from)
+        self._online_trainer: Optional[Tuple[object, object]] = None
+        self._last_online_update = 0.0
+
+    @property
+    def model(self):
+        """
+        The model used for prediction.
+        """
+        return self._model
+
+    @model.setter
+    def model(self, model) -> None:
+        # Replacing the model makes every cached prediction stale
+        self._model = model
+        if self.cache:
+            self.cache.invalidate()
 
-    def _build_model(self) -> tf.keras.Model:
+    def swap_model(self, model, scaler: Optional[ScalingPipeline]) -> None:
+        """
+        Atomically replace the model and its scaling pipeline.
+        
+        Predictions in flight finish on the previous pair; later ones use
+        the new pair. Serving never pauses.
+        
+        Args:
+            model: New Keras model or NumpyMLP
+            scaler: Scaling pipeline the model was trained with
+        """
+        with self._swap_lock:
+            self.model = model
+            self.scaler = scaler
+
+    def _build_model(self, input_dim: int = NUM_FEATURES) -> "tf.keras.Model":
         """
         Build the neural network model for resource prediction.
         
+        Args:
+            input_dim: Number of input features
+        
         Returns:
             tf.keras.Model: Compiled TensorFlow model
         """
+        import tensorflow as tf
+
         model = tf.keras.Sequential([
-            tf.keras.layers.Dense(64, activation='relu', input_shape=(6,)),
+            tf.keras.layers.Dense(64, activation='relu', input_shape=(input_dim,)),
             tf.keras.layers.Dropout(0.2),
             tf.keras.layers.Dense(32, activation='relu'),
             tf.keras.layers.Dropout(0.1),
@@ -33,18 +107,49 @@ class ResourcePredictor:
 
         return model
 
-    def _load_model(self, model_path: str) -> tf.keras.Model:
+    def _load_model(self, model_path: str):
         """
         Load a pre-trained model from disk.
         
+        Weights exported to .npz are served by the NumPy backend without
+        importing TensorFlow.
+        
         Args:
-            model_path: Path to the saved model
+            model_path: Path to the saved model or exported .npz weights
         
         Returns:
-            tf.keras.Model: Loaded TensorFlow model
+            Loaded TensorFlow model, or NumpyMLP for .npz weights
         """
+        if model_path.endswith(".npz"):
+            return NumpyMLP.load(model_path)
+
+        import tensorflow as tf
         return tf.keras.models.load_model(model_path)
 
+    def _ensure_keras_model(self) -> None:
+        """
+        Replace a NumPy inference model with an equivalent Keras model so it
+        can be trained or saved.
+        """
+        if isinstance(self.model, NumpyMLP):
+            weights = self.model.get_weights()
+            self.model = self._build_model(self.model.input_dim)
+            self.model.set_weights(weights)
+
+    def export_numpy(self, path: str) -> None:
+        """
+        Export the model weights for TensorFlow-free inference.
+        
+        Args:
+            path: Path of the .npz file to write
+        """
+        if isinstance(self.model, NumpyMLP):
+            self.model.save(path)
+        else:
+            export_weights(self.model, path)
+        if self.scaler:
+            self.scaler.save(ScalingPipeline.path_for(path))
+
     def preprocess_input(
         self,
         qos_requirements: QoSRequirements,
@@ -73,10 +178,100 @@ class ResourcePredictor:
             qos_requirements.latency_ms,
             qos_requirements.bandwidth_mbps,
             qos_requirements.reliability
-        ] + service_type_encoding.get(service_type, [0, 0, 0])
+        ] + service_type_encoding.get(service_type, [0, 0, 0]) + [
+            (current_load or {}).get(name, 0.0) for name in LOAD_FEATURES
+        ]
 
         return np.array(features).reshape(1, -1)
 
+    def preprocess_batch(
+        self,
+        qos_requirements: List[QoSRequirements],
+        service_types: List[str],
+        current_loads: List[Dict[str, float]]
+    ) -> np.ndarray:
+        """
+        Preprocess many inputs into one feature matrix.
+        
+        Args:
+            qos_requirements: QoS requirements per input
+            service_types: Type of service per input
+            current_loads: Current system load per input
+        
+        Returns:
+            np.ndarray: Feature matrix with one row per input
+        """
+        qos = np.array(
+            [(q.latency_ms, q.bandwidth_mbps, q.reliability) for q in qos_requirements],
+            dtype=np.float32
+        ).reshape(-1, 3)
+
+        # Unknown service types map to the all-zero row after the identity rows
+        type_index = {service_type: i for i, service_type in enumerate(SERVICE_TYPES)}
+        codes = np.fromiter(
+            (type_index.get(t, len(SERVICE_TYPES)) for t in service_types),
+            dtype=np.int64,
+            count=len(service_types)
+        )
+        one_hot = np.eye(len(SERVICE_TYPES) + 1, len(SERVICE_TYPES), dtype=np.float32)[codes]
+
+        load = np.array(
+            [[(l or {}).get(name, 0.0) for name in LOAD_FEATURES] for l in current_loads],
+            dtype=np.float32
+        ).reshape(-1, len(LOAD_FEATURES))
+
+        return np.hstack([qos, one_hot, load])
+
+    def _model_inputs(self, features: np.ndarray, model=None) -> np.ndarray:
+        """
+        Trim features to the model's input width.
+        
+        Models saved before load features were added take only the leading
+        QoS and service type columns.
+        
+        Args:
+            features: Feature matrix with one row per input
+            model: Model to match, the current model if None
+        
+        Returns:
+            np.ndarray: Feature matrix matching the model input
+        """
+        if model is None:
+            model = self.model
+        if isinstance(model, NumpyMLP):
+            input_dim = model.input_dim
+        else:
+            input_dim = model.input_shape[-1]
+        return features[:, :input_dim]
+
+    def _infer(self, features: np.ndarray, batch_size: int = 4096) -> np.ndarray:
+        """
+        Run the model on a feature matrix.
+        
+        The model is called directly rather than through model.predict,
+        which sets up a data pipeline on every call.
+        
+        Args:
+            features: Feature matrix with one row per input
+            batch_size: Maximum rows per model call
+        
+        Returns:
+            np.ndarray: Non-negative predictions, one row per input
+        """
+        with self._swap_lock:
+            model, scaler = self.model, self.scaler
+
+        features = self._model_inputs(features, model)
+        if scaler:
+            features = scaler.features.transform(features)
+        outputs = np.concatenate([
+            np.asarray(model(features[start:start + batch_size], training=False))
+            for start in range(0, len(features), batch_size)
+        ])
+        if scaler:
+            outputs = scaler.targets.inverse_transform(outputs)
+        return np.maximum(outputs, 0.0)
+
     def predict_resources(
         self,
         qos_requirements: QoSRequirements,
@@ -94,38 +289,176 @@ class ResourcePredictor:
         Returns:
             Dict[str, float]: Predicted resource requirements
         """
+        if self.cache:
+            key = self.cache.make_key(qos_requirements, service_type, current_load)
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
+            generation = self.cache.generation  # Before inference snapshots the model
+
         input_features = self.preprocess_input(qos_requirements, service_type, current_load)
-        predictions = self.model.predict(input_features)[0]
+        predictions = self._infer(input_features.astype(np.float32))[0]
         
-        return {
-            "cpu": max(0.0, predictions[0]),
-            "memory": max(0.0, predictions[1]),
-            "bandwidth": max(0.0, predictions[2])
+        result = {
+            "cpu": float(predictions[0]),
+            "memory": float(predictions[1]),
+            "bandwidth": float(predictions[2])
         }
+        if self.cache:
+            self.cache.put(key, result, generation)
+        return result
+
+    def predict_resources_batch(
+        self,
+        requests: List[Tuple[QoSRequirements, str, Dict[str, float]]],
+        batch_size: int = 4096
+    ) -> List[Dict[str, float]]:
+        """
+        Predict required resources for many inputs at once.
+        
+        All inputs are preprocessed in one vectorized step and scored with
+        as few model calls as batch_size allows, so throughput grows with
+        the number of inputs instead of paying per-call overhead.
+        
+        Args:
+            requests: (QoS requirements, service type, current load) tuples
+            batch_size: Maximum rows per model call
+        
+        Returns:
+            List[Dict[str, float]]: Predicted resource requirements per input
+        """
+        if not requests:
+            return []
+
+        results: List[Optional[Dict[str, float]]] = [None] * len(requests)
+        keys = [None] * len(requests)
+        generation = None
+        if self.cache:
+            generation = self.cache.generation  # Before inference snapshots the model
+            for i, request in enumerate(requests):
+                keys[i] = self.cache.make_key(*request)
+                results[i] = self.cache.get(keys[i])
+        pending = [i for i, result in enumerate(results) if result is None]
+        if not pending:
+            return results
+
+        qos_requirements, service_types, current_loads = zip(*(requests[i] for i in pending))
+        features = self.preprocess_batch(qos_requirements, service_types, current_loads)
+        predictions = self._infer(features, batch_size).tolist()
+
+        for i, row in zip(pending, predictions):
+            results[i] = dict(zip(RESOURCE_TYPES, row))
+            if self.cache:
+                self.cache.put(keys[i], results[i], generation)
+        return results
+
+    def build_training_arrays(
+        self,
+        training_data: List[Tuple[Dict, Dict]]
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Turn (input, actual resources) pairs into feature and target matrices.
+        
+        Args:
+            training_data: List of (input_features, actual_resources) pairs
+        
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: (Features, targets), one row per pair
+        """
+        inputs = [d[0] for d in training_data]
+        X = self.preprocess_batch(
+            [i["qos_requirements"] for i in inputs],
+            [i["service_type"] for i in inputs],
+            [i.get("current_load") for i in inputs]
+        )
+        y = np.array(
+            [[d[1][name] for name in RESOURCE_TYPES] for d in training_data],
+            dtype=np.float32
+        ).reshape(-1, len(RESOURCE_TYPES))
+        return X, y
+
+    def _trainable_copy(self, model):
+        """
+        Build a Keras model with the weights of a model, to train without
+        touching the one being served.
+        
+        Args:
+            model: Keras model or NumpyMLP
+        
+        Returns:
+            tf.keras.Model: Compiled copy of the model
+        """
+        if isinstance(model, NumpyMLP):
+            copy = self._build_model(model.input_dim)
+        else:
+            import tensorflow as tf
+
+            copy = tf.keras.models.clone_model(model)
+            copy.compile(optimizer=tf.keras.optimizers.Adam(learning_rate=0.001), loss='mse', metrics=['mae'])
+        copy.set_weights(model.get_weights())
+        return copy
+
+    def _training_scaler(self, scaler: Optional[ScalingPipeline], reuse: bool, width: int) -> Optional[ScalingPipeline]:
+        """
+        Get the scaling pipeline to keep when continuing from a model.
+        
+        Args:
+            scaler: Pipeline of the model training starts from
+            reuse: Whether the caller asked to keep it
+            width: Number of model input columns
+        
+        Returns:
+            Optional[ScalingPipeline]: The pipeline if it can be kept, None
+                                       if a new one has to be fitted
+        """
+        if reuse and scaler is not None and scaler.features.fitted and len(scaler.features.mean) == width:
+            return scaler
+        return None
 
     def train(
         self,
         training_data: List[Tuple[Dict, Dict]],
         validation_split: float = 0.2,
         epochs: int = 100,
-        batch_size: int = 32
+        batch_size: int = 32,
+        callbacks: Optional[List] = None,
+        reuse_scaler: bool = False
     ) -> None:
         """
         Train the model on historical data.
         
+        A copy of the model is trained while the current model keeps
+        serving, then the trained copy and its scaling pipeline are swapped
+        in together. The pipeline is fitted on the training rows, so inputs
+        and targets reach the network standardized.
+        
         Args:
             training_data: List of (input_features, actual_resources) pairs
             validation_split: Fraction of data to use for validation
             epochs: Number of training epochs
             batch_size: Batch size for training
+            callbacks: Additional Keras callbacks (e.g., progress reporting)
+            reuse_scaler: Keep the current scaling pipeline instead of
+                          fitting a new one, when continuing training
         """
+        import tensorflow as tf
+
+        with self._swap_lock:
+            base, scaler = self.model, self.scaler
+        model = self._trainable_copy(base)
+
         # Prepare training data
-        X = np.array([self.preprocess_input(**d[0])[0] for d in training_data])
-        y = np.array([[d[1]["cpu"], d[1]["memory"], d[1]["bandwidth"]] for d in training_data])
+        X, y = self.build_training_arrays(training_data)
+        X = self._model_inputs(X, base)
+        train_rows = len(X) - int(len(X) * validation_split)
+        scaler = self._training_scaler(scaler, reuse_scaler, X.shape[1])
+        if scaler is None:
+            scaler = ScalingPipeline()
+            scaler.features.fit(X[:train_rows])
+            scaler.targets.fit(y[:train_rows])
 
-        # Train the model
-        self.model.fit(
-            X, y,
+        model.fit(
+            scaler.features.transform(X), scaler.targets.transform(y),
             epochs=epochs,
             batch_size=batch_size,
             validation_split=validation_split,
@@ -134,69 +467,293 @@ class ResourcePredictor:
                     patience=10,
                     restore_best_weights=True
                 )
-            ]
+            ] + list(callbacks or [])
+        )
+        self.swap_model(model, scaler)
+
+    def train_from_files(
+        self,
+        features_path: str,
+        targets_path: str,
+        validation_split: float = 0.2,
+        epochs: int = 10,
+        batch_size: int = 1024,
+        chunk_rows: int = 262144,
+        callbacks: Optional[List] = None,
+        reuse_scaler: bool = False
+    ) -> None:
+        """
+        Train on feature and target matrices stored as .npy files.
+        
+        The files are memory-mapped and streamed in chunks through tf.data,
+        so datasets larger than memory can be used. A first pass fits the
+        scaling pipeline chunk by chunk, then every epoch streams the
+        standardized chunks, shuffled within each chunk. The trailing
+        validation_split fraction of rows is used for validation. As with
+        train, a copy is trained and swapped in with its pipeline at the end.
+        
+        Args:
+            features_path: .npy file of features (see build_training_arrays)
+            targets_path: .npy file of actual cpu, memory and bandwidth
+            validation_split: Fraction of rows to use for validation
+            epochs: Number of training epochs
+            batch_size: Batch size for training
+            chunk_rows: Rows read from disk at a time
+            callbacks: Additional Keras callbacks (e.g., progress reporting)
+            reuse_scaler: Keep the current scaling pipeline instead of
+                          fitting a new one, when continuing training
+        """
+        import tensorflow as tf
+
+        with self._swap_lock:
+            base, scaler = self.model, self.scaler
+        model = self._trainable_copy(base)
+
+        X = np.load(features_path, mmap_mode='r')
+        y = np.load(targets_path, mmap_mode='r')
+        if len(X) != len(y):
+            raise ValueError("Feature and target files have different row counts")
+        train_rows = len(X) - int(len(X) * validation_split)
+
+        scaler = self._training_scaler(scaler, reuse_scaler, model.input_shape[-1])
+        if scaler is None:
+            scaler = ScalingPipeline()
+            for start in range(0, train_rows, chunk_rows):
+                stop = min(start + chunk_rows, train_rows)
+                scaler.features.partial_fit(self._model_inputs(X[start:stop], base))
+                scaler.targets.partial_fit(y[start:stop])
+
+        def batches(begin: int, end: int, shuffle: bool):
+            def generate():
+                rng = np.random.default_rng()
+                for start in range(begin, end, chunk_rows):
+                    stop = min(start + chunk_rows, end)
+                    features = scaler.features.transform(self._model_inputs(X[start:stop], base))
+                    targets = scaler.targets.transform(y[start:stop])
+                    if shuffle:
+                        order = rng.permutation(len(features))
+                        features, targets = features[order], targets[order]
+                    for offset in range(0, len(features), batch_size):
+                        yield features[offset:offset + batch_size], targets[offset:offset + batch_size]
+
+            signature = (
+                tf.TensorSpec(shape=(None, model.input_shape[-1]), dtype=tf.float32),
+                tf.TensorSpec(shape=(None, len(RESOURCE_TYPES)), dtype=tf.float32)
+            )
+            return tf.data.Dataset.from_generator(
+                generate, output_signature=signature
+            ).prefetch(tf.data.AUTOTUNE)
+
+        validation = batches(train_rows, len(X), shuffle=False) if train_rows < len(X) else None
+        model.fit(
+            batches(0, train_rows, shuffle=True),
+            epochs=epochs,
+            validation_data=validation,
+            callbacks=[
+                tf.keras.callbacks.EarlyStopping(
+                    monitor='val_loss' if validation is not None else 'loss',
+                    patience=3,
+                    restore_best_weights=True
+                )
+            ] + list(callbacks or [])
+        )
+        self.swap_model(model, scaler)
+
+    def enable_online_learning(
+        self,
+        batch_size: int = 32,
+        min_interval: float = 60.0,
+        max_pending: int = 4096
+    ) -> None:
+        """
+        Update the model incrementally from results passed to update_history.
+        
+        Updates run on a background thread. They train a Keras copy of the
+        model and swap in its exported weights, so callers of update_history
+        never wait for training and predictions never see a model in the
+        middle of an update.
+        
+        Args:
+            batch_size: Samples collected before a mini-batch update
+            min_interval: Minimum seconds between two updates
+            max_pending: Maximum samples kept while waiting, oldest dropped first
+        """
+        self.online_learning = {
+            "batch_size": batch_size,
+            "min_interval": min_interval,
+            "updates": 0
+        }
+        with self._online_lock:
+            self._online_samples = deque(self._online_samples, maxlen=max_pending)
+            if self._online_executor is None:
+                self._online_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="online-learning")
+
+    def disable_online_learning(self) -> None:
+        """
+        Stop incremental updates and drop samples not yet trained on.
+        
+        An update already running finishes in the background.
+        """
+        self.online_learning = None
+        with self._online_lock:
+            self._online_samples.clear()
+            if self._online_executor is not None:
+                self._online_executor.shutdown(wait=False)
+                self._online_executor = None
+            self._online_future = None
+
+    def _online_update_due(self, now: float) -> bool:
+        """
+        Check whether enough samples and time have passed for an update.
+        
+        Args:
+            now: Current monotonic time
+        
+        Returns:
+            bool: True if an update is due
+        """
+        return (
+            len(self._online_samples) >= self.online_learning["batch_size"]
+            and now - self._last_online_update >= self.online_learning["min_interval"]
         )
 
+    def _online_trainer_for(self, model):
+        """
+        Get a Keras model with the weights of the served model, for training.
+        
+        The Keras model behind the previous online update is reused, keeping
+        its optimizer state, as long as that update's model is still served.
+        
+        Args:
+            model: Model currently served
+        
+        Returns:
+            tf.keras.Model: Trainable model that is not being served
+        """
+        if self._online_trainer is not None and self._online_trainer[0] is model:
+            return self._online_trainer[1]
+        return self._trainable_copy(model)
+
+    def update_online(self, force: bool = False) -> bool:
+        """
+        Run one incremental update on the pending samples if one is due.
+        
+        Normally called on the background thread scheduled by update_history.
+        If the model is replaced while the update trains, the update is
+        dropped rather than overwriting the new model.
+        
+        Args:
+            force: Update even if the batch is not full or the interval has
+                   not passed yet
+        
+        Returns:
+            bool: True if the model was updated, False otherwise
+        """
+        if self.online_learning is None:
+            return False
+        now = time.monotonic()
+        with self._online_lock:
+            if not self._online_samples or not (force or self._online_update_due(now)):
+                return False
+            features, targets = zip(*self._online_samples)
+            self._online_samples.clear()
+
+        with self._swap_lock:
+            base, scaler = self.model, self.scaler
+        trainer = self._online_trainer_for(base)
+
+        features = self._model_inputs(np.vstack(features), base)
+        targets = np.vstack(targets)
+        if scaler:
+            features = scaler.features.transform(features)
+            targets = scaler.targets.transform(targets)
+        trainer.train_on_batch(features, targets)
+        updated = NumpyMLP.from_keras(trainer)
+
+        with self._swap_lock:
+            if self.model is not base or self.scaler is not scaler:
+                return False
+            self.model = updated
+            self._online_trainer = (updated, trainer)
+        self._last_online_update = now
+        settings = self.online_learning
+        if settings is not None:
+            settings["updates"] += 1
+        return True
+
+    def _run_online_update(self) -> None:
+        """
+        Background entry point of online updates; failures are logged.
+        """
+        try:
+            self.update_online()
+        except Exception:
+            logger.exception("Online model update failed")
+
     def update_history(
         self,
         prediction: Dict[str, float],
         actual_usage: Dict[str, float],
         qos_requirements: QoSRequirements,
-        service_type: str
+        service_type: str,
+        current_load: Optional[Dict[str, float]] = None
     ) -> None:
         """
         Update historical data with prediction results.
         
+        With online learning enabled the (input, actual usage) pair is also
+        queued, and an incremental model update is scheduled on the
+        background thread once one is due.
+        
         Args:
             prediction: Predicted resource requirements
             actual_usage: Actual resource usage
             qos_requirements: QoS requirements
             service_type: Type of service
+            current_load: System load the prediction was made under
+        """
+        if self.online_learning is not None:
+            sample = (
+                self.preprocess_input(qos_requirements, service_type, current_load).astype(np.float32),
+                np.array([[actual_usage[name] for name in RESOURCE_TYPES]], dtype=np.float32)
+            )
+            with self._online_lock:
+                self._online_samples.append(sample)
+                idle = self._online_future is None or self._online_future.done()
+                if idle and self._online_executor is not None and self._online_update_due(time.monotonic()):
+                    self._online_future = self._online_executor.submit(self._run_online_update)
+
+        self.history.append(prediction, actual_usage, service_type)
+
+    def get_cache_stats(self) -> Dict[str, float]:
+        """
+        Get prediction cache size and hit/miss counters.
+        
+        Returns:
+            Dict[str, float]: Cache statistics, empty if caching is disabled
         """
-        self.history.append({
-            "prediction": prediction,
-            "actual": actual_usage,
-            "qos_requirements": qos_requirements,
-            "service_type": service_type,
-            "error": {
-                k: abs(prediction[k] - actual_usage[k])
-                for k in prediction.keys()
-            }
-        })
+        return self.cache.get_stats() if self.cache else {}
 
     def get_prediction_accuracy(self) -> Dict[str, float]:
         """
         Calculate prediction accuracy metrics.
         
+        Statistics are maintained as results are recorded, so this does not
+        depend on the history length.
+        
         Returns:
-            Dict[str, float]: Accuracy metrics for each resource type
+            Dict[str, float]: Mean and p95 relative error (%) for each resource type
         """
-        if not self.history:
-            return {}
-
-        errors = {
-            "cpu": [],
-            "memory": [],
-            "bandwidth": []
-        }
-
-        for entry in self.history:
-            for resource_type in errors.keys():
-                error = entry["error"][resource_type]
-                actual = entry["actual"][resource_type]
-                relative_error = (error / actual) * 100 if actual > 0 else 0
-                errors[resource_type].append(relative_error)
-
-        return {
-            f"{k}_mean_error": np.mean(v)
-            for k, v in errors.items()
-        }
+        return self.history.get_accuracy()
 
     def save_model(self, model_path: str) -> None:
         """
-        Save the trained model to disk.
+        Save the trained model to disk, with its scaling pipeline next to it.
         
         Args:
             model_path: Path to save the model
         """
-        self.model.save(model_path) 
\ No newline at end of file
+        self._ensure_keras_model()
+        self.model.save(model_path)
+        if self.scaler:
+            self.scaler.save(ScalingPipeline.path_for(model_path)) 
\ No newline at end of file
@@ -0,0 +1,380 @@
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, List, Optional, Tuple
+import json
+import multiprocessing
+import os
+import threading
+import time
+import uuid
+
+MODEL_FILE = "model.keras"  # Full Keras model, used to continue training
+SERVING_FILE = "model.npz"  # NumPy export, used for serving
+METADATA_FILE = "metadata.json"
+PROGRESS_FILE = "progress.json"
+ACTIVE_FILE = "ACTIVE"  # Name of the active version, in the model directory
+
+def _write_json(path: str, data: Dict) -> None:
+    """
+    Write JSON atomically so readers never see a partial file.
+    
+    Args:
+        path: Destination path
+        data: JSON-serializable dictionary
+    """
+    temporary = f"{path}.tmp"
+    with open(temporary, 'w') as f:
+        json.dump(data, f)
+    os.replace(temporary, path)
+
+def _read_json(path: str) -> Optional[Dict]:
+    """
+    Read a JSON file written by _write_json.
+    
+    Args:
+        path: Source path
+    
+    Returns:
+        Optional[Dict]: Parsed content, None if the file does not exist
+    """
+    try:
+        with open(path, 'r') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+
+def _run_training_job(
+    version_dir: str,
+    base_model_path: Optional[str],
+    training_data: Optional[List[Tuple[Dict, Dict]]],
+    files: Optional[Tuple[str, str]],
+    params: Dict
+) -> Dict:
+    """
+    Train a model in a worker process and save it as a new version.
+    
+    Args:
+        version_dir: Directory of the new version
+        base_model_path: Model to continue training from, a fresh model if None
+        training_data: (input_features, actual_resources) pairs, or None
+        files: (features .npy, targets .npy) paths, used if training_data is None
+        params: Keyword arguments for the training call (epochs, batch_size, ...)
+    
+    Returns:
+        Dict: Metadata of the saved version
+    """
+    import tensorflow as tf
+    from src.ai.resource_predictor import ResourcePredictor
+
+    progress_path = os.path.join(version_dir, PROGRESS_FILE)
+    epochs = params.get("epochs", 100)
+    _write_json(progress_path, {"epoch": 0, "epochs": epochs, "metrics": {}})  # Marks the job as running
+
+    class ProgressReporter(tf.keras.callbacks.Callback):
+        def on_epoch_end(self, epoch, logs=None):
+            _write_json(progress_path, {
+                "epoch": epoch + 1,
+                "epochs": epochs,
+                "metrics": {k: float(v) for k, v in (logs or {}).items()}
+            })
+
+    predictor = ResourcePredictor(base_model_path, cache_size=0, history_size=1)
+    # Continued training keeps the scaling the base model's weights were trained with
+    reuse_scaler = base_model_path is not None
+    started = time.time()
+    if training_data is not None:
+        predictor.train(training_data, callbacks=[ProgressReporter()], reuse_scaler=reuse_scaler, **params)
+        samples = len(training_data)
+    else:
+        predictor.train_from_files(*files, callbacks=[ProgressReporter()], reuse_scaler=reuse_scaler, **params)
+        samples = None
+
+    predictor.save_model(os.path.join(version_dir, MODEL_FILE))
+    predictor.export_numpy(os.path.join(version_dir, SERVING_FILE))
+    metadata = {
+        "version": os.path.basename(version_dir),
+        "created": time.time(),
+        "training_seconds": time.time() - started,
+        "samples": samples,
+        "base_model": base_model_path,
+        "params": params,
+        "progress": _read_json(progress_path)
+    }
+    _write_json(os.path.join(version_dir, METADATA_FILE), metadata)
+    return metadata
+
+class TrainingJobManager:
+    def __init__(self, model_dir: str, predictor=None, data_dir: Optional[str] = None):
+        self.model_dir = model_dir
+        self.predictor = predictor  # Live ResourcePredictor that finished jobs are swapped into
+        # Only .npy training files inside this directory are accepted, none if None
+        self.data_dir = data_dir
+        self.jobs: Dict[str, Dict] = {}
+        self._futures: Dict[str, Future] = {}  # Worker call per job, to cancel on shutdown
+        self.previous_version: Optional[str] = None  # Version to roll back to
+        self._lock = threading.Lock()
+        self._executor = self._create_executor()
+        os.makedirs(model_dir, exist_ok=True)
+
+    @staticmethod
+    def _create_executor() -> ProcessPoolExecutor:
+        # Spawned, not forked: the parent may already hold TensorFlow threads
+        return ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn"))
+
+    @property
+    def active_version(self) -> Optional[str]:
+        """
+        Name of the version currently served, None if none was activated.
+        """
+        try:
+            with open(os.path.join(self.model_dir, ACTIVE_FILE), 'r') as f:
+                return f.read().strip() or None
+        except FileNotFoundError:
+            return None
+
+    def active_model_path(self) -> Optional[str]:
+        """
+        Get the serving file of the active version.
+        
+        Returns:
+            Optional[str]: Path to load the live predictor from, None if no
+                           version is active
+        """
+        version = self.active_version
+        return os.path.join(self.model_dir, version, SERVING_FILE) if version else None
+
+    def resolve_data_path(self, path: str) -> str:
+        """
+        Resolve a training file path and check it lies inside data_dir.
+        
+        Args:
+            path: Path relative to data_dir, or absolute
+        
+        Returns:
+            str: Resolved absolute path
+        
+        Raises:
+            ValueError: If no data directory is configured or the path
+                        resolves outside of it
+        """
+        if not self.data_dir:
+            raise ValueError("Training from files is disabled: no training data directory is configured")
+        root = os.path.realpath(self.data_dir)
+        resolved = os.path.realpath(os.path.join(root, path))
+        if os.path.commonpath([root, resolved]) != root:
+            raise ValueError(f"Training file must be inside the training data directory: {path}")
+        return resolved
+
+    def submit(
+        self,
+        training_data: Optional[List[Tuple[Dict, Dict]]] = None,
+        features_path: Optional[str] = None,
+        targets_path: Optional[str] = None,
+        from_active: bool = True,
+        activate: bool = True,
+        **params
+    ) -> str:
+        """
+        Start a training job in the worker process.
+        
+        Args:
+            training_data: (input_features, actual_resources) pairs
+            features_path: .npy features, used with targets_path instead of
+                           training_data; relative to data_dir
+            targets_path: .npy targets, relative to data_dir
+            from_active: Continue from the active version instead of a fresh model
+            activate: Swap the result into the live predictor when done
+            **params: Passed to the training call (epochs, batch_size, validation_split)
+        
+        Returns:
+            str: Job ID
+        
+        Raises:
+            ValueError: If no training data is given or a file is outside data_dir
+        """
+        if training_data is None and not (features_path and targets_path):
+            raise ValueError("Either training_data or features_path and targets_path are required")
+        if training_data is None:
+            features_path = self.resolve_data_path(features_path)
+            targets_path = self.resolve_data_path(targets_path)
+
+        with self._lock:
+            version = self._next_version()
+            version_dir = os.path.join(self.model_dir, version)
+            os.makedirs(version_dir)
+
+            active = self.active_version
+            base_model_path = (
+                os.path.join(self.model_dir, active, MODEL_FILE) if from_active and active else None
+            )
+            job_id = str(uuid.uuid4())
+            self.jobs[job_id] = {
+                "id": job_id,
+                "version": version,
+                "status": "queued",  # Running once the worker reports progress
+                "submitted": time.time(),
+                "finished": None,
+                "error": None,
+                "activate": activate
+            }
+            args = (
+                version_dir,
+                base_model_path,
+                training_data,
+                (features_path, targets_path) if training_data is None else None,
+                params
+            )
+            try:
+                future = self._executor.submit(_run_training_job, *args)
+            except BrokenProcessPool:
+                # A previous worker died (e.g. out of memory); start a fresh one
+                self._executor = self._create_executor()
+                future = self._executor.submit(_run_training_job, *args)
+            self._futures[job_id] = future
+        future.add_done_callback(lambda f: self._finish(job_id, f))
+        return job_id
+
+    def get_job(self, job_id: str) -> Optional[Dict]:
+        """
+        Get the status and training progress of a job.
+        
+        Args:
+            job_id: ID of the job
+        
+        Returns:
+            Optional[Dict]: Job status if found, None otherwise
+        """
+        job = self.jobs.get(job_id)
+        if job is None:
+            return None
+        progress = _read_json(os.path.join(self.model_dir, job["version"], PROGRESS_FILE))
+        if job["status"] == "queued" and progress is not None:
+            job["status"] = "running"
+        return {**job, "progress": progress}
+
+    def list_jobs(self) -> List[Dict]:
+        """
+        Get the status of all jobs of this process.
+        
+        Returns:
+            List[Dict]: Job status, oldest first
+        """
+        return [self.get_job(job_id) for job_id in list(self.jobs)]
+
+    def list_versions(self) -> List[Dict]:
+        """
+        Get the metadata of every saved model version.
+        
+        Returns:
+            List[Dict]: Version metadata, oldest first, with an "active" flag
+        """
+        active = self.active_version
+        versions = []
+        for name in sorted(self._version_names()):
+            metadata = _read_json(os.path.join(self.model_dir, name, METADATA_FILE))
+            if metadata is not None:
+                versions.append({**metadata, "active": name == active})
+        return versions
+
+    def activate(self, version: str) -> bool:
+        """
+        Swap a saved version into the live predictor.
+        
+        Args:
+            version: Name of the version
+        
+        Returns:
+            bool: True if the version exists and was activated, False otherwise
+        """
+        from src.ai.numpy_backend import NumpyMLP
+        from src.ai.feature_scaler import ScalingPipeline
+
+        serving_path = os.path.join(self.model_dir, version, SERVING_FILE)
+        if not os.path.exists(serving_path):
+            return False
+
+        model = NumpyMLP.load(serving_path)
+        scaler = ScalingPipeline.load(ScalingPipeline.path_for(serving_path))
+        with self._lock:
+            current = self.active_version
+            if self.predictor is not None:
+                self.predictor.swap_model(model, scaler)
+            with open(os.path.join(self.model_dir, f"{ACTIVE_FILE}.tmp"), 'w') as f:
+                f.write(version)
+            os.replace(
+                os.path.join(self.model_dir, f"{ACTIVE_FILE}.tmp"),
+                os.path.join(self.model_dir, ACTIVE_FILE)
+            )
+            if current != version:
+                self.previous_version = current
+        return True
+
+    def rollback(self) -> Optional[str]:
+        """
+        Re-activate the version that was active before the last activation.
+        
+        Returns:
+            Optional[str]: Version now active, None if there is nothing to roll back to
+        """
+        version = self.previous_version
+        if version is None or not self.activate(version):
+            return None
+        return version
+
+    def shutdown(self) -> None:
+        """
+        Stop the worker process, cancelling jobs that have not started.
+        """
+        # Cancelled by hand: shutdown(cancel_futures=True) needs Python 3.9
+        with self._lock:
+            futures = list(self._futures.values())
+        for future in futures:
+            future.cancel()
+        self._executor.shutdown(wait=False)
+
+    def _next_version(self) -> str:
+        """
+        Get the name of the next model version.
+        
+        Returns:
+            str: Version name (v0001, v0002, ...)
+        """
+        numbers = [int(name[1:]) for name in self._version_names()]
+        return f"v{max(numbers, default=0) + 1:04d}"
+
+    def _version_names(self) -> List[str]:
+        """
+        Get the names of the version directories.
+        
+        Returns:
+            List[str]: Version names, unordered
+        """
+        return [
+            name for name in os.listdir(self.model_dir)
+            if name.startswith("v") and name[1:].isdigit()
+            and os.path.isdir(os.path.join(self.model_dir, name))
+        ]
+
+    def _finish(self, job_id: str, future: Future) -> None:
+        """
+        Record the outcome of a job and activate its version on success.
+        
+        Args:
+            job_id: ID of the job
+            future: Completed future of the worker call
+        """
+        with self._lock:
+            self._futures.pop(job_id, None)
+        job = self.jobs[job_id]
+        job["finished"] = time.time()
+        error = future.exception() if not future.cancelled() else RuntimeError("Job cancelled")
+        if error is not None:
+            job["status"] = "failed"
+            job["error"] = str(error)
+            return
+
+        if job["activate"] and not self.activate(job["version"]):
+            job["status"] = "failed"
+            job["error"] = "Trained model could not be activated"
+            return
+        job["status"] = "completed"
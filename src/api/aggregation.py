@@ -0,0 +1,118 @@
+from typing import Dict, Optional, Sequence, Tuple
+import numpy as np
+
+QUANTILES = (0.0, 0.25, 0.5, 0.75, 0.9, 0.99, 1.0)
+
+def aggregate_columns(
+    values: np.ndarray,
+    groups: Sequence[str],
+    metrics: Tuple[str, ...],
+    bins: int = 20,
+    quantiles: Tuple[float, ...] = QUANTILES
+) -> Dict:
+    """
+    Summarize metric columns, overall and per group.
+    
+    Histograms of one metric share their bin edges across groups, so the
+    groups can be drawn on the same axis. Missing values are ignored.
+    
+    Args:
+        values: Metric values with shape (records, metrics), NaN if missing
+        groups: Group name per record
+        metrics: Metric name per column
+        bins: Histogram bins per metric
+        quantiles: Quantiles to report, in [0, 1]
+    
+    Returns:
+        Dict: "count", "quantiles" and "groups"; each group (and "all") maps
+              every metric to count, mean, quantile values and a histogram
+    """
+    group_names, codes = np.unique(np.array(groups, dtype=str), return_inverse=True)
+    codes = codes.reshape(-1)
+
+    histograms = [
+        _histogram(values[:, column], codes, len(group_names), bins)
+        for column in range(len(metrics))
+    ]
+    groups = {"all": np.ones(len(values), dtype=bool)}
+    groups.update({name: codes == i for i, name in enumerate(group_names)})
+
+    summary = {}
+    for group_index, (group, mask) in enumerate(groups.items()):
+        group_values = values[mask]
+        summary[group] = {
+            "count": int(mask.sum()),
+            "metrics": {
+                metric: _summarize(
+                    group_values[:, column],
+                    quantiles,
+                    histograms[column],
+                    None if group == "all" else group_index - 1
+                )
+                for column, metric in enumerate(metrics)
+            }
+        }
+
+    return {"count": len(values), "quantiles": list(quantiles), "groups": summary}
+
+def _histogram(
+    values: np.ndarray,
+    codes: np.ndarray,
+    group_count: int,
+    bins: int
+) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+    """
+    Count values per bin and group in one pass.
+    
+    Args:
+        values: One metric for all records
+        codes: Group index per record
+        group_count: Number of groups
+        bins: Number of bins
+    
+    Returns:
+        Optional[Tuple[np.ndarray, np.ndarray]]: (Bin edges, counts with shape
+            (groups, bins)), None if no value is present
+    """
+    present = ~np.isnan(values)
+    if not present.any():
+        return None
+    low, high = values[present].min(), values[present].max()
+    if low == high:
+        low, high = low - 0.5, high + 0.5
+    edges = np.linspace(low, high, bins + 1)
+    # The last bin is closed on the right, as in np.histogram
+    bin_index = np.minimum(((values[present] - low) / (high - low) * bins).astype(np.int64), bins - 1)
+    counts = np.bincount(codes[present] * bins + bin_index, minlength=group_count * bins)
+    return edges, counts.reshape(group_count, bins)
+
+def _summarize(
+    values: np.ndarray,
+    quantiles: Tuple[float, ...],
+    histogram: Optional[Tuple[np.ndarray, np.ndarray]],
+    group_index: Optional[int]
+) -> Dict:
+    """
+    Summarize one metric of one group.
+    
+    Args:
+        values: Metric values of the group
+        quantiles: Quantiles to report
+        histogram: Shared edges and per-group counts of the metric
+        group_index: Row of the group in the counts, None for all groups
+    
+    Returns:
+        Dict: Count, mean, quantile values and histogram
+    """
+    values = values[~np.isnan(values)]
+    if len(values) == 0:
+        return {"count": 0, "mean": None, "quantiles": None, "histogram": None}
+
+    edges, counts = histogram
+    group_counts = counts.sum(axis=0) if group_index is None else counts[group_index]
+    return {
+        "count": int(len(values)),
+        "mean": float(values.mean()),
+        "quantiles": np.quantile(values, quantiles).tolist(),
+        "histogram": {"edges": edges.tolist(), "counts": group_counts.tolist()}
+    }
@@ -0,0 +1,548 @@
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+import argparse
+import asyncio
+import json
+import logging
+import math
+import os
+import platform
+import random
+import httpx
+
+OPERATIONS = ("create_slice", "list_slices", "get_slice", "create_vnf")
+DEFAULT_MIX = {"create_slice": 0.2, "list_slices": 0.3, "get_slice": 0.4, "create_vnf": 0.1}
+
+# Request bodies cycled through by create_slice, as in slices.templates
+SLICE_TEMPLATES = [
+    {
+        "qos_requirements": {"latency_ms": 20.0, "bandwidth_mbps": 1000.0, "reliability": 99.9, "isolation_level": "shared"},
+        "service_type": "eMBB"
+    },
+    {
+        "qos_requirements": {"latency_ms": 1.0, "bandwidth_mbps": 100.0, "reliability": 99.999, "isolation_level": "isolated"},
+        "service_type": "URLLC"
+    },
+    {
+        "qos_requirements": {"latency_ms": 100.0, "bandwidth_mbps": 10.0, "reliability": 99.0, "isolation_level": "shared"},
+        "service_type": "mMTC"
+    }
+]
+VNF_TYPES = ("firewall", "load-balancer")
+
+class LatencyHistogram:
+    def __init__(self, lowest: float = 1e-5, highest: float = 120.0, growth: float = 1.05):
+        self.lowest = lowest  # Seconds, upper edge of the first bucket
+        self.growth = growth  # Ratio between consecutive bucket edges (5 % relative error)
+        self.counts = [0] * (int(math.log(highest / lowest) / math.log(growth)) + 2)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, seconds: float) -> None:
+        """
+        Add one latency sample.
+        
+        Args:
+            seconds: Latency in seconds
+        """
+        index = 0 if seconds <= self.lowest else int(math.log(seconds / self.lowest) / math.log(self.growth)) + 1
+        self.counts[min(index, len(self.counts) - 1)] += 1
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+    def percentile(self, q: float) -> Optional[float]:
+        """
+        Get a latency percentile.
+        
+        Args:
+            q: Percentile in [0, 100]
+        
+        Returns:
+            Optional[float]: Upper edge of the bucket holding the percentile in
+                             seconds, capped at the largest sample; None if empty
+        """
+        if not self.count:
+            return None
+        rank = max(math.ceil(q / 100.0 * self.count), 1)
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank:
+                return min(self.lowest * self.growth ** index, self.max)
+        return self.max
+
+    def to_dict(self, buckets: bool = True) -> Dict:
+        """
+        Summarize the histogram in milliseconds.
+        
+        Args:
+            buckets: Include the non-empty buckets as [upper edge, count] pairs
+        
+        Returns:
+            Dict: Count, mean, percentiles and max
+        """
+        summary = {
+            "count": self.count,
+            "mean_ms": 1000.0 * self.total / self.count if self.count else None,
+            **{
+                f"p{str(q).replace('.', '_')}_ms": None if self.count == 0 else 1000.0 * self.percentile(q)
+                for q in (50, 90, 99, 99.9)
+            },
+            "max_ms": 1000.0 * self.max if self.count else None
+        }
+        if buckets:
+            summary["buckets"] = [
+                [1000.0 * self.lowest * self.growth ** index, count]
+                for index, count in enumerate(self.counts) if count
+            ]
+        return summary
+
+class RunStats:
+    def __init__(self, started: float, warmup: float, interval: float):
+        self.started = started  # Loop time the run started
+        self.warmup = warmup  # Seconds of results to discard
+        self.interval = interval  # Seconds per timeline window
+        self.latency = LatencyHistogram()
+        self.operations = {operation: LatencyHistogram() for operation in OPERATIONS}
+        self.errors: Dict[str, int] = {}  # Error kind -> count
+        self.timeline: List[Dict] = []
+        self.last_finish = started + warmup
+
+    def record(self, operation: str, latency: float, finished: float, error: Optional[str]) -> None:
+        """
+        Add the outcome of one request, unless it finished during the warm-up.
+        
+        Args:
+            operation: Operation of the request
+            latency: Seconds from the intended start to the response
+            finished: Loop time of the response
+            error: Error kind, None on success
+        """
+        elapsed = finished - self.started - self.warmup
+        if elapsed < 0:
+            return
+        self.last_finish = max(self.last_finish, finished)
+
+        window = int(elapsed / self.interval)
+        while len(self.timeline) <= window:
+            self.timeline.append({"requests": 0, "errors": 0, "latency": LatencyHistogram()})
+        self.timeline[window]["requests"] += 1
+        if error is not None:
+            self.errors[error] = self.errors.get(error, 0) + 1
+            self.timeline[window]["errors"] += 1
+            return
+        self.latency.record(latency)
+        self.operations[operation].record(latency)
+        self.timeline[window]["latency"].record(latency)
+
+    def summary(self, duration: float) -> Dict:
+        """
+        Summarize the run.
+        
+        Args:
+            duration: Seconds requests were issued after the warm-up
+        
+        Returns:
+            Dict: Totals, throughput, latency per operation and the timeline
+        """
+        measured = max(self.last_finish - self.started - self.warmup, duration)
+        requests = sum(window["requests"] for window in self.timeline)
+        errors = sum(self.errors.values())
+        return {
+            "duration": measured,
+            "requests": requests,
+            "errors": errors,
+            "errors_by_kind": dict(self.errors),
+            "throughput": (requests - errors) / measured,
+            "latency": self.latency.to_dict(),
+            "operations": {
+                operation: histogram.to_dict(buckets=False)
+                for operation, histogram in self.operations.items() if histogram.count
+            },
+            "timeline": [
+                {
+                    "t": index * self.interval,
+                    "requests": window["requests"],
+                    "errors": window["errors"],
+                    "p50_ms": _milliseconds(window["latency"].percentile(50)),
+                    "p99_ms": _milliseconds(window["latency"].percentile(99))
+                }
+                for index, window in enumerate(self.timeline)
+            ]
+        }
+
+class LoadGenerator:
+    def __init__(
+        self,
+        client: httpx.AsyncClient,
+        mix: Optional[Dict[str, float]] = None,
+        list_limit: int = 100,
+        interval: float = 1.0,
+        seed: int = 0
+    ):
+        mix = mix or DEFAULT_MIX
+        unknown = set(mix) - set(OPERATIONS)
+        if unknown:
+            raise ValueError(f"Unknown operations: {sorted(unknown)}")
+        self.client = client
+        self.operations = list(mix)
+        self.weights = [mix[operation] for operation in self.operations]  # Share of requests per operation
+        self.list_limit = list_limit  # Page size of list_slices
+        self.interval = interval  # Seconds per timeline window
+        self.random = random.Random(seed)
+        self.slice_ids: List[str] = []  # Slices created so far, targets of get_slice
+        self._names = 0
+
+    async def prepare(self, initial_slices: int) -> None:
+        """
+        Create slices before the run, so get_slice and list_slices have data.
+        
+        Args:
+            initial_slices: Number of slices to create
+        """
+        for _ in range(initial_slices):
+            await self.request("create_slice")
+
+    async def request(self, operation: str) -> Optional[str]:
+        """
+        Send one request of an operation.
+        
+        Args:
+            operation: One of OPERATIONS
+        
+        Returns:
+            Optional[str]: Error kind ("HTTP 500", "ReadTimeout", ...), None on success
+        """
+        self._names += 1
+        try:
+            if operation == "create_slice" or (operation == "get_slice" and not self.slice_ids):
+                body = {"name": f"load-slice-{self._names}", **self.random.choice(SLICE_TEMPLATES)}
+                response = await self.client.post("/api/v1/slices", json=body)
+                if response.status_code == 200:
+                    self.slice_ids.append(response.json()["slice_id"])
+            elif operation == "list_slices":
+                response = await self.client.get("/api/v1/slices", params={"limit": self.list_limit})
+            elif operation == "get_slice":
+                response = await self.client.get(f"/api/v1/slices/{self.random.choice(self.slice_ids)}")
+            else:
+                body = {
+                    "vnf_type": self.random.choice(VNF_TYPES),
+                    "instance_name": f"load-vnf-{self._names}",
+                    "config": {}
+                }
+                response = await self.client.post("/api/v1/vnf/instances", json=body)
+        except httpx.HTTPError as e:
+            return type(e).__name__
+        return None if response.status_code < 400 else f"HTTP {response.status_code}"
+
+    async def run_open(
+        self,
+        rate: float,
+        duration: float,
+        warmup: float = 0.0,
+        max_in_flight: int = 1000,
+        poisson: bool = True
+    ) -> Dict:
+        """
+        Start requests at a target rate, whether or not earlier ones finished.
+        
+        Latency counts from the time a request was due, so queueing in the
+        generator while the API falls behind is part of it.
+        
+        Args:
+            rate: Requests per second
+            duration: Seconds to measure, after the warm-up
+            warmup: Seconds to run before measuring
+            max_in_flight: Outstanding requests at which new ones are dropped
+            poisson: Exponential gaps between requests instead of even spacing
+        
+        Returns:
+            Dict: Run summary (see RunStats.summary) with the dropped count
+        """
+        loop = asyncio.get_running_loop()
+        stats = RunStats(loop.time(), warmup, self.interval)
+        end = stats.started + warmup + duration
+        in_flight = set()
+        dropped = 0
+
+        due = stats.started
+        while due < end:
+            delay = due - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            if len(in_flight) >= max_in_flight:
+                dropped += due >= stats.started + warmup
+            else:
+                task = loop.create_task(self._timed(self._pick(), due, stats))
+                in_flight.add(task)
+                task.add_done_callback(in_flight.discard)
+            due += self.random.expovariate(rate) if poisson else 1.0 / rate
+        if in_flight:
+            await asyncio.gather(*in_flight)
+
+        return {"rate": rate, **stats.summary(duration), "dropped": dropped}
+
+    async def run_closed(
+        self,
+        concurrency: int,
+        duration: float,
+        warmup: float = 0.0,
+        think_time: float = 0.0
+    ) -> Dict:
+        """
+        Keep a fixed number of clients busy, each sending its next request
+        when the previous one returns.
+        
+        Args:
+            concurrency: Number of concurrent clients
+            duration: Seconds to measure, after the warm-up
+            warmup: Seconds to run before measuring
+            think_time: Seconds each client waits between requests
+        
+        Returns:
+            Dict: Run summary (see RunStats.summary)
+        """
+        loop = asyncio.get_running_loop()
+        stats = RunStats(loop.time(), warmup, self.interval)
+        end = stats.started + warmup + duration
+
+        async def client() -> None:
+            while loop.time() < end:
+                await self._timed(self._pick(), loop.time(), stats)
+                if think_time:
+                    await asyncio.sleep(think_time)
+
+        await asyncio.gather(*(client() for _ in range(concurrency)))
+        return {"concurrency": concurrency, **stats.summary(duration)}
+
+    def _pick(self) -> str:
+        """Draw the next operation from the mix."""
+        return self.random.choices(self.operations, self.weights)[0]
+
+    async def _timed(self, operation: str, due: float, stats: RunStats) -> None:
+        """Send a request and record its latency from the time it was due."""
+        error = await self.request(operation)
+        finished = asyncio.get_running_loop().time()
+        stats.record(operation, finished - due, finished, error)
+
+def find_saturation(steps: List[Dict], key: str, slo_p99_ms: float, min_gain: float = 0.05) -> Optional[Dict]:
+    """
+    Find the first load level the API could not keep up with.
+    
+    An open-loop step saturates when its throughput falls short of the
+    target rate by more than min_gain; a closed-loop step when it adds less
+    than min_gain throughput over the previous step. Either saturates when
+    its p99 latency exceeds the SLO or requests fail.
+    
+    Args:
+        steps: Run summaries in order of increasing load
+        key: "rate" or "concurrency"
+        slo_p99_ms: Highest acceptable p99 latency
+        min_gain: Relative throughput shortfall or gain threshold
+    
+    Returns:
+        Optional[Dict]: Saturated level, reason and the last good level; None
+                        if no step saturated
+    """
+    previous = None
+    for step in steps:
+        p99 = step["latency"]["p99_ms"]
+        reason = None
+        if step["errors"] or step.get("dropped"):
+            reason = "errors"
+        elif p99 is not None and p99 > slo_p99_ms:
+            reason = "latency"
+        elif key == "rate" and step["throughput"] < (1.0 - min_gain) * step["rate"]:
+            reason = "throughput"
+        elif key == "concurrency" and previous is not None and step["throughput"] < (1.0 + min_gain) * previous["throughput"]:
+            reason = "throughput"
+        if reason is not None:
+            return {
+                key: step[key],
+                "reason": reason,
+                "last_good": None if previous is None else {key: previous[key], "throughput": previous["throughput"]}
+            }
+        previous = step
+    return None
+
+@asynccontextmanager
+async def open_client(url: Optional[str], timeout: float, max_connections: int) -> AsyncIterator[httpx.AsyncClient]:
+    """
+    Open an HTTP client to a running API, or to the app in this process.
+    
+    Args:
+        url: Base URL of a running API (e.g. http://127.0.0.1:8000); the
+             FastAPI app is served in-process over ASGI if None
+        timeout: Request timeout in seconds
+        max_connections: Connection pool size for a running API
+    
+    Yields:
+        httpx.AsyncClient: Client with the API as base URL
+    """
+    if url:
+        limits = httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections)
+        async with httpx.AsyncClient(base_url=url, timeout=timeout, limits=limits) as client:
+            yield client
+        return
+
+    from src.api.main import app
+
+    # Run the startup and shutdown handlers as a server would
+    async with app.router.lifespan_context(app):
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://api", timeout=timeout) as client:
+            yield client
+
+async def run_load_test(
+    url: Optional[str] = None,
+    mode: str = "open",
+    levels: Tuple[float, ...] = (50, 100, 200, 400),
+    duration: float = 10.0,
+    warmup: float = 2.0,
+    mix: Optional[Dict[str, float]] = None,
+    initial_slices: int = 100,
+    list_limit: int = 100,
+    max_in_flight: int = 1000,
+    think_time: float = 0.0,
+    timeout: float = 10.0,
+    interval: float = 1.0,
+    slo_p99_ms: float = 100.0,
+    seed: int = 0
+) -> Dict:
+    """
+    Step through load levels and report each step and the saturation point.
+    
+    Args:
+        url: Base URL of a running API, in-process if None
+        mode: "open" (levels are request rates) or "closed" (levels are
+              concurrent clients)
+        levels: Load levels, in increasing order
+        duration: Measured seconds per level
+        warmup: Unmeasured seconds before each level
+        mix: Share of requests per operation, DEFAULT_MIX if None
+        initial_slices: Slices created before the first level
+        list_limit: Page size of list_slices
+        max_in_flight: Open loop: outstanding requests at which new ones are dropped
+        think_time: Closed loop: seconds between a client's requests
+        timeout: Request timeout in seconds
+        interval: Seconds per timeline window
+        slo_p99_ms: p99 latency above which a level counts as saturated
+        seed: Seed of the operation mix and arrival times
+    
+    Returns:
+        Dict: Settings, environment, per-level results and saturation point
+    """
+    if mode not in ("open", "closed"):
+        raise ValueError(f"Unknown mode: {mode}")
+    key = "rate" if mode == "open" else "concurrency"
+
+    steps = []
+    async with open_client(url, timeout, max_connections=int(max(levels)) if mode == "closed" else max_in_flight) as client:
+        generator = LoadGenerator(client, mix, list_limit=list_limit, interval=interval, seed=seed)
+        await generator.prepare(initial_slices)
+        for level in levels:
+            if mode == "open":
+                steps.append(await generator.run_open(level, duration, warmup, max_in_flight))
+            else:
+                steps.append(await generator.run_closed(int(level), duration, warmup, think_time))
+
+    return {
+        "target": url or "in-process",
+        "mode": mode,
+        "mix": mix or DEFAULT_MIX,
+        "settings": {
+            "duration": duration,
+            "warmup": warmup,
+            "initial_slices": initial_slices,
+            "list_limit": list_limit,
+            "slo_p99_ms": slo_p99_ms,
+            "seed": seed
+        },
+        "environment": {
+            "python": platform.python_version(),
+            "httpx": httpx.__version__,
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count()
+        },
+        "steps": steps,
+        "max_throughput": max(step["throughput"] for step in steps),
+        "saturation": find_saturation(steps, key, slo_p99_ms)
+    }
+
+def _milliseconds(seconds: Optional[float]) -> Optional[float]:
+    """Convert seconds to milliseconds, keeping None."""
+    return None if seconds is None else 1000.0 * seconds
+
+def parse_mix(value: str) -> Dict[str, float]:
+    """
+    Parse an operation mix such as "create_slice=0.2,get_slice=0.8".
+    
+    Args:
+        value: Comma-separated operation=weight pairs
+    
+    Returns:
+        Dict[str, float]: Weight per operation
+    """
+    mix = {}
+    for pair in value.split(","):
+        operation, _, weight = pair.partition("=")
+        if operation.strip() not in OPERATIONS:
+            raise argparse.ArgumentTypeError(f"Unknown operation: {operation.strip()}")
+        mix[operation.strip()] = float(weight)
+    return mix
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Load generator for the slicing API "
+                    "(e.g. python -m src.api.loadgen --mode open --levels 100,200,400,800)"
+    )
+    parser.add_argument("--url", type=str, default=None, help="Base URL of a running API; in-process over ASGI if omitted")
+    parser.add_argument("--mode", choices=("open", "closed"), default="open",
+                        help="open: levels are requests/s; closed: levels are concurrent clients")
+    parser.add_argument("--levels", type=lambda v: tuple(float(s) for s in v.split(",")), default=(50, 100, 200, 400))
+    parser.add_argument("--duration", type=float, default=10.0, help="Measured seconds per level")
+    parser.add_argument("--warmup", type=float, default=2.0, help="Unmeasured seconds before each level")
+    parser.add_argument("--mix", type=parse_mix, default=None, help="e.g. create_slice=0.2,list_slices=0.3,get_slice=0.4,create_vnf=0.1")
+    parser.add_argument("--initial-slices", type=int, default=100)
+    parser.add_argument("--list-limit", type=int, default=100)
+    parser.add_argument("--max-in-flight", type=int, default=1000)
+    parser.add_argument("--think-time", type=float, default=0.0)
+    parser.add_argument("--timeout", type=float, default=10.0)
+    parser.add_argument("--interval", type=float, default=1.0, help="Seconds per timeline window")
+    parser.add_argument("--slo-p99-ms", type=float, default=100.0)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--api-log-level", type=str, default="WARNING",
+                        help="Log level of the in-process API; its per-request INFO logs cost throughput")
+    parser.add_argument("--output", type=str, default=None, help="JSON file to write, stdout if omitted")
+    args = parser.parse_args(argv)
+
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    if args.url is None:
+        logging.getLogger("src.api.main").setLevel(args.api_log_level.upper())
+
+    results = asyncio.run(run_load_test(
+        url=args.url,
+        mode=args.mode,
+        levels=args.levels,
+        duration=args.duration,
+        warmup=args.warmup,
+        mix=args.mix,
+        initial_slices=args.initial_slices,
+        list_limit=args.list_limit,
+        max_in_flight=args.max_in_flight,
+        think_time=args.think_time,
+        timeout=args.timeout,
+        interval=args.interval,
+        slo_p99_ms=args.slo_p99_ms,
+        seed=args.seed
+    ))
+    output = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output + "\n")
+    else:
+        print(output)
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,20 @@
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request, Response
+from fastapi.encoders import jsonable_encoder
 from fastapi.middleware.cors import CORSMiddleware
 from typing import Dict, List, Optional
 from pydantic import BaseModel
-import uvicorn
 import uuid
+import hashlib
+import json
 import logging
+import asyncio
+import os
 import sys
+from src.core.config_cache import load_cached_config
+from src.core.network_slice import QoSRequirements as SliceQoSRequirements
+from src.api.aggregation import aggregate_columns
+from src.core.metrics_store import SliceMetricsStore
+from src.core.sla_monitor import SLAMonitor
 
 # Configure logging
 logging.basicConfig(
@@ -33,10 +42,40 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Network state, created on first use (networkx and the NFV modules are slow to
+# import); src.main replaces these with the instances it configured
+sdn_controller = None
+vnf_manager = None
+
+# Serialized full topology of the latest revision; the epoch tells restarts apart
+TOPOLOGY_EPOCH = uuid.uuid4().hex[:8]
+topology_cache = {"version": None, "body": None}
+
 # In-memory storage
 slices = {}
 vnfs = {}
 
+slices_version = 0  # Bumped when slices are added or removed, keys the aggregate cache
+
+# Numeric slice metrics summarized by the aggregate endpoint
+SLICE_METRICS = ("current_latency", "current_bandwidth", "reliability_score", "resource_utilization")
+# Bins -> ((slices_version, slice_metrics.version), summary)
+slice_aggregate_cache: Dict[int, tuple] = {}
+slice_metrics = SliceMetricsStore(SLICE_METRICS)  # Current metrics of all slices, written in batches
+sla_monitor = SLAMonitor(
+    slice_metrics,
+    onset_ticks=int(os.environ.get("NWSLICING_SLA_ONSET_TICKS", 3)),
+    recovery_ticks=int(os.environ.get("NWSLICING_SLA_RECOVERY_TICKS", 3)),
+    # Samples older than this (e.g. backfilled batches) are not evaluated
+    stale_after=float(os.environ.get("NWSLICING_SLA_STALE_AFTER", 60.0))
+)
+
+# Resource prediction, loaded on first use from NWSLICING_MODEL_PATH, else the active
+# version in NWSLICING_MODEL_DIR (untrained model if neither exists)
+prediction_batcher = None
+prediction_batcher_lock: Optional[asyncio.Lock] = None  # Created on the server's event loop at startup
+training_manager = None
+
 # Pydantic models
 class QoSRequirements(BaseModel):
     latency_ms: float
@@ -54,6 +93,102 @@ class VNFConfig(BaseModel):
     instance_name: str
     config: Dict[str, str] = {}
 
+class VNFUsageReport(BaseModel):
+    usage: Dict[str, float]  # e.g. {"cpu": 0.4, "memory": 300.0, "bandwidth": 80.0}
+    timestamp: Optional[float] = None
+
+class PredictionRequest(BaseModel):
+    qos_requirements: QoSRequirements
+    service_type: str
+    current_load: Dict[str, float] = {}
+
+class TrainingSample(BaseModel):
+    qos_requirements: QoSRequirements
+    service_type: str
+    current_load: Dict[str, float] = {}
+    actual_resources: Dict[str, float]
+
+class TrainingRequest(BaseModel):
+    samples: List[TrainingSample] = []
+    # .npy files inside NWSLICING_TRAINING_DATA_DIR, used instead of samples
+    features_path: Optional[str] = None
+    targets_path: Optional[str] = None
+    epochs: int = 100
+    batch_size: int = 32
+    validation_split: float = 0.2
+    from_active: bool = True
+    activate: bool = True
+
+def get_sdn_controller():
+    """Get the SDN controller, creating an empty one on first use."""
+    global sdn_controller
+    if sdn_controller is None:
+        from src.sdn.controller import SDNController
+
+        sdn_controller = SDNController()
+    return sdn_controller
+
+def get_vnf_manager():
+    """Get the VNF manager, creating one without a catalog on first use."""
+    global vnf_manager
+    if vnf_manager is None:
+        from src.nfv.vnf_manager import VNFManager
+
+        vnf_manager = VNFManager()
+    return vnf_manager
+
+async def get_prediction_batcher():
+    """Create the resource predictor, its micro-batcher and the training job manager on first use."""
+    global prediction_batcher, prediction_batcher_lock, training_manager
+    if prediction_batcher_lock is None:
+        # Startup did not run (e.g. the app is driven without lifespan events)
+        prediction_batcher_lock = asyncio.Lock()
+    async with prediction_batcher_lock:
+        if prediction_batcher is None:
+            from src.ai.resource_predictor import ResourcePredictor
+            from src.ai.batcher import PredictionBatcher
+            from src.ai.training_jobs import TrainingJobManager
+
+            training_manager = TrainingJobManager(
+                os.environ.get("NWSLICING_MODEL_DIR", "models"),
+                data_dir=os.environ.get("NWSLICING_TRAINING_DATA_DIR")
+            )
+            model_path = os.environ.get("NWSLICING_MODEL_PATH") or training_manager.active_model_path()
+
+            # Loading may import TensorFlow, keep it off the event loop
+            predictor = await asyncio.get_running_loop().run_in_executor(
+                None, ResourcePredictor, model_path
+            )
+            training_manager.predictor = predictor
+            prediction_batcher = PredictionBatcher(
+                predictor,
+                max_batch_size=int(os.environ.get("NWSLICING_PREDICTION_BATCH_SIZE", 256)),
+                max_wait_ms=float(os.environ.get("NWSLICING_PREDICTION_WAIT_MS", 2.0))
+            )
+            logger.info("Resource predictor loaded")
+    return prediction_batcher
+
+def conditional_json(request: Request, payload) -> Response:
+    """
+    Serialize a payload with an ETag, answering 304 if the client has it.
+    
+    Pollers such as the dashboard send the ETag back in If-None-Match and
+    skip the transfer and their own re-rendering while nothing changed.
+    
+    Args:
+        request: Incoming request
+        payload: JSON-serializable response body
+    
+    Returns:
+        Response: 200 with the body, or 304 Not Modified
+    """
+    body = json.dumps(jsonable_encoder(payload), separators=(",", ":")).encode()
+    etag = f'"{hashlib.sha1(body).hexdigest()}"'
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if etag in request.headers.get("if-none-match", ""):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
 @app.get("/")
 async def root():
     logger.info("Health check request received")
@@ -61,6 +196,7 @@ async def root():
 
 @app.post("/api/v1/slices")
 async def create_slice(request: CreateSliceRequest):
+    global slices_version
     try:
         slice_id = str(uuid.uuid4())
         slices[slice_id] = {
@@ -70,6 +206,9 @@ async def create_slice(request: CreateSliceRequest):
             "service_type": request.service_type,
             "status": "active"
         }
+        slice_metrics.add(slice_id)
+        sla_monitor.add(slice_id, SliceQoSRequirements(**request.qos_requirements.dict()))
+        slices_version += 1
         logger.info(f"Created new slice: {request.name} (ID: {slice_id})")
         return {"slice_id": slice_id}
     except Exception as e:
@@ -77,14 +216,38 @@ async def create_slice(request: CreateSliceRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/api/v1/slices")
-async def list_slices():
+async def list_slices(request: Request, service_type: Optional[str] = None, limit: Optional[int] = None):
     try:
         logger.info("Listing all slices")
-        return {"slices": list(slices.values())}
+        records = list(slices.values())
+        if service_type is not None:
+            records = [record for record in records if record["service_type"] == service_type]
+        if limit is not None:
+            records = records[:max(limit, 0)]
+        metrics = slice_metrics.get_many([record["id"] for record in records])
+        records = [{**record, "performance_metrics": m} for record, m in zip(records, metrics)]
+        return conditional_json(request, {"slices": records, "total": len(slices)})
     except Exception as e:
         logger.error(f"Error listing slices: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.get("/api/v1/slices/aggregate")
+async def aggregate_slices(request: Request, bins: int = 20):
+    try:
+        bins = min(max(bins, 1), 200)
+        # Ingests that rewrite the same values leave the summary cached
+        state = (slices_version, slice_metrics.version)
+        cached = slice_aggregate_cache.get(bins)
+        if cached is None or cached[0] != state:
+            slice_ids, values = slice_metrics.snapshot()
+            groups = [slices[slice_id]["service_type"] for slice_id in slice_ids]
+            cached = (state, aggregate_columns(values, groups, SLICE_METRICS, bins=bins))
+            slice_aggregate_cache[bins] = cached
+        return conditional_json(request, cached[1])
+    except Exception as e:
+        logger.error(f"Error aggregating slices: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
 @app.get("/api/v1/slices/{slice_id}")
 async def get_slice(slice_id: str):
     try:
@@ -92,13 +255,60 @@ async def get_slice(slice_id: str):
             logger.warning(f"Slice not found: {slice_id}")
             raise HTTPException(status_code=404, detail="Slice not found")
         logger.info(f"Retrieved slice: {slice_id}")
-        return slices[slice_id]
+        return {**slices[slice_id], "performance_metrics": slice_metrics.get(slice_id)}
     except HTTPException:
         raise
     except Exception as e:
         logger.error(f"Error retrieving slice: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.post("/api/v1/metrics/slices")
+async def ingest_slice_metrics(request: Request):
+    """
+    Ingest a columnar batch of slice metrics, e.g.
+    {"slice_ids": [...], "metrics": {"current_latency": [...], ...}, "timestamp": 1700000000.0}
+    
+    The body is parsed without a Pydantic model: validating every element
+    of large arrays would cost more than storing them.
+    """
+    try:
+        batch = json.loads(await request.body())
+        if not isinstance(batch, dict):
+            raise HTTPException(status_code=400, detail="The batch must be a JSON object")
+        slice_ids = batch.get("slice_ids")
+        metrics = batch.get("metrics")
+        if not isinstance(slice_ids, list) or not isinstance(metrics, dict):
+            raise HTTPException(status_code=400, detail="slice_ids (list) and metrics (object) are required")
+        try:
+            result = slice_metrics.ingest(slice_ids, metrics, batch.get("timestamp"))
+        except (ValueError, TypeError) as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        return result
+    except HTTPException:
+        raise
+    except json.JSONDecodeError as e:
+        raise HTTPException(status_code=400, detail=f"Invalid JSON: {e}")
+    except Exception as e:
+        logger.error(f"Error ingesting slice metrics: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.get("/api/v1/sla/events")
+async def list_sla_events(since: int = 0, limit: int = 1000, slice_id: Optional[str] = None):
+    try:
+        events = sla_monitor.events_since(since, min(max(limit, 1), 10000), slice_id)
+        return {"events": events, "last_id": events[-1]["id"] if events else since}
+    except Exception as e:
+        logger.error(f"Error listing SLA events: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.get("/api/v1/sla/status")
+async def get_sla_status(limit: int = 100):
+    try:
+        return {**sla_monitor.status(), "violating_slices": sla_monitor.violating_slices()[:max(limit, 0)]}
+    except Exception as e:
+        logger.error(f"Error retrieving SLA status: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
 @app.post("/api/v1/vnf/instances")
 async def create_vnf(config: VNFConfig):
     try:
@@ -117,23 +327,203 @@ async def create_vnf(config: VNFConfig):
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/api/v1/vnf/instances")
-async def list_vnfs():
+async def list_vnfs(request: Request):
     try:
         logger.info("Listing all VNF instances")
-        return {"vnfs": list(vnfs.values())}
+        return conditional_json(request, {"vnfs": list(vnfs.values())})
     except Exception as e:
         logger.error(f"Error listing VNF instances: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.get("/api/v1/vnf/managed")
+async def list_managed_vnfs(request: Request):
+    try:
+        return conditional_json(request, {"vnfs": get_vnf_manager().list_active_vnfs()})
+    except Exception as e:
+        logger.error(f"Error listing managed VNF instances: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.post("/api/v1/vnf/managed/{instance_id}/usage")
+async def report_vnf_usage(instance_id: str, report: VNFUsageReport):
+    try:
+        if not get_vnf_manager().update_resource_usage(instance_id, report.usage, report.timestamp):
+            raise HTTPException(status_code=404, detail="VNF instance not found")
+        return {"instance_id": instance_id, "recorded": True}
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error recording VNF usage: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.get("/api/v1/vnf/managed/{instance_id}/telemetry")
+async def get_vnf_telemetry(instance_id: str, window: float = 60.0, tier: Optional[int] = None):
+    """
+    Get the status and usage aggregates of a VNF instance run by the VNF
+    manager, plus the stored samples of one retention tier if requested.
+    """
+    try:
+        manager = get_vnf_manager()
+        status = manager.get_vnf_status(instance_id, telemetry_window=window)
+        if status is None:
+            raise HTTPException(status_code=404, detail="VNF instance not found")
+        if tier is not None:
+            history = manager.telemetry.history(instance_id, tier)
+            if history is None and not 0 <= tier < len(manager.telemetry.tiers):
+                raise HTTPException(status_code=400, detail=f"Unknown telemetry tier: {tier}")
+            status["history"] = history
+        return status
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error retrieving VNF telemetry: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.post("/api/v1/predictions/resources")
+async def predict_resources(request: PredictionRequest):
+    try:
+        batcher = await get_prediction_batcher()
+        prediction = await batcher.predict(
+            SliceQoSRequirements(**request.qos_requirements.dict()),
+            request.service_type,
+            request.current_load
+        )
+        return {"prediction": prediction}
+    except Exception as e:
+        logger.error(f"Error predicting resources: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.get("/api/v1/metrics/resource-prediction")
+async def get_prediction_metrics(request: Request):
+    if prediction_batcher is None:
+        return conditional_json(request, {})
+    return conditional_json(request, prediction_batcher.predictor.get_prediction_accuracy())
+
+@app.post("/api/v1/models/train")
+async def train_model(request: TrainingRequest):
+    try:
+        await get_prediction_batcher()
+        training_data = None
+        if request.samples:
+            training_data = [
+                (
+                    {
+                        "qos_requirements": SliceQoSRequirements(**sample.qos_requirements.dict()),
+                        "service_type": sample.service_type,
+                        "current_load": sample.current_load
+                    },
+                    sample.actual_resources
+                )
+                for sample in request.samples
+            ]
+        job_id = training_manager.submit(
+            training_data,
+            features_path=request.features_path,
+            targets_path=request.targets_path,
+            from_active=request.from_active,
+            activate=request.activate,
+            epochs=request.epochs,
+            batch_size=request.batch_size,
+            validation_split=request.validation_split
+        )
+        logger.info(f"Started training job: {job_id}")
+        return training_manager.get_job(job_id)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error starting training job: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.get("/api/v1/models/jobs")
+async def list_training_jobs():
+    await get_prediction_batcher()
+    return {"jobs": training_manager.list_jobs()}
+
+@app.get("/api/v1/models/jobs/{job_id}")
+async def get_training_job(job_id: str):
+    await get_prediction_batcher()
+    job = training_manager.get_job(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Training job not found")
+    return job
+
+@app.get("/api/v1/models/versions")
+async def list_model_versions():
+    await get_prediction_batcher()
+    return {"versions": training_manager.list_versions(), "active": training_manager.active_version}
+
+@app.post("/api/v1/models/versions/{version}/activate")
+async def activate_model_version(version: str):
+    try:
+        await get_prediction_batcher()
+        if not training_manager.activate(version):
+            raise HTTPException(status_code=404, detail="Model version not found")
+        logger.info(f"Activated model version: {version}")
+        return {"active": version}
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error activating model version: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.post("/api/v1/models/rollback")
+async def rollback_model():
+    await get_prediction_batcher()
+    version = training_manager.rollback()
+    if version is None:
+        raise HTTPException(status_code=409, detail="No previous model version to roll back to")
+    logger.info(f"Rolled back to model version: {version}")
+    return {"active": version}
+
+@app.get("/api/v1/topology")
+async def get_topology(request: Request, since: Optional[int] = None, epoch: Optional[str] = None):
+    try:
+        controller = get_sdn_controller()
+        version = controller.topology_revision
+        if since is not None and epoch == TOPOLOGY_EPOCH:
+            delta = controller.topology_delta(since)
+            if delta is not None:
+                return {**delta, "epoch": TOPOLOGY_EPOCH, "delta": True}
+
+        etag = f'"topology-{TOPOLOGY_EPOCH}-{version}"'
+        headers = {"ETag": etag, "Cache-Control": "no-cache"}
+        if etag in request.headers.get("if-none-match", ""):
+            return Response(status_code=304, headers=headers)
+        if topology_cache["version"] != version:
+            view = {**controller.serialize_topology(), "epoch": TOPOLOGY_EPOCH, "delta": False}
+            topology_cache["body"] = json.dumps(jsonable_encoder(view), separators=(",", ":")).encode()
+            topology_cache["version"] = version
+        return Response(content=topology_cache["body"], media_type="application/json", headers=headers)
+    except Exception as e:
+        logger.error(f"Error retrieving topology: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
 @app.on_event("startup")
 async def startup_event():
+    global prediction_batcher_lock
     logger.info("Starting Network Slicing API server...")
+    prediction_batcher_lock = asyncio.Lock()
+    controller = get_sdn_controller()
+    if controller.network_topology.number_of_nodes() == 0:
+        # Standalone API server: load the topology from the configuration file
+        config_path = os.environ.get("NWSLICING_CONFIG", "configs/default.yaml")
+        if os.path.exists(config_path):
+            _, topology = load_cached_config(config_path)
+            controller.load_compiled_topology(topology)
+        logger.info(f"Loaded topology: {controller.network_topology.number_of_nodes()} nodes")
+    sla_monitor.start(float(os.environ.get("NWSLICING_SLA_INTERVAL", 1.0)))
 
 @app.on_event("shutdown")
 async def shutdown_event():
     logger.info("Shutting down Network Slicing API server...")
+    sla_monitor.stop()
+    if prediction_batcher is not None:
+        prediction_batcher.stop()
+    if training_manager is not None:
+        training_manager.shutdown()
 
 if __name__ == "__main__":
+    import uvicorn
+
     try:
         uvicorn.run(app, host="0.0.0.0", port=8000)
     except Exception as e:
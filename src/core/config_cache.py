@@ -0,0 +1,153 @@
+from typing import Any, Dict, List, Optional, Tuple
+import glob
+import hashlib
+import marshal
+import os
+import sys
+import yaml
+
+CACHE_FORMAT = 1  # Bump when the cached entry layout changes
+DEFAULT_CACHE_DIR = os.path.join(".cache", "nwslicing")
+
+# libyaml's loader is several times faster; PyYAML without it falls back to pure Python
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Config digest -> marshalled entry, so a process parses each file version once
+_entries: Dict[str, bytes] = {}
+
+def load_yaml(path: str) -> Any:
+    """
+    Parse a YAML file with the fastest safe loader available.
+    
+    Args:
+        path: Path to the YAML file
+    
+    Returns:
+        Any: Parsed document, None if the file is empty
+    """
+    with open(path, 'rb') as f:
+        return yaml.load(f, Loader=YAML_LOADER)
+
+def compile_topology(topology_config: Optional[Dict]) -> Dict[str, List]:
+    """
+    Validate a topology configuration and flatten it for bulk loading.
+    
+    Nodes referenced only by links are added without capacity, as
+    SDNController.add_link does.
+    
+    Args:
+        topology_config: Dictionary with "nodes" (id, capacity) and
+                         "links" (source, target, latency, bandwidth)
+    
+    Returns:
+        Dict[str, List]: "nodes" as [id, capacity] and "links" as
+                         [source, target, latency, bandwidth]
+    
+    Raises:
+        ValueError: If a node or link is malformed
+    """
+    topology_config = topology_config or {}
+    nodes: Dict[str, Dict[str, float]] = {}
+    for node in topology_config.get("nodes") or []:
+        if not isinstance(node, dict) or node.get("id") is None:
+            raise ValueError(f"Topology node without an id: {node!r}")
+        node_id = str(node["id"])
+        if node_id in nodes:
+            raise ValueError(f"Duplicate topology node: {node_id}")
+        try:
+            nodes[node_id] = {
+                resource_type: float(amount)
+                for resource_type, amount in (node.get("capacity") or {}).items()
+            }
+        except (AttributeError, TypeError, ValueError):
+            raise ValueError(f"Invalid capacity for topology node {node_id}: {node.get('capacity')!r}")
+
+    links = []
+    for link in topology_config.get("links") or []:
+        if not isinstance(link, dict) or link.get("source") is None or link.get("target") is None:
+            raise ValueError(f"Topology link without source and target: {link!r}")
+        source, target = str(link["source"]), str(link["target"])
+        try:
+            latency = float(link.get("latency", 0.0))
+            bandwidth = float(link.get("bandwidth", 0.0))
+        except (TypeError, ValueError):
+            raise ValueError(f"Invalid latency or bandwidth for link {source}-{target}")
+        if latency < 0 or bandwidth < 0:
+            raise ValueError(f"Negative latency or bandwidth for link {source}-{target}")
+        for node_id in (source, target):
+            nodes.setdefault(node_id, {})
+        links.append([source, target, latency, bandwidth])
+
+    return {"nodes": [[node_id, capacity] for node_id, capacity in nodes.items()], "links": links}
+
+def load_cached_config(config_path: str, cache_dir: Optional[str] = None) -> Tuple[Dict, Dict[str, List]]:
+    """
+    Load a configuration file and its compiled topology, parsing only on change.
+    
+    Entries are keyed on the SHA-256 of the file and stored with marshal,
+    which loads plain dicts and lists far faster than YAML is parsed. An
+    unwritable or corrupt cache only costs the parse.
+    
+    Args:
+        config_path: Path to the YAML configuration
+        cache_dir: Cache directory, NWSLICING_CACHE_DIR or DEFAULT_CACHE_DIR if None
+    
+    Returns:
+        Tuple[Dict, Dict[str, List]]: (Configuration, topology from
+                                      compile_topology); fresh objects the
+                                      caller may modify
+    
+    Raises:
+        OSError: If the configuration cannot be read
+        yaml.YAMLError: If it is not valid YAML
+        ValueError: If its topology is invalid
+    """
+    with open(config_path, 'rb') as f:
+        content = f.read()
+    digest = hashlib.sha256(content).hexdigest()
+    data = _entries.get(digest)
+    if data is not None:
+        return marshal.loads(data)
+
+    # Entries are named after the file and its path, so edits replace the stale entry of that file only
+    cache_dir = cache_dir or os.environ.get("NWSLICING_CACHE_DIR", DEFAULT_CACHE_DIR)
+    path_digest = hashlib.sha256(os.path.abspath(config_path).encode()).hexdigest()[:8]
+    prefix = f"{os.path.splitext(os.path.basename(config_path))[0]}-{path_digest}"
+    version = f"{CACHE_FORMAT}-py{sys.version_info[0]}{sys.version_info[1]}"  # marshal is version-specific
+    cache_path = os.path.join(cache_dir, f"{prefix}-{digest[:32]}-{version}.bin")
+    try:
+        with open(cache_path, 'rb') as f:
+            data = f.read()
+        entry = marshal.loads(data)
+    except (OSError, EOFError, ValueError, TypeError):
+        config = yaml.load(content, Loader=YAML_LOADER) or {}
+        entry = (config, compile_topology((config.get("simulation") or {}).get("topology")))
+        try:
+            data = marshal.dumps(entry)
+        except ValueError:
+            return entry  # Values marshal cannot store, e.g. YAML timestamps: not cached
+        _write_entry(cache_path, data, os.path.join(glob.escape(cache_dir), f"{glob.escape(prefix)}-*.bin"))
+
+    _entries[digest] = data
+    return entry
+
+def _write_entry(cache_path: str, data: bytes, stale_pattern: str) -> None:
+    """
+    Store a cache entry atomically and drop older entries of the same file.
+    
+    Args:
+        cache_path: Path of the entry
+        data: Marshalled entry
+        stale_pattern: Glob matching older entries of the same configuration
+    """
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        for stale in glob.glob(stale_pattern):
+            if stale != cache_path:
+                os.remove(stale)
+        temporary = f"{cache_path}.{os.getpid()}.tmp"
+        with open(temporary, 'wb') as f:
+            f.write(data)
+        os.replace(temporary, cache_path)
+    except OSError:
+        pass  # Read-only or shared location: parse again next time
@@ -0,0 +1,175 @@
+from typing import Dict, List, Optional, Sequence, Tuple
+import time
+import numpy as np
+
+METRIC_COLUMNS = ("current_latency", "current_bandwidth", "reliability_score", "resource_utilization")
+
+class SliceMetricsStore:
+    def __init__(self, columns: Tuple[str, ...] = METRIC_COLUMNS, initial_capacity: int = 1024):
+        self.columns = columns
+        self.column_index = {column: i for i, column in enumerate(columns)}
+        self.rows: Dict[str, int] = {}  # Slice ID -> row in the value arrays
+        self._free_rows = list(range(initial_capacity - 1, -1, -1))  # Popped lowest first
+
+        # One row per slice, one column per metric
+        self.values = np.zeros((initial_capacity, len(columns)), dtype=np.float64)
+        self.updated = np.full(initial_capacity, np.nan)  # Time of the last update per row
+        self.active = np.zeros(initial_capacity, dtype=bool)  # Rows holding a slice
+        self.stats = {"batches": 0, "points": 0, "unknown": 0}
+        self.version = 0  # Bumped when a slice is added or removed, or a stored value changes
+
+    @property
+    def capacity(self) -> int:
+        """Number of rows allocated, used or not."""
+        return len(self.active)
+
+    def add(self, slice_id: str, metrics: Optional[Dict[str, float]] = None) -> int:
+        """
+        Give a slice a row, with all metrics at 0 unless given.
+        
+        Args:
+            slice_id: ID of the slice
+            metrics: Initial metric values
+        
+        Returns:
+            int: Row of the slice
+        """
+        row = self.rows.get(slice_id)
+        if row is not None:
+            return row
+
+        if not self._free_rows:
+            capacity = self.capacity
+            # Double the arrays; rows keep their indices
+            self.values = np.concatenate([self.values, np.zeros_like(self.values)])
+            self.updated = np.concatenate([self.updated, np.full(capacity, np.nan)])
+            self.active = np.concatenate([self.active, np.zeros(capacity, dtype=bool)])
+            self._free_rows.extend(range(2 * capacity - 1, capacity - 1, -1))
+
+        row = self._free_rows.pop()
+        self.values[row] = 0.0
+        for column, value in (metrics or {}).items():
+            if column in self.column_index:
+                self.values[row, self.column_index[column]] = value
+        self.updated[row] = np.nan
+        self.active[row] = True
+        self.rows[slice_id] = row
+        self.version += 1
+        return row
+
+    def remove(self, slice_id: str) -> bool:
+        """
+        Free the row of a slice.
+        
+        Args:
+            slice_id: ID of the slice
+        
+        Returns:
+            bool: True if the slice was known, False otherwise
+        """
+        row = self.rows.pop(slice_id, None)
+        if row is None:
+            return False
+        self.active[row] = False
+        self._free_rows.append(row)
+        self.version += 1
+        return True
+
+    def ingest(
+        self,
+        slice_ids: Sequence[str],
+        metrics: Dict[str, Sequence[float]],
+        timestamp: Optional[float] = None
+    ) -> Dict[str, int]:
+        """
+        Write one batch of metric values, one column at a time.
+        
+        Looking up the rows is the only per-slice step; each column is then
+        written with a single vectorized assignment. Unknown slice IDs are
+        skipped; if an ID repeats, its last value wins. version is bumped
+        only if a stored value changed.
+        
+        Args:
+            slice_ids: IDs of the slices in the batch
+            metrics: Column name -> one value per slice ID (any subset of columns)
+            timestamp: Time of the measurements, now if None
+        
+        Returns:
+            Dict[str, int]: Number of "accepted" and "unknown" slice IDs
+        
+        Raises:
+            ValueError: If a column is unknown or its length does not match
+        """
+        unknown_columns = set(metrics) - set(self.column_index)
+        if unknown_columns:
+            raise ValueError(f"Unknown metrics: {sorted(unknown_columns)}")
+        arrays = {column: np.asarray(values, dtype=np.float64) for column, values in metrics.items()}
+        for column, values in arrays.items():
+            if values.shape != (len(slice_ids),):
+                raise ValueError(f"{column} has {values.size} values for {len(slice_ids)} slice IDs")
+
+        rows_by_id = self.rows
+        rows = np.fromiter((rows_by_id.get(s, -1) for s in slice_ids), dtype=np.int64, count=len(slice_ids))
+        known = rows >= 0
+        accepted = int(known.sum())
+        if accepted < len(rows):
+            rows = rows[known]
+            arrays = {column: values[known] for column, values in arrays.items()}
+
+        changed = False
+        for column, values in arrays.items():
+            index = self.column_index[column]
+            changed = changed or not np.array_equal(self.values[rows, index], values, equal_nan=True)
+            self.values[rows, index] = values
+        if changed:
+            self.version += 1
+        self.updated[rows] = time.time() if timestamp is None else timestamp
+
+        self.stats["batches"] += 1
+        self.stats["points"] += accepted * len(arrays)
+        self.stats["unknown"] += len(slice_ids) - accepted
+        return {"accepted": accepted, "unknown": len(slice_ids) - accepted}
+
+    def get(self, slice_id: str) -> Optional[Dict[str, float]]:
+        """
+        Get the current metrics of a slice.
+        
+        Args:
+            slice_id: ID of the slice
+        
+        Returns:
+            Optional[Dict[str, float]]: Metric values, None if the slice is unknown
+        """
+        row = self.rows.get(slice_id)
+        if row is None:
+            return None
+        return dict(zip(self.columns, self.values[row].tolist()))
+
+    def get_many(self, slice_ids: Sequence[str]) -> List[Optional[Dict[str, float]]]:
+        """
+        Get the current metrics of many slices with one gather.
+        
+        Args:
+            slice_ids: IDs of the slices
+        
+        Returns:
+            List[Optional[Dict[str, float]]]: Metric values per slice, None for unknown slices
+        """
+        rows = np.fromiter((self.rows.get(s, -1) for s in slice_ids), dtype=np.int64, count=len(slice_ids))
+        values = self.values[rows].tolist()
+        return [
+            dict(zip(self.columns, row_values)) if row >= 0 else None
+            for row, row_values in zip(rows.tolist(), values)
+        ]
+
+    def snapshot(self) -> Tuple[List[str], np.ndarray]:
+        """
+        Get the metrics of all slices as one array.
+        
+        Returns:
+            Tuple[List[str], np.ndarray]: (Slice IDs, copy of their values with
+                                          shape (slices, columns))
+        """
+        slice_ids = list(self.rows)
+        rows = np.fromiter(self.rows.values(), dtype=np.int64, count=len(slice_ids))
+        return slice_ids, self.values[rows]
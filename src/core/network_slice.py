@@ -28,6 +28,7 @@ class NetworkSlice:
         self.service_type = service_type
         self.allocated_resources: Dict[str, float] = {}
         self.virtual_functions: List[str] = []
+        self.service_chain: List[str] = []  # Ordered VNF types traffic traverses
         self.active = False
         self.performance_metrics = {
             "current_latency": 0.0,
@@ -96,6 +97,16 @@ class NetworkSlice:
             return True
         return False
 
+    def set_service_chain(self, chain: List[str]) -> None:
+        """
+        Set the ordered service function chain of the slice.
+        
+        Args:
+            chain: VNF types in the order traffic passes through them
+                   (e.g., ["firewall", "load-balancer"])
+        """
+        self.service_chain = list(chain)
+
     def update_performance_metrics(self, metrics: Dict[str, float]) -> None:
         """
         Update the performance metrics of the slice.
@@ -137,6 +148,7 @@ class NetworkSlice:
             },
             "allocated_resources": self.allocated_resources,
             "virtual_functions": self.virtual_functions,
+            "service_chain": self.service_chain,
             "active": self.active,
             "performance_metrics": self.performance_metrics
         } 
\ No newline at end of file
@@ -0,0 +1,264 @@
+from collections import deque
+from typing import Deque, Dict, List, Optional
+import asyncio
+import bisect
+import itertools
+import time
+import numpy as np
+from src.core.metrics_store import SliceMetricsStore
+from src.core.network_slice import QoSRequirements
+
+# Metric checked per QoS field, as in NetworkSlice.meets_qos_requirements
+SLA_METRICS = ("current_latency", "current_bandwidth", "reliability_score")
+
+class SLAMonitor:
+    def __init__(
+        self,
+        store: SliceMetricsStore,
+        onset_ticks: int = 3,
+        recovery_ticks: int = 3,
+        stale_after: Optional[float] = None,
+        max_events: int = 10000
+    ):
+        self.store = store
+        self.onset_ticks = onset_ticks  # Consecutive breaching samples before a violation starts
+        self.recovery_ticks = recovery_ticks  # Consecutive clean samples before it ends
+        self.stale_after = stale_after  # Seconds after which a sample is too old to evaluate
+        self.columns = [store.column_index[metric] for metric in SLA_METRICS]
+
+        # Per store row: thresholds (NaN = not monitored) and debouncing state
+        capacity = store.capacity
+        self.max_latency = np.full(capacity, np.nan)
+        self.min_bandwidth = np.full(capacity, np.nan)
+        self.min_reliability = np.full(capacity, np.nan)
+        self.monitored = np.zeros(capacity, dtype=bool)
+        self.violating = np.zeros(capacity, dtype=bool)
+        self.breach_streak = np.zeros(capacity, dtype=np.int32)
+        self.clean_streak = np.zeros(capacity, dtype=np.int32)
+        self.evaluated_at = np.full(capacity, np.nan)  # Sample time last evaluated, per row
+        self.slice_ids = np.empty(capacity, dtype=object)  # Row -> slice ID, for events
+
+        self.events: Deque[Dict] = deque(maxlen=max_events)
+        self.event_ids: Deque[int] = deque(maxlen=max_events)  # IDs of the retained events, ascending
+        self._event_ids = itertools.count(1)
+        self.counters = {"ticks": 0, "violations": 0, "recoveries": 0, "last_tick_ms": 0.0}
+        self._task: Optional[asyncio.Task] = None
+
+    def add(self, slice_id: str, qos_requirements: QoSRequirements) -> None:
+        """
+        Start monitoring a slice against its QoS requirements.
+        
+        Args:
+            slice_id: ID of the slice, given a store row if it has none
+            qos_requirements: Thresholds to check
+        """
+        row = self.store.add(slice_id)
+        self._grow()
+        self.max_latency[row] = qos_requirements.latency_ms
+        self.min_bandwidth[row] = qos_requirements.bandwidth_mbps
+        self.min_reliability[row] = qos_requirements.reliability
+        self.monitored[row] = True
+        self.violating[row] = False
+        self.breach_streak[row] = 0
+        self.clean_streak[row] = 0
+        self.evaluated_at[row] = np.nan
+        self.slice_ids[row] = slice_id
+
+    def remove(self, slice_id: str) -> bool:
+        """
+        Stop monitoring a slice.
+        
+        Args:
+            slice_id: ID of the slice
+        
+        Returns:
+            bool: True if the slice was monitored, False otherwise
+        """
+        row = self.store.rows.get(slice_id)
+        if row is None or row >= len(self.monitored) or not self.monitored[row]:
+            return False
+        self.monitored[row] = False
+        self.violating[row] = False
+        return True
+
+    def tick(self, now: Optional[float] = None) -> List[Dict]:
+        """
+        Check every monitored slice once and emit onset and recovery events.
+        
+        All slices are evaluated together: a few array operations over the
+        whole store, whatever the number of slices. Only slices with a
+        sample newer than the one evaluated last are counted, so the onset
+        and recovery streaks count samples rather than ticks. Slices without
+        a new sample, or whose sample is older than stale_after, keep their
+        state.
+        
+        Args:
+            now: Time of the check, now if None
+        
+        Returns:
+            List[Dict]: Events emitted by this tick
+        """
+        started = time.perf_counter()
+        now = time.time() if now is None else now
+        self._grow()
+        values = self.store.values
+        latency, bandwidth, reliability = (values[:, column] for column in self.columns)
+
+        updated = self.store.updated
+        # NaN never compares equal, so a row's first sample counts as new
+        evaluated = self.monitored & self.store.active & ~np.isnan(updated) & (updated != self.evaluated_at)
+        if self.stale_after is not None:
+            evaluated &= updated >= now - self.stale_after
+        self.evaluated_at[evaluated] = updated[evaluated]
+        # NaN thresholds compare False, i.e. never breach
+        breach = evaluated & (
+            (latency > self.max_latency) | (bandwidth < self.min_bandwidth) | (reliability < self.min_reliability)
+        )
+        clean = evaluated & ~breach
+
+        self.breach_streak[breach] += 1
+        self.breach_streak[clean] = 0
+        self.clean_streak[clean] += 1
+        self.clean_streak[breach] = 0
+
+        onset = np.flatnonzero(breach & ~self.violating & (self.breach_streak >= self.onset_ticks))
+        recovery = np.flatnonzero(clean & self.violating & (self.clean_streak >= self.recovery_ticks))
+        self.violating[onset] = True
+        self.violating[recovery] = False
+
+        events = [self._event("violation", row, now) for row in onset.tolist()]
+        events += [self._event("recovery", row, now) for row in recovery.tolist()]
+        self.events.extend(events)
+        self.event_ids.extend(event["id"] for event in events)
+        self.counters["ticks"] += 1
+        self.counters["violations"] += len(onset)
+        self.counters["recoveries"] += len(recovery)
+        self.counters["last_tick_ms"] = 1000.0 * (time.perf_counter() - started)
+        return events
+
+    def events_since(self, after_id: int = 0, limit: int = 1000, slice_id: Optional[str] = None) -> List[Dict]:
+        """
+        Get retained events newer than an event ID, oldest first.
+        
+        The first newer event is found by bisecting the retained event IDs,
+        so a caller polling for recent events does not walk the whole log.
+        
+        Args:
+            after_id: Last event ID the caller has seen
+            limit: Maximum number of events
+            slice_id: Only events of this slice, all slices if None
+        
+        Returns:
+            List[Dict]: Matching events
+        """
+        events = self.events
+        matching = []
+        for index in range(bisect.bisect_right(self.event_ids, after_id), len(events)):
+            event = events[index]
+            if slice_id is None or event["slice_id"] == slice_id:
+                matching.append(event)
+                if len(matching) >= limit:
+                    break
+        return matching
+
+    def status(self) -> Dict:
+        """
+        Get the monitor counters.
+        
+        Returns:
+            Dict: Tick and event counters, monitored and currently violating slices
+        """
+        return {
+            **self.counters,
+            "monitored": int(self.monitored.sum()),
+            "violating": int((self.violating & self.monitored).sum()),
+            "last_event_id": self.events[-1]["id"] if self.events else 0
+        }
+
+    def violating_slices(self) -> List[str]:
+        """
+        Get the slices currently in violation.
+        
+        Returns:
+            List[str]: Slice IDs
+        """
+        return self.slice_ids[np.flatnonzero(self.violating & self.monitored)].tolist()
+
+    async def run(self, interval: float = 1.0) -> None:
+        """
+        Check all slices every interval seconds until cancelled.
+        
+        Args:
+            interval: Seconds between ticks
+        """
+        while True:
+            self.tick()
+            await asyncio.sleep(interval)
+
+    def start(self, interval: float = 1.0) -> asyncio.Task:
+        """
+        Start the monitoring loop as a background task on the running event loop.
+        
+        Args:
+            interval: Seconds between ticks
+        
+        Returns:
+            asyncio.Task: The background task
+        """
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self.run(interval))
+        return self._task
+
+    def stop(self) -> None:
+        """
+        Cancel the background monitoring loop if it is running.
+        """
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    def _event(self, kind: str, row: int, now: float) -> Dict:
+        """
+        Build a violation or recovery event for a store row.
+        
+        Args:
+            kind: "violation" or "recovery"
+            row: Store row of the slice
+            now: Time of the tick
+        
+        Returns:
+            Dict: Event with the metric values and the thresholds they breached
+        """
+        latency, bandwidth, reliability = (float(self.store.values[row, column]) for column in self.columns)
+        breached = []
+        if latency > self.max_latency[row]:
+            breached.append("latency")
+        if bandwidth < self.min_bandwidth[row]:
+            breached.append("bandwidth")
+        if reliability < self.min_reliability[row]:
+            breached.append("reliability")
+        return {
+            "id": next(self._event_ids),
+            "type": kind,
+            "slice_id": self.slice_ids[row],
+            "time": now,
+            "breached": breached,
+            "metrics": dict(zip(SLA_METRICS, (latency, bandwidth, reliability)))
+        }
+
+    def _grow(self) -> None:
+        """
+        Extend the per-row arrays to the store's capacity.
+        """
+        extra = self.store.capacity - len(self.monitored)
+        if extra <= 0:
+            return
+        self.max_latency = np.concatenate([self.max_latency, np.full(extra, np.nan)])
+        self.min_bandwidth = np.concatenate([self.min_bandwidth, np.full(extra, np.nan)])
+        self.min_reliability = np.concatenate([self.min_reliability, np.full(extra, np.nan)])
+        self.monitored = np.concatenate([self.monitored, np.zeros(extra, dtype=bool)])
+        self.violating = np.concatenate([self.violating, np.zeros(extra, dtype=bool)])
+        self.breach_streak = np.concatenate([self.breach_streak, np.zeros(extra, dtype=np.int32)])
+        self.clean_streak = np.concatenate([self.clean_streak, np.zeros(extra, dtype=np.int32)])
+        self.evaluated_at = np.concatenate([self.evaluated_at, np.full(extra, np.nan)])
+        self.slice_ids = np.concatenate([self.slice_ids, np.empty(extra, dtype=object)])
@@ -0,0 +1,536 @@
+from typing import Dict, Hashable, Iterable, List, Optional, Sequence, Tuple
+import asyncio
+import contextlib
+import copy
+import gc
+import itertools
+import json
+import os
+import struct
+import threading
+import time
+import zlib
+import numpy as np
+from src.core.network_slice import NetworkSlice, QoSRequirements
+
+MAGIC = b"NWSNAP01"
+FORMAT_VERSION = 1
+ALIGNMENT = 64  # Byte alignment of every column, so restored arrays are aligned views of the mapping
+HEADER = struct.Struct("<8sQ")  # Magic, length of the JSON index
+
+class _StringTable:
+    def __init__(self):
+        self.ids: Dict[Optional[Hashable], int] = {None: -1}  # Value -> index, in insertion order
+
+    def add_all(self, values: Iterable[Optional[Hashable]]) -> np.ndarray:
+        """Get the indices of many strings as an int32 array, adding new ones; -1 for None."""
+        values = values if isinstance(values, list) else list(values)
+        ids = self.ids
+        for value in dict.fromkeys(values):  # Only distinct values are looped over in Python
+            if value not in ids:
+                ids[value] = len(ids) - 1
+        return np.fromiter(map(ids.__getitem__, values), dtype=np.int32, count=len(values))
+
+    def encode(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Pack the table into byte offsets and one UTF-8 blob.
+        
+        Values that are not strings (e.g. integer node IDs of a topology
+        built with add_node) are stored as str(value), the form
+        compile_topology gives IDs, so they are restored as strings.
+        
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: (Offsets with one entry more than
+                                           strings, bytes)
+        """
+        encoded = [str(value).encode("utf-8") for value in itertools.islice(self.ids, 1, None)]
+        offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+        np.cumsum([len(value) for value in encoded], out=offsets[1:])
+        return offsets, np.frombuffer(b"".join(encoded), dtype=np.uint8)
+
+def _decode_strings(offsets: np.ndarray, data: np.ndarray) -> List[Optional[str]]:
+    """Unpack a string table written by _StringTable.encode, with None last so index -1 maps to it."""
+    blob = data.tobytes()
+    bounds = offsets.tolist()
+    return [blob[start:end].decode("utf-8") for start, end in zip(bounds, bounds[1:])] + [None]
+
+def _dict_matrix(dicts: Sequence[Dict[str, float]]) -> Tuple[List[str], np.ndarray]:
+    """
+    Turn numeric dicts into one matrix, NaN where a dict lacks a key.
+    
+    Args:
+        dicts: Dicts with float values (e.g. resource capacities)
+    
+    Returns:
+        Tuple[List[str], np.ndarray]: (Keys, matrix with shape (dicts, keys))
+    """
+    keys = sorted(set().union(*dicts))
+    matrix = np.empty((len(dicts), len(keys)))
+    for column, key in enumerate(keys):
+        matrix[:, column] = [d.get(key, np.nan) for d in dicts]
+    return keys, matrix
+
+def _matrix_dicts(keys: List[str], matrix: np.ndarray) -> List[Dict[str, float]]:
+    """Turn a matrix from _dict_matrix back into dicts."""
+    if not np.isnan(matrix).any():
+        return [dict(zip(keys, row)) for row in matrix.tolist()]
+    return [
+        {key: value for key, value in zip(keys, row) if value == value}  # NaN marks a missing key
+        for row in matrix.tolist()
+    ]
+
+def _ragged_strings(strings: _StringTable, lists: Sequence[Sequence[str]]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Flatten string lists of varying length into offsets and string indices (CSR layout).
+    
+    Args:
+        strings: String table to add the strings to
+        lists: One list per row
+    
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: (Offsets with one entry more than rows, values)
+    """
+    offsets = np.zeros(len(lists) + 1, dtype=np.int64)
+    np.cumsum([len(values) for values in lists], out=offsets[1:])
+    return offsets, strings.add_all(itertools.chain.from_iterable(lists))
+
+def _unragged(offsets: np.ndarray, flat: list) -> List[list]:
+    """Split flattened values back into one list per row."""
+    bounds = offsets.tolist()
+    return [flat[start:end] for start, end in zip(bounds, bounds[1:])]
+
+@contextlib.contextmanager
+def _gc_paused():
+    """Pause the cyclic garbage collector, which rescans the heap as capture and restore allocate."""
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+@_gc_paused()
+def capture_state(sdn_controller, vnf_manager) -> Tuple[Dict, Dict[str, np.ndarray]]:
+    """
+    Copy the state of the controller and the VNF manager into columns.
+    
+    Run this on the thread that mutates them (the event loop): the copy is
+    the consistent view that is written out later, while they keep changing.
+    Caches, the topology change log, telemetry history and warm pool
+    instances are not captured; they are rebuilt or refilled.
+    
+    Args:
+        sdn_controller: SDNController to capture
+        vnf_manager: VNFManager to capture
+    
+    Returns:
+        Tuple[Dict, Dict[str, np.ndarray]]: (JSON metadata, named columns)
+    """
+    strings = _StringTable()
+    columns: Dict[str, np.ndarray] = {}
+    keys: Dict[str, List[str]] = {}
+
+    # Topology
+    graph = sdn_controller.network_topology
+    nodes = list(graph.nodes(data=True))
+    columns["node.id"] = strings.add_all(node_id for node_id, _ in nodes)
+    keys["node.capacity"], columns["node.capacity"] = _dict_matrix([a.get("capacity", {}) for _, a in nodes])
+    keys["node.available"], columns["node.available"] = _dict_matrix([a.get("available", {}) for _, a in nodes])
+    edges = list(graph.edges(data=True))
+    columns["link.endpoints"] = strings.add_all(node_id for u, v, _ in edges for node_id in (u, v)).reshape(-1, 2)
+    columns["link.values"] = np.array(
+        [[a.get("latency", 0.0), a.get("bandwidth", 0.0), a.get("load", 0.0)] for _, _, a in edges],
+        dtype=np.float64
+    ).reshape(-1, 3)
+
+    # Slices
+    slices = list(sdn_controller.active_slices.values())
+    slice_ids = [s.slice_id for s in slices]
+    columns["slice.id"] = strings.add_all(slice_ids)
+    columns["slice.name"] = strings.add_all(s.name for s in slices)
+    columns["slice.service_type"] = strings.add_all(s.service_type for s in slices)
+    columns["slice.isolation_level"] = strings.add_all(s.qos_requirements.isolation_level for s in slices)
+    columns["slice.qos"] = np.array(
+        [[s.qos_requirements.latency_ms, s.qos_requirements.bandwidth_mbps, s.qos_requirements.reliability] for s in slices],
+        dtype=np.float64
+    ).reshape(-1, 3)
+    columns["slice.active"] = np.array([s.active for s in slices], dtype=np.uint8)
+    keys["slice.allocated"], columns["slice.allocated"] = _dict_matrix([s.allocated_resources for s in slices])
+    keys["slice.metrics"], columns["slice.metrics"] = _dict_matrix([s.performance_metrics for s in slices])
+    keys["slice.reservation"], columns["slice.reservation"] = _dict_matrix(
+        [sdn_controller.reservations.get(slice_id, {}) for slice_id in slice_ids]
+    )
+    columns["slice.has_reservation"] = np.array([s in sdn_controller.reservations for s in slice_ids], dtype=np.uint8)
+    for name, lists in (
+        ("slice.chain", [s.service_chain for s in slices]),
+        ("slice.vnfs", [s.virtual_functions for s in slices]),
+        ("slice.path", [sdn_controller.slice_paths.get(slice_id, []) for slice_id in slice_ids])
+    ):
+        columns[f"{name}.offsets"], columns[f"{name}.values"] = _ragged_strings(strings, lists)
+    columns["slice.has_path"] = np.array([s in sdn_controller.slice_paths for s in slice_ids], dtype=np.uint8)
+    slice_links = [sdn_controller.slice_links.get(slice_id) for slice_id in slice_ids]
+    # Links as flattened (source, target) pairs, one pair per two values
+    offsets, values = _ragged_strings(
+        strings, [list(itertools.chain.from_iterable(entry[0])) if entry else [] for entry in slice_links]
+    )
+    columns["slice.links.offsets"], columns["slice.links.values"] = offsets // 2, values.reshape(-1, 2)
+    columns["slice.link_bandwidth"] = np.array(
+        [entry[1] if entry else np.nan for entry in slice_links], dtype=np.float64
+    )
+
+    # Node resources per slice and node
+    allocations = [
+        (slice_id, node_id, amounts)
+        for slice_id, per_node in sdn_controller.resource_allocation.items()
+        for node_id, amounts in per_node.items()
+    ]
+    columns["allocation.slice"] = strings.add_all(slice_id for slice_id, _, _ in allocations)
+    columns["allocation.node"] = strings.add_all(node_id for _, node_id, _ in allocations)
+    keys["allocation.amounts"], columns["allocation.amounts"] = _dict_matrix([a for _, _, a in allocations])
+
+    # VNF instances
+    vnfs = list(vnf_manager.active_vnfs.items())
+    columns["vnf.id"] = strings.add_all(instance_id for instance_id, _ in vnfs)
+    for field in ("type", "name", "network", "status"):
+        columns[f"vnf.{field}"] = strings.add_all(vnf.get(field) for _, vnf in vnfs)
+    columns["vnf.start_time"] = np.array([vnf.get("start_time", 0.0) for _, vnf in vnfs], dtype=np.float64)
+    keys["vnf.usage"], columns["vnf.usage"] = _dict_matrix([vnf.get("resource_usage", {}) for _, vnf in vnfs])
+    columns["vnf.usage_reported"] = np.array([vnf.get("usage_reported", False) for _, vnf in vnfs], dtype=np.uint8)
+
+    columns["strings.offsets"], columns["strings.data"] = strings.encode()
+    meta = {
+        "format_version": FORMAT_VERSION,
+        "created": time.time(),
+        "keys": keys,
+        "available_resources": dict(sdn_controller.available_resources),
+        "topology_version": sdn_controller.topology_version,
+        "topology_revision": sdn_controller.topology_revision,
+        # A copy, as the write may run on another thread while the catalog changes
+        "vnf_catalog": copy.deepcopy(vnf_manager.vnf_catalog)
+    }
+    return meta, columns
+
+def write_snapshot(path: str, meta: Dict, columns: Dict[str, np.ndarray]) -> int:
+    """
+    Write captured state to a snapshot file, atomically.
+    
+    Layout: magic and index length, the JSON index (metadata plus dtype,
+    shape and offset of every column), then the raw columns, each aligned
+    to ALIGNMENT bytes from the start of the file.
+    
+    Args:
+        path: Destination path
+        meta: Metadata from capture_state
+        columns: Columns from capture_state
+    
+    Returns:
+        int: Size of the snapshot in bytes
+    """
+    layout = {}
+    offset = 0
+    checksum = 0
+    for name, array in columns.items():
+        array = np.ascontiguousarray(array)
+        columns[name] = array
+        layout[name] = {"dtype": array.dtype.str, "shape": list(array.shape), "offset": offset}
+        offset += -(-array.nbytes // ALIGNMENT) * ALIGNMENT
+        checksum = zlib.crc32(array.data, checksum)
+
+    index = json.dumps({**meta, "columns": layout, "crc32": checksum}, separators=(",", ":")).encode()
+    data_start = -(-(HEADER.size + len(index)) // ALIGNMENT) * ALIGNMENT
+
+    temporary = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"  # Concurrent writers never share a file
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(temporary, "wb") as f:
+        f.write(HEADER.pack(MAGIC, len(index)))
+        f.write(index)
+        f.write(b"\0" * (data_start - HEADER.size - len(index)))
+        for name, array in columns.items():
+            f.write(array.data)
+            f.write(b"\0" * (-array.nbytes % ALIGNMENT))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temporary, path)
+    return data_start + offset
+
+def read_snapshot(path: str, verify: bool = True) -> Tuple[Dict, Dict[str, np.ndarray]]:
+    """
+    Map a snapshot file into memory without reading it.
+    
+    Args:
+        path: Path to the snapshot
+        verify: Check the columns against the stored CRC32
+    
+    Returns:
+        Tuple[Dict, Dict[str, np.ndarray]]: (Metadata, read-only column views
+                                            of the mapped file)
+    
+    Raises:
+        ValueError: If the file is not a snapshot, has an unsupported
+                    version or fails the checksum
+    """
+    with open(path, "rb") as f:
+        magic, index_length = HEADER.unpack(f.read(HEADER.size))
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a controller snapshot")
+        meta = json.loads(f.read(index_length))
+    if meta.get("format_version") != FORMAT_VERSION:
+        raise ValueError(f"Unsupported snapshot version: {meta.get('format_version')}")
+
+    data_start = -(-(HEADER.size + index_length) // ALIGNMENT) * ALIGNMENT
+    mapped = np.memmap(path, dtype=np.uint8, mode="r")
+    columns = {}
+    checksum = 0
+    for name, spec in meta.pop("columns").items():
+        dtype = np.dtype(spec["dtype"])
+        start = data_start + spec["offset"]
+        count = int(np.prod(spec["shape"], dtype=np.int64))
+        columns[name] = mapped[start:start + count * dtype.itemsize].view(dtype).reshape(spec["shape"])
+        if verify:
+            checksum = zlib.crc32(columns[name].data, checksum)
+    if verify and checksum != meta["crc32"]:
+        raise ValueError(f"{path} is corrupt (checksum mismatch)")
+    return meta, columns
+
+@_gc_paused()
+def restore_state(meta: Dict, columns: Dict[str, np.ndarray], sdn_controller, vnf_manager) -> Dict[str, int]:
+    """
+    Replace the state of the controller and the VNF manager with a snapshot.
+    
+    Args:
+        meta: Metadata from read_snapshot
+        columns: Columns from read_snapshot
+        sdn_controller: SDNController to restore into
+        vnf_manager: VNFManager to restore into; VNF types it already has
+                     keep their current catalog entry
+    
+    Returns:
+        Dict[str, int]: Number of nodes, links, slices and VNF instances restored
+    """
+    strings = _decode_strings(columns["strings.offsets"], columns["strings.data"])
+    keys = meta["keys"]
+
+    def text(name: str) -> List[Optional[str]]:
+        return list(map(strings.__getitem__, columns[name].ravel().tolist()))
+
+    def ragged_text(name: str) -> List[list]:
+        return _unragged(columns[f"{name}.offsets"], text(f"{name}.values"))
+
+    # Topology, without logging every node and link as a change
+    graph = sdn_controller.network_topology
+    graph.clear()
+    node_ids = text("node.id")
+    graph.add_nodes_from(
+        (node_id, {"capacity": capacity, "available": available})
+        for node_id, capacity, available in zip(
+            node_ids,
+            _matrix_dicts(keys["node.capacity"], columns["node.capacity"]),
+            _matrix_dicts(keys["node.available"], columns["node.available"])
+        )
+    )
+    endpoints = text("link.endpoints")
+    graph.add_edges_from(
+        (u, v, {"latency": latency, "bandwidth": bandwidth, "load": load})
+        for u, v, (latency, bandwidth, load) in zip(endpoints[::2], endpoints[1::2], columns["link.values"].tolist())
+    )
+
+    # Slices
+    slice_ids = text("slice.id")
+    qos = columns["slice.qos"].tolist()
+    allocated = _matrix_dicts(keys["slice.allocated"], columns["slice.allocated"])
+    metrics = _matrix_dicts(keys["slice.metrics"], columns["slice.metrics"])
+    reservations = _matrix_dicts(keys["slice.reservation"], columns["slice.reservation"])
+    chains, vnf_lists, paths = ragged_text("slice.chain"), ragged_text("slice.vnfs"), ragged_text("slice.path")
+    link_ends = text("slice.links.values")
+    links = _unragged(columns["slice.links.offsets"], list(zip(link_ends[::2], link_ends[1::2])))
+    link_bandwidth = columns["slice.link_bandwidth"].tolist()
+    active = columns["slice.active"].astype(bool).tolist()
+    has_reservation = columns["slice.has_reservation"].astype(bool).tolist()
+    has_path = columns["slice.has_path"].astype(bool).tolist()
+
+    sdn_controller.active_slices = {}
+    sdn_controller.reservations = {}
+    sdn_controller.slice_paths = {}
+    sdn_controller.slice_links = {}
+    for i, (slice_id, name, service_type, isolation_level) in enumerate(zip(
+        slice_ids, text("slice.name"), text("slice.service_type"), text("slice.isolation_level")
+    )):
+        slice_instance = NetworkSlice(
+            slice_id=slice_id,
+            name=name,
+            qos_requirements=QoSRequirements(qos[i][0], qos[i][1], qos[i][2], isolation_level),
+            service_type=service_type
+        )
+        slice_instance.allocated_resources = allocated[i]
+        slice_instance.performance_metrics = metrics[i]
+        slice_instance.service_chain = chains[i]
+        slice_instance.virtual_functions = vnf_lists[i]
+        slice_instance.active = active[i]
+        sdn_controller.active_slices[slice_id] = slice_instance
+        if has_reservation[i]:
+            sdn_controller.reservations[slice_id] = reservations[i]
+        if has_path[i]:
+            sdn_controller.slice_paths[slice_id] = paths[i]
+        if link_bandwidth[i] == link_bandwidth[i]:  # NaN: no link load held
+            sdn_controller.slice_links[slice_id] = (
+                links[i],
+                link_bandwidth[i]
+            )
+
+    sdn_controller.resource_allocation = {}
+    for slice_id, node_id, amounts in zip(
+        text("allocation.slice"),
+        text("allocation.node"),
+        _matrix_dicts(keys["allocation.amounts"], columns["allocation.amounts"])
+    ):
+        sdn_controller.resource_allocation.setdefault(slice_id, {})[node_id] = amounts
+
+    sdn_controller.available_resources = dict(meta["available_resources"])
+    sdn_controller.topology_version = meta["topology_version"]
+    sdn_controller.topology_revision = meta["topology_revision"]
+    sdn_controller.topology_log.clear()  # Older revisions get a full view
+    sdn_controller._latency_cache = None
+    sdn_controller._chain_cache.clear()
+
+    # VNF instances; usage totals and per-type indexes are derived from them
+    for vnf_type, spec in meta["vnf_catalog"].items():
+        vnf_manager.vnf_catalog.setdefault(vnf_type, spec)
+    vnf_manager.active_vnfs = {}
+    vnf_manager.instances_by_type = {}
+    vnf_manager.usage_totals = {}
+    usage = _matrix_dicts(keys["vnf.usage"], columns["vnf.usage"])
+    for instance_id, vnf_type, name, network, status, start_time, resource_usage, reported in zip(
+        text("vnf.id"), text("vnf.type"), text("vnf.name"), text("vnf.network"), text("vnf.status"),
+        columns["vnf.start_time"].tolist(), usage, columns["vnf.usage_reported"].astype(bool).tolist()
+    ):
+        vnf_manager.active_vnfs[instance_id] = {
+            "type": vnf_type,
+            "name": name,
+            "network": network,
+            "status": status,
+            "start_time": start_time,
+            "resource_usage": resource_usage,
+            "usage_reported": reported
+        }
+        vnf_manager.instances_by_type.setdefault(vnf_type, {})[instance_id] = None
+        if reported:
+            vnf_manager._adjust_usage_totals(vnf_type, resource_usage, sign=1.0)
+
+    return {
+        "nodes": graph.number_of_nodes(),
+        "links": graph.number_of_edges(),
+        "slices": len(sdn_controller.active_slices),
+        "vnfs": len(vnf_manager.active_vnfs)
+    }
+
+def restore_snapshot(path: str, sdn_controller, vnf_manager) -> Dict[str, int]:
+    """
+    Restore the controller and the VNF manager from a snapshot file.
+    
+    Args:
+        path: Path to the snapshot
+        sdn_controller: SDNController to restore into
+        vnf_manager: VNFManager to restore into
+    
+    Returns:
+        Dict[str, int]: Number of nodes, links, slices and VNF instances restored
+    """
+    meta, columns = read_snapshot(path)
+    return restore_state(meta, columns, sdn_controller, vnf_manager)
+
+class SnapshotWriter:
+    def __init__(self, sdn_controller, vnf_manager, path: str):
+        self.sdn_controller = sdn_controller
+        self.vnf_manager = vnf_manager
+        self.path = path
+        self.last_snapshot: Optional[Dict] = None  # Time, size and duration of the last write
+        self._task: Optional[asyncio.Task] = None
+        self._write_lock = threading.Lock()  # Serializes writes, including one still running after stop()
+
+    def _write(self, meta: Dict, columns: Dict[str, np.ndarray]) -> int:
+        """Write one captured snapshot, waiting for any write already in progress."""
+        with self._write_lock:
+            return write_snapshot(self.path, meta, columns)
+
+    def save(self) -> Dict:
+        """
+        Capture and write a snapshot on the calling thread.
+        
+        A background write that is still running, e.g. one left behind by
+        stop(), finishes first, so this snapshot is the one left on disk.
+        
+        Returns:
+            Dict: Time, size in bytes and seconds spent capturing and writing
+        """
+        started = time.perf_counter()
+        meta, columns = capture_state(self.sdn_controller, self.vnf_manager)
+        captured = time.perf_counter()
+        size = self._write(meta, columns)
+        self.last_snapshot = {
+            "time": meta["created"],
+            "bytes": size,
+            "capture_seconds": captured - started,
+            "write_seconds": time.perf_counter() - captured
+        }
+        return self.last_snapshot
+
+    async def save_in_background(self) -> Dict:
+        """
+        Capture a snapshot on the event loop, then write it from a worker thread.
+        
+        The capture is the only part that blocks the loop; the copy it makes
+        stays consistent while the controller keeps changing during the write.
+        
+        Returns:
+            Dict: Time, size in bytes and seconds spent capturing and writing
+        """
+        started = time.perf_counter()
+        meta, columns = capture_state(self.sdn_controller, self.vnf_manager)
+        captured = time.perf_counter()
+        size = await asyncio.get_running_loop().run_in_executor(None, self._write, meta, columns)
+        self.last_snapshot = {
+            "time": meta["created"],
+            "bytes": size,
+            "capture_seconds": captured - started,
+            "write_seconds": time.perf_counter() - captured
+        }
+        return self.last_snapshot
+
+    async def run(self, interval: float = 60.0) -> None:
+        """
+        Write a snapshot every interval seconds until cancelled.
+        
+        Args:
+            interval: Seconds between snapshots
+        """
+        while True:
+            await asyncio.sleep(interval)
+            await self.save_in_background()
+
+    def start(self, interval: float = 60.0) -> asyncio.Task:
+        """
+        Start periodic snapshots as a background task on the running event loop.
+        
+        Args:
+            interval: Seconds between snapshots
+        
+        Returns:
+            asyncio.Task: The background task
+        """
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self.run(interval))
+        return self._task
+
+    def stop(self) -> None:
+        """
+        Cancel periodic snapshots if they are running.
+        
+        A write already handed to a worker thread keeps going; save() waits
+        for it.
+        """
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
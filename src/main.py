@@ -1,14 +1,19 @@
 import os
 import sys
-import yaml
 import argparse
-import uvicorn
+from src.core.config_cache import compile_topology, load_cached_config
 from src.core.network_slice import QoSRequirements
-from src.sdn.controller import SDNController
-from src.nfv.vnf_manager import VNFManager
+
+# networkx, NumPy, the SDN/NFV modules, the API and uvicorn are imported where
+# used, so that importing this module (e.g. for load_config) stays cheap
 
 def load_config(config_path: str = None) -> dict:
     """Load configuration from YAML file."""
+    config, _ = load_config_and_topology(config_path)
+    return config
+
+def load_config_and_topology(config_path: str = None) -> tuple:
+    """Load configuration from YAML file, with its topology compiled once per file version."""
     default_config = {
         "api": {
             "host": "0.0.0.0",
@@ -22,19 +27,18 @@ def load_config(config_path: str = None) -> dict:
     }
 
     if config_path and os.path.exists(config_path):
-        with open(config_path, 'r') as f:
-            config = yaml.safe_load(f)
-            # Merge with default config
-            for key, value in default_config.items():
-                if key not in config:
-                    config[key] = value
-                elif isinstance(value, dict):
-                    for sub_key, sub_value in value.items():
-                        if sub_key not in config[key]:
-                            config[key][sub_key] = sub_value
-            return config
+        config, topology = load_cached_config(config_path)
+        # Merge with default config
+        for key, value in default_config.items():
+            if key not in config:
+                config[key] = value
+            elif isinstance(value, dict):
+                for sub_key, sub_value in value.items():
+                    if sub_key not in config[key]:
+                        config[key][sub_key] = sub_value
+        return config, topology
     
-    return default_config
+    return default_config, compile_topology(None)
 
 def create_example_slices(sdn_controller, num_slices: int = 2) -> None:
     """Create example network slices for demonstration."""
@@ -75,7 +79,7 @@ def create_example_slices(sdn_controller, num_slices: int = 2) -> None:
             print(f"Failed to create slice: {config['name']}")
 
 def create_example_vnfs(vnf_manager) -> None:
-    """Register example VNF types for demonstration."""
+    """Register example VNF types when no catalog is configured."""
     # Example VNF configurations
     vnf_configs = [
         {
@@ -118,22 +122,110 @@ def create_example_vnfs(vnf_manager) -> None:
         else:
             print(f"Failed to register VNF type: {config['vnf_id']}")
 
-def main(config_path: str = None) -> None:
+def configure_warm_pool(vnf_manager, config: dict) -> None:
+    """Pre-start idle VNF instances as configured under vnf.warm_pool."""
+    pool_config = config.get("vnf", {}).get("warm_pool")
+    if not pool_config:
+        return
+
+    pool = vnf_manager.enable_warm_pool(
+        pool_sizes=pool_config.get("sizes", {}),
+        memory_budget=pool_config.get("memory_budget", float("inf"))
+    )
+    print(f"Warm pool ready: {pool.get_status()['idle']}")
+
+def schedule_background_tasks(
+    app,
+    config_path: str,
+    config: dict,
+    vnf_manager,
+    snapshot_writer=None,
+    capacity_planner=None
+) -> None:
+    """Start catalog hot reload, warm pool refilling, autoscaling, capacity planning and snapshots with the API server."""
+    from src.nfv.autoscaler import VNFAutoscaler, policies_from_config
+    from src.nfv.catalog import CatalogWatcher
+
+    catalog_watcher = CatalogWatcher(config_path, vnf_manager) if config_path else None
+    pool_config = config.get("vnf", {}).get("warm_pool") or {}
+    autoscaling_config = config.get("autoscaling") or {}
+    policies = policies_from_config(config)
+    autoscaler = VNFAutoscaler(
+        vnf_manager,
+        policies,
+        max_types_per_tick=autoscaling_config.get("max_types_per_tick", 16)
+    ) if policies else None
+
+    @app.on_event("startup")
+    async def start_vnf_background_tasks():
+        if catalog_watcher:
+            catalog_watcher.start(config.get("vnf", {}).get("reload_interval", 2))
+        if vnf_manager.warm_pool:
+            vnf_manager.warm_pool.start(pool_config.get("refill_interval", 1))
+        if autoscaler:
+            autoscaler.start(autoscaling_config.get("interval", 5))
+        if capacity_planner:
+            capacity_planner.start((config.get("forecasting") or {}).get("interval", 3600))
+        if snapshot_writer:
+            snapshot_writer.start((config.get("snapshot") or {}).get("interval", 60))
+
+    @app.on_event("shutdown")
+    async def stop_vnf_background_tasks():
+        if catalog_watcher:
+            catalog_watcher.stop()
+        if vnf_manager.warm_pool:
+            vnf_manager.warm_pool.stop()
+        if autoscaler:
+            autoscaler.stop()
+        if capacity_planner:
+            capacity_planner.stop()
+        if snapshot_writer:
+            snapshot_writer.stop()
+            last = snapshot_writer.save()  # Waits for a background write stop() left running
+            print(f"Wrote snapshot: {snapshot_writer.path} ({last['bytes']} bytes)")
+
+def main(config_path: str = None, snapshot_path: str = None) -> None:
     """Main entry point for the network slicing simulation."""
-    # Load configuration
-    config = load_config(config_path)
+    import uvicorn
+    from src.ai.demand_forecaster import planner_from_config
+    from src.core.snapshot import SnapshotWriter, restore_snapshot
+    from src.nfv.vnf_manager import VNFManager
+    from src.sdn.controller import SDNController
+
+    # Load configuration, with the topology compiled once per config file version
+    config, topology = load_config_and_topology(config_path)
+    snapshot_path = snapshot_path or (config.get("snapshot") or {}).get("path")
     
     # Initialize components
     sdn_controller = SDNController()
-    vnf_manager = VNFManager()
+    catalog_path = config_path if config_path and os.path.exists(config_path) else None
+    vnf_manager = VNFManager(catalog_path, config=config if catalog_path else None)
+    if not vnf_manager.vnf_catalog:
+        catalog_path = None  # Nothing to hot reload, fall back to the examples
     
-    # Create example network slices and VNFs
-    create_example_slices(sdn_controller, config["simulation"]["initial_slices"])
-    create_example_vnfs(vnf_manager)
+    # Restore the last snapshot, or build the configured topology with example slices
+    if snapshot_path and os.path.exists(snapshot_path):
+        counts = restore_snapshot(snapshot_path, sdn_controller, vnf_manager)
+        print(f"Restored snapshot {snapshot_path}: {counts['slices']} slices, {counts['vnfs']} VNFs")
+    else:
+        sdn_controller.load_compiled_topology(topology)
+        create_example_slices(sdn_controller, config["simulation"]["initial_slices"])
     
-    # Start the FastAPI server
-    from src.api.main import app
-    uvicorn.run(app, host=config["api"]["host"], port=config["api"]["port"])
+    # Example VNFs unless the config or the snapshot has a catalog
+    if catalog_path:
+        print(f"Loaded VNF catalog: {', '.join(vnf_manager.vnf_catalog)}")
+    elif not vnf_manager.vnf_catalog:
+        create_example_vnfs(vnf_manager)
+    configure_warm_pool(vnf_manager, config)
+    
+    # Start the FastAPI server on the configured controller and VNF manager
+    from src.api import main as api
+    api.sdn_controller = sdn_controller
+    api.vnf_manager = vnf_manager
+    snapshot_writer = SnapshotWriter(sdn_controller, vnf_manager, snapshot_path) if snapshot_path else None
+    capacity_planner = planner_from_config(config, sdn_controller, vnf_manager)
+    schedule_background_tasks(api.app, catalog_path, config, vnf_manager, snapshot_writer, capacity_planner)
+    uvicorn.run(api.app, host=config["api"]["host"], port=config["api"]["port"])
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Network Slicing Simulation")
@@ -143,6 +235,12 @@ if __name__ == "__main__":
         help="Path to configuration file",
         default=None
     )
+    parser.add_argument(
+        "--snapshot",
+        type=str,
+        help="Controller state file, restored at startup if present and written periodically",
+        default=None
+    )
     
     args = parser.parse_args()
-    main(args.config) 
\ No newline at end of file
+    main(args.config, args.snapshot) 
\ No newline at end of file
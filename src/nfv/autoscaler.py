@@ -0,0 +1,292 @@
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable, Deque, Dict, List, Optional
+import asyncio
+import math
+import time
+
+from src.nfv.vnf_manager import VNFManager
+
+@dataclass
+class ScalingPolicy:
+    vnf_type: str
+    min_instances: int = 1
+    max_instances: int = 10
+    target_utilization: float = 0.6  # Fraction of the catalog requirements
+    scale_out_threshold: float = 0.8  # Scale out above this utilization
+    scale_in_threshold: float = 0.4  # Scale in below this utilization
+    scale_out_cooldown: float = 30.0  # Seconds between scale-out actions
+    scale_in_cooldown: float = 300.0  # Seconds between scale-in actions
+    network: str = "default"  # Network new instances are attached to
+
+def policies_from_config(config: Dict) -> List[ScalingPolicy]:
+    """
+    Build scaling policies from the "autoscaling" configuration section.
+    
+    Args:
+        config: Full configuration dictionary
+    
+    Returns:
+        List[ScalingPolicy]: One policy per configured VNF type
+    """
+    section = config.get("autoscaling", {}) or {}
+    defaults = section.get("defaults", {}) or {}
+    return [
+        ScalingPolicy(**{**defaults, **policy})
+        for policy in section.get("policies", []) or []
+    ]
+
+class VNFAutoscaler:
+    def __init__(
+        self,
+        vnf_manager: VNFManager,
+        policies: Optional[List[ScalingPolicy]] = None,
+        metrics_source: Optional[Callable[[str], Optional[float]]] = None,
+        max_types_per_tick: int = 16,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.vnf_manager = vnf_manager
+        self.policies: Dict[str, ScalingPolicy] = {}
+        self.metrics_source = metrics_source or vnf_manager.get_type_utilization
+        self.max_types_per_tick = max_types_per_tick
+        self.clock = clock
+        self.last_scale_out: Dict[str, float] = {}
+        self.last_scale_in: Dict[str, float] = {}
+        self.events: Deque[Dict] = deque(maxlen=1000)  # Recent scaling actions
+        self.managed: Dict[str, Dict[str, None]] = {}  # Instances the autoscaler started, oldest first per type
+        self._cursor = 0  # Round-robin position over the policies
+        self._task: Optional[asyncio.Task] = None
+
+        for policy in policies or []:
+            self.set_policy(policy)
+
+    def set_policy(self, policy: ScalingPolicy) -> None:
+        """
+        Add or replace the scaling policy of a VNF type.
+        
+        Args:
+            policy: Scaling policy to apply
+        """
+        if not 0 < policy.scale_in_threshold < policy.target_utilization < policy.scale_out_threshold:
+            raise ValueError(
+                f"Policy for {policy.vnf_type} needs "
+                "0 < scale_in_threshold < target_utilization < scale_out_threshold"
+            )
+        if not 0 <= policy.min_instances <= policy.max_instances:
+            raise ValueError(f"Policy for {policy.vnf_type} needs 0 <= min_instances <= max_instances")
+        self.policies[policy.vnf_type] = policy
+
+    def remove_policy(self, vnf_type: str) -> bool:
+        """
+        Stop autoscaling a VNF type.
+        
+        Args:
+            vnf_type: Type of VNF
+        
+        Returns:
+            bool: True if a policy was removed, False otherwise
+        """
+        return self.policies.pop(vnf_type, None) is not None
+
+    def desired_instances(self, policy: ScalingPolicy, current: int, utilization: Optional[float]) -> int:
+        """
+        Calculate the instance count a policy asks for.
+        
+        Inside the hysteresis band between the scale-in and scale-out
+        thresholds the current count is kept. Outside it, the count is sized
+        so that the observed load lands on the target utilization. With no
+        instances, a utilization from the metrics source is read as demand
+        in units of one instance's capacity.
+        
+        Args:
+            policy: Scaling policy of the VNF type
+            current: Current number of instances
+            utilization: Observed utilization, None if unknown
+        
+        Returns:
+            int: Desired number of instances within the policy bounds
+        """
+        desired = current
+        if utilization is not None and current == 0:
+            desired = math.ceil(utilization / policy.target_utilization)
+        elif utilization is not None:
+            if utilization > policy.scale_out_threshold:
+                desired = math.ceil(current * utilization / policy.target_utilization)
+            elif utilization < policy.scale_in_threshold:
+                desired = math.ceil(current * utilization / policy.target_utilization)
+        return min(max(desired, policy.min_instances), policy.max_instances)
+
+    def evaluate(self, vnf_type: str) -> int:
+        """
+        Evaluate one VNF type and apply any scaling action.
+        
+        Args:
+            vnf_type: Type of VNF
+        
+        Returns:
+            int: Change in instance count (positive for scale-out)
+        """
+        policy = self.policies.get(vnf_type)
+        if policy is None or vnf_type not in self.vnf_manager.vnf_catalog:
+            return 0
+
+        current = self.vnf_manager.count_instances(vnf_type)
+        utilization = self.metrics_source(vnf_type)
+        desired = self.desired_instances(policy, current, utilization)
+        now = self.clock()
+
+        # Bound violations are corrected immediately, load-driven changes honour the cooldowns
+        if desired > current:
+            below_minimum = current < policy.min_instances
+            if not below_minimum and now - self.last_scale_out.get(vnf_type, -math.inf) < policy.scale_out_cooldown:
+                return 0
+            changed = self._scale_out(policy, desired - current)
+            if changed:
+                self.last_scale_out[vnf_type] = now
+        elif desired < current:
+            above_maximum = current > policy.max_instances
+            if not above_maximum and now - self.last_scale_in.get(vnf_type, -math.inf) < policy.scale_in_cooldown:
+                return 0
+            changed = -self._scale_in(policy, current - desired)
+            if changed:
+                self.last_scale_in[vnf_type] = now
+        else:
+            return 0
+
+        if changed:
+            self.events.append({
+                "time": time.time(),
+                "vnf_type": vnf_type,
+                "from": current,
+                "to": current + changed,
+                "utilization": utilization
+            })
+        return changed
+
+    def tick(self) -> Dict[str, int]:
+        """
+        Run one evaluation round.
+        
+        At most max_types_per_tick policies are evaluated per round, in
+        round-robin order, so the cost of a tick stays fixed no matter how
+        many VNF types or instances exist.
+        
+        Returns:
+            Dict[str, int]: Non-zero instance count changes per VNF type
+        """
+        vnf_types = list(self.policies)
+        if not vnf_types:
+            return {}
+
+        changes = {}
+        for i in range(min(self.max_types_per_tick, len(vnf_types))):
+            vnf_type = vnf_types[(self._cursor + i) % len(vnf_types)]
+            delta = self.evaluate(vnf_type)
+            if delta:
+                changes[vnf_type] = delta
+        self._cursor = (self._cursor + self.max_types_per_tick) % len(vnf_types)
+        return changes
+
+    async def run(self, interval: float = 5.0) -> None:
+        """
+        Evaluate the policies every interval seconds until cancelled.
+        
+        Args:
+            interval: Seconds between evaluation rounds
+        """
+        while True:
+            self.tick()
+            await asyncio.sleep(interval)
+
+    def start(self, interval: float = 5.0) -> asyncio.Task:
+        """
+        Start the control loop as a background task on the running event loop.
+        
+        Args:
+            interval: Seconds between evaluation rounds
+        
+        Returns:
+            asyncio.Task: The background task
+        """
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self.run(interval))
+        return self._task
+
+    def stop(self) -> None:
+        """
+        Cancel the background control loop if it is running.
+        """
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    def get_status(self) -> Dict:
+        """
+        Get the autoscaler state for every policy.
+        
+        Returns:
+            Dict: Instance counts, utilization and recent scaling events
+        """
+        return {
+            "policies": {
+                vnf_type: {
+                    "instances": self.vnf_manager.count_instances(vnf_type),
+                    "min_instances": policy.min_instances,
+                    "max_instances": policy.max_instances,
+                    "utilization": self.metrics_source(vnf_type)
+                }
+                for vnf_type, policy in self.policies.items()
+            },
+            "events": list(self.events)
+        }
+
+    def _scale_out(self, policy: ScalingPolicy, count: int) -> int:
+        """
+        Start new instances of a VNF type.
+        
+        Args:
+            policy: Scaling policy of the VNF type
+            count: Number of instances to start
+        
+        Returns:
+            int: Number of instances actually started
+        """
+        started = 0
+        managed = self.managed.setdefault(policy.vnf_type, {})
+        for _ in range(count):
+            success, instance_id = self.vnf_manager.instantiate_vnf(
+                vnf_type=policy.vnf_type,
+                instance_name=f"{policy.vnf_type}-auto",
+                network=policy.network
+            )
+            if not success:
+                break
+            managed[instance_id] = None
+            started += 1
+        return started
+
+    def _scale_in(self, policy: ScalingPolicy, count: int) -> int:
+        """
+        Terminate the most recently started instances the autoscaler started.
+        
+        Instances created manually or through the API are never terminated,
+        so fewer than count may be stopped.
+        
+        Args:
+            policy: Scaling policy of the VNF type
+            count: Number of instances to terminate
+        
+        Returns:
+            int: Number of instances actually terminated
+        """
+        managed = self.managed.get(policy.vnf_type, {})
+        running = self.vnf_manager.instances_by_type.get(policy.vnf_type, {})
+        for instance_id in [i for i in managed if i not in running]:
+            del managed[instance_id]  # Terminated elsewhere
+
+        stopped = 0
+        for instance_id in reversed(list(managed)[-count:]):
+            del managed[instance_id]
+            if self.vnf_manager.terminate_vnf(instance_id):
+                stopped += 1
+        return stopped
@@ -0,0 +1,155 @@
+from typing import Dict, Optional, Tuple
+import asyncio
+import logging
+import os
+import yaml
+from src.core.config_cache import load_yaml
+
+logger = logging.getLogger(__name__)
+
+RESOURCE_TYPES = ("cpu", "memory", "bandwidth")
+
+def parse_catalog(config: Dict) -> Dict[str, Dict]:
+    """
+    Parse and validate the VNF catalog from the "vnf.types" config section.
+    
+    Args:
+        config: Full configuration dictionary
+    
+    Returns:
+        Dict[str, Dict]: Catalog entries keyed by VNF type, in the format
+                         used by VNFManager.vnf_catalog
+    
+    Raises:
+        ValueError: If an entry is malformed or a VNF type is defined twice
+    """
+    catalog = {}
+    for index, entry in enumerate((config.get("vnf") or {}).get("types") or []):
+        if not isinstance(entry, dict):
+            raise ValueError(f"vnf.types[{index}] must be a mapping")
+
+        vnf_id = entry.get("id")
+        if not isinstance(vnf_id, str) or not vnf_id:
+            raise ValueError(f"vnf.types[{index}] needs a non-empty string id")
+        if vnf_id in catalog:
+            raise ValueError(f"VNF type {vnf_id} is defined more than once")
+
+        image = entry.get("image")
+        if not isinstance(image, str) or not image:
+            raise ValueError(f"VNF type {vnf_id} needs a non-empty string image")
+
+        requirements = entry.get("resource_requirements") or {}
+        for resource_type in RESOURCE_TYPES:
+            amount = requirements.get(resource_type)
+            if isinstance(amount, bool) or not isinstance(amount, (int, float)) or amount < 0:
+                raise ValueError(
+                    f"VNF type {vnf_id} needs a non-negative {resource_type} requirement"
+                )
+
+        vnf_config = entry.get("config") or {}
+        if not isinstance(vnf_config, dict):
+            raise ValueError(f"VNF type {vnf_id} config must be a mapping")
+
+        catalog[vnf_id] = {
+            "image": image,
+            "resource_requirements": {
+                resource_type: float(requirements[resource_type])
+                for resource_type in RESOURCE_TYPES
+            },
+            "config": vnf_config
+        }
+    return catalog
+
+class CatalogWatcher:
+    def __init__(self, config_path: str, vnf_manager):
+        self.config_path = config_path
+        self.vnf_manager = vnf_manager
+        self._cache: Optional[Tuple[Tuple[int, int], Dict[str, Dict]]] = None  # (file signature, parsed catalog)
+        self._rejected: Optional[Tuple[int, int]] = None  # Signature of the last invalid file
+        self._task: Optional[asyncio.Task] = None
+        # The VNF manager was built from the file as it is now: only later edits are applied
+        self.load()
+
+    def load(self) -> Optional[Dict[str, Dict]]:
+        """
+        Get the parsed catalog, re-reading the file only if it changed.
+        
+        Returns:
+            Optional[Dict[str, Dict]]: Parsed catalog, None if the file is
+                                       missing or invalid
+        """
+        try:
+            stat = os.stat(self.config_path)
+        except OSError as e:
+            logger.warning(f"Cannot stat VNF catalog {self.config_path}: {e}")
+            return None
+
+        signature = (stat.st_mtime_ns, stat.st_size)
+        if self._cache is not None and self._cache[0] == signature:
+            return self._cache[1]
+        if signature == self._rejected:
+            return None
+
+        try:
+            catalog = parse_catalog(load_yaml(self.config_path) or {})
+        except (OSError, yaml.YAMLError, ValueError) as e:
+            # Keep serving the last good catalog
+            self._rejected = signature
+            logger.error(f"Ignoring invalid VNF catalog {self.config_path}: {e}")
+            return None
+
+        self._cache = (signature, catalog)
+        return catalog
+
+    def check(self) -> Optional[Dict[str, list]]:
+        """
+        Apply the catalog file to the VNF manager if it changed.
+        
+        Returns:
+            Optional[Dict[str, list]]: Applied diff, None if nothing changed
+        """
+        previous = self._cache
+        catalog = self.load()
+        if catalog is None or (previous is not None and previous[1] is catalog):
+            return None
+
+        diff = self.vnf_manager.apply_catalog(catalog)
+        if any(diff.values()):
+            logger.info(
+                f"Reloaded VNF catalog: added={diff['added']} "
+                f"changed={diff['changed']} removed={diff['removed']}"
+            )
+        return diff
+
+    async def run(self, interval: float = 2.0) -> None:
+        """
+        Poll the catalog file every interval seconds until cancelled.
+        
+        Args:
+            interval: Seconds between polls
+        """
+        while True:
+            self.check()
+            await asyncio.sleep(interval)
+
+    def start(self, interval: float = 2.0) -> asyncio.Task:
+        """
+        Start polling as a background task on the running event loop.
+        
+        Args:
+            interval: Seconds between polls
+        
+        Returns:
+            asyncio.Task: The background task
+        """
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self.run(interval))
+        return self._task
+
+    def stop(self) -> None:
+        """
+        Cancel polling if it is running.
+        """
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
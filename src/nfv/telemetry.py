@@ -0,0 +1,234 @@
+from typing import Dict, List, Optional, Tuple
+import time
+import numpy as np
+
+RESOURCE_COLUMNS = ("cpu", "memory", "bandwidth")
+
+# (resolution in seconds, number of buckets): 1 h at 1 s, 1 day at 1 min, 30 days at 1 h
+DEFAULT_TIERS: List[Tuple[float, int]] = [(1.0, 3600), (60.0, 1440), (3600.0, 720)]
+
+# Rows allocated up front per ring buffer; storage doubles up to the capacity as rows arrive
+INITIAL_ROWS = 64
+
+class RingBuffer:
+    def __init__(self, capacity: int, columns: int):
+        self.capacity = capacity
+        rows = min(capacity, INITIAL_ROWS)
+        self.values = np.zeros((rows, columns), dtype=np.float64)
+        self.timestamps = np.full(rows, -np.inf, dtype=np.float64)
+        self.position = 0  # Next slot to write
+        self.size = 0
+
+    def append(self, timestamp: float, values: np.ndarray) -> None:
+        """
+        Write one row, overwriting the oldest once full.
+        
+        Args:
+            timestamp: Time of the row in seconds
+            values: One value per column
+        """
+        if self.position == len(self.timestamps) and self.size < self.capacity:
+            self._grow()
+        self.values[self.position] = values
+        self.timestamps[self.position] = timestamp
+        self.position = (self.position + 1) % self.capacity
+        self.size = min(self.size + 1, self.capacity)
+
+    def since(self, start: float) -> np.ndarray:
+        """
+        Get the rows written at or after a point in time.
+        
+        Args:
+            start: Earliest timestamp to include
+        
+        Returns:
+            np.ndarray: Matching rows (unordered)
+        """
+        return self.values[self.timestamps >= start]
+
+    def ordered(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get all rows from oldest to newest.
+        
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: (Timestamps, rows)
+        """
+        if self.size < self.capacity:
+            return self.timestamps[:self.size].copy(), self.values[:self.size].copy()
+        order = np.roll(np.arange(self.capacity), -self.position)
+        return self.timestamps[order], self.values[order]
+
+    def _grow(self) -> None:
+        """
+        Double the allocated rows, up to the capacity.
+        
+        Only called before the buffer first wraps, while rows are still in
+        write order.
+        """
+        rows = min(self.capacity, 2 * len(self.timestamps))
+        values = np.zeros((rows, self.values.shape[1]), dtype=np.float64)
+        values[:self.size] = self.values[:self.size]
+        timestamps = np.full(rows, -np.inf, dtype=np.float64)
+        timestamps[:self.size] = self.timestamps[:self.size]
+        self.values, self.timestamps = values, timestamps
+
+class TelemetrySeries:
+    def __init__(self, tiers: List[Tuple[float, int]], columns: int = len(RESOURCE_COLUMNS)):
+        self.tiers = [(resolution, RingBuffer(capacity, columns)) for resolution, capacity in tiers]
+        # Running bucket per tier: index, column sums and sample count
+        self._bucket = np.full(len(tiers), -1, dtype=np.int64)
+        self._sums = np.zeros((len(tiers), columns), dtype=np.float64)
+        self._counts = np.zeros(len(tiers), dtype=np.int64)
+
+    def append(self, timestamp: float, values: np.ndarray) -> None:
+        """
+        Add a sample to every retention tier.
+        
+        Each tier averages the samples that fall into one of its buckets and
+        writes the average when the next bucket starts, so the cost per
+        sample is constant.
+        
+        Args:
+            timestamp: Time of the sample in seconds
+            values: One value per column
+        """
+        for tier, (resolution, buffer) in enumerate(self.tiers):
+            bucket = int(timestamp // resolution)
+            if bucket != self._bucket[tier]:
+                self._flush(tier)
+                self._bucket[tier] = bucket
+            self._sums[tier] += values
+            self._counts[tier] += 1
+
+    def window(self, seconds: float, now: float) -> Tuple[float, np.ndarray]:
+        """
+        Get the samples of the last seconds from the finest tier covering them.
+        
+        The bucket still being filled is included as its running average.
+        
+        Args:
+            seconds: Length of the window
+            now: Current time in seconds
+        
+        Returns:
+            Tuple[float, np.ndarray]: (Resolution of the tier used, rows)
+        """
+        tier = next(
+            (i for i, (resolution, buffer) in enumerate(self.tiers)
+             if resolution * buffer.capacity >= seconds),
+            len(self.tiers) - 1
+        )
+        resolution, buffer = self.tiers[tier]
+        rows = buffer.since(now - seconds)
+        if self._counts[tier] and (self._bucket[tier] + 1) * resolution > now - seconds:
+            rows = np.vstack([rows, self._sums[tier] / self._counts[tier]])
+        return resolution, rows
+
+    def _flush(self, tier: int) -> None:
+        """
+        Write the running bucket of a tier into its ring buffer.
+        
+        Args:
+            tier: Index of the tier
+        """
+        if self._counts[tier]:
+            resolution, buffer = self.tiers[tier]
+            buffer.append(self._bucket[tier] * resolution, self._sums[tier] / self._counts[tier])
+        self._sums[tier] = 0.0
+        self._counts[tier] = 0
+
+class VNFTelemetryStore:
+    def __init__(self, tiers: Optional[List[Tuple[float, int]]] = None):
+        self.tiers = [tuple(tier) for tier in tiers] if tiers else list(DEFAULT_TIERS)
+        self.series: Dict[str, TelemetrySeries] = {}
+
+    def record(
+        self,
+        instance_id: str,
+        usage: Dict[str, float],
+        timestamp: Optional[float] = None
+    ) -> None:
+        """
+        Record a resource usage sample of a VNF instance.
+        
+        Args:
+            instance_id: ID of the VNF instance
+            usage: Resource usage (e.g., {"cpu": 0.4, "memory": 300.0, "bandwidth": 80.0})
+            timestamp: Time of the sample, now if None
+        """
+        series = self.series.get(instance_id)
+        if series is None:
+            series = self.series[instance_id] = TelemetrySeries(self.tiers)
+        series.append(
+            time.time() if timestamp is None else timestamp,
+            np.array([usage.get(column, 0.0) for column in RESOURCE_COLUMNS], dtype=np.float64)
+        )
+
+    def summary(
+        self,
+        instance_id: str,
+        window: float = 60.0,
+        now: Optional[float] = None
+    ) -> Optional[Dict]:
+        """
+        Get mean, p95 and max usage of a VNF instance over a time window.
+        
+        Args:
+            instance_id: ID of the VNF instance
+            window: Length of the window in seconds
+            now: End of the window, now if None
+        
+        Returns:
+            Optional[Dict]: Aggregates per resource, None if nothing recorded
+        """
+        series = self.series.get(instance_id)
+        if series is None:
+            return None
+
+        resolution, rows = series.window(window, time.time() if now is None else now)
+        if len(rows) == 0:
+            return None
+
+        mean = rows.mean(axis=0)
+        p95 = np.percentile(rows, 95, axis=0)
+        peak = rows.max(axis=0)
+        return {
+            "window": window,
+            "resolution": resolution,
+            "samples": int(len(rows)),
+            **{
+                column: {"mean": float(mean[i]), "p95": float(p95[i]), "max": float(peak[i])}
+                for i, column in enumerate(RESOURCE_COLUMNS)
+            }
+        }
+
+    def history(self, instance_id: str, tier: int = 0) -> Optional[Dict[str, List[float]]]:
+        """
+        Get the stored samples of one retention tier, oldest first.
+        
+        Args:
+            instance_id: ID of the VNF instance
+            tier: Index of the retention tier
+        
+        Returns:
+            Optional[Dict[str, List[float]]]: Timestamps and one list per
+                                              resource, None if unknown
+        """
+        series = self.series.get(instance_id)
+        if series is None or not 0 <= tier < len(series.tiers):
+            return None
+
+        timestamps, rows = series.tiers[tier][1].ordered()
+        return {
+            "timestamp": timestamps.tolist(),
+            **{column: rows[:, i].tolist() for i, column in enumerate(RESOURCE_COLUMNS)}
+        }
+
+    def remove(self, instance_id: str) -> None:
+        """
+        Drop the telemetry of a VNF instance.
+        
+        Args:
+            instance_id: ID of the VNF instance
+        """
+        self.series.pop(instance_id, None)
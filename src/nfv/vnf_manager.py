@@ -1,14 +1,27 @@
-from typing import Dict, List, Optional, Tuple
-import yaml
+from typing import Dict, List, Optional, Set, Tuple
 import os
 import uuid
 import time
+from src.core.config_cache import load_cached_config
+from src.nfv.catalog import parse_catalog
+from src.nfv.telemetry import VNFTelemetryStore
 
 class VNFManager:
-    def __init__(self, config_path: Optional[str] = None):
+    def __init__(self, config_path: Optional[str] = None, config: Optional[Dict] = None):
         self.vnf_catalog: Dict[str, Dict] = {}
+        self.file_types: Set[str] = set()  # Catalog types that came from the config file, see apply_catalog
         self.active_vnfs: Dict[str, Dict] = {}
-        self.config = self._load_config(config_path) if config_path else {}
+        self.instances_by_type: Dict[str, Dict[str, None]] = {}  # Insertion-ordered instance IDs per type
+        self.usage_totals: Dict[str, Dict[str, float]] = {}  # Reported usage summed per type
+        self.warm_pool = None  # Optional WarmPool of pre-started instances
+        if config is None and config_path:  # Unless the caller already loaded it
+            config = self._load_config(config_path)
+        self.config = config or {}
+        self.telemetry = VNFTelemetryStore(
+            (self.config.get("vnf") or {}).get("telemetry", {}).get("tiers")
+        )
+        if self.config:
+            self.apply_catalog(parse_catalog(self.config))
 
     def _load_config(self, config_path: str) -> Dict:
         """
@@ -20,8 +33,8 @@ class VNFManager:
         Returns:
             Dict: Configuration dictionary
         """
-        with open(config_path, 'r') as f:
-            return yaml.safe_load(f)
+        config, _ = load_cached_config(config_path)
+        return config
 
     def register_vnf(
         self,
@@ -52,6 +65,48 @@ class VNFManager:
         }
         return True
 
+    def apply_catalog(self, catalog: Dict[str, Dict]) -> Dict[str, List[str]]:
+        """
+        Bring the catalog in line with a parsed catalog, touching only the
+        VNF types that differ.
+        
+        Only types that came from an earlier catalog are removed when the
+        new one lacks them; types registered at runtime or restored from a
+        snapshot are left alone unless the catalog defines them.
+        Running instances are never restarted: they keep serving with the
+        spec they were started from, including instances of removed types.
+        Idle warm pool instances of changed or removed types are discarded.
+        
+        Args:
+            catalog: Parsed catalog (see src.nfv.catalog.parse_catalog)
+        
+        Returns:
+            Dict[str, List[str]]: VNF types that were added, changed and removed
+        """
+        diff = {"added": [], "changed": [], "removed": []}
+
+        for vnf_type in sorted(self.file_types - set(catalog)):
+            if self.vnf_catalog.pop(vnf_type, None) is not None:
+                diff["removed"].append(vnf_type)
+        self.file_types = set(catalog)
+
+        for vnf_type, spec in catalog.items():
+            current = self.vnf_catalog.get(vnf_type)
+            if current == spec:
+                continue
+            self.vnf_catalog[vnf_type] = {
+                "image": spec["image"],
+                "resource_requirements": dict(spec["resource_requirements"]),
+                "config": dict(spec["config"])
+            }
+            diff["added" if current is None else "changed"].append(vnf_type)
+
+        if self.warm_pool:
+            for vnf_type in diff["changed"] + diff["removed"]:
+                self.warm_pool.drain(vnf_type)
+
+        return diff
+
     def instantiate_vnf(
         self,
         vnf_type: str,
@@ -62,6 +117,9 @@ class VNFManager:
         """
         Instantiate a new VNF instance.
         
+        If a warm pool is enabled, a pre-started idle instance is claimed so
+        no instance start happens on the caller's path.
+        
         Args:
             vnf_type: Type of VNF to instantiate
             instance_name: Name for the new instance
@@ -74,23 +132,66 @@ class VNFManager:
         if vnf_type not in self.vnf_catalog:
             return False, None
 
+        claimed = self.warm_pool.claim(vnf_type) if self.warm_pool else None
+        instance_id, vnf = claimed or self.start_instance(vnf_type)
+        vnf.update({
+            "name": instance_name,
+            "network": network,
+            "status": "running",
+            "start_time": time.time()
+        })
+        self.active_vnfs[instance_id] = vnf
+        self.instances_by_type.setdefault(vnf_type, {})[instance_id] = None
+        
+        return True, instance_id
+
+    def start_instance(self, vnf_type: str) -> Tuple[str, Dict]:
+        """
+        Start an instance of a VNF type without attaching it to a network.
+        
+        Args:
+            vnf_type: Type of VNF to start
+        
+        Returns:
+            Tuple[str, Dict]: (Instance ID, idle instance record)
+        """
         vnf_spec = self.vnf_catalog[vnf_type]
         instance_id = str(uuid.uuid4())
         
-        self.active_vnfs[instance_id] = {
+        return instance_id, {
             "type": vnf_type,
-            "name": instance_name,
-            "network": network,
-            "status": "running",
+            "name": None,
+            "network": None,
+            "status": "standby",
             "start_time": time.time(),
             "resource_usage": {
                 "cpu": vnf_spec["resource_requirements"]["cpu"],
                 "memory": vnf_spec["resource_requirements"]["memory"],
                 "bandwidth": vnf_spec["resource_requirements"]["bandwidth"]
-            }
+            },
+            "usage_reported": False
         }
+
+    def enable_warm_pool(
+        self,
+        pool_sizes: Dict[str, int],
+        memory_budget: float = float("inf")
+    ) -> "WarmPool":
+        """
+        Keep pre-started idle instances for the given VNF types.
         
-        return True, instance_id
+        Args:
+            pool_sizes: Number of idle instances to keep per VNF type
+            memory_budget: Total memory (MB) the idle instances may hold
+        
+        Returns:
+            WarmPool: The warm pool, already filled once
+        """
+        from src.nfv.warm_pool import WarmPool
+
+        self.warm_pool = WarmPool(self, pool_sizes, memory_budget)
+        self.warm_pool.refill()
+        return self.warm_pool
 
     def terminate_vnf(self, instance_id: str) -> bool:
         """
@@ -105,9 +206,99 @@ class VNFManager:
         if instance_id not in self.active_vnfs:
             return False
 
-        del self.active_vnfs[instance_id]
+        vnf = self.active_vnfs.pop(instance_id)
+        self.instances_by_type.get(vnf["type"], {}).pop(instance_id, None)
+        if vnf["usage_reported"]:
+            self._adjust_usage_totals(vnf["type"], vnf["resource_usage"], sign=-1.0)
+        self.telemetry.remove(instance_id)
+        return True
+
+    def update_resource_usage(
+        self,
+        instance_id: str,
+        usage: Dict[str, float],
+        timestamp: Optional[float] = None
+    ) -> bool:
+        """
+        Record measured resource usage for a running VNF instance.
+        
+        Per-type totals are adjusted by the delta, so reading the load of a
+        VNF type never has to walk its instances. The sample is also added
+        to the instance's telemetry history.
+        
+        Args:
+            instance_id: ID of the VNF instance
+            usage: Measured usage (e.g., {"cpu": 0.4, "memory": 300.0})
+            timestamp: Time of the measurement, now if None
+        
+        Returns:
+            bool: True if the instance exists, False otherwise
+        """
+        if instance_id not in self.active_vnfs:
+            return False
+
+        vnf = self.active_vnfs[instance_id]
+        if vnf["usage_reported"]:
+            self._adjust_usage_totals(vnf["type"], vnf["resource_usage"], sign=-1.0)
+        vnf["resource_usage"].update(usage)
+        vnf["usage_reported"] = True
+        self._adjust_usage_totals(vnf["type"], vnf["resource_usage"], sign=1.0)
+        self.telemetry.record(instance_id, vnf["resource_usage"], timestamp)
         return True
 
+    def _adjust_usage_totals(self, vnf_type: str, usage: Dict[str, float], sign: float) -> None:
+        """
+        Add or subtract one instance's usage from the per-type totals.
+        
+        Args:
+            vnf_type: Type of the VNF instance
+            usage: Resource usage of the instance
+            sign: 1.0 to add the instance, -1.0 to remove it
+        """
+        totals = self.usage_totals.setdefault(
+            vnf_type, {"cpu": 0.0, "memory": 0.0, "bandwidth": 0.0, "reporting": 0.0}
+        )
+        for resource_type in ("cpu", "memory", "bandwidth"):
+            totals[resource_type] += sign * usage.get(resource_type, 0.0)
+        totals["reporting"] += sign
+
+    def count_instances(self, vnf_type: str) -> int:
+        """
+        Get the number of active instances of a VNF type.
+        
+        Args:
+            vnf_type: Type of VNF
+        
+        Returns:
+            int: Number of active instances
+        """
+        return len(self.instances_by_type.get(vnf_type, {}))
+
+    def get_type_utilization(self, vnf_type: str) -> Optional[float]:
+        """
+        Get the mean utilization of a VNF type from reported usage.
+        
+        Utilization is the usage of the most loaded resource relative to the
+        catalog requirements, averaged over the instances that have reported.
+        
+        Args:
+            vnf_type: Type of VNF
+        
+        Returns:
+            Optional[float]: Utilization as a fraction, None if no instance
+                             of the type has reported usage yet
+        """
+        totals = self.usage_totals.get(vnf_type)
+        if not totals or totals["reporting"] < 1 or vnf_type not in self.vnf_catalog:
+            return None
+
+        requirements = self.vnf_catalog[vnf_type]["resource_requirements"]
+        return max((
+            totals[resource_type] / (totals["reporting"] * requirements[resource_type])
+            for resource_type in ("cpu", "memory", "bandwidth")
+            if requirements.get(resource_type, 0) > 0
+        ), default=None)
+
     def update_vnf(
         self,
         instance_id: str,
@@ -128,18 +319,21 @@ class VNFManager:
 
         vnf = self.active_vnfs[instance_id]
         vnf_type = vnf["type"]
+        if vnf_type not in self.vnf_catalog:
+            return False
         vnf_spec = self.vnf_catalog[vnf_type]
         
         # Update configuration
         vnf_spec["config"].update(config_updates)
         return True
 
-    def get_vnf_status(self, instance_id: str) -> Optional[Dict]:
+    def get_vnf_status(self, instance_id: str, telemetry_window: float = 60.0) -> Optional[Dict]:
         """
         Get status of a VNF instance.
         
         Args:
             instance_id: ID of the VNF instance
+            telemetry_window: Seconds of usage history to aggregate
         
         Returns:
             Optional[Dict]: Status information if found, None otherwise
@@ -157,7 +351,8 @@ class VNFManager:
             "status": vnf["status"],
             "network": vnf["network"],
             "uptime": uptime,
-            "resources": vnf["resource_usage"]
+            "resources": vnf["resource_usage"],
+            "telemetry": self.telemetry.summary(instance_id, telemetry_window)
         }
 
     def list_active_vnfs(self) -> List[Dict]:
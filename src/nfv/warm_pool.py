@@ -0,0 +1,190 @@
+from collections import deque
+from typing import Deque, Dict, Optional, Tuple
+import asyncio
+import threading
+
+class WarmPool:
+    def __init__(
+        self,
+        vnf_manager,
+        pool_sizes: Dict[str, int],
+        memory_budget: float = float("inf")
+    ):
+        self.vnf_manager = vnf_manager
+        self.pool_sizes = dict(pool_sizes)  # Target idle instances per VNF type
+        self.memory_budget = memory_budget  # Memory (MB) all idle instances may hold
+        self.memory_in_use = 0.0
+        self.idle: Dict[str, Deque[Tuple[str, Dict]]] = {
+            vnf_type: deque() for vnf_type in self.pool_sizes
+        }
+        self.generations: Dict[str, int] = {}  # Bumped per type by drain; older starts are discarded
+        self.stats = {"hits": 0, "misses": 0, "started": 0, "discarded": 0}
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+
+    def claim(self, vnf_type: str) -> Optional[Tuple[str, Dict]]:
+        """
+        Take an idle pre-started instance of a VNF type.
+        
+        Args:
+            vnf_type: Type of VNF
+        
+        Returns:
+            Optional[Tuple[str, Dict]]: (Instance ID, instance record) if one
+                                        was idle, None otherwise
+        """
+        with self._lock:
+            pool = self.idle.get(vnf_type)
+            if not pool:
+                self.stats["misses"] += 1
+                claimed = None
+            else:
+                claimed = pool.popleft()
+                self.memory_in_use -= claimed[1]["resource_usage"]["memory"]
+                self.stats["hits"] += 1
+
+        self._request_refill()
+        return claimed
+
+    def refill(self) -> int:
+        """
+        Start instances until every type reaches its pool size or the
+        memory budget is exhausted.
+        
+        Returns:
+            int: Number of instances started
+        """
+        started = 0
+        for vnf_type, size in list(self.pool_sizes.items()):
+            spec = self.vnf_manager.vnf_catalog.get(vnf_type)
+            if spec is None:
+                continue
+            memory = spec["resource_requirements"]["memory"]
+
+            while True:
+                # Reserve budget before the slow start so concurrent refills cannot overshoot
+                with self._lock:
+                    pool = self.idle.setdefault(vnf_type, deque())
+                    if len(pool) >= size or self.memory_in_use + memory > self.memory_budget:
+                        break
+                    self.memory_in_use += memory
+                    generation = self.generations.get(vnf_type, 0)
+
+                instance_id, vnf = self.vnf_manager.start_instance(vnf_type)
+                with self._lock:
+                    self.stats["started"] += 1
+                    if self.generations.get(vnf_type, 0) != generation:
+                        # Drained while starting: the instance may run the old spec
+                        self.memory_in_use -= memory
+                        self.stats["discarded"] += 1
+                        break
+                    pool.append((instance_id, vnf))
+                started += 1
+        return started
+
+    def drain(self, vnf_type: str) -> int:
+        """
+        Discard the idle instances of a VNF type, e.g. after its spec changed.
+        
+        Args:
+            vnf_type: Type of VNF
+        
+        Returns:
+            int: Number of idle instances discarded
+        """
+        with self._lock:
+            self.generations[vnf_type] = self.generations.get(vnf_type, 0) + 1
+            pool = self.idle.get(vnf_type)
+            if not pool:
+                return 0
+            drained = len(pool)
+            for _, vnf in pool:
+                self.memory_in_use -= vnf["resource_usage"]["memory"]
+            pool.clear()
+
+        self._request_refill()
+        return drained
+
+    def set_pool_size(self, vnf_type: str, size: int) -> None:
+        """
+        Change the number of idle instances kept for a VNF type.
+        
+        Args:
+            vnf_type: Type of VNF
+            size: Number of idle instances to keep, 0 to stop pooling the type
+        """
+        with self._lock:
+            self.pool_sizes[vnf_type] = size
+            pool = self.idle.setdefault(vnf_type, deque())
+            while len(pool) > size:
+                _, vnf = pool.pop()
+                self.memory_in_use -= vnf["resource_usage"]["memory"]
+            if size == 0:
+                del self.pool_sizes[vnf_type]
+
+        self._request_refill()
+
+    async def run(self, interval: float = 1.0) -> None:
+        """
+        Refill the pool in a worker thread whenever an instance is claimed,
+        and at least every interval seconds, until cancelled.
+        
+        Args:
+            interval: Maximum seconds between refills
+        """
+        self._loop = asyncio.get_running_loop()
+        self._wakeup = asyncio.Event()
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            await self._loop.run_in_executor(None, self.refill)
+
+    def start(self, interval: float = 1.0) -> asyncio.Task:
+        """
+        Start background refilling on the running event loop.
+        
+        Args:
+            interval: Maximum seconds between refills
+        
+        Returns:
+            asyncio.Task: The background task
+        """
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self.run(interval))
+        return self._task
+
+    def stop(self) -> None:
+        """
+        Cancel background refilling if it is running.
+        """
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    def get_status(self) -> Dict:
+        """
+        Get idle instance counts, memory use and claim statistics.
+        
+        Returns:
+            Dict: Pool status
+        """
+        with self._lock:
+            return {
+                "idle": {vnf_type: len(pool) for vnf_type, pool in self.idle.items()},
+                "pool_sizes": dict(self.pool_sizes),
+                "memory_in_use": self.memory_in_use,
+                "memory_budget": self.memory_budget,
+                **self.stats
+            }
+
+    def _request_refill(self) -> None:
+        """
+        Wake the background refill task, safe to call from any thread.
+        """
+        if self._loop is not None and self._wakeup is not None:
+            self._loop.call_soon_threadsafe(self._wakeup.set)
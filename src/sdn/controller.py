@@ -1,7 +1,12 @@
-from typing import Dict, List, Optional, Tuple
+from collections import OrderedDict, deque
+from typing import Deque, Dict, List, Optional, Tuple
 import networkx as nx
 from src.core.network_slice import NetworkSlice, QoSRequirements
 
+CHAIN_CACHE_SIZE = 4096  # Cached chain placement prefixes
+TOPOLOGY_LOG_SIZE = 10000  # Topology changes kept for delta queries
+RESERVATION_PRIORITY = {"URLLC": 0, "eMBB": 1, "mMTC": 2}  # Lower reserves first when capacity is short
+
 class SDNController:
     def __init__(self):
         self.network_topology = nx.Graph()
@@ -13,6 +18,96 @@ class SDNController:
         }
         self.resource_allocation = {}  # Track resource allocation per node
         self.slice_paths = {}  # Track paths for each slice
+        self.reservations: Dict[str, Dict[str, float]] = {}  # Capacity held per slice beyond its allocation
+        self.topology_version = 0  # Bumped on every topology change
+        self.topology_revision = 0  # Bumped on every change visible in the topology view, incl. load
+        self.topology_log: Deque[Tuple[int, str, Tuple]] = deque(maxlen=TOPOLOGY_LOG_SIZE)  # (revision, kind, key)
+        self.slice_links: Dict[str, Tuple[List[Tuple[str, str]], float]] = {}  # Links and bandwidth per slice path
+        self._latency_cache: Optional[Tuple[int, Dict[str, Dict[str, float]]]] = None
+        self._chain_cache: "OrderedDict[Tuple, Dict[str, Tuple[float, Tuple[str, ...]]]]" = OrderedDict()
+        self.chain_cache_stats = {"hits": 0, "misses": 0}
+
+    def add_node(self, node_id: str, capacity: Dict[str, float]) -> None:
+        """
+        Add a compute node to the network topology.
+        
+        Args:
+            node_id: Identifier of the node
+            capacity: Resource capacity of the node
+                      (e.g., {"cpu": 100, "memory": 1024000, "bandwidth": 10000})
+        """
+        self.network_topology.add_node(
+            node_id,
+            capacity=dict(capacity),
+            available=dict(capacity)
+        )
+        self.topology_version += 1
+        self._record_change("node", node_id)
+
+    def add_link(
+        self,
+        source: str,
+        target: str,
+        latency: float,
+        bandwidth: float
+    ) -> None:
+        """
+        Add a link between two nodes of the network topology.
+        
+        Args:
+            source: Identifier of the first node
+            target: Identifier of the second node
+            latency: Link latency in ms
+            bandwidth: Link bandwidth in Mbps
+        """
+        for node_id in (source, target):
+            if node_id not in self.network_topology:
+                self.add_node(node_id, {})
+        self.network_topology.add_edge(source, target, latency=latency, bandwidth=bandwidth, load=0.0)
+        self.topology_version += 1
+        self._record_change("link", self._link_key(source, target))
+
+    def load_topology(self, topology_config: Dict) -> None:
+        """
+        Load nodes and links from a topology configuration.
+        
+        Args:
+            topology_config: Dictionary with "nodes" (id, capacity) and
+                             "links" (source, target, latency, bandwidth)
+        """
+        for node in topology_config.get("nodes", []):
+            self.add_node(node["id"], node.get("capacity", {}))
+        for link in topology_config.get("links", []):
+            self.add_link(
+                link["source"],
+                link["target"],
+                latency=link.get("latency", 0.0),
+                bandwidth=link.get("bandwidth", 0.0)
+            )
+
+    def load_compiled_topology(self, compiled: Dict[str, List]) -> None:
+        """
+        Load a topology from compile_topology in bulk.
+        
+        Unlike load_topology, the changes are not logged one by one; callers
+        of topology_delta from before the load get a full view instead.
+        
+        Args:
+            compiled: "nodes" as [id, capacity] and "links" as
+                      [source, target, latency, bandwidth]
+        """
+        nodes, links = compiled.get("nodes", []), compiled.get("links", [])
+        self.network_topology.add_nodes_from(
+            (node_id, {"capacity": dict(capacity), "available": dict(capacity)})
+            for node_id, capacity in nodes
+        )
+        self.network_topology.add_edges_from(
+            (source, target, {"latency": latency, "bandwidth": bandwidth, "load": 0.0})
+            for source, target, latency, bandwidth in links
+        )
+        self.topology_version += len(nodes) + len(links)
+        self.topology_revision += len(nodes) + len(links)
+        self.topology_log.clear()  # Nothing logged covers the load
 
     def create_slice(
         self,
@@ -63,11 +158,13 @@ class SDNController:
         """
         if slice_id in self.active_slices:
             slice_instance = self.active_slices[slice_id]
-            resources = slice_instance.allocated_resources
+            resources = dict(slice_instance.allocated_resources)  # Cleared by deallocate_resources
             
             # Release resources
             if slice_instance.deallocate_resources():
                 self._update_available_resources(resources, allocate=False)
+                self._release_node_resources(slice_id)
+                self._update_available_resources(self.reservations.pop(slice_id, {}), allocate=False)
                 del self.active_slices[slice_id]
                 if slice_id in self.slice_paths:
                     del self.slice_paths[slice_id]
@@ -98,15 +195,18 @@ class SDNController:
         
         if qos_requirements:
             # Check if we can accommodate new requirements
-            old_resources = slice_instance.allocated_resources
+            old_resources = dict(slice_instance.allocated_resources)
             new_resources = self._calculate_required_resources(qos_requirements)
             
-            # Update resource allocation
+            # Update resource allocation; capacity reserved for this slice counts as available to it
             self._update_available_resources(old_resources, allocate=False)
-            if self._check_resource_availability(qos_requirements):
+            reservation = self.reservations.get(slice_id)
+            if self._check_resource_availability(qos_requirements, credit=reservation):
                 slice_instance.qos_requirements = qos_requirements
-                slice_instance.allocate_resources(new_resources)
-                self._update_available_resources(new_resources, allocate=True)
+                # allocate_resources only allocates to an inactive slice
+                slice_instance.allocated_resources.clear()
+                slice_instance.allocated_resources.update(new_resources)
+                self._allocate_from_reservation(slice_id, new_resources, previous=old_resources)
             else:
                 # Rollback if we can't accommodate new requirements
                 self._update_available_resources(old_resources, allocate=True)
@@ -136,23 +236,574 @@ class SDNController:
             }
         return None
 
-    def _check_resource_availability(self, qos_requirements: QoSRequirements) -> bool:
+    def place_service_chain(
+        self,
+        slice_id: str,
+        chain: List[str],
+        vnf_requirements: Dict[str, Dict[str, float]],
+        ingress: Optional[str] = None,
+        egress: Optional[str] = None
+    ) -> Optional[Dict]:
+        """
+        Place the service function chain of a slice onto topology nodes.
+        
+        The chain and the slice path are placed jointly: every VNF type is
+        mapped to a node so that the total link latency from the ingress,
+        through the chain in order, to the egress is minimal. Consecutive
+        chain elements on the same node add no latency, so co-location wins
+        whenever capacity allows. Placements of chain prefixes are cached,
+        so chains sharing a prefix only compute their differing suffix.
+        
+        Args:
+            slice_id: ID of the slice
+            chain: VNF types in the order traffic passes through them
+            vnf_requirements: Resource requirements per VNF type
+            ingress: Node where slice traffic enters, any node if None
+            egress: Node where slice traffic leaves, the last VNF's node if None
+        
+        Returns:
+            Optional[Dict]: Placement, path and total latency if the chain fits
+                            the slice's latency budget, None otherwise
+        """
+        if slice_id not in self.active_slices or not chain:
+            return None
+        if any(vnf_type not in vnf_requirements for vnf_type in chain):
+            return None
+        slice_instance = self.active_slices[slice_id]
+
+        # The slice's current chain counts as free while placing the new one, and is
+        # put back if the new one does not fit
+        previous = (self.resource_allocation.get(slice_id), self.slice_links.get(slice_id))
+        self._release_node_resources(slice_id)
+        candidate = self._find_chain_placement(chain, vnf_requirements, ingress, egress)
+        if candidate is None or candidate[0] > slice_instance.qos_requirements.latency_ms:
+            self._restore_node_resources(slice_id, *previous)
+            return None
+        latency, placement = candidate
+
+        # Commit node resources and the path through the chain
+        allocation: Dict[str, Dict[str, float]] = {}
+        for vnf_type, node_id in zip(chain, placement):
+            node_allocation = allocation.setdefault(node_id, {})
+            for resource_type, amount in vnf_requirements[vnf_type].items():
+                node_allocation[resource_type] = node_allocation.get(resource_type, 0.0) + amount
+        for node_id, node_allocation in allocation.items():
+            available = self.network_topology.nodes[node_id]["available"]
+            for resource_type, amount in node_allocation.items():
+                available[resource_type] = available.get(resource_type, 0.0) - amount
+            self._record_change("node", node_id)
+        self.resource_allocation[slice_id] = allocation
+
+        waypoints = ([ingress] if ingress else []) + list(placement) + ([egress] if egress else [])
+        path = [waypoints[0]]
+        for source, target in zip(waypoints, waypoints[1:]):
+            if source != target:
+                path.extend(nx.shortest_path(self.network_topology, source, target, weight="latency")[1:])
+        self.slice_paths[slice_id] = path
+        self._add_link_load(slice_id, path, slice_instance.qos_requirements.bandwidth_mbps)
+        slice_instance.set_service_chain(chain)
+
+        return {
+            "placement": [
+                {"vnf_type": vnf_type, "node": node_id}
+                for vnf_type, node_id in zip(chain, placement)
+            ],
+            "path": path,
+            "latency_ms": latency
+        }
+
+    def reserve_capacity(
+        self,
+        forecasts: Dict[str, Dict[str, float]],
+        headroom: float = 0.1
+    ) -> Dict[str, Dict[str, Dict[str, float]]]:
+        """
+        Reserve or release capacity ahead of forecast slice demand.
+        
+        Each slice holds a reservation of the forecast peak plus headroom
+        minus what it already has allocated. Shrinking reservations are
+        released first so the freed capacity can serve growing ones, which
+        are granted by service type priority (URLLC first). A reservation
+        that does not fully fit is granted partially and the missing part
+        is reported as shortfall.
+        
+        Args:
+            forecasts: Slice ID -> forecast peak demand per resource
+            headroom: Fraction added on top of the forecast
+        
+        Returns:
+            Dict[str, Dict[str, Dict[str, float]]]: Per forecast slice, the
+                "reserved" capacity now held and any "shortfall"
+        """
+        targets = {}
+        for slice_id, demand in forecasts.items():
+            slice_instance = self.active_slices.get(slice_id)
+            if slice_instance is None:
+                continue
+            targets[slice_id] = {
+                resource_type: max(
+                    0.0,
+                    amount * (1 + headroom) - slice_instance.allocated_resources.get(resource_type, 0.0)
+                )
+                for resource_type, amount in demand.items()
+                if resource_type in self.available_resources
+            }
+
+        # Release first
+        for slice_id, target in targets.items():
+            held = self.reservations.setdefault(slice_id, {})
+            for resource_type, amount in target.items():
+                surplus = held.get(resource_type, 0.0) - amount
+                if surplus > 0:
+                    self._update_available_resources({resource_type: surplus}, allocate=False)
+                    held[resource_type] = amount
+
+        # Then grow, highest priority first
+        result = {}
+        ordered = sorted(
+            targets,
+            key=lambda s: RESERVATION_PRIORITY.get(self.active_slices[s].service_type, len(RESERVATION_PRIORITY))
+        )
+        for slice_id in ordered:
+            held = self.reservations[slice_id]
+            shortfall = {}
+            for resource_type, amount in targets[slice_id].items():
+                missing = amount - held.get(resource_type, 0.0)
+                if missing <= 0:
+                    continue
+                granted = min(missing, max(0.0, self.available_resources[resource_type]))
+                if granted > 0:
+                    self._update_available_resources({resource_type: granted}, allocate=True)
+                    held[resource_type] = held.get(resource_type, 0.0) + granted
+                if granted < missing:
+                    shortfall[resource_type] = missing - granted
+            result[slice_id] = {"reserved": dict(held), "shortfall": shortfall}
+        return result
+
+    def _find_chain_placement(
+        self,
+        chain: List[str],
+        vnf_requirements: Dict[str, Dict[str, float]],
+        ingress: Optional[str],
+        egress: Optional[str]
+    ) -> Optional[Tuple[float, Tuple[str, ...]]]:
+        """
+        Find the lowest-latency placement of a chain that fits the free resources.
+        
+        Args:
+            chain: VNF types in the order traffic passes through them
+            vnf_requirements: Resource requirements per VNF type
+            ingress: Node where slice traffic enters, any node if None
+            egress: Node where slice traffic leaves, None for no egress leg
+        
+        Returns:
+            Optional[Tuple[float, Tuple[str, ...]]]: (Latency, node per VNF)
+                                                     if the chain fits anywhere
+        """
+        chain_key = tuple(
+            (vnf_type, tuple(sorted(vnf_requirements[vnf_type].items())))
+            for vnf_type in chain
+        )
+
+        # First try static capacity (cacheable), then fall back to what is still free,
+        # counting what earlier chain elements already use on each node
+        for capacity_attribute in ("capacity", "available"):
+            candidate = self._best_chain_placement(chain_key, ingress, egress, capacity_attribute)
+            if candidate is not None and self._fits_available(candidate[1], chain, vnf_requirements):
+                return candidate
+        return None
+
+    def _latencies(self) -> Dict[str, Dict[str, float]]:
+        """
+        Get shortest-path latencies between all node pairs.
+        
+        Returns:
+            Dict[str, Dict[str, float]]: Latency in ms per (source, target),
+                                         cached per topology version
+        """
+        if self._latency_cache is None or self._latency_cache[0] != self.topology_version:
+            self._latency_cache = (
+                self.topology_version,
+                dict(nx.all_pairs_dijkstra_path_length(self.network_topology, weight="latency"))
+            )
+        return self._latency_cache[1]
+
+    def _best_chain_placement(
+        self,
+        chain_key: Tuple,
+        ingress: Optional[str],
+        egress: Optional[str],
+        capacity_attribute: str
+    ) -> Optional[Tuple[float, Tuple[str, ...]]]:
+        """
+        Find the lowest-latency placement of a whole chain.
+        
+        Args:
+            chain_key: Chain as ((vnf_type, requirements), ...) tuples
+            ingress: Node where slice traffic enters, any node if None
+            egress: Node where slice traffic leaves, None for no egress leg
+            capacity_attribute: Node attribute checked per VNF, "capacity"
+                                (cached) or "available"
+        
+        Returns:
+            Optional[Tuple[float, Tuple[str, ...]]]: (Latency, node per VNF)
+                                                     if any placement exists
+        """
+        latencies = self._latencies()
+        row = self._chain_row(chain_key, ingress, capacity_attribute)
+        best = None
+        for node_id, (latency, placement) in row.items():
+            if egress is not None:
+                if egress not in latencies.get(node_id, {}):
+                    continue
+                latency += latencies[node_id][egress]
+            if best is None or latency < best[0]:
+                best = (latency, placement)
+        return best
+
+    def _chain_row(
+        self,
+        chain_key: Tuple,
+        ingress: Optional[str],
+        capacity_attribute: str
+    ) -> Dict[str, Tuple[float, Tuple[str, ...]]]:
+        """
+        Get the best placement of a chain prefix ending on each node.
+        
+        Against "capacity" each VNF is checked on its own. Against
+        "available" a node must also hold the earlier chain elements of the
+        prefix placed on it, so the lowest-latency prefix that still fits is
+        kept and co-location never overflows a node.
+        
+        Args:
+            chain_key: Chain prefix as ((vnf_type, requirements), ...) tuples
+            ingress: Node where slice traffic enters, any node if None
+            capacity_attribute: Node attribute checked per VNF
+        
+        Returns:
+            Dict[str, Tuple[float, Tuple[str, ...]]]: (Latency, placement) per
+                                                      node the prefix can end on
+        """
+        cacheable = capacity_attribute == "capacity"
+        tracks_usage = capacity_attribute == "available"
+        cache_key = (self.topology_version, ingress, chain_key)
+        if cacheable and cache_key in self._chain_cache:
+            self._chain_cache.move_to_end(cache_key)
+            self.chain_cache_stats["hits"] += 1
+            return self._chain_cache[cache_key]
+
+        if not chain_key:
+            if ingress is None:
+                row = {node_id: (0.0, ()) for node_id in self.network_topology.nodes}
+            else:
+                row = {ingress: (0.0, ())} if ingress in self.network_topology else {}
+            return row
+
+        if cacheable:
+            self.chain_cache_stats["misses"] += 1
+        previous = self._chain_row(chain_key[:-1], ingress, capacity_attribute)
+        _, requirements = chain_key[-1]
+        latencies = self._latencies()
+
+        row = {}
+        for node_id, attributes in self.network_topology.nodes(data=True):
+            capacity = attributes.get(capacity_attribute, {})
+            if any(capacity.get(resource_type, 0.0) < amount for resource_type, amount in requirements):
+                continue
+            best = None
+            for previous_node, (latency, placement) in previous.items():
+                hop = latencies.get(previous_node, {}).get(node_id)
+                if hop is None:
+                    continue
+                # On equal latency prefer staying on the previous node
+                if best is not None and not (
+                    latency + hop < best[0] or (latency + hop == best[0] and previous_node == node_id)
+                ):
+                    continue
+                if tracks_usage and not self._fits_with_prefix(capacity, chain_key, placement, node_id):
+                    continue
+                best = (latency + hop, placement + (node_id,))
+            if best is not None:
+                row[node_id] = best
+
+        if cacheable:
+            self._chain_cache[cache_key] = row
+            if len(self._chain_cache) > CHAIN_CACHE_SIZE:
+                self._chain_cache.popitem(last=False)
+        return row
+
+    @staticmethod
+    def _fits_with_prefix(
+        capacity: Dict[str, float],
+        chain_key: Tuple,
+        placement: Tuple[str, ...],
+        node_id: str
+    ) -> bool:
+        """
+        Check that a node holds the last chain element together with the
+        earlier elements a prefix placement puts on it.
+        
+        Args:
+            capacity: Resources of the node
+            chain_key: Chain as ((vnf_type, requirements), ...) tuples
+            placement: Node per chain element before the last
+            node_id: Node considered for the last element
+        
+        Returns:
+            bool: True if all of them fit, False otherwise
+        """
+        demand: Dict[str, float] = {}
+        for (_, requirements), placed_on in zip(chain_key[:-1], placement):
+            if placed_on == node_id:
+                for resource_type, amount in requirements:
+                    demand[resource_type] = demand.get(resource_type, 0.0) + amount
+        for resource_type, amount in chain_key[-1][1]:
+            demand[resource_type] = demand.get(resource_type, 0.0) + amount
+        return all(capacity.get(resource_type, 0.0) >= amount for resource_type, amount in demand.items())
+
+    def _fits_available(
+        self,
+        placement: Tuple[str, ...],
+        chain: List[str],
+        vnf_requirements: Dict[str, Dict[str, float]]
+    ) -> bool:
+        """
+        Check that the nodes of a placement have enough free resources for
+        all chain elements placed on them together.
+        
+        Args:
+            placement: Node per chain element
+            chain: VNF types of the chain
+            vnf_requirements: Resource requirements per VNF type
+        
+        Returns:
+            bool: True if the placement fits, False otherwise
+        """
+        demand: Dict[Tuple[str, str], float] = {}
+        for vnf_type, node_id in zip(chain, placement):
+            for resource_type, amount in vnf_requirements[vnf_type].items():
+                demand[(node_id, resource_type)] = demand.get((node_id, resource_type), 0.0) + amount
+        return all(
+            self.network_topology.nodes[node_id]["available"].get(resource_type, 0.0) >= amount
+            for (node_id, resource_type), amount in demand.items()
+        )
+
+    def _release_node_resources(self, slice_id: str) -> None:
+        """
+        Return the node resources and link load held by a slice's service chain.
+        
+        Args:
+            slice_id: ID of the slice
+        """
+        for node_id, node_allocation in self.resource_allocation.pop(slice_id, {}).items():
+            if node_id not in self.network_topology:
+                continue
+            available = self.network_topology.nodes[node_id]["available"]
+            for resource_type, amount in node_allocation.items():
+                available[resource_type] = available.get(resource_type, 0.0) + amount
+            self._record_change("node", node_id)
+
+        links, bandwidth = self.slice_links.pop(slice_id, ([], 0.0))
+        for source, target in links:
+            if self.network_topology.has_edge(source, target):
+                self.network_topology.edges[source, target]["load"] -= bandwidth
+                self._record_change("link", (source, target))
+
+    def _restore_node_resources(
+        self,
+        slice_id: str,
+        allocation: Optional[Dict[str, Dict[str, float]]],
+        links: Optional[Tuple[List[Tuple[str, str]], float]]
+    ) -> None:
+        """
+        Take back node resources and link load released by _release_node_resources.
+        
+        Args:
+            slice_id: ID of the slice
+            allocation: Node allocation the slice held, None if none
+            links: Links and bandwidth the slice loaded, None if none
+        """
+        if allocation is not None:
+            for node_id, node_allocation in allocation.items():
+                if node_id not in self.network_topology:
+                    continue
+                available = self.network_topology.nodes[node_id]["available"]
+                for resource_type, amount in node_allocation.items():
+                    available[resource_type] = available.get(resource_type, 0.0) - amount
+                self._record_change("node", node_id)
+            self.resource_allocation[slice_id] = allocation
+
+        if links is not None:
+            for source, target in links[0]:
+                if self.network_topology.has_edge(source, target):
+                    self.network_topology.edges[source, target]["load"] += links[1]
+                    self._record_change("link", (source, target))
+            self.slice_links[slice_id] = links
+
+    def _add_link_load(self, slice_id: str, path: List[str], bandwidth: float) -> None:
+        """
+        Add a slice's bandwidth to the load of every link on its path.
+        
+        Args:
+            slice_id: ID of the slice
+            path: Nodes the slice traffic traverses
+            bandwidth: Bandwidth of the slice in Mbps
+        """
+        links = [self._link_key(source, target) for source, target in zip(path, path[1:])]
+        for source, target in links:
+            self.network_topology.edges[source, target]["load"] += bandwidth
+            self._record_change("link", (source, target))
+        self.slice_links[slice_id] = (links, bandwidth)
+
+    @staticmethod
+    def _link_key(source: str, target: str) -> Tuple[str, str]:
+        """Order link endpoints so an undirected link has one key."""
+        return (source, target) if str(source) <= str(target) else (target, source)
+
+    def _record_change(self, kind: str, key) -> None:
+        """
+        Log a change to a node or link for topology delta queries.
+        
+        Args:
+            kind: "node" or "link"
+            key: Node ID or (source, target) link key
+        """
+        self.topology_revision += 1
+        self.topology_log.append((self.topology_revision, kind, key))
+
+    def serialize_topology(self) -> Dict:
+        """
+        Get the full topology view with current utilization.
+        
+        Returns:
+            Dict: Revision, nodes (capacity, available, utilization) and
+                  links (latency, bandwidth, load, utilization)
+        """
+        return {
+            "version": self.topology_revision,
+            "nodes": [self._node_view(node_id) for node_id in self.network_topology.nodes],
+            "links": [self._link_view(*self._link_key(u, v)) for u, v in self.network_topology.edges]
+        }
+
+    def topology_delta(self, since: int) -> Optional[Dict]:
+        """
+        Get the nodes and links changed after a revision.
+        
+        Args:
+            since: Revision the caller already has
+        
+        Returns:
+            Optional[Dict]: Revision, current state of changed nodes and links
+                            and removed ones; None if changes after since are
+                            no longer logged and a full view is needed
+        """
+        if since > self.topology_revision:
+            return None
+        oldest = self.topology_log[0][0] if self.topology_log else self.topology_revision + 1
+        if since < self.topology_revision and since + 1 < oldest:
+            return None
+
+        changed = {"node": {}, "link": {}}
+        for revision, kind, key in reversed(self.topology_log):
+            if revision <= since:
+                break
+            changed[kind].setdefault(key, None)
+
+        return {
+            "version": self.topology_revision,
+            "since": since,
+            "nodes": [self._node_view(n) for n in changed["node"] if n in self.network_topology],
+            "links": [
+                self._link_view(*key) for key in changed["link"]
+                if self.network_topology.has_edge(*key)
+            ],
+            "removed_nodes": [n for n in changed["node"] if n not in self.network_topology],
+            "removed_links": [list(key) for key in changed["link"] if not self.network_topology.has_edge(*key)]
+        }
+
+    def _node_view(self, node_id: str) -> Dict:
+        """Serialize one node with its utilization per resource."""
+        attributes = self.network_topology.nodes[node_id]
+        capacity = attributes.get("capacity", {})
+        available = attributes.get("available", {})
+        return {
+            "id": node_id,
+            "capacity": capacity,
+            "available": available,
+            "utilization": {
+                resource_type: (total - available.get(resource_type, total)) / total
+                for resource_type, total in capacity.items() if total
+            }
+        }
+
+    def _link_view(self, source: str, target: str) -> Dict:
+        """Serialize one link with its load."""
+        attributes = self.network_topology.edges[source, target]
+        bandwidth = attributes.get("bandwidth", 0.0)
+        load = attributes.get("load", 0.0)
+        return {
+            "source": source,
+            "target": target,
+            "latency": attributes.get("latency", 0.0),
+            "bandwidth": bandwidth,
+            "load": load,
+            "utilization": load / bandwidth if bandwidth else None
+        }
+
+    def _check_resource_availability(
+        self,
+        qos_requirements: QoSRequirements,
+        credit: Optional[Dict[str, float]] = None
+    ) -> bool:
         """
         Check if required resources are available.
         
         Args:
             qos_requirements: QoS requirements to check against
+            credit: Capacity usable on top of the available resources, e.g.
+                    the reservation of the slice being admitted
         
         Returns:
             bool: True if resources are available, False otherwise
         """
         required_resources = self._calculate_required_resources(qos_requirements)
+        credit = credit or {}
         
         for resource_type, amount in required_resources.items():
-            if self.available_resources.get(resource_type, 0) < amount:
+            if self.available_resources.get(resource_type, 0) + credit.get(resource_type, 0.0) < amount:
                 return False
         return True
 
+    def _allocate_from_reservation(
+        self,
+        slice_id: str,
+        resources: Dict[str, float],
+        previous: Optional[Dict[str, float]] = None
+    ) -> None:
+        """
+        Allocate resources to a slice, drawing on its reservation for growth.
+        
+        The reservation holds capacity for growth beyond the slice's
+        allocation, so the part of the new allocation above the previous one
+        is taken from it first. Reserved capacity is already out of the
+        available resources, only the rest is allocated anew.
+        
+        Args:
+            slice_id: ID of the slice
+            resources: Resources to allocate
+            previous: Allocation the slice held before, already released
+        """
+        held = self.reservations.get(slice_id, {})
+        previous = previous or {}
+        remainder = {}
+        for resource_type, amount in resources.items():
+            growth = max(0.0, amount - previous.get(resource_type, 0.0))
+            drawn = min(growth, held.get(resource_type, 0.0))
+            if drawn > 0:
+                held[resource_type] -= drawn
+            remainder[resource_type] = amount - drawn
+        self._update_available_resources(remainder, allocate=True)
+
     def _calculate_required_resources(self, qos_requirements: QoSRequirements) -> Dict[str, float]:
         """
         Calculate required resources based on QoS requirements.
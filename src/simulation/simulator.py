@@ -0,0 +1,497 @@
+from typing import Dict, Iterator, List, Optional, Tuple
+import argparse
+import heapq
+import itertools
+import json
+import random
+import time
+import numpy as np
+import yaml
+from src.nfv.catalog import parse_catalog
+from src.nfv.telemetry import VNFTelemetryStore
+from src.nfv.vnf_manager import VNFManager
+from src.sdn.controller import SDNController
+from src.simulation.workload import WorkloadConfig, parse_workload, read_trace
+
+RESOURCE_TYPES = ("cpu", "memory", "bandwidth")
+
+# Event kinds, used as indices into the handler table
+ARRIVAL, DEPARTURE, VNF_FAILURE, VNF_REPAIR, METRICS, WARMUP_END = range(6)
+
+# Time-weighted state: pool usage and node usage per resource, active and degraded slices
+POOL_USED, NODE_USED, ACTIVE, DEGRADED = 0, len(RESOURCE_TYPES), 2 * len(RESOURCE_TYPES), 2 * len(RESOURCE_TYPES) + 1
+
+def build_topology(config: Dict, workload: WorkloadConfig, num_nodes: Optional[int] = None) -> Dict:
+    """
+    Get the topology to simulate.
+    
+    Args:
+        config: Full configuration dictionary
+        workload: Parsed workload, for the capacity of generated nodes
+        num_nodes: Generate a ring of this many nodes instead of using the
+                   configured topology
+    
+    Returns:
+        Dict: Topology with "nodes" and "links", as taken by load_topology;
+              a generated ring of simulation.num_nodes nodes if the config
+              has no topology
+    """
+    simulation = config.get("simulation") or {}
+    topology = simulation.get("topology") or {}
+    if num_nodes is None and topology.get("nodes"):
+        return topology
+
+    num_nodes = num_nodes or simulation.get("num_nodes", 10)
+    node_ids = [f"node{i + 1}" for i in range(num_nodes)]
+    links = [
+        {
+            "source": node_ids[i],
+            "target": node_ids[(i + 1) % num_nodes],
+            "latency": workload.link_latency,
+            "bandwidth": workload.link_bandwidth
+        }
+        for i in range(num_nodes if num_nodes > 2 else num_nodes - 1)
+    ]
+    return {
+        "nodes": [{"id": node_id, "capacity": dict(workload.node_capacity)} for node_id in node_ids],
+        "links": links
+    }
+
+class CapacitySimulator:
+    def __init__(
+        self,
+        topology: Dict,
+        catalog: Dict[str, Dict],
+        workload: WorkloadConfig,
+        trace_path: Optional[str] = None
+    ):
+        if not workload.classes:
+            raise ValueError("The workload needs at least one service class")
+        for service_class in workload.classes:
+            unknown = [vnf_type for vnf_type in service_class.service_chain if vnf_type not in catalog]
+            if unknown:
+                raise ValueError(f"Service class {service_class.service_type} uses unknown VNF types: {unknown}")
+
+        self.workload = workload
+        self.classes = workload.classes
+        self.random = random.Random(workload.seed)  # Inter-event times, cheaper per draw than NumPy
+        self.rng = np.random.default_rng(workload.seed)  # Metric noise, drawn per tick
+
+        self.sdn_controller = SDNController()
+        self.sdn_controller.load_topology(topology)
+        self.vnf_manager = VNFManager()
+        # A few samples per instance at simulated resolution instead of the default tiers
+        self.vnf_manager.telemetry = VNFTelemetryStore([(workload.metrics_interval, workload.telemetry_buckets)])
+        self.vnf_manager.apply_catalog(catalog)
+        self.vnf_requirements = {
+            vnf_type: spec["resource_requirements"] for vnf_type, spec in catalog.items()
+        }
+
+        # Node capacity the chains are placed on, and the pool slices are admitted against
+        self.node_capacity = {resource_type: 0.0 for resource_type in RESOURCE_TYPES}
+        for _, attributes in self.sdn_controller.network_topology.nodes(data=True):
+            for resource_type in RESOURCE_TYPES:
+                self.node_capacity[resource_type] += attributes.get("capacity", {}).get(resource_type, 0.0)
+        self.pool = {
+            resource_type: float((workload.pool or self.node_capacity).get(resource_type, 0.0))
+            for resource_type in RESOURCE_TYPES
+        }
+        self.sdn_controller.available_resources = dict(self.pool)
+
+        # Largest requirement per resource of any VNF in a chain, for fragmentation
+        chained = {vnf_type for service_class in self.classes for vnf_type in service_class.service_chain}
+        self.largest_vnf = [
+            max((self.vnf_requirements[vnf_type].get(resource_type, 0.0) for vnf_type in chained), default=0.0)
+            for resource_type in RESOURCE_TYPES
+        ]
+
+        # Node resources held by one slice of each class: the sum over its chain
+        self.chain_usage = [
+            [
+                sum(self.vnf_requirements[vnf_type].get(resource_type, 0.0) for vnf_type in service_class.service_chain)
+                for resource_type in RESOURCE_TYPES
+            ]
+            for service_class in self.classes
+        ]
+
+        self.now = 0.0
+        self.slices: Dict[str, List] = {}  # Slice ID -> [class index, departure, instance IDs, failed VNFs,
+                                      # pool usage, NetworkSlice, (chain latency, bandwidth, reliability)]
+        self._queue: List[Tuple[float, int, int, Tuple]] = []
+        self._sequence = itertools.count()  # Breaks ties between events at the same time
+        self._request_numbers = itertools.count(1)
+        self._trace: Optional[Iterator] = read_trace(trace_path, self.classes) if trace_path else None
+        self._state = [0.0] * (DEGRADED + 1)
+        self._reset_statistics(0.0)
+
+    def run(self) -> Dict:
+        """
+        Simulate the workload for the configured duration.
+        
+        Returns:
+            Dict: Report, see report()
+        """
+        handlers = (
+            self._arrival,
+            self._departure,
+            self._vnf_failure,
+            self._vnf_repair,
+            self._metrics,
+            self._warmup_end
+        )
+        if self._trace is None:
+            for class_index, service_class in enumerate(self.classes):
+                if service_class.arrival_rate > 0:
+                    self._schedule(self.random.expovariate(service_class.arrival_rate), ARRIVAL, (class_index, None, None))
+        else:
+            self._schedule_trace_arrival()
+        self._schedule(self.workload.metrics_interval, METRICS, ())
+        if self.workload.warmup > 0:
+            self._schedule(self.workload.warmup, WARMUP_END, ())
+
+        queue = self._queue
+        duration = self.workload.duration
+        events = 0
+        started = time.perf_counter()
+        while queue and queue[0][0] <= duration:
+            now, _, kind, payload = heapq.heappop(queue)
+            self._integrate(now)
+            handlers[kind](now, payload)
+            events += 1
+        self._integrate(duration)
+        return self.report(events, time.perf_counter() - started)
+
+    def report(self, events: int, wall_seconds: float) -> Dict:
+        """
+        Summarize the statistics collected after the warm-up.
+        
+        Args:
+            events: Number of events processed
+            wall_seconds: Wall-clock time the run took
+        
+        Returns:
+            Dict: Throughput, blocking probability overall and per class,
+                  time-weighted pool and node utilization, node
+                  fragmentation and VNF churn
+        """
+        measured = max(self.now - self._measure_start, 1e-9)
+        mean = [area / measured for area in self._area]
+        arrivals = sum(stats["arrivals"] for stats in self._class_stats)
+        blocked = sum(stats["blocked"] for stats in self._class_stats)
+
+        classes = {}
+        for service_class, stats in zip(self.classes, self._class_stats):
+            classes[service_class.service_type] = {
+                **stats,
+                "blocking_probability": stats["blocked"] / stats["arrivals"] if stats["arrivals"] else None,
+                "offered_load": (
+                    service_class.arrival_rate * service_class.mean_holding_time if self._trace is None else None
+                )
+            }
+
+        samples = max(self._fragmentation_samples, 1)
+        return {
+            "simulated_seconds": measured,
+            "wall_seconds": wall_seconds,
+            "events": events,
+            "events_per_second": events / wall_seconds if wall_seconds else None,
+            "metric_updates": self._metric_updates,
+            # Events plus the slice and VNF metric writes done by the metric ticks
+            "updates_per_second": (events + self._metric_updates) / wall_seconds if wall_seconds else None,
+            "arrivals": arrivals,
+            "blocked": blocked,
+            "blocking_probability": blocked / arrivals if arrivals else None,
+            "blocked_by_reason": dict(self._blocked_by_reason),
+            "classes": classes,
+            "mean_active_slices": mean[ACTIVE],
+            "utilization": {
+                "pool": self._utilization(mean, POOL_USED, self.pool),
+                "nodes": self._utilization(mean, NODE_USED, self.node_capacity)
+            },
+            "peak_utilization": {
+                "pool": self._utilization(self._peak, POOL_USED, self.pool),
+                "nodes": self._utilization(self._peak, NODE_USED, self.node_capacity)
+            },
+            "fragmentation": {
+                resource_type: {
+                    "mean": self._fragmentation_sum[i] / samples,
+                    "max": self._fragmentation_max[i]
+                }
+                for i, resource_type in enumerate(RESOURCE_TYPES)
+            },
+            "link_utilization": {
+                "mean_max": self._link_utilization_sum / samples,
+                "max": self._link_utilization_max
+            },
+            "vnf": {
+                "failures": self._vnf_failures,
+                "repairs": self._vnf_repairs,
+                # Share of slice time with every VNF of the chain running
+                "slice_availability": 1.0 - self._area[DEGRADED] / self._area[ACTIVE] if self._area[ACTIVE] else None
+            }
+        }
+
+    def _schedule(self, at: float, kind: int, payload: Tuple) -> None:
+        """Add an event to the queue."""
+        heapq.heappush(self._queue, (at, next(self._sequence), kind, payload))
+
+    def _schedule_trace_arrival(self) -> None:
+        """Queue the next request of the trace, if any remain."""
+        row = next(self._trace, None)
+        if row is not None:
+            arrival, class_index, holding_time, qos = row
+            self._schedule(arrival, ARRIVAL, (class_index, holding_time, qos))
+
+    def _schedule_failure(self, now: float, slice_id: str, position: int, instance_id: str, departure: float) -> None:
+        """Queue the failure of a VNF instance if it fails before its slice departs."""
+        if self.workload.vnf_failure_rate > 0:
+            failure = now + self.random.expovariate(self.workload.vnf_failure_rate)
+            if failure < departure:
+                self._schedule(failure, VNF_FAILURE, (slice_id, position, instance_id))
+
+    def _integrate(self, now: float) -> None:
+        """Accumulate the time-weighted state up to now."""
+        elapsed = now - self.now
+        if elapsed > 0:
+            self._area = [area + value * elapsed for area, value in zip(self._area, self._state)]
+            self.now = now
+
+    def _arrival(self, now: float, payload: Tuple) -> None:
+        """Admit a slice request, place its chain and start its VNFs."""
+        class_index, holding_time, qos = payload
+        service_class = self.classes[class_index]
+        if self._trace is None:
+            self._schedule(now + self.random.expovariate(service_class.arrival_rate), ARRIVAL, payload)
+        else:
+            self._schedule_trace_arrival()
+        stats = self._class_stats[class_index]
+        stats["arrivals"] += 1
+
+        name = f"{service_class.service_type}-{next(self._request_numbers)}"
+        success, slice_id = self.sdn_controller.create_slice(
+            name,
+            qos or service_class.qos_requirements,
+            service_class.service_type
+        )
+        if not success:
+            self._block(stats, "pool")
+            return
+
+        chain = service_class.service_chain
+        latency = 0.0
+        if chain:
+            placement = self.sdn_controller.place_service_chain(slice_id, chain, self.vnf_requirements)
+            if placement is None:
+                self.sdn_controller.delete_slice(slice_id)
+                self._block(stats, "placement")
+                return
+            latency = placement["latency_ms"]
+
+        if holding_time is None:
+            holding_time = self.random.expovariate(1.0 / service_class.mean_holding_time)
+        departure = now + holding_time
+        instances = []
+        for position, vnf_type in enumerate(chain):
+            _, instance_id = self.vnf_manager.instantiate_vnf(vnf_type, f"{name}-{vnf_type}", slice_id)
+            instances.append(instance_id)
+            self._schedule_failure(now, slice_id, position, instance_id, departure)
+
+        slice_instance = self.sdn_controller.active_slices[slice_id]
+        pool_usage = [slice_instance.allocated_resources.get(resource_type, 0.0) for resource_type in RESOURCE_TYPES]
+        qos = slice_instance.qos_requirements
+        self.slices[slice_id] = [
+            class_index, departure, instances, 0, pool_usage,
+            slice_instance, (latency, qos.bandwidth_mbps, qos.reliability)
+        ]
+        self._schedule(departure, DEPARTURE, (slice_id,))
+        self._add_usage(class_index, pool_usage, 1.0)
+        self._peak = [max(peak, value) for peak, value in zip(self._peak, self._state)]
+        stats["accepted"] += 1
+
+    def _departure(self, now: float, payload: Tuple) -> None:
+        """Stop a slice's VNFs and release the slice."""
+        slice_id, = payload
+        class_index, _, instances, failed, pool_usage, _, _ = self.slices.pop(slice_id)
+        for instance_id in instances:
+            if instance_id is not None:
+                self.vnf_manager.terminate_vnf(instance_id)
+        if failed:
+            self._state[DEGRADED] -= 1
+        self.sdn_controller.delete_slice(slice_id)
+        self._add_usage(class_index, pool_usage, -1.0)
+
+    def _vnf_failure(self, now: float, payload: Tuple) -> None:
+        """Take a failed VNF instance down and queue its restart."""
+        slice_id, position, instance_id = payload
+        record = self.slices.get(slice_id)
+        if record is None or record[2][position] != instance_id:
+            return
+        self.vnf_manager.terminate_vnf(instance_id)
+        record[2][position] = None
+        record[3] += 1
+        if record[3] == 1:
+            self._state[DEGRADED] += 1
+        self._vnf_failures += 1
+        self._schedule(
+            now + self.random.expovariate(1.0 / self.workload.vnf_repair_time),
+            VNF_REPAIR,
+            (slice_id, position)
+        )
+
+    def _vnf_repair(self, now: float, payload: Tuple) -> None:
+        """Restart a failed VNF instance if its slice is still active."""
+        slice_id, position = payload
+        record = self.slices.get(slice_id)
+        if record is None:
+            return
+        class_index, departure, instances = record[0], record[1], record[2]
+        vnf_type = self.classes[class_index].service_chain[position]
+        _, instance_id = self.vnf_manager.instantiate_vnf(vnf_type, f"{record[5].name}-{vnf_type}", slice_id)
+        instances[position] = instance_id
+        record[3] -= 1
+        if record[3] == 0:
+            self._state[DEGRADED] -= 1
+        self._vnf_repairs += 1
+        self._schedule_failure(now, slice_id, position, instance_id, departure)
+
+    def _metrics(self, now: float, payload: Tuple) -> None:
+        """Report synthetic slice and VNF metrics and sample fragmentation."""
+        self._schedule(now + self.workload.metrics_interval, METRICS, ())
+        records = list(self.slices.values())
+        if records:
+            # Metric values for all slices at once; only the writes loop in Python
+            base = np.array([record[6] for record in records], dtype=np.float64)
+            failed_share = np.array([record[3] / len(record[2]) if record[2] else 0.0 for record in records])
+            noise = self.rng.random((len(records), 3))
+            load = 0.3 + 0.6 * noise[:, 2]
+            columns = (
+                base[:, 0] * (1.0 + 0.2 * noise[:, 0]),
+                base[:, 1] * (0.8 + 0.2 * noise[:, 1]),
+                base[:, 2] * (1.0 - failed_share),
+                load
+            )
+            for record, latency, bandwidth, reliability, utilization in zip(records, *(c.tolist() for c in columns)):
+                record[5].update_performance_metrics({
+                    "current_latency": latency,
+                    "current_bandwidth": bandwidth,
+                    "reliability_score": reliability,
+                    "resource_utilization": 100.0 * utilization
+                })
+                if record[2]:
+                    chain = self.classes[record[0]].service_chain
+                    for instance_id, vnf_type in zip(record[2], chain):
+                        if instance_id is not None:
+                            self.vnf_manager.update_resource_usage(
+                                instance_id,
+                                {r: amount * utilization for r, amount in self.vnf_requirements[vnf_type].items()},
+                                timestamp=now
+                            )
+                            self._metric_updates += 1
+            self._metric_updates += len(records)
+
+        if now < self._measure_start:
+            return
+        topology = self.sdn_controller.network_topology
+        free = [
+            [max(attributes["available"].get(resource_type, 0.0), 0.0) for resource_type in RESOURCE_TYPES]
+            for _, attributes in topology.nodes(data=True)
+        ]
+        # Free capacity stranded on nodes that cannot host the largest VNF any more
+        stranded = [
+            node_free for node_free in free
+            if any(amount < needed for amount, needed in zip(node_free, self.largest_vnf))
+        ]
+        for i in range(len(RESOURCE_TYPES)):
+            total = sum(node_free[i] for node_free in free)
+            fragmentation = sum(node_free[i] for node_free in stranded) / total if total > 0 else 0.0
+            self._fragmentation_sum[i] += fragmentation
+            self._fragmentation_max[i] = max(self._fragmentation_max[i], fragmentation)
+        link_utilization = max(
+            (
+                attributes.get("load", 0.0) / attributes["bandwidth"]
+                for _, _, attributes in topology.edges(data=True) if attributes.get("bandwidth")
+            ),
+            default=0.0
+        )
+        self._link_utilization_sum += link_utilization
+        self._link_utilization_max = max(self._link_utilization_max, link_utilization)
+        self._fragmentation_samples += 1
+
+    def _warmup_end(self, now: float, payload: Tuple) -> None:
+        """Discard the statistics collected during the warm-up."""
+        self._reset_statistics(now)
+
+    def _reset_statistics(self, now: float) -> None:
+        """Start collecting statistics from now on."""
+        self._measure_start = now
+        self._area = [0.0] * len(self._state)
+        self._peak = list(self._state)
+        self._class_stats = [{"arrivals": 0, "accepted": 0, "blocked": 0} for _ in self.classes]
+        self._blocked_by_reason = {"pool": 0, "placement": 0}
+        self._vnf_failures = 0
+        self._vnf_repairs = 0
+        self._metric_updates = 0
+        self._fragmentation_sum = [0.0] * len(RESOURCE_TYPES)
+        self._fragmentation_max = [0.0] * len(RESOURCE_TYPES)
+        self._fragmentation_samples = 0
+        self._link_utilization_sum = 0.0
+        self._link_utilization_max = 0.0
+
+    def _block(self, stats: Dict, reason: str) -> None:
+        """Count a blocked slice request."""
+        stats["blocked"] += 1
+        self._blocked_by_reason[reason] += 1
+
+    def _add_usage(self, class_index: int, pool_usage: List[float], sign: float) -> None:
+        """Add or remove one slice from the time-weighted state."""
+        state = self._state
+        for i, amount in enumerate(pool_usage):
+            state[POOL_USED + i] += sign * amount
+        for i, amount in enumerate(self.chain_usage[class_index]):
+            state[NODE_USED + i] += sign * amount
+        state[ACTIVE] += sign
+
+    @staticmethod
+    def _utilization(values: List[float], offset: int, capacity: Dict[str, float]) -> Dict[str, Optional[float]]:
+        """Divide usage per resource by capacity."""
+        return {
+            resource_type: values[offset + i] / capacity[resource_type] if capacity[resource_type] else None
+            for i, resource_type in enumerate(RESOURCE_TYPES)
+        }
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Discrete-event capacity planning simulation "
+                    "(e.g. python -m src.simulation.simulator --duration 2592000 --nodes 8)"
+    )
+    parser.add_argument("--config", type=str, default="configs/default.yaml")
+    parser.add_argument("--duration", type=float, default=None, help="Simulated seconds, overrides the config")
+    parser.add_argument("--seed", type=int, default=None, help="Random seed, overrides the config")
+    parser.add_argument("--nodes", type=int, default=None, help="Simulate a generated ring of this many nodes")
+    parser.add_argument("--trace", type=str, default=None, help="CSV of slice requests instead of Poisson arrivals")
+    parser.add_argument("--output", type=str, default=None, help="JSON file to write, stdout if omitted")
+    args = parser.parse_args(argv)
+
+    with open(args.config, "r") as f:
+        config = yaml.safe_load(f) or {}
+    workload = parse_workload(config)
+    if args.duration is not None:
+        workload.duration = args.duration
+    if args.seed is not None:
+        workload.seed = args.seed
+
+    simulator = CapacitySimulator(
+        build_topology(config, workload, args.nodes),
+        parse_catalog(config),
+        workload,
+        trace_path=args.trace
+    )
+    output = json.dumps(simulator.run(), indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output + "\n")
+    else:
+        print(output)
+
+if __name__ == "__main__":
+    main()
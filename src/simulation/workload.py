@@ -0,0 +1,114 @@
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Optional, Tuple
+import csv
+from src.core.network_slice import QoSRequirements
+
+@dataclass
+class ServiceClass:
+    service_type: str  # eMBB, URLLC, mMTC
+    arrival_rate: float  # Slice requests per simulated second (Poisson)
+    mean_holding_time: float  # Mean slice lifetime in seconds (exponential)
+    qos_requirements: QoSRequirements
+    service_chain: List[str] = field(default_factory=list)  # VNF types placed per slice
+
+@dataclass
+class WorkloadConfig:
+    duration: float = 86400.0  # Simulated seconds
+    warmup: float = 0.0  # Seconds before statistics are collected
+    seed: int = 0
+    metrics_interval: float = 60.0  # Seconds between slice and VNF metric updates
+    vnf_failure_rate: float = 0.0  # Failures per VNF instance and second
+    vnf_repair_time: float = 300.0  # Mean seconds until a failed VNF is restarted
+    pool: Optional[Dict[str, float]] = None  # Slice admission pool, sum of node capacities if None
+    node_capacity: Dict[str, float] = field(
+        default_factory=lambda: {"cpu": 100.0, "memory": 1024000.0, "bandwidth": 10000.0}
+    )  # Per node of a generated topology
+    link_latency: float = 1.0  # ms, per link of a generated topology
+    link_bandwidth: float = 10000.0  # Mbps, per link of a generated topology
+    telemetry_buckets: int = 60  # Telemetry samples kept per VNF instance
+    classes: List[ServiceClass] = field(default_factory=list)
+
+def parse_workload(config: Dict) -> WorkloadConfig:
+    """
+    Parse the "simulation.workload" config section.
+    
+    Args:
+        config: Full configuration dictionary
+    
+    Returns:
+        WorkloadConfig: Parsed workload, with defaults for missing fields
+    
+    Raises:
+        ValueError: If a service class is malformed
+    """
+    section = dict((config.get("simulation") or {}).get("workload") or {})
+    classes = []
+    for index, entry in enumerate(section.pop("classes", None) or []):
+        if not isinstance(entry, dict) or not entry.get("service_type"):
+            raise ValueError(f"simulation.workload.classes[{index}] needs a service_type")
+        if entry.get("arrival_rate", 0) < 0 or entry.get("mean_holding_time", 0) <= 0:
+            raise ValueError(
+                f"Service class {entry['service_type']} needs a non-negative arrival_rate "
+                f"and a positive mean_holding_time"
+            )
+        qos = entry.get("qos_requirements") or {}
+        classes.append(ServiceClass(
+            service_type=entry["service_type"],
+            arrival_rate=float(entry.get("arrival_rate", 0.0)),
+            mean_holding_time=float(entry["mean_holding_time"]),
+            qos_requirements=QoSRequirements(
+                latency_ms=float(qos.get("latency_ms", 100.0)),
+                bandwidth_mbps=float(qos.get("bandwidth_mbps", 100.0)),
+                reliability=float(qos.get("reliability", 99.9)),
+                isolation_level=qos.get("isolation_level", "shared")
+            ),
+            service_chain=list(entry.get("service_chain") or [])
+        ))
+
+    known = set(WorkloadConfig.__dataclass_fields__) - {"classes"}
+    return WorkloadConfig(
+        classes=classes,
+        **{key: value for key, value in section.items() if key in known}
+    )
+
+def read_trace(path: str, classes: List[ServiceClass]) -> Iterator[Tuple[float, int, float, Optional[QoSRequirements]]]:
+    """
+    Stream slice requests from a CSV trace, one row at a time.
+    
+    Rows need the columns time, service_type and holding_time (seconds) and
+    must be sorted by time. Optional latency_ms, bandwidth_mbps and
+    reliability columns override the QoS of the row's service class.
+    
+    Args:
+        path: Path to the CSV file
+        classes: Service classes, matched by service_type
+    
+    Yields:
+        Tuple[float, int, float, Optional[QoSRequirements]]: (Arrival time,
+            class index, holding time, QoS override or None)
+    
+    Raises:
+        ValueError: If a row has an unknown service type or is out of order
+    """
+    index_by_type = {service_class.service_type: i for i, service_class in enumerate(classes)}
+    previous = float("-inf")
+    with open(path, newline="") as f:
+        for line, row in enumerate(csv.DictReader(f), start=2):
+            class_index = index_by_type.get(row["service_type"])
+            if class_index is None:
+                raise ValueError(f"{path}:{line}: unknown service type {row['service_type']}")
+            arrival = float(row["time"])
+            if arrival < previous:
+                raise ValueError(f"{path}:{line}: trace is not sorted by time")
+            previous = arrival
+
+            qos = None
+            if any(row.get(column) for column in ("latency_ms", "bandwidth_mbps", "reliability")):
+                base = classes[class_index].qos_requirements
+                qos = QoSRequirements(
+                    latency_ms=float(row.get("latency_ms") or base.latency_ms),
+                    bandwidth_mbps=float(row.get("bandwidth_mbps") or base.bandwidth_mbps),
+                    reliability=float(row.get("reliability") or base.reliability),
+                    isolation_level=base.isolation_level
+                )
+            yield arrival, class_index, float(row["holding_time"]), qos
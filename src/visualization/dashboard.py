@@ -1,59 +1,310 @@
 import dash
 from dash import html, dcc
-from dash.dependencies import Input, Output
+from dash.dependencies import Input, Output, State
 import plotly.graph_objs as go
-import plotly.express as px
-import pandas as pd
 import networkx as nx
-from typing import Dict, List
+import numpy as np
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+from requests.adapters import HTTPAdapter
 import requests
+import threading
+import hashlib
 import json
 
+# pandas and plotly.express are imported by the callbacks that chart with them,
+# at the first update rather than at startup
+
 # Initialize the Dash app
 app = dash.Dash(__name__, suppress_callback_exceptions=True)
 server = app.server  # Expose Flask server for WSGI
 
 # API endpoint
 API_BASE_URL = "http://localhost:8000/api/v1"
+API_TIMEOUT = (2.0, 5.0)  # Connect and read timeout in seconds
+FETCH_INTERVAL_MS = 5000
+
+# Endpoints fetched once per cycle into the shared store: store key -> endpoint
+API_ENDPOINTS = {
+    "slice_aggregate": "slices/aggregate",
+    "vnfs": "vnf/instances",
+    "prediction_metrics": "metrics/resource-prediction"
+}
+# Raw slice records, fetched only while drill-down is enabled
+RAW_POINT_LIMIT = 5000
+RAW_SLICES_ENDPOINT = f"slices?limit={RAW_POINT_LIMIT}"
+
+# Slice performance metrics shown in the utilization distribution
+METRIC_LABELS = {
+    "current_bandwidth": "Bandwidth (Mbps)",
+    "current_latency": "Latency (ms)",
+    "reliability_score": "Reliability (%)",
+    "resource_utilization": "Utilization (%)"
+}
+
+# One pooled session shared by all callbacks, so connections are reused
+session = requests.Session()
+session.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+
+# Last response per endpoint for conditional requests: endpoint -> (ETag, body)
+_etag_cache: Dict[str, Tuple[str, Dict]] = {}
+_etag_lock = threading.Lock()
+
+def fetch_topology(current: Optional[Dict]) -> Optional[Dict]:
+    """
+    Fetch the SDN controller topology, as a delta when possible.
+    
+    Args:
+        current: Topology view this tab already holds, None if none
+    
+    Returns:
+        Optional[Dict]: Up-to-date topology view, None if the API is unreachable
+    """
+    params = {}
+    if current:
+        params = {"since": current["version"], "epoch": current["epoch"]}
+    try:
+        response = session.get(f"{API_BASE_URL}/topology", params=params, timeout=API_TIMEOUT)
+        response.raise_for_status()
+        view = response.json()
+    except (requests.RequestException, ValueError):
+        return None
+
+    if not view.get("delta"):
+        return view
+    return merge_topology_delta(current, view)
+
+def merge_topology_delta(topology: Dict, delta: Dict) -> Dict:
+    """
+    Apply a topology delta to a full topology view.
+    
+    Args:
+        topology: Full view with "nodes" and "links"
+        delta: Changed and removed nodes and links after topology's version
+    
+    Returns:
+        Dict: Full view at the delta's version
+    """
+    nodes = {node["id"]: node for node in topology["nodes"]}
+    links = {(link["source"], link["target"]): link for link in topology["links"]}
+    for node_id in delta["removed_nodes"]:
+        nodes.pop(node_id, None)
+    for source, target in delta["removed_links"]:
+        links.pop((source, target), None)
+    nodes.update((node["id"], node) for node in delta["nodes"])
+    links.update(((link["source"], link["target"]), link) for link in delta["links"])
+    return {
+        "version": delta["version"],
+        "epoch": delta["epoch"],
+        "delta": False,
+        "nodes": list(nodes.values()),
+        "links": list(links.values())
+    }
+
+# Topology layouts by fingerprint, plus the last one shown to seed the next
+LAYOUT_CACHE_SIZE = 8
+_layout_cache: "OrderedDict[str, Dict[str, np.ndarray]]" = OrderedDict()
+_last_layout: Dict[str, np.ndarray] = {}
+_layout_lock = threading.Lock()
+
+def fetch_api_data(endpoint: str) -> Tuple[Dict, Optional[str]]:
+    """
+    Fetch data from the API with a conditional request.
+    
+    The last response of each endpoint is kept with its ETag; when the API
+    answers 304 Not Modified the kept body is returned without a transfer.
+    
+    Args:
+        endpoint: Path below API_BASE_URL
+    
+    Returns:
+        Tuple[Dict, Optional[str]]: (Response body, its ETag); an empty body
+                                    and no ETag if the API is unreachable
+    """
+    with _etag_lock:
+        cached = _etag_cache.get(endpoint)
+    headers = {"If-None-Match": cached[0]} if cached else {}
 
-def get_api_data(endpoint: str) -> Dict:
-    """Fetch data from the API."""
     try:
-        response = requests.get(f"{API_BASE_URL}/{endpoint}")
-        return response.json()
-    except:
-        return {}
+        response = session.get(f"{API_BASE_URL}/{endpoint}", headers=headers, timeout=API_TIMEOUT)
+        if response.status_code == 304 and cached:
+            return cached[1], cached[0]
+        response.raise_for_status()
+        data = response.json()
+    except (requests.RequestException, ValueError):
+        return {}, None
+
+    etag = response.headers.get("ETag")
+    with _etag_lock:
+        if etag:
+            _etag_cache[endpoint] = (etag, data)
+        else:
+            _etag_cache.pop(endpoint, None)
+    return data, etag
+
+def topology_fingerprint(nodes: List[str], edges: List[Tuple[str, str]]) -> str:
+    """
+    Identify a topology independently of node and edge order.
+    
+    Args:
+        nodes: Node identifiers
+        edges: (source, target) pairs
+    
+    Returns:
+        str: Hex digest of the sorted nodes and undirected edges
+    """
+    canonical = json.dumps([
+        sorted(map(str, nodes)),
+        sorted(sorted((str(u), str(v))) for u, v in edges)
+    ])
+    return hashlib.sha1(canonical.encode()).hexdigest()
+
+def _place_new_nodes(
+    G: nx.Graph,
+    positions: Dict[str, np.ndarray],
+    new_nodes: List[str],
+    iterations: int = 50
+) -> Dict[str, np.ndarray]:
+    """
+    Lay out added nodes around a fixed existing layout.
+    
+    New nodes start at the centroid of their placed neighbours and then
+    follow Fruchterman-Reingold forces (repulsion cut off beyond a few node
+    spacings) for a few iterations. Only the new
+    nodes move, so each iteration costs O(new nodes x all nodes) and the
+    rest of the picture stays where the user last saw it.
+    
+    Args:
+        G: Current topology
+        positions: Positions of the nodes kept from the previous layout
+        new_nodes: Nodes without a position yet
+        iterations: Force iterations
+    
+    Returns:
+        Dict[str, np.ndarray]: Positions of all nodes
+    """
+    nodes = list(positions) + list(new_nodes)
+    index = {node: i for i, node in enumerate(nodes)}
+    pos = np.zeros((len(nodes), 2))
+    pos[:len(positions)] = np.array(list(positions.values())).reshape(-1, 2)
+
+    # Typical node spacing of the existing layout
+    extent = np.ptp(pos[:len(positions)], axis=0).max() if len(positions) > 1 else 1.0
+    k = max(extent, 1e-3) / np.sqrt(len(nodes))
+    rng = np.random.default_rng(len(nodes))
+
+    movable = np.arange(len(positions), len(nodes))
+    for i in movable:
+        placed = [index[v] for v in G.neighbors(nodes[i]) if index[v] < i]
+        center = pos[placed].mean(axis=0) if placed else pos[:i].mean(axis=0) if i else np.zeros(2)
+        pos[i] = center + rng.normal(0.0, k, 2)
+
+    # Sparse adjacency of the movable nodes: (row in movable, neighbour index)
+    pairs = np.array(
+        [(row, index[v]) for row, i in enumerate(movable) for v in G.neighbors(nodes[i])],
+        dtype=np.int64
+    ).reshape(-1, 2)
+
+    temperature = k * 2
+    for _ in range(iterations):
+        delta = pos[movable, None, :] - pos[None, :, :]
+        distance = np.maximum(np.linalg.norm(delta, axis=2), 1e-6)
+        # Repulsion only from nearby nodes, else the fixed mass pushes new nodes to the rim
+        repulsion = np.where(distance < 3 * k, k * k / distance ** 2, 0.0)
+        displacement = (delta * repulsion[:, :, None]).sum(axis=1)
+        if len(pairs):
+            attraction = delta[pairs[:, 0], pairs[:, 1]] * (distance[pairs[:, 0], pairs[:, 1]] / k)[:, None]
+            np.subtract.at(displacement, pairs[:, 0], attraction)
+        length = np.maximum(np.linalg.norm(displacement, axis=1), 1e-9)
+        pos[movable] += displacement * (np.minimum(length, temperature) / length)[:, None]
+        temperature *= 0.9
+
+    return {node: pos[i] for node, i in index.items()}
+
+def compute_layout(G: nx.Graph) -> Dict[str, np.ndarray]:
+    """
+    Get node positions for a topology, reusing earlier layouts.
+    
+    Layouts are cached by topology fingerprint. For a topology not seen
+    before, nodes already placed in the previous layout keep their
+    position and only added nodes are laid out; a full spring layout runs
+    only when most of the nodes are new.
+    
+    Args:
+        G: Topology to lay out
+    
+    Returns:
+        Dict[str, np.ndarray]: Position per node
+    """
+    global _last_layout
+    fingerprint = topology_fingerprint(list(G.nodes()), list(G.edges()))
+    with _layout_lock:
+        if fingerprint in _layout_cache:
+            _layout_cache.move_to_end(fingerprint)
+            _last_layout = _layout_cache[fingerprint]
+            return _last_layout
+        previous = _last_layout
+
+    kept = {node: previous[node] for node in G.nodes() if node in previous}
+    new_nodes = [node for node in G.nodes() if node not in previous]
+    if len(kept) >= len(new_nodes) and kept:
+        positions = _place_new_nodes(G, kept, new_nodes) if new_nodes else kept
+    else:
+        positions = nx.spring_layout(G, pos=kept or None, seed=42)
+
+    with _layout_lock:
+        _layout_cache[fingerprint] = positions
+        while len(_layout_cache) > LAYOUT_CACHE_SIZE:
+            _layout_cache.popitem(last=False)
+        _last_layout = positions
+    return positions
 
 def create_network_topology_figure(topology_data: Dict) -> go.Figure:
     """Create a network topology visualization."""
-    G = nx.Graph(topology_data)
-    pos = nx.spring_layout(G)
-    
+    G = nx.Graph()
+    G.add_nodes_from(topology_data.get('nodes', []))
+    G.add_edges_from(topology_data.get('edges', []))
+    pos = compute_layout(G)
+
+    nodes = list(G.nodes())
+    index = {node: i for i, node in enumerate(nodes)}
+    xy = np.array([pos[node] for node in nodes], dtype=np.float64).reshape(-1, 2)
+
+    # Edges as one polyline: x0, x1, NaN per edge, the NaN breaks the line
+    endpoints = np.array([(index[u], index[v]) for u, v in G.edges()], dtype=np.int64).reshape(-1, 2)
+    edge_x = np.full(3 * len(endpoints), np.nan)
+    edge_y = np.full(3 * len(endpoints), np.nan)
+    edge_x[0::3], edge_x[1::3] = xy[endpoints[:, 0], 0], xy[endpoints[:, 1], 0]
+    edge_y[0::3], edge_y[1::3] = xy[endpoints[:, 0], 1], xy[endpoints[:, 1], 1]
+
     edge_trace = go.Scatter(
-        x=[],
-        y=[],
+        x=edge_x,
+        y=edge_y,
         line=dict(width=0.5, color='#888'),
         hoverinfo='none',
         mode='lines'
     )
 
-    for edge in G.edges():
-        x0, y0 = pos[edge[0]]
-        x1, y1 = pos[edge[1]]
-        edge_trace['x'] += (x0, x1, None)
-        edge_trace['y'] += (y0, y1, None)
+    # Color nodes by utilization when the topology carries it
+    utilization = topology_data.get('utilization')
+    marker = dict(size=20, color='lightblue', line=dict(width=2))
+    if utilization:
+        marker.update(
+            color=[utilization.get(node, 0.0) for node in nodes],
+            colorscale='YlOrRd',
+            cmin=0.0,
+            cmax=1.0,
+            colorbar=dict(title='Utilization')
+        )
 
     node_trace = go.Scatter(
-        x=[pos[node][0] for node in G.nodes()],
-        y=[pos[node][1] for node in G.nodes()],
+        x=xy[:, 0],
+        y=xy[:, 1],
         mode='markers+text',
         hoverinfo='text',
-        text=list(G.nodes()),
-        marker=dict(
-            size=20,
-            color='lightblue',
-            line=dict(width=2)
-        )
+        text=nodes,
+        marker=marker
     )
 
     return go.Figure(
@@ -72,141 +323,209 @@ def create_network_topology_figure(topology_data: Dict) -> go.Figure:
 app.layout = html.Div([
     html.H1('Network Slicing Dashboard'),
     
+    # Single fetch cycle; every graph is derived from the store
+    dcc.Store(id='api-data'),
+    dcc.Store(id='topology-data'),
+    dcc.Interval(
+        id='fetch-interval',
+        interval=FETCH_INTERVAL_MS
+    ),
+    dcc.Checklist(
+        id='raw-points',
+        options=[{'label': f' Show raw slice points (first {RAW_POINT_LIMIT})', 'value': 'raw'}],
+        value=[]
+    ),
+    
     html.Div([
         html.Div([
             html.H3('Active Network Slices'),
-            dcc.Graph(id='slice-status-graph'),
-            dcc.Interval(
-                id='slice-status-interval',
-                interval=5000  # Update every 5 seconds
-            )
+            dcc.Graph(id='slice-status-graph')
         ], className='six columns'),
         
         html.Div([
             html.H3('Resource Utilization'),
-            dcc.Graph(id='resource-utilization-graph'),
-            dcc.Interval(
-                id='resource-interval',
-                interval=5000
-            )
+            dcc.Graph(id='resource-utilization-graph')
         ], className='six columns')
     ], className='row'),
     
     html.Div([
         html.Div([
             html.H3('Network Topology'),
-            dcc.Graph(id='network-topology'),
-            dcc.Interval(
-                id='topology-interval',
-                interval=10000
-            )
+            dcc.Graph(id='network-topology')
         ], className='twelve columns')
     ], className='row'),
     
     html.Div([
         html.Div([
             html.H3('VNF Instances'),
-            dcc.Graph(id='vnf-status-graph'),
-            dcc.Interval(
-                id='vnf-interval',
-                interval=5000
-            )
+            dcc.Graph(id='vnf-status-graph')
         ], className='six columns'),
         
         html.Div([
             html.H3('Resource Prediction Accuracy'),
-            dcc.Graph(id='prediction-accuracy-graph'),
-            dcc.Interval(
-                id='prediction-interval',
-                interval=10000
-            )
+            dcc.Graph(id='prediction-accuracy-graph')
         ], className='six columns')
     ], className='row')
 ])
 
+@app.callback(
+    Output('api-data', 'data'),
+    Output('topology-data', 'data'),
+    Input('fetch-interval', 'n_intervals'),
+    Input('raw-points', 'value'),
+    State('api-data', 'data'),
+    State('topology-data', 'data')
+)
+def refresh_api_data(
+    n,
+    raw_points: Optional[List[str]],
+    current: Optional[Dict],
+    current_topology: Optional[Dict]
+):
+    """Fetch all endpoints once per cycle into the shared stores."""
+    endpoints = dict(API_ENDPOINTS)
+    if 'raw' in (raw_points or []):
+        endpoints['slices'] = RAW_SLICES_ENDPOINT
+
+    data = {"etags": {}}
+    for key, endpoint in endpoints.items():
+        data[key], data["etags"][key] = fetch_api_data(endpoint)
+
+    # When every endpoint still has the ETag this tab holds, leave the store
+    # alone so no graph is redrawn
+    etags = data["etags"]
+    if current and all(etags.values()) and etags == current.get("etags"):
+        data = dash.no_update
+
+    topology = fetch_topology(current_topology)
+    if current_topology and topology and (
+        (topology["epoch"], topology["version"]) == (current_topology["epoch"], current_topology["version"])
+    ):
+        topology = dash.no_update
+    return data, topology
+
 @app.callback(
     Output('slice-status-graph', 'figure'),
-    Input('slice-status-interval', 'n_intervals')
+    Input('api-data', 'data')
 )
-def update_slice_status(n):
+def update_slice_status(data):
     """Update the slice status visualization."""
-    slices = get_api_data('slices')
-    
-    if not slices:
-        return go.Figure()
+    data = data or {}
+    slices = data.get('slices')
 
-    df = pd.DataFrame(slices['slices'])
-    
-    fig = px.bar(
-        df,
-        x='name',
-        y='performance_metrics.resource_utilization',
-        color='service_type',
-        title='Slice Resource Utilization'
+    # Drill-down: one bar per slice
+    if slices and slices.get('slices'):
+        import pandas as pd
+        import plotly.express as px
+
+        df = pd.json_normalize(slices['slices'])
+        return px.bar(
+            df,
+            x='name',
+            y='performance_metrics.resource_utilization',
+            color='service_type',
+            title='Slice Resource Utilization'
+        )
+
+    # Default: server-side histogram per service type
+    groups = (data.get('slice_aggregate') or {}).get('groups', {})
+    fig = go.Figure()
+    for service_type, group in groups.items():
+        summary = group['metrics'].get('resource_utilization') or {}
+        histogram = summary.get('histogram')
+        if service_type == 'all' or not histogram:
+            continue
+        edges = np.array(histogram['edges'])
+        fig.add_trace(go.Bar(
+            x=(edges[:-1] + edges[1:]) / 2,
+            y=histogram['counts'],
+            width=np.diff(edges),
+            name=service_type
+        ))
+    fig.update_layout(
+        title='Slice Resource Utilization',
+        barmode='stack',
+        xaxis_title='Utilization (%)',
+        yaxis_title='Slices'
     )
-    
     return fig
 
 @app.callback(
     Output('resource-utilization-graph', 'figure'),
-    Input('resource-interval', 'n_intervals')
+    Input('api-data', 'data')
 )
-def update_resource_utilization(n):
+def update_resource_utilization(data):
     """Update the resource utilization visualization."""
-    slices = get_api_data('slices')
-    
-    if not slices:
-        return go.Figure()
+    data = data or {}
+    slices = data.get('slices')
+    fig = go.Figure()
 
-    resources = {
-        'CPU': [],
-        'Memory': [],
-        'Bandwidth': []
-    }
-    
-    for slice_data in slices['slices']:
-        metrics = slice_data['performance_metrics']
-        resources['CPU'].append(metrics['current_bandwidth'])
-        resources['Memory'].append(metrics['current_latency'])
-        resources['Bandwidth'].append(metrics['reliability_score'])
+    # Drill-down: every slice as a point
+    if slices and slices.get('slices'):
+        for metric, label in METRIC_LABELS.items():
+            fig.add_trace(go.Box(
+                y=[s.get('performance_metrics', {}).get(metric) for s in slices['slices']],
+                name=label,
+                boxpoints='all'
+            ))
+        fig.update_layout(title='Resource Utilization Distribution')
+        return fig
 
-    fig = go.Figure()
-    
-    for resource, values in resources.items():
+    # Default: boxes drawn from server-side quantiles
+    aggregate = data.get('slice_aggregate') or {}
+    quantiles = aggregate.get('quantiles', [])
+    overall = aggregate.get('groups', {}).get('all', {}).get('metrics', {})
+    for metric, label in METRIC_LABELS.items():
+        summary = overall.get(metric) or {}
+        if not summary.get('quantiles'):
+            continue
+        values = dict(zip(quantiles, summary['quantiles']))
         fig.add_trace(go.Box(
-            y=values,
-            name=resource,
-            boxpoints='all'
+            name=label,
+            lowerfence=[values[0.0]],
+            q1=[values[0.25]],
+            median=[values[0.5]],
+            q3=[values[0.75]],
+            upperfence=[values[1.0]],
+            mean=[summary['mean']]
         ))
-    
     fig.update_layout(title='Resource Utilization Distribution')
     return fig
 
 @app.callback(
     Output('network-topology', 'figure'),
-    Input('topology-interval', 'n_intervals')
+    Input('topology-data', 'data')
 )
-def update_topology(n):
+def update_topology(topology):
     """Update the network topology visualization."""
-    # In a real implementation, this would fetch topology data from the SDN controller
+    if not topology:
+        return go.Figure()
+
     topology_data = {
-        'nodes': ['node1', 'node2', 'node3', 'node4'],
-        'edges': [('node1', 'node2'), ('node2', 'node3'), ('node3', 'node4'), ('node4', 'node1')]
+        'nodes': [node['id'] for node in topology['nodes']],
+        'edges': [(link['source'], link['target']) for link in topology['links']],
+        'utilization': {
+            node['id']: max(node['utilization'].values(), default=0.0)
+            for node in topology['nodes']
+        }
     }
     
     return create_network_topology_figure(topology_data)
 
 @app.callback(
     Output('vnf-status-graph', 'figure'),
-    Input('vnf-interval', 'n_intervals')
+    Input('api-data', 'data')
 )
-def update_vnf_status(n):
+def update_vnf_status(data):
     """Update the VNF status visualization."""
-    vnfs = get_api_data('vnf/instances')
+    vnfs = (data or {}).get('vnfs')
     
     if not vnfs:
         return go.Figure()
 
+    import pandas as pd
+    import plotly.express as px
+
     df = pd.DataFrame(vnfs['vnfs'])
     
     fig = px.scatter(
@@ -221,15 +540,18 @@ def update_vnf_status(n):
 
 @app.callback(
     Output('prediction-accuracy-graph', 'figure'),
-    Input('prediction-interval', 'n_intervals')
+    Input('api-data', 'data')
 )
-def update_prediction_accuracy(n):
+def update_prediction_accuracy(data):
     """Update the prediction accuracy visualization."""
-    metrics = get_api_data('metrics/resource-prediction')
+    metrics = (data or {}).get('prediction_metrics')
     
     if not metrics:
         return go.Figure()
 
+    import pandas as pd
+    import plotly.express as px
+
     df = pd.DataFrame({
         'Resource': list(metrics.keys()),
         'Error (%)': list(metrics.values())
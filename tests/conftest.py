@@ -0,0 +1,6 @@
+import pytest
+
+@pytest.fixture(autouse=True)
+def config_cache_dir(tmp_path, monkeypatch):
+    """Keep the parsed-config cache of every test out of the working tree."""
+    monkeypatch.setenv("NWSLICING_CACHE_DIR", str(tmp_path / "config-cache"))
@@ -0,0 +1,86 @@
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+from src.api import main as api
+from src.api.aggregation import aggregate_columns
+from src.core.metrics_store import SliceMetricsStore
+from src.core.sla_monitor import SLAMonitor
+
+METRICS = ("latency", "bandwidth")
+
+class TestAggregateColumns:
+    def test_groups_share_histogram_edges(self):
+        values = np.array([[1.0, 10.0], [2.0, np.nan], [3.0, 30.0], [4.0, 40.0]])
+        summary = aggregate_columns(values, ["a", "b", "a", "b"], METRICS, bins=3)
+        latency = {group: summary["groups"][group]["metrics"]["latency"] for group in ("all", "a", "b")}
+        assert latency["a"]["histogram"]["edges"] == latency["b"]["histogram"]["edges"]
+        assert latency["all"]["histogram"]["counts"] == [1, 1, 2]
+        assert latency["a"]["histogram"]["counts"] == [1, 0, 1]
+        assert latency["a"]["mean"] == 2.0
+        assert summary["groups"]["b"]["metrics"]["bandwidth"]["count"] == 1  # NaN ignored
+
+    def test_quantiles(self):
+        values = np.arange(101, dtype=np.float64).reshape(-1, 1)
+        summary = aggregate_columns(values, ["a"] * 101, ("latency",), quantiles=(0.0, 0.5, 1.0))
+        assert summary["groups"]["all"]["metrics"]["latency"]["quantiles"] == [0.0, 50.0, 100.0]
+
+    def test_missing_metric(self):
+        values = np.full((2, 1), np.nan)
+        summary = aggregate_columns(values, ["a", "a"], ("latency",))
+        assert summary["groups"]["a"]["metrics"]["latency"] == {
+            "count": 0, "mean": None, "quantiles": None, "histogram": None
+        }
+
+class TestMetricsVersion:
+    def test_version_follows_membership_and_values(self):
+        store = SliceMetricsStore(METRICS)
+        store.add("s1")
+        version = store.version
+        store.ingest(["s1"], {"latency": [5.0]})
+        assert store.version == version + 1
+        store.ingest(["s1"], {"latency": [5.0]})
+        assert store.version == version + 1  # Same values again
+        store.ingest(["unknown"], {"latency": [1.0]})
+        assert store.version == version + 1
+        store.remove("s1")
+        assert store.version == version + 2
+
+@pytest.fixture
+def client(monkeypatch):
+    store = SliceMetricsStore(api.SLICE_METRICS)
+    monkeypatch.setattr(api, "slices", {})
+    monkeypatch.setattr(api, "slice_metrics", store)
+    monkeypatch.setattr(api, "slice_aggregate_cache", {})
+    monkeypatch.setattr(api, "sla_monitor", SLAMonitor(store))
+    return TestClient(api.app)
+
+def create_slice(client, service_type="eMBB"):
+    return client.post("/api/v1/slices", json={
+        "name": "slice",
+        "qos_requirements": {"latency_ms": 10.0, "bandwidth_mbps": 100.0, "reliability": 99.9, "isolation_level": "shared"},
+        "service_type": service_type
+    }).json()["slice_id"]
+
+class TestAggregateEndpoint:
+    def test_cache_survives_unchanged_ingest(self, client):
+        slice_id = create_slice(client)
+        batch = {"slice_ids": [slice_id], "metrics": {"current_latency": [12.0]}}
+        client.post("/api/v1/metrics/slices", json=batch)
+        first = client.get("/api/v1/slices/aggregate")
+        cached = api.slice_aggregate_cache[20]
+
+        client.post("/api/v1/metrics/slices", json=batch)
+        assert client.get("/api/v1/slices/aggregate").json() == first.json()
+        assert api.slice_aggregate_cache[20] is cached
+
+    def test_changed_values_and_membership_refresh(self, client):
+        slice_id = create_slice(client)
+        client.post("/api/v1/metrics/slices", json={"slice_ids": [slice_id], "metrics": {"current_latency": [12.0]}})
+        client.get("/api/v1/slices/aggregate")
+
+        client.post("/api/v1/metrics/slices", json={"slice_ids": [slice_id], "metrics": {"current_latency": [20.0]}})
+        latency = client.get("/api/v1/slices/aggregate").json()["groups"]["all"]["metrics"]["current_latency"]
+        assert latency["mean"] == 20.0
+
+        create_slice(client, "URLLC")
+        assert "URLLC" in client.get("/api/v1/slices/aggregate").json()["groups"]
@@ -0,0 +1,42 @@
+import asyncio
+import pytest
+from fastapi.testclient import TestClient
+from src.api import main as api
+
+class TestLifecycle:
+    def test_batcher_lock_created_on_server_loop(self, monkeypatch):
+        monkeypatch.setattr(api, "prediction_batcher_lock", None)
+        monkeypatch.setenv("NWSLICING_CONFIG", "missing.yaml")  # Keep the shared topology empty
+        with TestClient(api.app) as client:
+            lock = api.prediction_batcher_lock
+            assert isinstance(lock, asyncio.Lock)
+            assert client.get("/").status_code == 200
+
+@pytest.fixture
+def training_api(tmp_path, monkeypatch):
+    import numpy as np
+    from src.ai.numpy_backend import NumpyMLP
+    from src.ai.resource_predictor import NUM_FEATURES
+
+    model_path = str(tmp_path / "model.npz")
+    NumpyMLP([(np.zeros((NUM_FEATURES, 3), dtype=np.float32), np.zeros(3, dtype=np.float32), "linear")]).save(model_path)
+    (tmp_path / "data").mkdir()
+    monkeypatch.setenv("NWSLICING_MODEL_PATH", model_path)
+    monkeypatch.setenv("NWSLICING_MODEL_DIR", str(tmp_path / "models"))
+    monkeypatch.setenv("NWSLICING_TRAINING_DATA_DIR", str(tmp_path / "data"))
+    monkeypatch.setattr(api, "prediction_batcher", None)
+    monkeypatch.setattr(api, "training_manager", None)
+    yield TestClient(api.app)
+    if api.training_manager is not None:
+        api.training_manager.shutdown()
+    if api.prediction_batcher is not None:
+        api.prediction_batcher.stop()
+
+class TestTraining:
+    @pytest.mark.parametrize("features_path", ["/etc/passwd", "../model.npz"])
+    def test_files_outside_data_dir_rejected(self, training_api, features_path):
+        response = training_api.post(
+            "/api/v1/models/train", json={"features_path": features_path, "targets_path": "y.npy"}
+        )
+        assert response.status_code == 400
+        assert api.training_manager.jobs == {}
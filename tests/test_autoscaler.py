@@ -0,0 +1,131 @@
+import pytest
+from src.nfv.autoscaler import ScalingPolicy, VNFAutoscaler, policies_from_config
+from src.nfv.vnf_manager import VNFManager
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+@pytest.fixture
+def vnf_manager():
+    manager = VNFManager()
+    manager.register_vnf(
+        vnf_id="firewall",
+        image="nginx:latest",
+        resource_requirements={"cpu": 1.0, "memory": 512.0, "bandwidth": 100.0},
+        config={}
+    )
+    return manager
+
+@pytest.fixture
+def policy():
+    return ScalingPolicy(
+        vnf_type="firewall",
+        min_instances=1,
+        max_instances=10,
+        scale_out_cooldown=30.0,
+        scale_in_cooldown=300.0
+    )
+
+def make_autoscaler(vnf_manager, policy, utilization):
+    clock = FakeClock()
+    autoscaler = VNFAutoscaler(
+        vnf_manager,
+        [policy],
+        metrics_source=lambda vnf_type: utilization["value"],
+        clock=clock
+    )
+    return autoscaler, clock
+
+class TestDesiredInstances:
+    def test_hysteresis_band_keeps_count(self, vnf_manager, policy):
+        autoscaler = VNFAutoscaler(vnf_manager, [policy])
+        for utilization in (0.41, 0.6, 0.79):
+            assert autoscaler.desired_instances(policy, 4, utilization) == 4
+
+    def test_sized_to_target_outside_band(self, vnf_manager, policy):
+        autoscaler = VNFAutoscaler(vnf_manager, [policy])
+        assert autoscaler.desired_instances(policy, 4, 0.9) == 6
+        assert autoscaler.desired_instances(policy, 4, 0.15) == 1
+        assert autoscaler.desired_instances(policy, 9, 2.0) == policy.max_instances
+
+    def test_zero_instances_scale_from_demand(self, vnf_manager, policy):
+        autoscaler = VNFAutoscaler(vnf_manager, [policy])
+        assert autoscaler.desired_instances(policy, 0, None) == policy.min_instances
+        assert autoscaler.desired_instances(policy, 0, 1.5) == 3
+
+        idle_allowed = ScalingPolicy(vnf_type="firewall", min_instances=0)
+        assert autoscaler.desired_instances(idle_allowed, 0, None) == 0
+        assert autoscaler.desired_instances(idle_allowed, 0, 0.5) == 1
+
+class TestScaling:
+    def test_minimum_enforced_without_metrics(self, vnf_manager, policy):
+        autoscaler, _ = make_autoscaler(vnf_manager, policy, {"value": None})
+        assert autoscaler.tick() == {"firewall": 1}
+        assert vnf_manager.count_instances("firewall") == 1
+
+    def test_scale_out_honours_cooldown(self, vnf_manager, policy):
+        utilization = {"value": None}
+        autoscaler, clock = make_autoscaler(vnf_manager, policy, utilization)
+        autoscaler.tick()
+
+        utilization["value"] = 1.2
+        clock.now = 100.0
+        assert autoscaler.evaluate("firewall") == 1
+        clock.now = 110.0
+        assert autoscaler.evaluate("firewall") == 0  # Within the cooldown
+        clock.now = 131.0
+        assert autoscaler.evaluate("firewall") == 2
+
+    def test_scale_in_only_terminates_own_instances(self, vnf_manager, policy):
+        _, manual_id = vnf_manager.instantiate_vnf("firewall", "manual", "default")
+        utilization = {"value": 1.2}
+        autoscaler, clock = make_autoscaler(vnf_manager, policy, utilization)
+        assert autoscaler.evaluate("firewall") == 1  # 1 -> 2
+        auto_ids = list(autoscaler.managed["firewall"])
+
+        utilization["value"] = 0.05
+        clock.now = 1000.0
+        assert autoscaler.evaluate("firewall") == -1
+        assert manual_id in vnf_manager.active_vnfs
+        assert not any(instance_id in vnf_manager.active_vnfs for instance_id in auto_ids)
+
+        # Nothing of its own left to remove
+        clock.now = 2000.0
+        assert autoscaler.evaluate("firewall") == 0
+        assert manual_id in vnf_manager.active_vnfs
+
+    def test_idle_type_scales_to_zero(self, vnf_manager):
+        idle_allowed = ScalingPolicy(vnf_type="firewall", min_instances=0, scale_out_cooldown=0.0, scale_in_cooldown=0.0)
+        utilization = {"value": 0.5}
+        autoscaler, _ = make_autoscaler(vnf_manager, idle_allowed, utilization)
+        assert autoscaler.evaluate("firewall") == 1
+
+        utilization["value"] = 0.0
+        assert autoscaler.desired_instances(idle_allowed, 1, 0.0) == 0
+        assert autoscaler.evaluate("firewall") == -1
+        assert vnf_manager.count_instances("firewall") == 0
+
+    def test_externally_terminated_instances_forgotten(self, vnf_manager, policy):
+        autoscaler, _ = make_autoscaler(vnf_manager, policy, {"value": None})
+        autoscaler.tick()
+        instance_id = next(iter(autoscaler.managed["firewall"]))
+        vnf_manager.terminate_vnf(instance_id)
+        assert autoscaler._scale_in(policy, 1) == 0
+        assert not autoscaler.managed["firewall"]
+
+    def test_policies_from_config(self):
+        policies = policies_from_config({
+            "autoscaling": {
+                "defaults": {"max_instances": 5},
+                "policies": [{"vnf_type": "firewall", "min_instances": 2}]
+            }
+        })
+        assert policies == [ScalingPolicy(vnf_type="firewall", min_instances=2, max_instances=5)]
+
+    def test_invalid_thresholds_rejected(self, vnf_manager):
+        with pytest.raises(ValueError):
+            VNFAutoscaler(vnf_manager, [ScalingPolicy(vnf_type="firewall", scale_in_threshold=0.7)])
@@ -0,0 +1,72 @@
+import asyncio
+import pytest
+from src.ai.batcher import PredictionBatcher
+from src.core.network_slice import QoSRequirements
+
+class FakePredictor:
+    def __init__(self, fail=False):
+        self.batches = []
+        self.fail = fail
+
+    def predict_resources_batch(self, requests):
+        if self.fail:
+            raise RuntimeError("model failed")
+        self.batches.append(len(requests))
+        return [{"cpu": qos.latency_ms} for qos, _, _ in requests]
+
+def qos(latency_ms):
+    return QoSRequirements(latency_ms=latency_ms, bandwidth_mbps=10.0, reliability=99.0, isolation_level="shared")
+
+async def predict_all(batcher, count):
+    return await asyncio.gather(*(batcher.predict(qos(float(i)), "eMBB") for i in range(count)))
+
+class TestPredictionBatcher:
+    def test_concurrent_requests_coalesce(self):
+        predictor = FakePredictor()
+        batcher = PredictionBatcher(predictor, max_batch_size=64, max_wait_ms=50.0)
+
+        async def scenario():
+            results = await predict_all(batcher, 10)
+            batcher.stop()
+            return results
+
+        results = asyncio.run(scenario())
+        assert [r["cpu"] for r in results] == [float(i) for i in range(10)]
+        assert predictor.batches == [10]
+        assert batcher.stats == {"requests": 10, "batches": 1}
+
+    def test_batches_capped_at_max_size(self):
+        predictor = FakePredictor()
+        batcher = PredictionBatcher(predictor, max_batch_size=4, max_wait_ms=50.0)
+
+        async def scenario():
+            await predict_all(batcher, 10)
+            batcher.stop()
+
+        asyncio.run(scenario())
+        assert predictor.batches == [4, 4, 2]
+
+    def test_model_error_reaches_every_caller(self):
+        batcher = PredictionBatcher(FakePredictor(fail=True), max_wait_ms=10.0)
+
+        async def scenario():
+            results = await asyncio.gather(
+                *(batcher.predict(qos(1.0), "eMBB") for _ in range(3)), return_exceptions=True
+            )
+            batcher.stop()
+            return results
+
+        assert all(isinstance(r, RuntimeError) for r in asyncio.run(scenario()))
+
+    def test_stop_releases_worker_and_restarts(self):
+        batcher = PredictionBatcher(FakePredictor(), max_wait_ms=1.0)
+
+        async def scenario():
+            await batcher.predict(qos(1.0), "eMBB")
+            executor = batcher._executor
+            batcher.stop()
+            assert executor._shutdown and batcher._executor is None
+            return await batcher.predict(qos(2.0), "eMBB")
+
+        assert asyncio.run(scenario()) == {"cpu": 2.0}
+        batcher.stop()
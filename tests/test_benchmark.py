@@ -0,0 +1,82 @@
+import json
+import os
+import types
+import numpy as np
+import pytest
+from src.ai import benchmark
+from src.ai.benchmark import WorkloadGenerator, measure_accuracy, measure_latency, parse_mix, run_benchmark
+from src.ai.numpy_backend import NumpyMLP
+from src.ai.resource_predictor import NUM_FEATURES, ResourcePredictor
+
+@pytest.fixture
+def predictor(tmp_path):
+    path = str(tmp_path / "model.npz")
+    rng = np.random.default_rng(0)
+    NumpyMLP([(rng.normal(size=(NUM_FEATURES, 3)).astype(np.float32), np.zeros(3, dtype=np.float32), "relu")]).save(path)
+    return ResourcePredictor(path, cache_size=0)
+
+class TestWorkloadGenerator:
+    def test_same_seed_same_workload(self):
+        first, first_needs = WorkloadGenerator(seed=3).generate(20)
+        second, second_needs = WorkloadGenerator(seed=3).generate(20)
+        assert [r[1] for r in first] == [r[1] for r in second]
+        np.testing.assert_array_equal(first_needs, second_needs)
+
+    def test_mix_and_profiles(self):
+        requests, needs = WorkloadGenerator(mix={"URLLC": 1.0}).generate(50)
+        assert needs.shape == (50, 3)
+        assert all(service_type == "URLLC" for _, service_type, _ in requests)
+        assert all(1.0 <= qos.latency_ms <= 10.0 for qos, _, _ in requests)
+
+    def test_load_curves(self):
+        times = np.array([4 / 24, 16 / 24, 20 / 24])
+        diurnal = WorkloadGenerator(load_curve="diurnal").load_at(times)
+        assert diurnal[0] == pytest.approx(0.1) and diurnal[1] == pytest.approx(0.9)
+        assert WorkloadGenerator(load_curve="spike").load_at(times)[2] == pytest.approx(1.0)
+
+    @pytest.mark.parametrize("kwargs", [{"load_curve": "sawtooth"}, {"mix": {"VoIP": 1.0}}])
+    def test_invalid_settings_rejected(self, kwargs):
+        with pytest.raises(ValueError):
+            WorkloadGenerator(**kwargs)
+
+class TestMeasurements:
+    def test_latency_per_batch_size(self, predictor):
+        requests, _ = WorkloadGenerator().generate(16)
+        results = measure_latency(predictor, requests, batch_sizes=(1, 8), min_time=0.0, max_repeats=5)
+        assert set(results) == {"1", "8"}
+        assert results["8"]["calls"] == 5
+        assert results["8"]["per_request_us"] == pytest.approx(results["8"]["p50_ms"] * 1000 / 8)
+
+    def test_unmeasurable_latency_stays_valid_json(self, predictor, monkeypatch):
+        # A clock too coarse to see a call gives p50 = 0
+        monkeypatch.setattr(benchmark, "time", types.SimpleNamespace(perf_counter=lambda: 1.0))
+        requests, _ = WorkloadGenerator().generate(8)
+        results = measure_latency(predictor, requests, batch_sizes=(8,), min_time=0.0, max_repeats=5)
+        assert results["8"]["p50_ms"] == 0.0 and results["8"]["throughput_per_s"] is None
+        json.dumps(results, allow_nan=False)
+
+    def test_accuracy_groups(self, predictor):
+        requests, needs = WorkloadGenerator(mix={"eMBB": 1.0, "mMTC": 1.0}).generate(40)
+        results = measure_accuracy(predictor, requests, needs)
+        assert set(results) == {"all", "eMBB", "mMTC"}
+        assert results["all"]["samples"] == 40
+
+    def test_parse_mix(self):
+        assert parse_mix("eMBB=0.5, URLLC=0.5") == {"eMBB": 0.5, "URLLC": 0.5}
+
+class TestRunBenchmark:
+    def test_trained_model_export_cleaned_up(self, monkeypatch):
+        served = []
+
+        def fake_cold_start(model_path, repeats):
+            served.append((model_path, os.path.exists(model_path)))
+            return {}
+
+        monkeypatch.setattr(benchmark, "measure_cold_start", fake_cold_start)
+        report = run_benchmark(
+            batch_sizes=(1, 4), train_samples=64, test_samples=16, epochs=1, min_time=0.0, cold_start_repeats=0
+        )
+        (model_path, existed), = served
+        assert existed and not os.path.exists(os.path.dirname(model_path))
+        assert report["model"]["path"] is None and report["model"]["backend"] == "numpy"
+        json.dumps(report, allow_nan=False)
@@ -0,0 +1,87 @@
+import os
+import pytest
+import yaml
+from src.nfv.catalog import CatalogWatcher, parse_catalog
+from src.nfv.vnf_manager import VNFManager
+
+def vnf_type(vnf_id, image="nginx:latest", cpu=1.0):
+    return {
+        "id": vnf_id,
+        "image": image,
+        "resource_requirements": {"cpu": cpu, "memory": 512.0, "bandwidth": 100.0},
+        "config": {}
+    }
+
+def write_catalog(path, types, mtime_ns):
+    path.write_text(yaml.safe_dump({"vnf": {"types": types}}))
+    os.utime(path, ns=(mtime_ns, mtime_ns))  # Distinct signatures even within one clock tick
+
+@pytest.fixture
+def catalog_path(tmp_path):
+    path = tmp_path / "config.yaml"
+    write_catalog(path, [vnf_type("firewall"), vnf_type("load-balancer")], 1_000_000_000)
+    return path
+
+class TestParseCatalog:
+    def test_valid_catalog(self):
+        catalog = parse_catalog({"vnf": {"types": [vnf_type("firewall", cpu=2)]}})
+        assert catalog["firewall"]["resource_requirements"]["cpu"] == 2.0
+
+    @pytest.mark.parametrize("types", [
+        [vnf_type("firewall"), vnf_type("firewall")],
+        [{**vnf_type("firewall"), "image": ""}],
+        [{**vnf_type("firewall"), "resource_requirements": {"cpu": -1, "memory": 1, "bandwidth": 1}}],
+        [{**vnf_type("firewall"), "config": ["ports"]}]
+    ])
+    def test_invalid_catalog_rejected(self, types):
+        with pytest.raises(ValueError):
+            parse_catalog({"vnf": {"types": types}})
+
+class TestApplyCatalog:
+    def test_diff_touches_only_changed_types(self, catalog_path):
+        manager = VNFManager(str(catalog_path))
+        firewall = manager.vnf_catalog["firewall"]
+        diff = manager.apply_catalog(parse_catalog({"vnf": {"types": [
+            vnf_type("firewall"), vnf_type("load-balancer", image="haproxy:2"), vnf_type("nat")
+        ]}}))
+        assert diff == {"added": ["nat"], "changed": ["load-balancer"], "removed": []}
+        assert manager.vnf_catalog["firewall"] is firewall
+
+    def test_runtime_types_survive_reload(self, catalog_path):
+        manager = VNFManager(str(catalog_path))
+        manager.register_vnf("dpi", "dpi:latest", {"cpu": 4.0, "memory": 2048.0, "bandwidth": 1000.0}, {})
+        diff = manager.apply_catalog(parse_catalog({"vnf": {"types": [vnf_type("firewall")]}}))
+        assert diff["removed"] == ["load-balancer"]
+        assert set(manager.vnf_catalog) == {"firewall", "dpi"}
+
+    def test_running_instances_keep_removed_type(self, catalog_path):
+        manager = VNFManager(str(catalog_path))
+        _, instance_id = manager.instantiate_vnf("load-balancer", "lb", "default")
+        manager.apply_catalog(parse_catalog({"vnf": {"types": [vnf_type("firewall")]}}))
+        assert manager.active_vnfs[instance_id]["type"] == "load-balancer"
+
+class TestCatalogWatcher:
+    def test_first_check_applies_nothing(self, catalog_path):
+        manager = VNFManager(str(catalog_path))
+        manager.register_vnf("dpi", "dpi:latest", {"cpu": 4.0, "memory": 2048.0, "bandwidth": 1000.0}, {})
+        watcher = CatalogWatcher(str(catalog_path), manager)
+        assert watcher.check() is None
+        assert "dpi" in manager.vnf_catalog
+
+    def test_edit_applied_once(self, catalog_path):
+        manager = VNFManager(str(catalog_path))
+        manager.register_vnf("dpi", "dpi:latest", {"cpu": 4.0, "memory": 2048.0, "bandwidth": 1000.0}, {})
+        watcher = CatalogWatcher(str(catalog_path), manager)
+
+        write_catalog(catalog_path, [vnf_type("firewall", cpu=2.0)], 2_000_000_000)
+        assert watcher.check() == {"added": [], "changed": ["firewall"], "removed": ["load-balancer"]}
+        assert watcher.check() is None
+        assert set(manager.vnf_catalog) == {"firewall", "dpi"}
+
+    def test_invalid_edit_keeps_last_good_catalog(self, catalog_path):
+        manager = VNFManager(str(catalog_path))
+        watcher = CatalogWatcher(str(catalog_path), manager)
+
+        write_catalog(catalog_path, [vnf_type("firewall"), vnf_type("firewall")], 2_000_000_000)
+        assert watcher.check() is None
+        assert set(manager.vnf_catalog) == {"firewall", "load-balancer"}
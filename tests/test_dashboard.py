@@ -0,0 +1,122 @@
+from collections import OrderedDict
+import dash
+import networkx as nx
+import numpy as np
+import pytest
+import requests
+from src.visualization import dashboard
+
+class FakeResponse:
+    def __init__(self, status_code, body=None, etag=None):
+        self.status_code = status_code
+        self._body = body
+        self.headers = {"ETag": etag} if etag else {}
+
+    def json(self):
+        return self._body
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(str(self.status_code))
+
+class FakeSession:
+    """Answers like the API: 304 while the client holds the current ETag."""
+
+    def __init__(self, bodies):
+        self.bodies = bodies  # endpoint -> body
+        self.calls = []
+
+    def get(self, url, headers=None, params=None, timeout=None):
+        endpoint = url[len(dashboard.API_BASE_URL) + 1:]
+        self.calls.append(endpoint)
+        if endpoint == "topology":
+            return FakeResponse(503)
+        body = self.bodies[endpoint]
+        etag = f'"{hash(repr(body))}"'
+        if (headers or {}).get("If-None-Match") == etag:
+            return FakeResponse(304)
+        return FakeResponse(200, body, etag)
+
+@pytest.fixture
+def session(monkeypatch):
+    fake = FakeSession({endpoint: {"endpoint": endpoint} for endpoint in dashboard.API_ENDPOINTS.values()})
+    fake.bodies[dashboard.RAW_SLICES_ENDPOINT] = {"slices": []}
+    monkeypatch.setattr(dashboard, "session", fake)
+    monkeypatch.setattr(dashboard, "_etag_cache", {})
+    return fake
+
+class TestFetchCycle:
+    def test_conditional_request_reuses_body(self, session):
+        first, etag = dashboard.fetch_api_data("vnf/instances")
+        second, second_etag = dashboard.fetch_api_data("vnf/instances")
+        assert second == first and second_etag == etag
+
+    def test_unreachable_api_gives_empty_body(self, monkeypatch):
+        class DownSession:
+            def get(self, *args, **kwargs):
+                raise requests.ConnectionError()
+
+        monkeypatch.setattr(dashboard, "session", DownSession())
+        assert dashboard.fetch_api_data("vnf/instances") == ({}, None)
+
+    def test_one_fetch_per_endpoint_per_cycle(self, session):
+        data, topology = dashboard.refresh_api_data(1, [], None, None)
+        assert sorted(session.calls) == sorted(list(dashboard.API_ENDPOINTS.values()) + ["topology"])
+        assert data["vnfs"] == {"endpoint": "vnf/instances"}
+        assert topology is None
+
+    def test_unchanged_cycle_leaves_store_alone(self, session):
+        data, _ = dashboard.refresh_api_data(1, [], None, None)
+        again, _ = dashboard.refresh_api_data(2, [], data, None)
+        assert again is dash.no_update
+
+        session.bodies["vnf/instances"] = {"endpoint": "changed"}
+        changed, _ = dashboard.refresh_api_data(3, [], data, None)
+        assert changed["vnfs"] == {"endpoint": "changed"}
+
+    def test_raw_points_fetched_only_on_request(self, session):
+        dashboard.refresh_api_data(1, ["raw"], None, None)
+        assert dashboard.RAW_SLICES_ENDPOINT in session.calls
+
+@pytest.fixture
+def layout_cache(monkeypatch):
+    monkeypatch.setattr(dashboard, "_layout_cache", OrderedDict())
+    monkeypatch.setattr(dashboard, "_last_layout", {})
+
+def ring(size):
+    return nx.cycle_graph([f"n{i}" for i in range(size)])
+
+class TestTopologyFigure:
+    def test_fingerprint_ignores_order(self):
+        assert dashboard.topology_fingerprint(["a", "b"], [("a", "b")]) == \
+            dashboard.topology_fingerprint(["b", "a"], [("b", "a")])
+        assert dashboard.topology_fingerprint(["a", "b"], [("a", "b")]) != \
+            dashboard.topology_fingerprint(["a", "b"], [])
+
+    def test_layout_cached_per_topology(self, layout_cache):
+        first = dashboard.compute_layout(ring(10))
+        assert dashboard.compute_layout(ring(10)) is first
+
+    def test_added_nodes_keep_existing_positions(self, layout_cache):
+        before = dashboard.compute_layout(ring(10))
+        grown = ring(10)
+        grown.add_edge("n0", "extra")
+        after = dashboard.compute_layout(grown)
+        for node, position in before.items():
+            np.testing.assert_array_equal(after[node], position)
+        assert np.all(np.isfinite(after["extra"]))
+
+    def test_edges_drawn_as_one_broken_polyline(self, layout_cache):
+        figure = dashboard.create_network_topology_figure({
+            "nodes": ["a", "b", "c"],
+            "edges": [("a", "b"), ("b", "c")],
+            "utilization": {"a": 0.5}
+        })
+        edge_trace, node_trace = figure.data
+        assert len(edge_trace.x) == 6
+        assert np.isnan(edge_trace.x[2]) and np.isnan(edge_trace.x[5])
+        assert list(node_trace.marker.color) == [0.5, 0.0, 0.0]
+
+    def test_empty_topology(self, layout_cache):
+        figure = dashboard.create_network_topology_figure({"nodes": [], "edges": []})
+        assert len(figure.data[0].x) == 0
@@ -0,0 +1,130 @@
+import numpy as np
+import pytest
+from src.ai.demand_forecaster import CapacityPlanner, DemandForecaster, planner_from_config, slice_usage_source
+from src.core.network_slice import QoSRequirements
+from src.nfv.vnf_manager import VNFManager
+from src.sdn.controller import SDNController
+
+PATTERN = [10.0, 20.0, 30.0, 20.0]  # One season of cpu usage, mean 20
+
+def usage(cpu):
+    return {"cpu": cpu, "memory": 0.0, "bandwidth": 0.0}
+
+def seasonal_history(seasons, scale=1.0):
+    return np.array([[[scale * cpu, 0.0, 0.0] for cpu in PATTERN * seasons]])
+
+class TestDemandForecaster:
+    def test_flat_before_one_season(self):
+        forecaster = DemandForecaster(season_length=4)
+        for cpu in PATTERN[:3]:
+            forecaster.observe({"s": usage(cpu)})
+        _, forecasts = forecaster.forecast(4)
+        assert forecasts[0, :, 0].tolist() == pytest.approx([20.0] * 4)
+
+    def test_seasonal_shape_after_a_season(self):
+        forecaster = DemandForecaster(season_length=4)
+        forecaster.fit(["s"], seasonal_history(3))
+        slice_ids, forecasts = forecaster.forecast(6)
+        assert slice_ids == ["s"]
+        assert forecasts[0, :, 0].tolist() == pytest.approx(PATTERN + PATTERN[:2])
+        assert forecaster.forecast_peaks(4) == {"s": pytest.approx(usage(30.0))}
+
+    def test_batch_matches_per_slice_runs(self):
+        rng = np.random.default_rng(0)
+        history = rng.random((3, 10, 3)) * 100.0
+        batched = DemandForecaster(season_length=4)
+        batched.fit(["a", "b", "c"], history)
+
+        for i, slice_id in enumerate(["a", "b", "c"]):
+            single = DemandForecaster(season_length=4)
+            for values in history[i]:
+                single.observe({slice_id: dict(zip(single.resource_types, values))})
+            expected = single.forecast(5)[1][0]
+            assert np.allclose(batched.forecast(5, [slice_id])[1][0], expected)
+
+    def test_missing_slices_do_not_advance(self):
+        forecaster = DemandForecaster(season_length=4)
+        forecaster.observe({"a": usage(1.0), "b": usage(1.0)})
+        forecaster.observe({"a": usage(1.0)})
+        assert forecaster.steps[forecaster.rows["a"]] == 2
+        assert forecaster.steps[forecaster.rows["b"]] == 1
+
+    def test_remove_and_reuse_rows(self):
+        forecaster = DemandForecaster(season_length=4, initial_capacity=2)
+        forecaster.fit(["a", "b"], np.concatenate([seasonal_history(2), seasonal_history(2, scale=2.0)]))
+        row = forecaster.rows["a"]
+        assert forecaster.remove("a") and not forecaster.remove("a")
+        assert forecaster.forecast(2, ["a", "b"])[0] == ["b"]
+
+        forecaster.observe({"c": usage(5.0), "d": usage(7.0)})  # Reuses a's row, then grows
+        assert forecaster.rows["c"] == row and len(forecaster.steps) == 4
+        assert forecaster.forecast_peaks(1)["c"]["cpu"] == pytest.approx(5.0)
+        assert forecaster.forecast_peaks(4)["b"]["cpu"] == pytest.approx(60.0)
+
+    def test_invalid_smoothing_rejected(self):
+        with pytest.raises(ValueError):
+            DemandForecaster(alpha=0.0)
+
+def qos(bandwidth_mbps=100.0):
+    # 0.1 cpu per Mbps
+    return QoSRequirements(latency_ms=20.0, bandwidth_mbps=bandwidth_mbps, reliability=99.9, isolation_level="shared")
+
+class TestCapacityPlanner:
+    def test_tick_reserves_and_releases(self):
+        controller = SDNController()  # 100 cpu
+        _, slice_id = controller.create_slice("slice", qos(), "URLLC")  # 10 cpu allocated
+        observed = {"value": {slice_id: usage(30.0)}}
+        planner = CapacityPlanner(
+            controller, DemandForecaster(season_length=24), lambda: observed["value"], horizon=2, headroom=0.1
+        )
+
+        result = planner.tick()
+        assert result[slice_id]["reserved"]["cpu"] == pytest.approx(23.0)  # 30 * 1.1 - 10
+        assert controller.available_resources["cpu"] == pytest.approx(67.0)
+
+        observed["value"] = {slice_id: usage(0.0)}
+        for _ in range(4):
+            result = planner.tick()  # Flat forecast falls to the mean, 6 cpu, below the allocation
+        assert result[slice_id]["reserved"]["cpu"] == 0.0
+        assert controller.available_resources["cpu"] == pytest.approx(90.0)
+
+    def test_deleted_slices_forgotten(self):
+        controller = SDNController()
+        _, slice_id = controller.create_slice("slice", qos(), "eMBB")
+        planner = CapacityPlanner(controller, DemandForecaster(), lambda: {slice_id: usage(30.0), "unknown": usage(1.0)})
+        planner.tick()
+        assert set(planner.forecaster.rows) == {slice_id}
+
+        controller.delete_slice(slice_id)
+        assert planner.tick() == {}
+        assert planner.forecaster.rows == {}
+        assert controller.available_resources["cpu"] == pytest.approx(100.0)
+
+class TestUsageSource:
+    def test_vnf_usage_then_slice_utilization(self):
+        controller = SDNController()
+        _, with_vnfs = controller.create_slice("vnfs", qos(), "eMBB")
+        _, with_metrics = controller.create_slice("metrics", qos(), "eMBB")
+        _, silent = controller.create_slice("silent", qos(), "eMBB")
+        controller.active_slices[with_metrics].update_performance_metrics({"resource_utilization": 50.0})
+
+        manager = VNFManager()
+        manager.register_vnf("fw", "fw:latest", {"cpu": 2.0, "memory": 512.0, "bandwidth": 100.0}, {})
+        for name in ("fw-1", "fw-2"):
+            _, instance_id = manager.instantiate_vnf("fw", name, with_vnfs)
+            manager.update_resource_usage(instance_id, {"cpu": 1.5})
+        manager.instantiate_vnf("fw", "unreported", with_vnfs)
+        manager.instantiate_vnf("fw", "elsewhere", "default")
+
+        observed = slice_usage_source(controller, manager)()
+        assert set(observed) == {with_vnfs, with_metrics}
+        assert observed[with_vnfs]["cpu"] == pytest.approx(3.0)
+        assert observed[with_metrics] == pytest.approx({"cpu": 5.0, "memory": 500.0, "bandwidth": 50.0})
+
+    def test_planner_from_config(self):
+        controller, manager = SDNController(), VNFManager()
+        assert planner_from_config({}, controller, manager) is None
+        planner = planner_from_config(
+            {"forecasting": {"enabled": True, "season_length": 12, "horizon": 3, "headroom": 0.2}}, controller, manager
+        )
+        assert (planner.forecaster.season_length, planner.horizon, planner.headroom) == (12, 3, 0.2)
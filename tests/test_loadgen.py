@@ -0,0 +1,121 @@
+import argparse
+import asyncio
+import httpx
+import pytest
+from src.api import main as api
+from src.api.loadgen import LatencyHistogram, LoadGenerator, RunStats, find_saturation, parse_mix, run_load_test
+from src.core.metrics_store import SliceMetricsStore
+from src.core.sla_monitor import SLAMonitor
+
+def fake_api(fail_every=0):
+    """A transport answering like the slicing API, failing every n-th request."""
+    calls = {"count": 0}
+
+    def handler(request):
+        calls["count"] += 1
+        if fail_every and calls["count"] % fail_every == 0:
+            return httpx.Response(503)
+        if request.method == "POST" and request.url.path == "/api/v1/slices":
+            return httpx.Response(200, json={"slice_id": f"s{calls['count']}"})
+        return httpx.Response(200, json={})
+
+    return httpx.MockTransport(handler), calls
+
+def step(level, throughput, p99_ms=10.0, errors=0, key="rate"):
+    return {key: level, "throughput": throughput, "errors": errors, "latency": {"p99_ms": p99_ms}}
+
+class TestLatencyHistogram:
+    def test_percentiles_within_bucket_error(self):
+        histogram = LatencyHistogram()
+        for ms in range(1, 101):
+            histogram.record(ms / 1000.0)
+        assert histogram.percentile(50) == pytest.approx(0.050, rel=0.05)
+        assert histogram.percentile(99) == pytest.approx(0.099, rel=0.05)
+        assert histogram.percentile(100) == 0.1  # Capped at the largest sample
+        summary = histogram.to_dict()
+        assert summary["count"] == 100 and summary["mean_ms"] == pytest.approx(50.5)
+        assert sum(count for _, count in summary["buckets"]) == 100
+
+    def test_empty(self):
+        assert LatencyHistogram().percentile(50) is None
+        assert LatencyHistogram().to_dict(buckets=False)["p99_ms"] is None
+
+class TestRunStats:
+    def test_warmup_discarded_and_windows(self):
+        stats = RunStats(started=100.0, warmup=1.0, interval=0.5)
+        stats.record("get_slice", 0.01, 100.5, None)  # During the warm-up
+        stats.record("get_slice", 0.01, 101.2, None)
+        stats.record("list_slices", 0.02, 101.7, "HTTP 500")
+        summary = stats.summary(duration=1.0)
+        assert summary["requests"] == 2 and summary["errors"] == 1
+        assert summary["errors_by_kind"] == {"HTTP 500": 1}
+        assert summary["throughput"] == pytest.approx(1.0)
+        assert [window["requests"] for window in summary["timeline"]] == [1, 1]
+        assert list(summary["operations"]) == ["get_slice"]
+
+class TestFindSaturation:
+    def test_open_loop_throughput_shortfall(self):
+        steps = [step(100, 99.0), step(200, 150.0)]
+        assert find_saturation(steps, "rate", slo_p99_ms=100.0) == {
+            "rate": 200, "reason": "throughput", "last_good": {"rate": 100, "throughput": 99.0}
+        }
+
+    def test_latency_and_errors(self):
+        assert find_saturation([step(100, 100.0, p99_ms=500.0)], "rate", 100.0)["reason"] == "latency"
+        assert find_saturation([step(100, 100.0, errors=3)], "rate", 100.0)["reason"] == "errors"
+
+    def test_closed_loop_gain(self):
+        steps = [step(1, 100.0, key="concurrency"), step(2, 190.0, key="concurrency"), step(4, 195.0, key="concurrency")]
+        assert find_saturation(steps, "concurrency", 100.0)["concurrency"] == 4
+        assert find_saturation(steps[:2], "concurrency", 100.0) is None
+
+class TestLoadGenerator:
+    def test_unknown_operation_rejected(self):
+        with pytest.raises(ValueError):
+            LoadGenerator(None, {"delete_slice": 1.0})
+        with pytest.raises(argparse.ArgumentTypeError):
+            parse_mix("create_slice=0.5,delete_slice=0.5")
+        assert parse_mix("create_slice=0.2, get_slice=0.8") == {"create_slice": 0.2, "get_slice": 0.8}
+
+    def test_open_loop_rate_and_errors(self):
+        transport, calls = fake_api(fail_every=10)
+
+        async def scenario():
+            async with httpx.AsyncClient(transport=transport, base_url="http://api") as client:
+                generator = LoadGenerator(client, {"create_slice": 0.5, "get_slice": 0.5}, interval=0.1)
+                await generator.prepare(3)
+                return generator, await generator.run_open(200.0, duration=0.5, poisson=False)
+
+        generator, result = asyncio.run(scenario())
+        assert result["rate"] == 200.0 and result["dropped"] == 0
+        assert result["requests"] == pytest.approx(100, abs=2)
+        assert result["errors_by_kind"] == {"HTTP 503": result["errors"]} and result["errors"] >= 9
+        assert len(generator.slice_ids) >= 3
+
+    def test_closed_loop_keeps_clients_busy(self):
+        transport, _ = fake_api()
+
+        async def scenario():
+            async with httpx.AsyncClient(transport=transport, base_url="http://api") as client:
+                generator = LoadGenerator(client, {"list_slices": 1.0}, interval=0.1)
+                return await generator.run_closed(2, duration=0.3, think_time=0.01)
+
+        result = asyncio.run(scenario())
+        assert result["concurrency"] == 2 and result["errors"] == 0
+        # Two clients, one request per ~10 ms think time each
+        assert 20 <= result["requests"] <= 70
+
+    def test_in_process_run(self, monkeypatch):
+        monkeypatch.setenv("NWSLICING_CONFIG", "missing.yaml")
+        monkeypatch.setattr(api, "slices", {})
+        monkeypatch.setattr(api, "vnfs", {})
+        store = SliceMetricsStore(api.SLICE_METRICS)
+        monkeypatch.setattr(api, "slice_metrics", store)
+        monkeypatch.setattr(api, "sla_monitor", SLAMonitor(store))
+        results = asyncio.run(run_load_test(
+            levels=(20,), duration=0.3, warmup=0.0, initial_slices=2,
+            mix={"list_slices": 0.5, "get_slice": 0.5}, slo_p99_ms=1000.0
+        ))
+        assert results["target"] == "in-process"
+        assert results["steps"][0]["errors"] == 0 and results["steps"][0]["requests"] > 0
+        assert len(api.slices) == 2
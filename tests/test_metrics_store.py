@@ -0,0 +1,109 @@
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+from src.api import main as api
+from src.core.metrics_store import SliceMetricsStore
+from src.core.sla_monitor import SLAMonitor
+
+COLUMNS = ("latency", "bandwidth", "reliability")
+
+@pytest.fixture
+def store():
+    store = SliceMetricsStore(COLUMNS, initial_capacity=2)
+    for slice_id in ("a", "b"):
+        store.add(slice_id)
+    return store
+
+class TestSliceMetricsStore:
+    def test_columnar_ingest(self, store):
+        result = store.ingest(["b", "a"], {"latency": [2.0, 1.0], "bandwidth": [20.0, 10.0]}, timestamp=5.0)
+        assert result == {"accepted": 2, "unknown": 0}
+        assert store.get("a") == {"latency": 1.0, "bandwidth": 10.0, "reliability": 0.0}
+        assert store.updated[store.rows["b"]] == 5.0
+        assert store.stats == {"batches": 1, "points": 4, "unknown": 0}
+
+    def test_unknown_ids_skipped(self, store):
+        result = store.ingest(["a", "x", "b"], {"latency": [1.0, 99.0, 2.0]})
+        assert result == {"accepted": 2, "unknown": 1}
+        assert [m["latency"] for m in store.get_many(["a", "b"])] == [1.0, 2.0]
+        assert store.stats["unknown"] == 1
+
+    def test_repeated_id_last_value_wins(self, store):
+        store.ingest(["a", "a"], {"latency": [1.0, 2.0]})
+        assert store.get("a")["latency"] == 2.0
+
+    @pytest.mark.parametrize("metrics", [
+        {"jitter": [1.0, 2.0]},
+        {"latency": [1.0]},
+        {"latency": [[1.0], [2.0]]},
+        {"latency": ["fast", "slow"]}
+    ])
+    def test_malformed_batch_rejected(self, store, metrics):
+        with pytest.raises(ValueError):
+            store.ingest(["a", "b"], metrics)
+        assert store.stats["batches"] == 0
+
+    def test_growth_keeps_rows(self, store):
+        store.ingest(["a", "b"], {"latency": [1.0, 2.0]})
+        rows = dict(store.rows)
+        store.add("c", {"latency": 3.0, "unknown": 1.0})
+        assert store.capacity == 4
+        assert {k: store.rows[k] for k in rows} == rows
+        assert [m["latency"] for m in store.get_many(["a", "b", "c"])] == [1.0, 2.0, 3.0]
+        assert np.isnan(store.updated[store.rows["c"]])
+
+    def test_removed_rows_are_reused_clean(self, store):
+        store.ingest(["a"], {"latency": [7.0]})
+        row = store.rows["a"]
+        assert store.remove("a") and not store.remove("a")
+        assert store.get("a") is None and store.get_many(["a"]) == [None]
+        assert store.add("d") == row
+        assert store.get("d") == {"latency": 0.0, "bandwidth": 0.0, "reliability": 0.0}
+
+    def test_snapshot_is_a_copy(self, store):
+        store.ingest(["a", "b"], {"latency": [1.0, 2.0]})
+        slice_ids, values = store.snapshot()
+        assert slice_ids == ["a", "b"]
+        assert values[:, 0].tolist() == [1.0, 2.0]
+        values[:] = -1.0
+        assert store.get("a")["latency"] == 1.0
+
+@pytest.fixture
+def client(monkeypatch):
+    store = SliceMetricsStore(api.SLICE_METRICS)
+    monkeypatch.setattr(api, "slices", {})
+    monkeypatch.setattr(api, "slice_metrics", store)
+    monkeypatch.setattr(api, "slice_aggregate_cache", {})
+    monkeypatch.setattr(api, "sla_monitor", SLAMonitor(store))
+    return TestClient(api.app)
+
+def create_slice(client):
+    return client.post("/api/v1/slices", json={
+        "name": "slice",
+        "qos_requirements": {"latency_ms": 10.0, "bandwidth_mbps": 100.0, "reliability": 99.9, "isolation_level": "shared"},
+        "service_type": "eMBB"
+    }).json()["slice_id"]
+
+class TestIngestEndpoint:
+    def test_batch_visible_in_slice_views(self, client):
+        first, second = create_slice(client), create_slice(client)
+        response = client.post("/api/v1/metrics/slices", json={
+            "slice_ids": [first, second, "missing"],
+            "metrics": {"current_latency": [5.0, 6.0, 7.0], "reliability_score": [99.0, 98.0, 97.0]},
+            "timestamp": 100.0
+        })
+        assert response.json() == {"accepted": 2, "unknown": 1}
+        assert client.get(f"/api/v1/slices/{first}").json()["performance_metrics"]["current_latency"] == 5.0
+        listed = {s["id"]: s["performance_metrics"] for s in client.get("/api/v1/slices").json()["slices"]}
+        assert listed[second]["reliability_score"] == 98.0
+
+    @pytest.mark.parametrize("body", [
+        b"not json",
+        b"[]",
+        b"1",
+        b'{"slice_ids": "a", "metrics": {}}',
+        b'{"slice_ids": ["a"], "metrics": {"current_latency": [1, 2]}}',
+        b'{"slice_ids": ["a"], "metrics": {"jitter": [1]}}'
+    ])
+    def test_malformed_batch_is_400(self, client, body):
+        assert client.post("/api/v1/metrics/slices", content=body).status_code == 400
@@ -0,0 +1,41 @@
+import numpy as np
+import pytest
+from src.ai.prediction_history import PredictionHistory
+
+def usage(cpu, memory=100.0, bandwidth=10.0):
+    return {"cpu": cpu, "memory": memory, "bandwidth": bandwidth}
+
+class TestPredictionHistory:
+    def test_bounded_to_capacity(self):
+        history = PredictionHistory(capacity=3)
+        for i in range(5):
+            history.append(usage(float(i)), usage(1.0), "eMBB", timestamp=float(i))
+        assert len(history) == 3
+        assert [r["timestamp"] for r in history.records()] == [2.0, 3.0, 4.0]
+        assert [r["timestamp"] for r in history.records(last=1)] == [4.0]
+
+    def test_running_mean_matches_held_rows(self):
+        history = PredictionHistory(capacity=4)
+        rng = np.random.default_rng(0)
+        predicted = rng.uniform(0.5, 2.0, size=11)
+        for value in predicted:
+            history.append(usage(value), usage(1.0), "URLLC")
+        expected = np.abs(predicted[-4:] - 1.0).mean() * 100
+        assert history.get_accuracy()["cpu_mean_error"] == pytest.approx(expected)
+
+    def test_p95_within_one_bin(self):
+        history = PredictionHistory(capacity=100)
+        for i in range(100):
+            history.append(usage(1.0 + i / 100), usage(1.0), "eMBB")
+        p95 = history.get_accuracy()["cpu_p95_error"]
+        assert 94.0 <= p95 <= 94.0 * 1.06  # Exact p95 of 0..99 % is 94 %
+
+    def test_zero_actual_and_unknown_service(self):
+        history = PredictionHistory(capacity=2)
+        history.append(usage(1.0), usage(0.0), "unknown")
+        record = history.records()[0]
+        assert record["relative_error"]["cpu"] == 0.0
+        assert record["service_type"] is None
+
+    def test_empty_history(self):
+        assert PredictionHistory().get_accuracy() == {}
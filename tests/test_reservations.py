@@ -0,0 +1,56 @@
+import pytest
+from src.core.network_slice import QoSRequirements
+from src.sdn.controller import SDNController
+
+def qos(bandwidth_mbps):
+    # Requires 0.1 cpu, 10 MB memory and 1 Mbps per Mbps of bandwidth
+    return QoSRequirements(latency_ms=20.0, bandwidth_mbps=bandwidth_mbps, reliability=99.9, isolation_level="shared")
+
+@pytest.fixture
+def sdn_controller():
+    return SDNController()  # 100 cpu in total
+
+def create_slice(controller, bandwidth_mbps, service_type="eMBB"):
+    success, slice_id = controller.create_slice("slice", qos(bandwidth_mbps), service_type)
+    assert success
+    return slice_id
+
+class TestReservations:
+    def test_reserve_peak_minus_allocation(self, sdn_controller):
+        slice_id = create_slice(sdn_controller, 100.0)  # 10 cpu
+        result = sdn_controller.reserve_capacity({slice_id: {"cpu": 60.0}}, headroom=0.0)
+        assert result[slice_id] == {"reserved": {"cpu": 50.0}, "shortfall": {}}
+        assert sdn_controller.available_resources["cpu"] == pytest.approx(40.0)
+
+    def test_priority_and_shortfall(self, sdn_controller):
+        embb = create_slice(sdn_controller, 100.0, "eMBB")
+        urllc = create_slice(sdn_controller, 100.0, "URLLC")
+        result = sdn_controller.reserve_capacity({embb: {"cpu": 60.0}, urllc: {"cpu": 60.0}}, headroom=0.0)
+        assert result[urllc]["reserved"] == {"cpu": 50.0}
+        assert result[embb]["reserved"]["cpu"] == pytest.approx(30.0)
+        assert result[embb]["shortfall"]["cpu"] == pytest.approx(20.0)
+
+    def test_update_draws_on_own_reservation(self, sdn_controller):
+        slice_id = create_slice(sdn_controller, 100.0)
+        sdn_controller.reserve_capacity({slice_id: {"cpu": 60.0}}, headroom=0.0)
+        # 50 cpu needed, only 40 unreserved: fits because the slice's own 50 are credited
+        assert sdn_controller.update_slice(slice_id, qos_requirements=qos(500.0))
+        assert sdn_controller.reservations[slice_id]["cpu"] == pytest.approx(10.0)
+        assert sdn_controller.available_resources["cpu"] == pytest.approx(40.0)
+        assert sdn_controller.active_slices[slice_id].allocated_resources["cpu"] == pytest.approx(50.0)
+
+    def test_other_slices_cannot_use_reservation(self, sdn_controller):
+        reserved = create_slice(sdn_controller, 100.0)
+        sdn_controller.reserve_capacity({reserved: {"cpu": 60.0}}, headroom=0.0)
+        other = create_slice(sdn_controller, 100.0)
+        assert not sdn_controller.update_slice(other, qos_requirements=qos(500.0))
+        assert sdn_controller.available_resources["cpu"] == pytest.approx(30.0)
+        assert sdn_controller.reservations[reserved]["cpu"] == pytest.approx(50.0)
+
+    def test_delete_returns_everything(self, sdn_controller):
+        slice_id = create_slice(sdn_controller, 100.0)
+        sdn_controller.reserve_capacity({slice_id: {"cpu": 60.0}}, headroom=0.0)
+        sdn_controller.update_slice(slice_id, qos_requirements=qos(500.0))
+        assert sdn_controller.delete_slice(slice_id)
+        assert sdn_controller.available_resources["cpu"] == pytest.approx(100.0)
+        assert slice_id not in sdn_controller.reservations
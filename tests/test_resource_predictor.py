@@ -0,0 +1,262 @@
+import subprocess
+import sys
+import numpy as np
+import pytest
+from src.core.network_slice import QoSRequirements
+from src.ai.numpy_backend import NumpyMLP
+from src.ai.prediction_cache import PredictionCache
+from src.ai.resource_predictor import NUM_FEATURES, ResourcePredictor
+
+def random_mlp(input_dim=NUM_FEATURES, seed=0):
+    rng = np.random.default_rng(seed)
+    sizes = [input_dim, 64, 32, 16, 3]  # Same layout as ResourcePredictor._build_model
+    return NumpyMLP([
+        (rng.normal(size=(n_in, n_out)).astype(np.float32), rng.normal(size=n_out).astype(np.float32), activation)
+        for (n_in, n_out), activation in zip(zip(sizes, sizes[1:]), ("relu", "relu", "relu", "linear"))
+    ])
+
+@pytest.fixture
+def model_path(tmp_path):
+    path = str(tmp_path / "model.npz")
+    random_mlp().save(path)
+    return path
+
+def qos(latency_ms=20.0, bandwidth_mbps=100.0, reliability=99.9):
+    return QoSRequirements(latency_ms=latency_ms, bandwidth_mbps=bandwidth_mbps, reliability=reliability, isolation_level="shared")
+
+def requests(count):
+    service_types = ("eMBB", "URLLC", "mMTC", "unknown")
+    return [
+        (qos(5.0 + i, 10.0 * i, 99.0), service_types[i % 4], {"cpu": i / count, "bandwidth": 2.0 * i})
+        for i in range(count)
+    ]
+
+class TestBatchInference:
+    def test_batch_matches_single_predictions(self, model_path):
+        predictor = ResourcePredictor(model_path, cache_size=0)
+        batch = requests(10)
+        results = predictor.predict_resources_batch(batch, batch_size=3)
+        for request, result in zip(batch, results):
+            single = predictor.predict_resources(*request)
+            assert result == pytest.approx(single, rel=1e-5)
+
+    def test_empty_batch(self, model_path):
+        assert ResourcePredictor(model_path).predict_resources_batch([]) == []
+
+    def test_unknown_service_type_encodes_as_zeros(self, model_path):
+        predictor = ResourcePredictor(model_path)
+        features = predictor.preprocess_batch([qos(), qos()], ["URLLC", "unknown"], [{}, None])
+        assert features[0, 3:6].tolist() == [0.0, 1.0, 0.0]
+        assert features[1, 3:6].tolist() == [0.0, 0.0, 0.0]
+        assert features.shape == (2, NUM_FEATURES)
+
+    def test_batch_fills_cache_misses_only(self, model_path):
+        predictor = ResourcePredictor(model_path)
+        batch = requests(4)
+        predictor.predict_resources(*batch[0])
+        predictor.predict_resources_batch(batch)
+        stats = predictor.get_cache_stats()
+        assert (stats["hits"], stats["entries"]) == (1, 4)
+
+class TestNumpyBackend:
+    def test_save_load_round_trip(self, tmp_path):
+        model = random_mlp()
+        model.save(str(tmp_path / "weights.npz"))
+        loaded = NumpyMLP.load(str(tmp_path / "weights.npz"))
+        features = np.random.default_rng(1).normal(size=(5, NUM_FEATURES))
+        np.testing.assert_array_equal(loaded(features), model(features))
+
+    def test_matches_keras(self):
+        predictor = ResourcePredictor(cache_size=0)
+        features = np.random.default_rng(2).normal(size=(8, NUM_FEATURES)).astype(np.float32)
+        expected = np.asarray(predictor.model(features, training=False))
+        np.testing.assert_allclose(NumpyMLP.from_keras(predictor.model)(features), expected, rtol=1e-5, atol=1e-5)
+
+    def test_serving_does_not_import_tensorflow(self, model_path):
+        script = (
+            "import sys\n"
+            "from src.ai.resource_predictor import ResourcePredictor\n"
+            "from src.core.network_slice import QoSRequirements\n"
+            f"predictor = ResourcePredictor({model_path!r})\n"
+            "predictor.predict_resources(QoSRequirements(10.0, 100.0, 99.9, 'shared'), 'eMBB', {})\n"
+            "print('tensorflow' in sys.modules)\n"
+        )
+        output = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True).stdout
+        assert output.strip() == "False"
+
+    def test_older_models_get_leading_features(self, tmp_path):
+        path = str(tmp_path / "legacy.npz")
+        random_mlp(input_dim=6).save(path)
+        predictor = ResourcePredictor(path)
+        prediction = predictor.predict_resources(qos(), "eMBB", {"cpu": 0.5})
+        assert set(prediction) == {"cpu", "memory", "bandwidth"}
+
+    def test_unsupported_activation_rejected(self):
+        class Layer:
+            def get_weights(self):
+                return [np.zeros((2, 2)), np.zeros(2)]
+
+            def get_config(self):
+                return {"activation": "softmax"}
+
+        class Model:
+            layers = [Layer()]
+
+        with pytest.raises(ValueError):
+            NumpyMLP.from_keras(Model())
+
+class TestPredictionCache:
+    def test_quantized_inputs_share_entry(self, model_path):
+        predictor = ResourcePredictor(model_path)
+        first = predictor.predict_resources(qos(latency_ms=20.0), "eMBB", {"cpu": 0.5})
+        second = predictor.predict_resources(qos(latency_ms=20.01), "eMBB", {"cpu": 0.501})
+        assert first == second
+        assert predictor.get_cache_stats()["hits"] == 1
+
+    def test_ttl_expires_entries(self):
+        now = [0.0]
+        cache = PredictionCache(ttl=10.0, clock=lambda: now[0])
+        cache.put("key", {"cpu": 1.0})
+        now[0] = 11.0
+        assert cache.get("key") is None
+
+    def test_lru_eviction(self):
+        cache = PredictionCache(max_entries=2)
+        cache.put("a", {"cpu": 1.0})
+        cache.put("b", {"cpu": 2.0})
+        cache.get("a")
+        cache.put("c", {"cpu": 3.0})
+        assert cache.get("b") is None and cache.get("a") is not None
+
+    def test_put_after_invalidate_dropped(self):
+        cache = PredictionCache()
+        generation = cache.generation
+        cache.invalidate()
+        cache.put("key", {"cpu": 1.0}, generation)
+        assert cache.get_stats()["entries"] == 0
+
+    def test_swap_during_inference_not_cached(self, model_path):
+        predictor = ResourcePredictor(model_path)
+        old_model, new_model = predictor.model, random_mlp(seed=1)
+
+        class SwappingModel(NumpyMLP):
+            def __call__(self, features, training=False):
+                predictor.swap_model(new_model, None)  # Lands while the old model is scoring
+                return old_model(features, training)
+
+        predictor.swap_model(SwappingModel(old_model.layers), None)
+        stale = predictor.predict_resources(qos(), "eMBB", {})
+        assert predictor.get_cache_stats()["entries"] == 0
+        fresh = predictor.predict_resources(qos(), "eMBB", {})
+        assert fresh != stale
+        assert predictor.predict_resources(qos(), "eMBB", {}) == fresh
+
+def record_results(predictor, count):
+    for i in range(count):
+        request = (qos(10.0 + i, 50.0, 99.0), "eMBB", {"cpu": 0.1 * i})
+        prediction = predictor.predict_resources(*request)
+        predictor.update_history(prediction, {"cpu": 5.0, "memory": 500.0, "bandwidth": 50.0}, *request)
+
+class TestOnlineLearning:
+    def test_update_runs_in_background_and_swaps(self, model_path):
+        predictor = ResourcePredictor(model_path)
+        served = predictor.model
+        predictor.enable_online_learning(batch_size=4, min_interval=0.0)
+        record_results(predictor, 4)
+        predictor._online_future.result(timeout=60)
+
+        assert predictor.online_learning["updates"] == 1
+        assert predictor.model is not served
+        assert isinstance(predictor.model, NumpyMLP)  # Serving stays TensorFlow-free
+        assert predictor.get_cache_stats()["entries"] == 0
+        # The served weights were never trained in place
+        np.testing.assert_array_equal(served.layers[0][0], NumpyMLP.load(model_path).layers[0][0])
+        predictor.disable_online_learning()
+
+    def test_update_not_due_waits(self, model_path):
+        predictor = ResourcePredictor(model_path)
+        predictor.enable_online_learning(batch_size=10, min_interval=0.0)
+        record_results(predictor, 3)
+        assert predictor._online_future is None
+        assert predictor.update_online() is False
+        assert predictor.update_online(force=True) is True
+        predictor.disable_online_learning()
+
+    def test_update_dropped_if_model_replaced(self, model_path, monkeypatch):
+        predictor = ResourcePredictor(model_path)
+        predictor.enable_online_learning(batch_size=1, min_interval=1e9)
+        record_results(predictor, 1)
+        replacement = random_mlp(seed=3)
+        trainer_for = predictor._online_trainer_for
+
+        def swap_while_training(model):
+            trainer = trainer_for(model)
+            predictor.swap_model(replacement, None)
+            return trainer
+
+        monkeypatch.setattr(predictor, "_online_trainer_for", swap_while_training)
+        assert predictor.update_online(force=True) is False
+        assert predictor.model is replacement
+        predictor.disable_online_learning()
+
+def training_data(count, seed=0):
+    rng = np.random.default_rng(seed)
+    return [
+        (
+            {"qos_requirements": qos(float(latency), 100.0, 99.0), "service_type": "eMBB", "current_load": {"cpu": 0.5}},
+            {"cpu": float(latency) / 10, "memory": 1000.0 - latency, "bandwidth": 50.0}
+        )
+        for latency in rng.uniform(1.0, 100.0, size=count)
+    ]
+
+class TestTraining:
+    def test_model_and_scaler_swapped_together_after_fit(self, model_path):
+        import tensorflow as tf
+
+        predictor = ResourcePredictor(model_path)
+        served = predictor.model
+        seen = []
+
+        class Observer(tf.keras.callbacks.Callback):
+            def on_epoch_end(self, epoch, logs=None):
+                seen.append((predictor.model is served, predictor.scaler is None))
+
+        predictor.train(training_data(32), epochs=2, batch_size=8, callbacks=[Observer()])
+        assert seen and all(old_model and old_scaler for old_model, old_scaler in seen)
+        assert predictor.model is not served
+        assert predictor.scaler.features.fitted
+        # The served weights were never trained in place
+        np.testing.assert_array_equal(served.layers[0][0], NumpyMLP.load(model_path).layers[0][0])
+
+    def test_reuse_scaler_keeps_pipeline(self, model_path):
+        predictor = ResourcePredictor(model_path)
+        predictor.train(training_data(32), epochs=1, batch_size=8)
+        scaler = predictor.scaler
+        predictor.train(training_data(32, seed=1), epochs=1, batch_size=8, reuse_scaler=True)
+        assert predictor.scaler is scaler
+        predictor.train(training_data(32, seed=1), epochs=1, batch_size=8)
+        assert predictor.scaler is not scaler
+
+    def test_train_from_files(self, model_path, tmp_path):
+        predictor = ResourcePredictor(model_path)
+        X, y = predictor.build_training_arrays(training_data(40))
+        np.save(tmp_path / "X.npy", X)
+        np.save(tmp_path / "y.npy", y)
+        predictor.train_from_files(str(tmp_path / "X.npy"), str(tmp_path / "y.npy"), epochs=1, batch_size=8, chunk_rows=16)
+        assert predictor.scaler.features.count == 32
+        np.testing.assert_allclose(predictor.scaler.targets.mean, y[:32].mean(axis=0), rtol=1e-5)
+
+    def test_training_job_continues_with_base_scaler(self, tmp_path):
+        from src.ai.feature_scaler import ScalingPipeline
+        from src.ai.training_jobs import MODEL_FILE, _run_training_job
+
+        params = {"epochs": 1, "batch_size": 8}
+        for version in ("v0001", "v0002"):
+            (tmp_path / version).mkdir()
+        _run_training_job(str(tmp_path / "v0001"), None, training_data(32), None, params)
+        base_path = str(tmp_path / "v0001" / MODEL_FILE)
+        _run_training_job(str(tmp_path / "v0002"), base_path, training_data(32, seed=1), None, params)
+
+        base = ScalingPipeline.load(ScalingPipeline.path_for(base_path))
+        continued = ScalingPipeline.load(ScalingPipeline.path_for(str(tmp_path / "v0002" / MODEL_FILE)))
+        np.testing.assert_array_equal(continued.features.mean, base.features.mean)
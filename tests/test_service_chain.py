@@ -0,0 +1,106 @@
+import pytest
+from src.core.network_slice import QoSRequirements
+from src.sdn.controller import SDNController
+
+REQUIREMENTS = {
+    "fw": {"cpu": 2.0, "memory": 512.0},
+    "lb": {"cpu": 4.0, "memory": 1024.0},
+    "huge": {"cpu": 1000.0, "memory": 512.0}
+}
+
+@pytest.fixture
+def sdn_controller():
+    controller = SDNController()
+    controller.load_topology({
+        "nodes": [
+            {"id": "a", "capacity": {"cpu": 8.0, "memory": 4096.0}},
+            {"id": "b", "capacity": {"cpu": 8.0, "memory": 4096.0}},
+            {"id": "c", "capacity": {"cpu": 2.0, "memory": 4096.0}}
+        ],
+        "links": [
+            {"source": "a", "target": "b", "latency": 2.0, "bandwidth": 1000.0},
+            {"source": "b", "target": "c", "latency": 3.0, "bandwidth": 1000.0}
+        ]
+    })
+    return controller
+
+def create_slice(controller, latency_ms=20.0):
+    success, slice_id = controller.create_slice(
+        "chain-slice",
+        QoSRequirements(latency_ms=latency_ms, bandwidth_mbps=10.0, reliability=99.0, isolation_level="shared"),
+        "eMBB"
+    )
+    assert success
+    return slice_id
+
+class TestServiceChainPlacement:
+    def test_colocates_chain(self, sdn_controller):
+        slice_id = create_slice(sdn_controller)
+        result = sdn_controller.place_service_chain(slice_id, ["fw", "lb"], REQUIREMENTS, ingress="a")
+        assert [p["node"] for p in result["placement"]] == ["a", "a"]
+        assert result["latency_ms"] == 0.0
+        assert sdn_controller.network_topology.nodes["a"]["available"]["cpu"] == 2.0
+        assert sdn_controller.active_slices[slice_id].service_chain == ["fw", "lb"]
+
+    def test_path_and_link_load(self, sdn_controller):
+        slice_id = create_slice(sdn_controller)
+        result = sdn_controller.place_service_chain(slice_id, ["fw"], REQUIREMENTS, ingress="a", egress="c")
+        assert result["path"][0] == "a" and result["path"][-1] == "c"
+        assert result["latency_ms"] == 5.0
+        assert sdn_controller.network_topology.edges["a", "b"]["load"] == 10.0
+
+    def test_spreads_when_colocation_overflows(self):
+        controller = SDNController()
+        controller.load_topology({
+            "nodes": [{"id": "a", "capacity": {"cpu": 3.0}}, {"id": "b", "capacity": {"cpu": 3.0}}],
+            "links": [{"source": "a", "target": "b", "latency": 1.0, "bandwidth": 1000.0}]
+        })
+        slice_id = create_slice(controller)
+        result = controller.place_service_chain(slice_id, ["fw", "lb"], {"fw": {"cpu": 2.0}, "lb": {"cpu": 2.0}}, ingress="a", egress="b")
+        assert [p["node"] for p in result["placement"]] == ["a", "b"]
+        assert controller.network_topology.nodes["a"]["available"]["cpu"] == 1.0
+        assert controller.network_topology.nodes["b"]["available"]["cpu"] == 1.0
+
+    def test_latency_budget_rejects(self, sdn_controller):
+        slice_id = create_slice(sdn_controller, latency_ms=1.0)
+        assert sdn_controller.place_service_chain(slice_id, ["fw"], REQUIREMENTS, ingress="a", egress="c") is None
+        assert slice_id not in sdn_controller.resource_allocation
+
+    def test_failed_replacement_keeps_old_chain(self, sdn_controller):
+        slice_id = create_slice(sdn_controller)
+        sdn_controller.place_service_chain(slice_id, ["fw"], REQUIREMENTS, ingress="a", egress="b")
+        allocation = {n: dict(a) for n, a in sdn_controller.resource_allocation[slice_id].items()}
+        available = {n: dict(d["available"]) for n, d in sdn_controller.network_topology.nodes(data=True)}
+        load = sdn_controller.network_topology.edges["a", "b"]["load"]
+        path = list(sdn_controller.slice_paths[slice_id])
+
+        assert sdn_controller.place_service_chain(slice_id, ["huge"], REQUIREMENTS, ingress="a") is None
+
+        assert sdn_controller.resource_allocation[slice_id] == allocation
+        assert {n: d["available"] for n, d in sdn_controller.network_topology.nodes(data=True)} == available
+        assert sdn_controller.network_topology.edges["a", "b"]["load"] == load
+        assert sdn_controller.slice_paths[slice_id] == path
+        assert sdn_controller.active_slices[slice_id].service_chain == ["fw"]
+
+    def test_replacement_reuses_own_capacity(self, sdn_controller):
+        slice_id = create_slice(sdn_controller)
+        sdn_controller.place_service_chain(slice_id, ["lb", "lb"], REQUIREMENTS, ingress="a")
+        # Only fits on "a" if the slice's own allocation there counts as free
+        result = sdn_controller.place_service_chain(slice_id, ["lb", "lb"], REQUIREMENTS, ingress="a")
+        assert [p["node"] for p in result["placement"]] == ["a", "a"]
+        assert sdn_controller.network_topology.nodes["a"]["available"]["cpu"] == 0.0
+
+    def test_delete_releases_chain(self, sdn_controller):
+        slice_id = create_slice(sdn_controller)
+        sdn_controller.place_service_chain(slice_id, ["fw"], REQUIREMENTS, ingress="a", egress="c")
+        assert sdn_controller.delete_slice(slice_id)
+        assert sdn_controller.network_topology.nodes["a"]["available"]["cpu"] == 8.0
+        assert sdn_controller.network_topology.edges["a", "b"]["load"] == 0.0
+
+    def test_prefix_cache_shared(self, sdn_controller):
+        first, second = create_slice(sdn_controller), create_slice(sdn_controller)
+        sdn_controller.place_service_chain(first, ["fw", "lb"], REQUIREMENTS, ingress="a")
+        misses = sdn_controller.chain_cache_stats["misses"]
+        sdn_controller.place_service_chain(second, ["fw", "fw"], REQUIREMENTS, ingress="a")
+        assert sdn_controller.chain_cache_stats["hits"] >= 1
+        assert sdn_controller.chain_cache_stats["misses"] == misses + 1  # Only the new suffix
@@ -0,0 +1,131 @@
+import pytest
+import yaml
+from src.core.network_slice import QoSRequirements
+from src.nfv.catalog import parse_catalog
+from src.simulation.simulator import CapacitySimulator, build_topology, main
+from src.simulation.workload import ServiceClass, WorkloadConfig, parse_workload, read_trace
+
+CATALOG = {
+    "fw": {"image": "fw:latest", "resource_requirements": {"cpu": 2.0, "memory": 512.0, "bandwidth": 100.0}, "config": {}}
+}
+
+def service_class(service_type="eMBB", arrival_rate=0.1, mean_holding_time=100.0, bandwidth_mbps=10.0, chain=("fw",)):
+    return ServiceClass(
+        service_type=service_type,
+        arrival_rate=arrival_rate,
+        mean_holding_time=mean_holding_time,
+        qos_requirements=QoSRequirements(
+            latency_ms=50.0, bandwidth_mbps=bandwidth_mbps, reliability=99.0, isolation_level="shared"
+        ),
+        service_chain=list(chain)
+    )
+
+def simulator(classes, trace_path=None, num_nodes=4, **workload):
+    workload = WorkloadConfig(classes=classes, **{"duration": 20000.0, "seed": 7, **workload})
+    return CapacitySimulator(build_topology({}, workload, num_nodes), CATALOG, workload, trace_path=trace_path)
+
+def write_trace(path, rows):
+    path.write_text("time,service_type,holding_time\n" + "".join(f"{t},{s},{h}\n" for t, s, h in rows))
+    return str(path)
+
+class TestWorkload:
+    def test_default_config_parses(self):
+        with open("configs/default.yaml") as f:
+            config = yaml.safe_load(f)
+        workload = parse_workload(config)
+        assert [c.service_type for c in workload.classes] == ["eMBB", "URLLC", "mMTC"]
+        assert workload.duration == 604800
+        # Every chained VNF type is in the catalog, so the simulator accepts the config
+        CapacitySimulator(build_topology(config, workload), parse_catalog(config), workload)
+
+    def test_invalid_class_rejected(self):
+        with pytest.raises(ValueError):
+            parse_workload({"simulation": {"workload": {"classes": [{"service_type": "eMBB", "mean_holding_time": 0}]}}})
+
+    @pytest.mark.parametrize("num_nodes, num_links", [(2, 1), (5, 5)])
+    def test_generated_ring(self, num_nodes, num_links):
+        topology = build_topology({}, WorkloadConfig(), num_nodes)
+        assert len(topology["nodes"]) == num_nodes
+        assert len(topology["links"]) == num_links
+
+    def test_trace_validation(self, tmp_path):
+        classes = [service_class()]
+        unsorted = write_trace(tmp_path / "unsorted.csv", [(5, "eMBB", 10), (1, "eMBB", 10)])
+        with pytest.raises(ValueError):
+            list(read_trace(unsorted, classes))
+        unknown = write_trace(tmp_path / "unknown.csv", [(1, "V2X", 10)])
+        with pytest.raises(ValueError):
+            list(read_trace(unknown, classes))
+
+class TestCapacitySimulator:
+    def test_unknown_vnf_type_rejected(self):
+        with pytest.raises(ValueError):
+            simulator([service_class(chain=("dpi",))])
+
+    def test_seeded_runs_are_reproducible(self):
+        first, second = simulator([service_class()]).run(), simulator([service_class()]).run()
+        for report in (first, second):
+            for key in ("wall_seconds", "events_per_second", "updates_per_second"):
+                report.pop(key)
+        assert first == second
+
+    def test_uncongested_load_matches_littles_law(self):
+        report = simulator([service_class(arrival_rate=0.1, mean_holding_time=100.0)], duration=200000.0).run()
+        assert report["blocking_probability"] == 0.0
+        assert report["mean_active_slices"] == pytest.approx(10.0, rel=0.15)
+        assert report["classes"]["eMBB"]["offered_load"] == pytest.approx(10.0)
+
+    def test_small_pool_blocks(self):
+        # Each slice needs 1 CPU from the pool, so at most two are admitted at once
+        sim = simulator([service_class(arrival_rate=1.0, mean_holding_time=100.0)], pool={"cpu": 2.0, "memory": 1e9, "bandwidth": 1e9})
+        report = sim.run()
+        assert report["blocking_probability"] > 0.9
+        assert report["blocked_by_reason"]["pool"] == report["blocked"]
+        assert report["peak_utilization"]["pool"]["cpu"] == pytest.approx(1.0)
+        assert report["utilization"]["pool"]["cpu"] <= 1.0
+
+    def test_node_capacity_blocks_placement(self):
+        # Eight 2-CPU chains fill four 4-CPU nodes while the pool still has room
+        sim = simulator(
+            [service_class(arrival_rate=1.0, mean_holding_time=100.0)],
+            node_capacity={"cpu": 4.0, "memory": 1e6, "bandwidth": 1e6},
+            pool={"cpu": 1000.0, "memory": 1e9, "bandwidth": 1e9}
+        )
+        report = sim.run()
+        assert report["blocked_by_reason"]["placement"] > 0
+        assert report["blocked_by_reason"]["pool"] == 0
+        assert report["peak_utilization"]["nodes"]["cpu"] == pytest.approx(1.0)
+
+    def test_trace_driven_run_releases_resources(self, tmp_path):
+        trace = write_trace(tmp_path / "trace.csv", [(1, "eMBB", 10), (2, "eMBB", 10), (30, "eMBB", 5)])
+        sim = simulator([service_class()], trace_path=trace, duration=100.0)
+        report = sim.run()
+        assert report["arrivals"] == 3 and report["blocked"] == 0
+        assert report["classes"]["eMBB"]["offered_load"] is None
+        assert sim.sdn_controller.active_slices == {}
+        assert sim.vnf_manager.active_vnfs == {}
+        assert sim.sdn_controller.available_resources == pytest.approx(sim.pool)
+
+    def test_vnf_failures_degrade_availability(self):
+        report = simulator([service_class(mean_holding_time=1000.0)], vnf_failure_rate=0.001, vnf_repair_time=100.0).run()
+        assert report["vnf"]["failures"] > 0 and report["vnf"]["repairs"] > 0
+        assert 0.0 < report["vnf"]["slice_availability"] < 1.0
+
+    def test_warmup_discards_statistics(self):
+        report = simulator([service_class()], duration=1000.0, warmup=600.0).run()
+        assert report["simulated_seconds"] == pytest.approx(400.0)
+        assert report["arrivals"] < 0.1 * 1000.0
+
+class TestCli:
+    def test_writes_report(self, tmp_path):
+        config = tmp_path / "config.yaml"
+        config.write_text(yaml.safe_dump({
+            "vnf": {"types": [{"id": "fw", **CATALOG["fw"]}]},
+            "simulation": {"workload": {"classes": [{
+                "service_type": "eMBB", "arrival_rate": 0.1, "mean_holding_time": 50, "service_chain": ["fw"]
+            }]}}
+        }))
+        output = tmp_path / "report.json"
+        main(["--config", str(config), "--duration", "1000", "--nodes", "3", "--output", str(output)])
+        report = yaml.safe_load(output.read_text())
+        assert report["arrivals"] > 0
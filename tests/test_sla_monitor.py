@@ -0,0 +1,119 @@
+import pytest
+from fastapi.testclient import TestClient
+from src.api import main as api
+from src.core.metrics_store import SliceMetricsStore
+from src.core.network_slice import QoSRequirements
+from src.core.sla_monitor import SLAMonitor
+
+QOS = QoSRequirements(latency_ms=10.0, bandwidth_mbps=100.0, reliability=99.0, isolation_level="shared")
+
+@pytest.fixture
+def store():
+    return SliceMetricsStore(api.SLICE_METRICS, initial_capacity=2)
+
+def report(store, slice_id, latency, at):
+    store.ingest([slice_id], {"current_latency": [latency], "current_bandwidth": [200.0], "reliability_score": [99.9]}, at)
+
+class TestDebounce:
+    def test_onset_needs_consecutive_samples(self, store):
+        monitor = SLAMonitor(store, onset_ticks=3, recovery_ticks=2)
+        monitor.add("s", QOS)
+        for at in (1.0, 2.0):
+            report(store, "s", 50.0, at)
+            assert monitor.tick(now=at) == []
+        report(store, "s", 50.0, 3.0)
+        events = monitor.tick(now=3.0)
+        assert [(e["type"], e["breached"]) for e in events] == [("violation", ["latency"])]
+        assert monitor.violating_slices() == ["s"]
+
+        report(store, "s", 5.0, 4.0)
+        assert monitor.tick(now=4.0) == []
+        report(store, "s", 5.0, 5.0)
+        assert [e["type"] for e in monitor.tick(now=5.0)] == ["recovery"]
+
+    def test_ticks_without_new_samples_do_not_count(self, store):
+        monitor = SLAMonitor(store, onset_ticks=3)
+        monitor.add("s", QOS)
+        report(store, "s", 50.0, 1.0)
+        for now in (1.0, 2.0, 3.0, 4.0):
+            assert monitor.tick(now=now) == []
+        assert monitor.breach_streak[store.rows["s"]] == 1
+
+    def test_single_clean_sample_resets_streak(self, store):
+        monitor = SLAMonitor(store, onset_ticks=2)
+        monitor.add("s", QOS)
+        for at, latency in ((1.0, 50.0), (2.0, 5.0), (3.0, 50.0)):
+            report(store, "s", latency, at)
+            assert monitor.tick(now=at) == []
+
+    def test_stale_samples_skipped(self, store):
+        monitor = SLAMonitor(store, onset_ticks=1, stale_after=10.0)
+        monitor.add("s", QOS)
+        report(store, "s", 50.0, 1.0)
+        assert monitor.tick(now=100.0) == []
+        report(store, "s", 50.0, 95.0)
+        assert len(monitor.tick(now=100.0)) == 1
+
+    def test_unmonitored_and_silent_slices_ignored(self, store):
+        monitor = SLAMonitor(store, onset_ticks=1)
+        monitor.add("silent", QOS)
+        monitor.add("gone", QOS)
+        monitor.remove("gone")
+        store.add("unmonitored")
+        report(store, "gone", 50.0, 1.0)
+        report(store, "unmonitored", 50.0, 1.0)
+        assert monitor.tick(now=1.0) == []
+        assert monitor.status()["monitored"] == 1
+
+class TestEventLog:
+    def breaching_monitor(self, store, slices, max_events=10000):
+        monitor = SLAMonitor(store, onset_ticks=1, recovery_ticks=1, max_events=max_events)
+        for slice_id in slices:
+            monitor.add(slice_id, QOS)
+        return monitor
+
+    def flap(self, store, monitor, slices, ticks):
+        for at in range(1, ticks + 1):
+            for slice_id in slices:
+                report(store, slice_id, 50.0 if at % 2 else 5.0, float(at))
+            monitor.tick(now=float(at))
+
+    def test_events_since_and_filters(self, store):
+        monitor = self.breaching_monitor(store, ["a", "b"])
+        self.flap(store, monitor, ["a", "b"], 3)
+        assert [e["id"] for e in monitor.events_since(0)] == [1, 2, 3, 4, 5, 6]
+        assert [e["id"] for e in monitor.events_since(4)] == [5, 6]
+        assert [e["id"] for e in monitor.events_since(0, limit=2)] == [1, 2]
+        assert {e["slice_id"] for e in monitor.events_since(2, slice_id="a")} == {"a"}
+        assert monitor.events_since(6) == []
+
+    def test_trimmed_log_keeps_newest(self, store):
+        monitor = self.breaching_monitor(store, ["a"], max_events=3)
+        self.flap(store, monitor, ["a"], 5)
+        assert [e["id"] for e in monitor.events_since(0)] == [3, 4, 5]
+        assert [e["id"] for e in monitor.events_since(3)] == [4, 5]
+        assert monitor.status()["last_event_id"] == 5
+
+    def test_grows_with_the_store(self, store):
+        slices = [f"s{i}" for i in range(5)]
+        monitor = self.breaching_monitor(store, slices)
+        self.flap(store, monitor, slices, 1)
+        assert sorted(monitor.violating_slices()) == slices
+
+class TestSlaEndpoints:
+    def test_events_and_status(self, monkeypatch):
+        store = SliceMetricsStore(api.SLICE_METRICS)
+        monitor = SLAMonitor(store, onset_ticks=1)
+        monkeypatch.setattr(api, "slice_metrics", store)
+        monkeypatch.setattr(api, "sla_monitor", monitor)
+        monitor.add("s", QOS)
+        report(store, "s", 50.0, 1.0)
+        monitor.tick(now=1.0)
+
+        client = TestClient(api.app)
+        body = client.get("/api/v1/sla/events", params={"since": 0}).json()
+        assert [e["slice_id"] for e in body["events"]] == ["s"] and body["last_id"] == 1
+        assert client.get("/api/v1/sla/events", params={"since": 1}).json() == {"events": [], "last_id": 1}
+        status = client.get("/api/v1/sla/status").json()
+        assert status["violating"] == 1 and status["violating_slices"] == ["s"]
+
@@ -0,0 +1,176 @@
+import asyncio
+import threading
+import time
+import pytest
+from src.core import snapshot
+from src.core.network_slice import QoSRequirements
+from src.core.snapshot import ALIGNMENT, HEADER, SnapshotWriter, capture_state, read_snapshot, restore_snapshot, restore_state, write_snapshot
+from src.nfv.vnf_manager import VNFManager
+from src.sdn.controller import SDNController
+
+TOPOLOGY = {
+    "nodes": [{"id": "a", "capacity": {"cpu": 8.0, "memory": 4096.0}}, {"id": "b", "capacity": {"cpu": 8.0}}],
+    "links": [{"source": "a", "target": "b", "latency": 2.0, "bandwidth": 1000.0}]
+}
+QOS = QoSRequirements(latency_ms=20.0, bandwidth_mbps=100.0, reliability=99.9, isolation_level="shared")
+
+@pytest.fixture
+def state():
+    controller = SDNController()
+    controller.load_topology(TOPOLOGY)
+    _, chained = controller.create_slice("chained", QOS, "eMBB")
+    controller.place_service_chain(chained, ["fw"], {"fw": {"cpu": 2.0}}, ingress="a", egress="b")
+    _, reserved = controller.create_slice("reserved", QOS, "URLLC")
+    controller.reserve_capacity({reserved: {"cpu": 20.0}}, headroom=0.0)
+
+    manager = VNFManager()
+    manager.register_vnf("fw", "fw:latest", {"cpu": 2.0, "memory": 512.0, "bandwidth": 100.0}, {"ports": [80]})
+    _, reporting = manager.instantiate_vnf("fw", "fw-1", chained)
+    manager.instantiate_vnf("fw", "fw-2", chained)
+    manager.update_resource_usage(reporting, {"cpu": 1.0})
+    return controller, manager
+
+def slice_view(controller):
+    return {
+        slice_id: (s.name, s.service_type, s.qos_requirements, s.allocated_resources, s.service_chain, s.active)
+        for slice_id, s in controller.active_slices.items()
+    }
+
+class TestRoundTrip:
+    def test_restores_controller_and_vnfs(self, state, tmp_path):
+        controller, manager = state
+        path = str(tmp_path / "state.snap")
+        write_snapshot(path, *capture_state(controller, manager))
+
+        restored_controller, restored_manager = SDNController(), VNFManager()
+        counts = restore_snapshot(path, restored_controller, restored_manager)
+
+        assert counts == {"nodes": 2, "links": 1, "slices": 2, "vnfs": 2}
+        assert slice_view(restored_controller) == slice_view(controller)
+        assert restored_controller.reservations == controller.reservations
+        assert restored_controller.resource_allocation == controller.resource_allocation
+        assert restored_controller.slice_paths == controller.slice_paths
+        assert restored_controller.slice_links == controller.slice_links
+        assert restored_controller.available_resources == controller.available_resources
+        assert dict(restored_controller.network_topology.nodes(data=True)) == dict(controller.network_topology.nodes(data=True))
+        assert restored_controller.serialize_topology()["version"] == controller.serialize_topology()["version"]
+
+        assert restored_manager.vnf_catalog == manager.vnf_catalog
+        assert restored_manager.active_vnfs == manager.active_vnfs
+        assert restored_manager.usage_totals == manager.usage_totals
+        assert restored_manager.count_instances("fw") == 2
+
+    def test_existing_catalog_entries_win(self, state, tmp_path):
+        controller, manager = state
+        meta, columns = capture_state(controller, manager)
+        target = VNFManager()
+        target.register_vnf("fw", "fw:2", {"cpu": 1.0, "memory": 256.0, "bandwidth": 10.0}, {})
+        restore_state(meta, columns, SDNController(), target)
+        assert target.vnf_catalog["fw"]["image"] == "fw:2"
+
+    def test_integer_ids_restored_as_strings(self, tmp_path):
+        controller = SDNController()
+        controller.add_node(0, {"cpu": 4.0})
+        controller.add_node(1, {"cpu": 4.0})
+        controller.add_link(0, 1, 1.0, 100.0)
+        path = str(tmp_path / "state.snap")
+        write_snapshot(path, *capture_state(controller, VNFManager()))
+
+        restored = SDNController()
+        restore_snapshot(path, restored, VNFManager())
+        assert sorted(restored.network_topology.nodes) == ["0", "1"]
+        assert list(restored.network_topology.edges) == [("0", "1")]
+
+class TestCapture:
+    def test_catalog_copied(self, state):
+        controller, manager = state
+        meta, _ = capture_state(controller, manager)
+        manager.vnf_catalog["fw"]["config"]["ports"].append(443)
+        manager.register_vnf("nat", "nat:latest", {"cpu": 1.0, "memory": 1.0, "bandwidth": 1.0}, {})
+        assert meta["vnf_catalog"]["fw"]["config"] == {"ports": [80]}
+        assert "nat" not in meta["vnf_catalog"]
+
+    def test_capture_isolated_from_later_changes(self, state, tmp_path):
+        controller, manager = state
+        meta, columns = capture_state(controller, manager)
+        controller.create_slice("late", QOS, "mMTC")
+        path = str(tmp_path / "state.snap")
+        write_snapshot(path, meta, columns)
+        assert restore_snapshot(path, SDNController(), VNFManager())["slices"] == 2
+
+class TestFileFormat:
+    def test_rejects_other_files(self, tmp_path):
+        path = tmp_path / "other.snap"
+        path.write_bytes(b"x" * 64)
+        with pytest.raises(ValueError):
+            read_snapshot(str(path))
+
+    def test_rejects_corruption(self, state, tmp_path):
+        path = tmp_path / "state.snap"
+        write_snapshot(str(path), *capture_state(*state))
+        data = bytearray(path.read_bytes())
+        _, index_length = HEADER.unpack(bytes(data[:HEADER.size]))
+        data[-(-(HEADER.size + index_length) // ALIGNMENT) * ALIGNMENT] ^= 0xFF  # First byte of the first column
+        path.write_bytes(bytes(data))
+        with pytest.raises(ValueError):
+            read_snapshot(str(path))
+
+    def test_columns_are_aligned(self, state, tmp_path):
+        path = str(tmp_path / "state.snap")
+        write_snapshot(path, *capture_state(*state))
+        _, columns = read_snapshot(path)
+        assert all(array.ctypes.data % 64 == 0 for array in columns.values())
+
+class TestSnapshotWriter:
+    def test_background_save(self, state, tmp_path):
+        controller, manager = state
+        writer = SnapshotWriter(controller, manager, str(tmp_path / "nested" / "state.snap"))
+        result = asyncio.run(writer.save_in_background())
+        assert result["bytes"] > 0 and writer.last_snapshot is result
+        assert restore_snapshot(writer.path, SDNController(), VNFManager())["vnfs"] == 2
+
+    def test_concurrent_writes_do_not_collide(self, state, tmp_path):
+        path = str(tmp_path / "state.snap")
+        errors = []
+
+        def write():
+            try:
+                write_snapshot(path, *capture_state(*state))
+            except OSError as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=write) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert not errors
+        assert restore_snapshot(path, SDNController(), VNFManager())["vnfs"] == 2
+        assert [entry.name for entry in tmp_path.iterdir()] == ["state.snap"]
+
+    def test_save_waits_for_write_left_by_stop(self, state, tmp_path, monkeypatch):
+        controller, manager = state
+        writer = SnapshotWriter(controller, manager, str(tmp_path / "state.snap"))
+        started = threading.Event()
+        active = []
+
+        def slow_write(path, meta, columns):
+            active.append(path)
+            started.set()
+            time.sleep(0.2)
+            assert len(active) == 1
+            size = write_snapshot(path, meta, columns)
+            active.remove(path)
+            return size
+
+        monkeypatch.setattr(snapshot, "write_snapshot", slow_write)
+
+        async def shutdown():
+            writer.start(interval=0.0)
+            await asyncio.get_running_loop().run_in_executor(None, started.wait)
+            writer.stop()
+            return writer.save()
+
+        assert asyncio.run(shutdown())["bytes"] > 0
+        assert not active
+        assert restore_snapshot(writer.path, SDNController(), VNFManager())["vnfs"] == 2
@@ -0,0 +1,152 @@
+import os
+import subprocess
+import sys
+import time
+import pytest
+from src.core import config_cache
+from src.core.config_cache import compile_topology, load_cached_config
+from src.sdn.controller import SDNController
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CONFIG_PATH = os.path.join(ROOT, "configs", "default.yaml")
+STARTUP_BUDGET_S = float(os.environ.get("NWSLICING_STARTUP_BUDGET", 1.0))  # Import and set-up of an API worker
+
+def import_times(module):
+    """Import a module in a fresh interpreter; cumulative import time per module in seconds."""
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(filter(None, [ROOT, os.environ.get("PYTHONPATH")]))}
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True, check=True, cwd=ROOT, env=env
+    ).stderr
+    times = {}
+    for line in stderr.splitlines():
+        if line.startswith("import time:") and "[us]" not in line:
+            _, cumulative, name = line[len("import time:"):].split("|")
+            times[name.strip()] = int(cumulative) / 1e6
+    return times
+
+@pytest.fixture
+def topology_config():
+    return {
+        "nodes": [{"id": "node1", "capacity": {"cpu": 100}}, {"id": "node2", "capacity": {"cpu": 50}}],
+        "links": [
+            {"source": "node1", "target": "node2", "latency": 5, "bandwidth": 1000},
+            {"source": "node2", "target": "node3", "latency": 2, "bandwidth": 100}
+        ]
+    }
+
+class TestStartupBudget:
+    def test_main_defers_heavy_subsystems(self):
+        times = import_times("src.main")
+        for heavy in ("tensorflow", "networkx", "numpy", "uvicorn", "fastapi", "src.sdn.controller"):
+            assert heavy not in times
+
+    def test_dashboard_defers_pandas_and_plotly_express(self):
+        times = import_times("src.visualization.dashboard")
+        assert "pandas" not in times
+        assert "plotly.express" not in times
+
+    def test_api_worker_import_budget(self):
+        times = import_times("src.api.main")
+        assert "tensorflow" not in times
+        assert "uvicorn" not in times
+        assert times["src.api.main"] < STARTUP_BUDGET_S
+        # The controller and the VNF manager are created on first use
+        for heavy in ("networkx", "src.sdn.controller", "src.nfv.vnf_manager"):
+            assert heavy not in times
+
+    def test_api_worker_cold_start_budget(self, tmp_path):
+        script = (
+            "import time\n"
+            "begin = time.perf_counter()\n"
+            "from src.api import main as api\n"
+            "from src.core.config_cache import load_cached_config\n"
+            f"_, topology = load_cached_config({CONFIG_PATH!r})\n"
+            "api.get_sdn_controller().load_compiled_topology(topology)\n"
+            "print(time.perf_counter() - begin)\n"
+        )
+        env = {**os.environ, "PYTHONPATH": ROOT, "NWSLICING_CACHE_DIR": str(tmp_path)}
+        durations = []
+        for _ in range(2):  # Cold cache, then warm
+            output = subprocess.run(
+                [sys.executable, "-c", script], capture_output=True, text=True, check=True, cwd=tmp_path, env=env
+            ).stdout
+            durations.append(float(output.strip().splitlines()[-1]))
+        assert max(durations) < STARTUP_BUDGET_S
+
+class TestMain:
+    def test_config_loaded_once(self, monkeypatch):
+        import uvicorn
+        import src.main as entry
+        import src.nfv.vnf_manager as vnf_manager_module
+        from src.api import main as api
+
+        calls = []
+
+        def counting_load(*args, **kwargs):
+            calls.append(args)
+            return load_cached_config(*args, **kwargs)
+
+        monkeypatch.setattr(config_cache, "_entries", {})  # Keep the in-process memo of other tests clean
+        monkeypatch.setattr(entry, "load_cached_config", counting_load)
+        monkeypatch.setattr(vnf_manager_module, "load_cached_config", counting_load)
+        scheduled = []
+        monkeypatch.setattr(entry, "schedule_background_tasks", lambda *args: scheduled.append(args))
+        monkeypatch.setattr(uvicorn, "run", lambda *args, **kwargs: None)
+        monkeypatch.setattr(api, "sdn_controller", None)
+        monkeypatch.setattr(api, "vnf_manager", None)
+
+        entry.main(CONFIG_PATH)
+        assert len(calls) == 1
+        assert api.sdn_controller.network_topology.number_of_nodes() == 3
+        assert "firewall" in api.vnf_manager.vnf_catalog
+        # Forecasting is enabled in the default config, so a capacity planner runs with the server
+        capacity_planner = scheduled[0][-1]
+        assert capacity_planner.sdn_controller is api.sdn_controller and capacity_planner.horizon == 6
+
+class TestConfigCache:
+    def test_cached_config_round_trip(self, tmp_path):
+        config, topology = load_cached_config(CONFIG_PATH, cache_dir=str(tmp_path))
+        assert config["api"]["port"] == 8000
+        assert [node[0] for node in topology["nodes"]] == ["node1", "node2", "node3"]
+        assert len(os.listdir(tmp_path)) == 1
+
+        # Callers get fresh objects they may modify
+        config["api"]["port"] = 1
+        assert load_cached_config(CONFIG_PATH, cache_dir=str(tmp_path))[0]["api"]["port"] == 8000
+
+    def test_cache_keyed_on_content(self, tmp_path):
+        config_path = tmp_path / "config.yaml"
+        cache_dir = str(tmp_path / "cache")
+        config_path.write_text("api:\n  port: 8000\n")
+        assert load_cached_config(str(config_path), cache_dir=cache_dir)[0]["api"]["port"] == 8000
+        config_path.write_text("api:\n  port: 9000\n")
+        assert load_cached_config(str(config_path), cache_dir=cache_dir)[0]["api"]["port"] == 9000
+        assert len(os.listdir(cache_dir)) == 1  # The stale entry is replaced
+
+    def test_zero_ids_accepted(self):
+        compiled = compile_topology({
+            "nodes": [{"id": 0, "capacity": {"cpu": 1}}, {"id": 1}],
+            "links": [{"source": 0, "target": 1, "latency": 1, "bandwidth": 10}]
+        })
+        assert [node[0] for node in compiled["nodes"]] == ["0", "1"]
+        assert compiled["links"] == [["0", "1", 1.0, 10.0]]
+
+    def test_invalid_topology_rejected(self):
+        with pytest.raises(ValueError):
+            compile_topology({"nodes": [{"id": "node1"}, {"id": "node1"}]})
+        with pytest.raises(ValueError):
+            compile_topology({"links": [{"source": "node1", "target": "node2", "latency": -1}]})
+        with pytest.raises(ValueError):
+            compile_topology({"nodes": [{"capacity": {"cpu": 1}}]})
+        with pytest.raises(ValueError):
+            compile_topology({"links": [{"source": "node1", "target": None}]})
+
+    def test_compiled_topology_matches_load_topology(self, topology_config):
+        loaded, compiled = SDNController(), SDNController()
+        loaded.load_topology(topology_config)
+        compiled.load_compiled_topology(compile_topology(topology_config))
+        assert dict(loaded.network_topology.nodes(data=True)) == dict(compiled.network_topology.nodes(data=True))
+        assert list(loaded.network_topology.edges(data=True)) == list(compiled.network_topology.edges(data=True))
+        assert compiled.topology_version == loaded.topology_version
+        assert compiled.topology_delta(0) is None  # Bulk loads are not logged
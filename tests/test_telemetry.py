@@ -0,0 +1,76 @@
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+from src.api import main as api
+from src.nfv.telemetry import INITIAL_ROWS, RingBuffer, VNFTelemetryStore
+from src.nfv.vnf_manager import VNFManager
+
+@pytest.fixture
+def vnf_manager(monkeypatch):
+    manager = VNFManager()
+    manager.register_vnf(
+        vnf_id="firewall",
+        image="nginx:latest",
+        resource_requirements={"cpu": 1.0, "memory": 512.0, "bandwidth": 100.0},
+        config={}
+    )
+    monkeypatch.setattr(api, "vnf_manager", manager)
+    return manager
+
+class TestRingBuffer:
+    def test_grows_lazily_up_to_capacity(self):
+        buffer = RingBuffer(1000, 3)
+        assert len(buffer.timestamps) == INITIAL_ROWS
+        for i in range(INITIAL_ROWS + 1):
+            buffer.append(float(i), np.full(3, float(i)))
+        assert len(buffer.timestamps) == 2 * INITIAL_ROWS
+        timestamps, rows = buffer.ordered()
+        assert timestamps.tolist() == [float(i) for i in range(INITIAL_ROWS + 1)]
+        assert rows[-1].tolist() == [float(INITIAL_ROWS)] * 3
+
+    def test_wraps_after_growing(self):
+        buffer = RingBuffer(100, 1)
+        for i in range(250):
+            buffer.append(float(i), np.array([float(i)]))
+        assert len(buffer.timestamps) == 100
+        timestamps, _ = buffer.ordered()
+        assert timestamps.tolist() == [float(i) for i in range(150, 250)]
+        assert len(buffer.since(200.0)) == 50
+
+class TestTelemetryStore:
+    def test_summary_over_window(self):
+        store = VNFTelemetryStore([(1.0, 10), (10.0, 10)])
+        for second in range(30):
+            store.record("vnf-1", {"cpu": float(second)}, timestamp=float(second))
+        summary = store.summary("vnf-1", window=5.0, now=29.0)
+        assert summary["resolution"] == 1.0
+        assert summary["cpu"]["max"] == 29.0
+        assert store.summary("vnf-1", window=60.0, now=29.0)["resolution"] == 10.0
+
+    def test_new_series_is_small(self):
+        store = VNFTelemetryStore()
+        store.record("vnf-1", {"cpu": 1.0}, timestamp=0.0)
+        buffers = [buffer for _, buffer in store.series["vnf-1"].tiers]
+        assert sum(buffer.values.nbytes + buffer.timestamps.nbytes for buffer in buffers) < 10_000
+
+class TestTelemetryEndpoints:
+    def test_usage_reported_over_http(self, vnf_manager):
+        _, instance_id = vnf_manager.instantiate_vnf("firewall", "fw", "default")
+        client = TestClient(api.app)
+
+        assert client.get("/api/v1/vnf/managed").json()["vnfs"][0]["id"] == instance_id
+        response = client.post(
+            f"/api/v1/vnf/managed/{instance_id}/usage",
+            json={"usage": {"cpu": 0.5, "memory": 300.0}, "timestamp": 100.0}
+        )
+        assert response.status_code == 200
+
+        telemetry = client.get(f"/api/v1/vnf/managed/{instance_id}/telemetry?window=1e12&tier=0").json()
+        assert telemetry["telemetry"]["cpu"]["mean"] == 0.5
+        assert telemetry["history"]["timestamp"] == []  # The 1 s bucket is still open
+        assert client.get(f"/api/v1/vnf/managed/{instance_id}/telemetry?tier=9").status_code == 400
+
+    def test_unknown_instance(self, vnf_manager):
+        client = TestClient(api.app)
+        assert client.get("/api/v1/vnf/managed/missing/telemetry").status_code == 404
+        assert client.post("/api/v1/vnf/managed/missing/usage", json={"usage": {}}).status_code == 404
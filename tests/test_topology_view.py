@@ -0,0 +1,84 @@
+from collections import deque
+import pytest
+from fastapi.testclient import TestClient
+from src.api import main as api
+from src.core.network_slice import QoSRequirements
+from src.sdn.controller import SDNController
+from src.visualization.dashboard import merge_topology_delta
+
+TOPOLOGY = {
+    "nodes": [{"id": "a", "capacity": {"cpu": 8.0}}, {"id": "b", "capacity": {"cpu": 8.0}}, {"id": "c", "capacity": {"cpu": 8.0}}],
+    "links": [
+        {"source": "a", "target": "b", "latency": 1.0, "bandwidth": 100.0},
+        {"source": "b", "target": "c", "latency": 1.0, "bandwidth": 100.0}
+    ]
+}
+
+@pytest.fixture
+def sdn_controller():
+    controller = SDNController()
+    controller.load_topology(TOPOLOGY)
+    return controller
+
+def place_chain(controller):
+    _, slice_id = controller.create_slice(
+        "slice", QoSRequirements(latency_ms=10.0, bandwidth_mbps=10.0, reliability=99.0, isolation_level="shared"), "eMBB"
+    )
+    controller.place_service_chain(slice_id, ["fw"], {"fw": {"cpu": 2.0}}, ingress="a", egress="b")
+
+class TestTopologyDelta:
+    def test_delta_holds_changed_elements(self, sdn_controller):
+        since = sdn_controller.topology_revision
+        place_chain(sdn_controller)
+        delta = sdn_controller.topology_delta(since)
+        assert delta["version"] > since
+        assert [node["id"] for node in delta["nodes"]] == ["a"]
+        assert delta["nodes"][0]["utilization"]["cpu"] == 0.25
+        assert [(link["source"], link["target"], link["load"]) for link in delta["links"]] == [("a", "b", 10.0)]
+
+    def test_current_revision_gives_empty_delta(self, sdn_controller):
+        delta = sdn_controller.topology_delta(sdn_controller.topology_revision)
+        assert delta["nodes"] == [] and delta["links"] == []
+
+    def test_unlogged_revisions_need_full_view(self, sdn_controller):
+        assert sdn_controller.topology_delta(sdn_controller.topology_revision + 1) is None
+        sdn_controller.topology_log = deque(sdn_controller.topology_log, maxlen=2)
+        since = sdn_controller.topology_revision
+        place_chain(sdn_controller)
+        place_chain(sdn_controller)
+        assert sdn_controller.topology_delta(since) is None
+
+    def test_bulk_load_invalidates_deltas(self):
+        controller = SDNController()
+        controller.load_compiled_topology({"nodes": [["a", {"cpu": 1.0}]], "links": []})
+        assert controller.topology_delta(0) is None
+        assert controller.serialize_topology()["version"] == 1
+
+    def test_dashboard_merge_matches_full_view(self, sdn_controller):
+        view = sdn_controller.serialize_topology()
+        place_chain(sdn_controller)
+        merged = merge_topology_delta({**view, "epoch": "e"}, {**sdn_controller.topology_delta(view["version"]), "epoch": "e"})
+        full = sdn_controller.serialize_topology()
+        assert merged["version"] == full["version"]
+        assert sorted(merged["nodes"], key=lambda n: n["id"]) == sorted(full["nodes"], key=lambda n: n["id"])
+        key = lambda link: (link["source"], link["target"])
+        assert sorted(merged["links"], key=key) == sorted(full["links"], key=key)
+
+class TestTopologyEndpoint:
+    def test_etag_and_deltas(self, sdn_controller, monkeypatch):
+        monkeypatch.setattr(api, "sdn_controller", sdn_controller)
+        monkeypatch.setattr(api, "topology_cache", {"version": None, "body": None})
+        client = TestClient(api.app)
+
+        full = client.get("/api/v1/topology")
+        view = full.json()
+        assert view["delta"] is False and len(view["nodes"]) == 3
+        assert client.get("/api/v1/topology", headers={"If-None-Match": full.headers["ETag"]}).status_code == 304
+
+        place_chain(sdn_controller)
+        delta = client.get("/api/v1/topology", params={"since": view["version"], "epoch": view["epoch"]}).json()
+        assert delta["delta"] is True and [node["id"] for node in delta["nodes"]] == ["a"]
+
+        # A client from another server run gets a full view
+        other = client.get("/api/v1/topology", params={"since": view["version"], "epoch": "stale"}).json()
+        assert other["delta"] is False
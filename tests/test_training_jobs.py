@@ -0,0 +1,67 @@
+import os
+from concurrent.futures import Future
+import pytest
+from src.ai.training_jobs import PROGRESS_FILE, TrainingJobManager, _write_json
+
+class PendingExecutor:
+    """Accepts jobs without running them, like a busy worker process."""
+
+    def __init__(self):
+        self.futures = []
+        self.shut_down = False
+
+    def submit(self, fn, *args):
+        future = Future()
+        self.futures.append(future)
+        return future
+
+    def shutdown(self, wait=True):
+        self.shut_down = True
+
+@pytest.fixture
+def manager(tmp_path):
+    data_dir = tmp_path / "data"
+    data_dir.mkdir()
+    manager = TrainingJobManager(str(tmp_path / "models"), data_dir=str(data_dir))
+    manager._executor.shutdown()
+    manager._executor = PendingExecutor()
+    return manager
+
+class TestTrainingFiles:
+    def test_relative_path_inside_data_dir(self, manager):
+        resolved = manager.resolve_data_path("X.npy")
+        assert resolved == os.path.join(os.path.realpath(manager.data_dir), "X.npy")
+
+    @pytest.mark.parametrize("path", ["../secret.npy", "/etc/passwd", "sub/../../secret.npy"])
+    def test_paths_outside_data_dir_rejected(self, manager, path):
+        with pytest.raises(ValueError):
+            manager.submit(features_path=path, targets_path="y.npy")
+        assert manager.jobs == {}
+
+    def test_symlink_out_of_data_dir_rejected(self, manager, tmp_path):
+        os.symlink(str(tmp_path), os.path.join(manager.data_dir, "escape"))
+        with pytest.raises(ValueError):
+            manager.resolve_data_path("escape/models/ACTIVE")
+
+    def test_files_disabled_without_data_dir(self, tmp_path):
+        manager = TrainingJobManager(str(tmp_path / "models"))
+        with pytest.raises(ValueError):
+            manager.resolve_data_path("X.npy")
+        manager.shutdown()
+
+class TestJobStates:
+    def test_queued_until_worker_reports(self, manager):
+        job_id = manager.submit(features_path="X.npy", targets_path="y.npy")
+        assert manager.get_job(job_id)["status"] == "queued"
+
+        version_dir = os.path.join(manager.model_dir, manager.jobs[job_id]["version"])
+        _write_json(os.path.join(version_dir, PROGRESS_FILE), {"epoch": 0, "epochs": 1, "metrics": {}})
+        assert manager.get_job(job_id)["status"] == "running"
+
+    def test_shutdown_cancels_queued_jobs(self, manager):
+        job_id = manager.submit(features_path="X.npy", targets_path="y.npy")
+        manager.shutdown()
+        job = manager.get_job(job_id)
+        assert (job["status"], job["error"]) == ("failed", "Job cancelled")
+        assert manager._executor.shut_down
+        assert manager._futures == {}
@@ -0,0 +1,79 @@
+import pytest
+from src.nfv.vnf_manager import VNFManager
+
+@pytest.fixture
+def vnf_manager():
+    manager = VNFManager()
+    manager.register_vnf(
+        vnf_id="firewall",
+        image="nginx:latest",
+        resource_requirements={"cpu": 1.0, "memory": 512.0, "bandwidth": 100.0},
+        config={}
+    )
+    return manager
+
+class TestWarmPool:
+    def test_claim_hits_then_misses(self, vnf_manager):
+        pool = vnf_manager.enable_warm_pool({"firewall": 2})
+        assert pool.get_status()["idle"] == {"firewall": 2}
+
+        success, instance_id = vnf_manager.instantiate_vnf("firewall", "fw", "default")
+        assert success
+        assert vnf_manager.active_vnfs[instance_id]["status"] == "running"
+        vnf_manager.instantiate_vnf("firewall", "fw", "default")
+        vnf_manager.instantiate_vnf("firewall", "fw", "default")
+
+        status = pool.get_status()
+        assert (status["hits"], status["misses"]) == (2, 1)
+        assert status["memory_in_use"] == 0.0
+
+    def test_memory_budget_limits_pool(self, vnf_manager):
+        pool = vnf_manager.enable_warm_pool({"firewall": 5}, memory_budget=1200.0)
+        status = pool.get_status()
+        assert status["idle"] == {"firewall": 2}
+        assert status["memory_in_use"] == 1024.0
+
+    def test_refill_restores_pool_size(self, vnf_manager):
+        pool = vnf_manager.enable_warm_pool({"firewall": 2})
+        vnf_manager.instantiate_vnf("firewall", "fw", "default")
+        assert pool.refill() == 1
+        assert pool.get_status()["idle"] == {"firewall": 2}
+
+    def test_drain_during_start_discards_old_instance(self, vnf_manager):
+        pool = vnf_manager.enable_warm_pool({"firewall": 0})
+        pool.pool_sizes["firewall"] = 1
+        start_instance = vnf_manager.start_instance
+
+        def start_then_drain(vnf_type):
+            started = start_instance(vnf_type)
+            # The spec changes while the instance is starting
+            vnf_manager.vnf_catalog["firewall"]["resource_requirements"]["memory"] = 1024.0
+            pool.drain(vnf_type)
+            return started
+
+        vnf_manager.start_instance = start_then_drain
+        assert pool.refill() == 0
+        status = pool.get_status()
+        assert status["idle"] == {"firewall": 0}
+        assert status["memory_in_use"] == 0.0
+        assert (status["started"], status["discarded"]) == (1, 1)
+
+        # The next refill starts from the new spec
+        vnf_manager.start_instance = start_instance
+        assert pool.refill() == 1
+        assert pool.idle["firewall"][0][1]["resource_usage"]["memory"] == 1024.0
+
+    def test_catalog_change_drains_pool(self, vnf_manager):
+        pool = vnf_manager.enable_warm_pool({"firewall": 2})
+        spec = dict(vnf_manager.vnf_catalog["firewall"])
+        spec["image"] = "nginx:1.25"
+        diff = vnf_manager.apply_catalog({"firewall": spec})
+        assert diff["changed"] == ["firewall"]
+        assert pool.get_status()["idle"] == {"firewall": 0}
+
+    def test_set_pool_size_shrinks(self, vnf_manager):
+        pool = vnf_manager.enable_warm_pool({"firewall": 3})
+        pool.set_pool_size("firewall", 1)
+        status = pool.get_status()
+        assert status["idle"] == {"firewall": 1}
+        assert status["memory_in_use"] == 512.0